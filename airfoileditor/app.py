@@ -25,11 +25,12 @@ from ast import Add
 import os
 import sys
 import argparse
+import multiprocessing
 
 from PyQt6.QtCore           import pyqtSignal, QMargins, Qt
 from PyQt6.QtWidgets        import QApplication, QMainWindow, QWidget 
 from PyQt6.QtWidgets        import QGridLayout
-from PyQt6.QtGui            import QCloseEvent, QGuiApplication
+from PyQt6.QtGui            import QCloseEvent, QGuiApplication, QShortcut, QKeySequence
 
 # DEV: when running app.py as main, set package property to allow relative imports
 if __name__ == "__main__":  
@@ -38,11 +39,12 @@ if __name__ == "__main__":
 
 from .resources              import get_resources_root
 from .base.common_utils      import * 
+from .base                   import instrument
 
 from .model.xo2_input        import Input_File
 from .model.case             import Case_Optimize, Case_Direct_Design
 
-from .base.panels            import Win_Util
+from .base.panels            import Win_Util, MessageBox
 from .base.widgets           import Icon, Widget
 from .base.app_utils         import Settings, Update_Checker, Run_Checker, check_or_get_initial_file
 
@@ -50,6 +52,7 @@ from .ui.ae_widgets          import create_airfoil_from_path
 from .ui.ae_diagrams         import Diagram_Airfoil_Polar
 
 from .app_model              import App_Model, Mode_Id
+from .match_runner           import Match_Cache
 from .app_modes              import Mode_As_BSpline, Modes_Manager, Mode_View, Mode_Modify, Mode_Optimize, Mode_As_Bezier, Mode_As_CST
 
 import logging
@@ -94,6 +97,8 @@ class Main (QMainWindow):
         
         Update_Checker (self, APP_NAME, PACKAGE_NAME,  __version__) 
 
+        Match_Cache.set_dir (os.path.join (Settings.user_data_dir (APP_NAME), "match_cache"))
+
 
         # --- init App Model ---------------
 
@@ -172,6 +177,10 @@ class Main (QMainWindow):
 
         self._diagram = diagram                                             # keep for close down
 
+        # instrumentation summary (if enabled with --instrument)
+
+        QShortcut (QKeySequence ("Ctrl+Shift+I"), self, activated=self._show_instrumentation)
+
 
         # --- Enter event loop ---------------
 
@@ -181,6 +190,17 @@ class Main (QMainWindow):
     # --- private ---------------------------------------------------------
 
 
+    def _show_instrumentation (self):
+        """ show summary of hot path counters and timers """
+
+        if not instrument.enabled():
+            text = "Instrumentation is disabled.<br>Start the app with '--instrument' to collect timings."
+        else:
+            text = f"<pre>{instrument.summary_text()}</pre>"
+
+        MessageBox.info (self, "Instrumentation", text, min_width=600)
+
+
     def _set_win_title (self):
         """ set window title with airfoil or case name """
 
@@ -270,6 +290,10 @@ class Main (QMainWindow):
         # save e.g. diagram options 
         self._save_app_settings () 
 
+        # dump instrumentation data 
+        if instrument.enabled():
+            instrument.save_json (os.path.join (Settings.user_data_dir (APP_NAME), "instrumentation.json"))
+
         event.accept()
 
 
@@ -279,6 +303,10 @@ class Main (QMainWindow):
 def start ():
     """ start the app """
 
+    # worker processes of a frozen app (e.g. batch export) must not start the app again 
+
+    multiprocessing.freeze_support ()
+
     # init logging - can be overwritten within a module  
 
     init_logging (level= logging.INFO)             # INFO, DEBUG or WARNING
@@ -287,7 +315,10 @@ def start ():
     
     parser = argparse.ArgumentParser(prog=APP_NAME, description='View and modify an airfoil')
     parser.add_argument("airfoil", nargs='*', help="Airfoil .dat or .bez file to show")
+    parser.add_argument("--instrument", action="store_true", help="collect timings of hot paths (Ctrl+Shift+I)")
     args = parser.parse_args()
+    if args.instrument:
+        instrument.enable ()
     if args.airfoil: 
         initial_file = args.airfoil[0]
     else: 
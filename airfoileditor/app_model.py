@@ -9,6 +9,7 @@ App model and state management for the airfoil editor.
 - signals for changes in data to inform the UI
 - loading and saving of airfoil specific settings
 - watchdog thread for monitoring polar generation and optimization state
+- prefetch thread of the polars of neighbour designs
 - can be notified of changes in airfoil geometry and other parameters
 
 The App Model is needed as the 'real' model is QObject agnostic and stateless. 
@@ -19,7 +20,7 @@ import os
 from enum                    import Enum, auto
 from typing                  import override
 from shutil                  import copytree, rmtree
-from PyQt6.QtCore            import QCoreApplication, pyqtSignal, QObject, QThread, QTimer
+from PyQt6.QtCore            import pyqtSignal, QObject, QThread, QTimer
 
 from .resources              import get_assets_dir, get_xo2_examples_dir, XO2_EXAMPLE_DIR
 from .base.common_utils      import Parameters, clip
@@ -37,10 +38,11 @@ from .model.geometry_cst     import Geometry_CST
 from .model.polar_set        import Polar_Definition, Polar_Set, Polar_Task
 from .model.xo2_driver       import Worker, Xoptfoil2
 from .model.xo2_input        import OpPoint_Definition, Input_File
+from .model.xo2_queue        import Xo2_Job_Queue
 from .model.nf_driver        import Neuralfoil_Evaluator
 from .model.case             import Case_Direct_Design, Case_Optimize, Case_Abstract, Case_Match_Target
 
-from .match_runner           import Matcher, Match_Result
+from .match_runner           import Matcher, Match_Result, Match_Progress
 
 import logging
 logger = logging.getLogger(__name__)
@@ -125,7 +127,7 @@ class App_Model (QObject):
 
     # fast geometry updates during user interaction - no new design airfoil created yet
     sig_geo_changing            = pyqtSignal(object)    # geometry changing including source widget
-    sig_geo_curve_changing      = pyqtSignal(Line.Type) # curve (Bezier or B-Spline) during match curve 
+    sig_geo_curve_changing      = pyqtSignal(object, object) # line type, snapshot curve (Bezier or B-Spline) during match curve 
 
     # enter/leave modes - show/hide artists
     sig_te_gap_mode             = pyqtSignal(bool)      
@@ -147,6 +149,7 @@ class App_Model (QObject):
     sig_xo2_new_design          = pyqtSignal()          # new current design index (Watchdog)
     sig_xo2_new_step            = pyqtSignal()          # new step (Watchdog)
     sig_xo2_still_running       = pyqtSignal()          # still running (Watchdog)
+    sig_xo2_queue_changed       = pyqtSignal()          # job of optimization queue changed (Watchdog)
     sig_xo2_input_changed       = pyqtSignal()          # input data changed (opPoints, ref airfoils, ...)
     sig_xo2_opPoint_def_selected= pyqtSignal()          # opPoint definition selected
 
@@ -179,9 +182,12 @@ class App_Model (QObject):
         self._is_lower_minimized= False                 # is lower panel minimized
         
         self._watchdog = None                           # watchdog thread (may not be started)
+        self._export_runner = None                      # batch export thread 
+        self._prefetch_runner = None                    # background prefetch of neighbour designs
 
         self._xo2_iopPoint_def  = 0                     # current xo2 opPoint definition index
         self._xo2_run_started   = False                 # has xo2 run started
+        self._xo2_queue         = None                  # lazy queue of concurrent optimization jobs
 
         # set working dir for Example airfoils created
         Example.workingDir_default = workingDir_default   
@@ -224,6 +230,7 @@ class App_Model (QObject):
         self._watchdog.sig_xo2_new_design.connect   (self._on_xo2_new_design)  
         self._watchdog.sig_xo2_new_step.connect     (self.sig_xo2_new_step.emit)
         self._watchdog.sig_xo2_still_running.connect(self.sig_xo2_still_running.emit)
+        self._watchdog.sig_xo2_queue_changed.connect(self.sig_xo2_queue_changed.emit)
 
         self._watchdog.start()
 
@@ -239,9 +246,11 @@ class App_Model (QObject):
             self._watchdog.sig_xo2_new_design.disconnect()
             self._watchdog.sig_xo2_new_step.disconnect()
             self._watchdog.sig_xo2_still_running.disconnect()
+            self._watchdog.sig_xo2_queue_changed.disconnect()
 
             # Stop the thread
             self._watchdog.set_case_optimize(None)              # stop watching
+            self._watchdog.set_xo2_queue(None)
             self._watchdog.requestInterruption()
             self._watchdog.wait(2000)                           # wait max 2s for finish
             
@@ -314,13 +323,12 @@ class App_Model (QObject):
         self.sig_xo2_new_state.emit()
 
 
-    def _on_match_results (self, ipass, nevals, result):
-        """ slot to handle new match results signaled by Matcher"""
+    def _on_match_progress (self, progress : Match_Progress):
+        """ slot to handle new match progress signaled by Matcher - diagram is drawn from the snapshot"""
 
         if self._matcher:
             line_type = self._matcher._side.type
-            self.sig_geo_curve_changing.emit (line_type)                     # update diagram
-            QCoreApplication.processEvents()
+            self.sig_geo_curve_changing.emit (line_type, progress.curve())  # update diagram
 
 
     def _on_match_finished (self, result : Match_Result ):
@@ -328,7 +336,7 @@ class App_Model (QObject):
 
         if self._matcher:
             self._matcher.sig_finished.disconnect ()
-            self._matcher.sig_new_results.disconnect ()
+            self._matcher.sig_progress.disconnect ()
 
             aSide = self._matcher._side
             self.airfoil.geo.finished_change_of (aSide, matched=True) # will reset geo and handle changed  
@@ -449,7 +457,17 @@ class App_Model (QObject):
     def is_case_optimize (self) -> bool:
         """ is current case an optimize case """
         return isinstance (self.case, Case_Optimize)
-    
+
+
+    @property
+    def xo2_queue (self) -> Xo2_Job_Queue:
+        """ queue of optimization jobs running concurrently - polled by watchdog"""
+        if self._xo2_queue is None:
+            self._xo2_queue = Xo2_Job_Queue ()
+            if self._watchdog:
+                self._watchdog.set_xo2_queue (self._xo2_queue)
+        return self._xo2_queue
+
 
     @property
     def airfoil (self) -> Airfoil:
@@ -488,6 +506,10 @@ class App_Model (QObject):
 
         logger.debug (f"{self} Set new airfoil {aNew}")
 
+        # selection jumped - stop prefetch, it must not work on the new airfoil anymore
+        if self._prefetch_runner:
+            self._prefetch_runner.cancel()
+
         # sanity cleanup Worker working dir of previous airfoil
         if self.airfoil:
             Worker().clean_workingDir (self.airfoil.pathName_abs)
@@ -498,7 +520,10 @@ class App_Model (QObject):
         # assign polar set with current polar definitions
         if aNew is not None:
             if assign_polar_set: 
-                self._airfoil.set_polarSet (Polar_Set (aNew, polar_def=self.polar_definitions, only_active=True))
+                new_polarSet = Polar_Set (aNew, polar_def=self.polar_definitions, only_active=True)
+                if not (aNew.usedAsDesign and new_polarSet.is_equal_to (aNew.polarSet)):   # keep prefetched polars 
+                    self._airfoil.set_polarSet (new_polarSet)
+                self._prefetch_neighbour_designs (aNew)
             else: 
                 self._airfoil.set_polarSet (Polar_Set (aNew, polar_def=[]))   # empty polar set
 
@@ -513,6 +538,21 @@ class App_Model (QObject):
             self.sig_new_airfoil.emit()
 
 
+    def _prefetch_neighbour_designs (self, airfoil : Airfoil):
+        """ warm geometry and polars of the designs next to 'airfoil' in background """
+
+        if not (self.case and airfoil.usedAsDesign): return
+
+        fileNames = self.case.airfoil_designs_fileNames()
+        if airfoil.fileName not in fileNames: return
+
+        if self._prefetch_runner is None:
+            self._prefetch_runner = Prefetch_Runner (parent=self)
+
+        self._prefetch_runner.prefetch (self.case.airfoil_designs, fileNames.index (airfoil.fileName), 
+                                        self.polar_definitions)
+
+
     def notify_geo_changing (self, source = None):
         """ 
         Notify self that current airfoil *geometry* is changing rapidly during user edit
@@ -852,6 +892,9 @@ class App_Model (QObject):
         case : Case_Optimize = self.case
         case.input_file.update_nml ()                                              # ensure namelist dict is up to date
 
+        for error_text in case.input_file.check_nml ():                          # in-process - no Worker needed
+            logger.warning (f"{self} {error_text}")
+
         # polar definitions could have changed - update polarSets of airfoils 
         self._refresh_polar_sets (silent=True)
 
@@ -1099,6 +1142,13 @@ class App_Model (QObject):
 
         self._finish_watchdog()
 
+        if self._prefetch_runner:
+            self._prefetch_runner.cancel()
+            self._prefetch_runner.wait()
+
+        if isinstance (self.case, Case_Direct_Design):
+            self.case.flush()                                   # pending design files 
+
         if Worker.ready and self.airfoil:
             Worker().clean_workingDir (self.airfoil.pathName)
 
@@ -1173,13 +1223,225 @@ class App_Model (QObject):
  
         self._matcher.set_match (side, targets)
 
-        self._matcher.sig_new_results.connect     (self._on_match_results)
+        self._matcher.sig_progress.connect        (self._on_match_progress)
         self._matcher.sig_finished.connect        (self._on_match_finished)
 
         QTimer.singleShot(0, self._matcher.start)
 
         return self._matcher
 
+
+    def run_export_dxf_batch (self, exporter) -> 'Export_Runner':
+        """ run a batch DXF export (Export_Airfoils_Dxf) in background. Returns Export_Runner thread 
+            which signals progress of each airfoil and the results when finished """
+
+        self._export_runner = Export_Runner (exporter, parent=self)
+
+        QTimer.singleShot(0, self._export_runner.start)
+
+        return self._export_runner
+
+# -----------------------------------------------------------------------------
+
+
+class Export_Runner (QThread):
+    """ 
+    Short running QThread to run a batch export of airfoils (Export_Airfoils_Dxf) 
+    without blocking the UI - the files itself are rendered in a process pool
+    """
+
+    sig_progress            = pyqtSignal (int, int, object)         # n_done, n_total, Dxf_Batch_Result
+    sig_finished            = pyqtSignal (object)                   # list of Dxf_Batch_Result
+
+
+    def __init__ (self, exporter, parent = None):
+
+        super().__init__(parent)
+
+        self._exporter = exporter
+
+
+    def __repr__(self) -> str:
+        """ nice representation of self """
+        return f"<{type(self).__name__}>"
+
+
+    @override
+    def run (self) :
+        # Note: This is never called directly. It is called by Qt once the
+        # thread environment has been set up. 
+
+        logger.info (f"{self} starting batch export of {len(self._exporter.items)} airfoils")
+
+        results = self._exporter.do_it (progress_callback=self.sig_progress.emit,
+                                        stop_callback=self.isInterruptionRequested)
+        self.sig_finished.emit (results)
+
+
+
+# -----------------------------------------------------------------------------
+
+
+class Prefetch_Runner (QThread):
+    """ 
+    Short running QThread to prefetch the designs next to the current design 
+
+    NeuralFoil polars of the next and previous designs are evaluated and existing 
+    Xfoil polar files are loaded at low priority, so stepping through the designs 
+    doesn't wait for them. 
+    The thread works on copies of the designs made in the main thread - lazy caches 
+    of the shared designs are never touched by the thread. The prefetched polar set 
+    is handed over to the design and its geometry is warmed in the main thread 
+    (sig_prefetched).
+    No Xfoil polars are generated - this is done in the main thread when a design 
+    gets selected. 
+
+    A new prefetch or a jump of the selection only requests an interruption - the
+    next prefetch starts when the running one has finished.
+    """
+
+    N_NEIGHBOURS = 2                                            # next and previous designs to prefetch
+
+    sig_prefetched = pyqtSignal (object, object)                # airfoil, prefetched Polar_Set
+
+
+    def __init__ (self, parent = None):
+
+        super().__init__(parent)
+
+        self._airfoils : list [Airfoil] = []                    # designs to prefetch - nearest first
+        self._copies   : list [Airfoil] = []                    # copies of designs the thread works on
+        self._polar_defs : list [Polar_Definition] = []
+        self._n_done = 0
+
+        self._pending = None                                    # next (airfoils, polar_defs) to prefetch
+
+        self.finished.connect       (self._start_pending)       # both run in main thread 
+        self.sig_prefetched.connect (self._on_prefetched)
+
+
+    def __repr__(self) -> str:
+        """ nice representation of self """
+        return f"<{type(self).__name__}>"
+
+
+    @property
+    def airfoils (self) -> list [Airfoil]:
+        """ designs of the current prefetch in prefetch order"""
+        return self._airfoils
+
+    @property
+    def n_done (self) -> int:
+        """ number of designs already prefetched"""
+        return self._n_done
+
+
+    @staticmethod
+    def neighbour_indexes (index : int, n : int, k : int) -> list [int]:
+        """ indexes of the k next and k previous designs - nearest first, next before previous"""
+
+        indexes = []
+        for dist in range (1, k + 1):
+            for i in (index + dist, index - dist):
+                if 0 <= i < n:
+                    indexes.append (i)
+        return indexes
+
+
+    def prefetch (self, designs : list [Airfoil], index : int, polar_defs : list [Polar_Definition], 
+                  k : int = None):
+        """ prefetch the designs next to index - starts when a running prefetch has finished"""
+
+        k = self.N_NEIGHBOURS if k is None else k
+
+        # airfoils are taken in the main thread - designs may be created on demand 
+        airfoils = [designs [i] for i in self.neighbour_indexes (index, len(designs), k)]
+
+        if self.isRunning():
+            self.requestInterruption()
+            self._pending = (airfoils, polar_defs)              # started by finished signal
+        else: 
+            self._start (airfoils, polar_defs)
+
+
+    def cancel (self):
+        """ request stop of running prefetch - doesn't wait for the thread"""
+
+        self._pending = None
+        if self.isRunning():
+            self.requestInterruption()
+
+
+    def _start (self, airfoils : list [Airfoil], polar_defs : list [Polar_Definition]):
+        """ start thread for airfoils"""
+
+        self._airfoils   = airfoils
+        self._copies     = [airfoil.asCopy_design() for airfoil in airfoils]    # in main thread
+        self._polar_defs = polar_defs
+        self._n_done     = 0
+
+        if self._airfoils:
+            self.start (QThread.Priority.LowestPriority)
+
+
+    def _start_pending (self):
+        """ slot - thread finished - start a pending prefetch"""
+
+        if self._pending:
+            airfoils, polar_defs = self._pending
+            self._pending = None
+            self._start (airfoils, polar_defs)
+
+
+    def _on_prefetched (self, airfoil : Airfoil, polarSet : Polar_Set):
+        """ slot - hand over prefetched polar set and warm geometry in main thread"""
+
+        geo = airfoil.geo
+        geo.thickness, geo.camber, geo.curvature, geo.le            # lazy evaluated on first access
+
+        polarSet.set_airfoil (airfoil)                              # was prepared on a copy
+        if not polarSet.is_equal_to (airfoil.polarSet):
+            airfoil.set_polarSet (polarSet)
+
+
+    @override
+    def run (self) :
+        # Note: This is never called directly. It is called by Qt once the
+        # thread environment has been set up. 
+
+        for airfoil, copy in zip (self._airfoils, self._copies):
+
+            if self.isInterruptionRequested():
+                logger.debug (f"{self} cancelled after {self._n_done} of {len(self._airfoils)} designs")
+                return
+
+            try: 
+                polarSet = self._prefetch_airfoil (copy)
+                if polarSet:
+                    self.sig_prefetched.emit (airfoil, polarSet)
+            except Exception as exc:
+                logger.warning (f"{self} prefetch of {airfoil} failed: {exc}")
+
+            self._n_done += 1
+
+
+    def _prefetch_airfoil (self, airfoil : Airfoil) -> Polar_Set | None:
+        """ 
+        evaluate NeuralFoil and load existing Xfoil polars of airfoil (a copy of 
+        the design) into a new polar set - None if interrupted
+        """
+
+        polarSet = Polar_Set (airfoil, polar_def=self._polar_defs, only_active=True)
+
+        for polar in polarSet.polars_normal:
+            if self.isInterruptionRequested(): 
+                return None
+            polar.load_polar ()                                     # Xfoil only if polar file exists 
+
+        return polarSet
+
+
+
 # -----------------------------------------------------------------------------
 
 
@@ -1197,6 +1459,7 @@ class Watchdog (QThread):
     sig_xo2_new_step        = pyqtSignal ()
     sig_xo2_new_design      = pyqtSignal ()
     sig_xo2_still_running   = pyqtSignal ()
+    sig_xo2_queue_changed   = pyqtSignal ()
 
 
     def __init__ (self, parent = None):
@@ -1209,6 +1472,7 @@ class Watchdog (QThread):
         self._xo2_id           = None                           # instance id of xo2 for change detection
         self._xo2_nDesigns     = 0                              # last actual design    
         self._xo2_nSteps       = 0                              # last actual steps    
+        self._xo2_queue : Xo2_Job_Queue = None                  # optimization job queue to poll
 
 
     def __repr__(self) -> str:
@@ -1282,6 +1546,11 @@ class Watchdog (QThread):
             self.reset_watch_optimize ()
 
 
+    def set_xo2_queue (self, queue : Xo2_Job_Queue | None):
+        """ set optimization job queue to poll"""
+        self._xo2_queue = queue
+
+
     def reset_watch_optimize (self):
         """ reset local state of optimization watch"""
         self._xo2_state        = None                           # last run state of xo2
@@ -1306,6 +1575,11 @@ class Watchdog (QThread):
             if self._case_optimize:
                 self._check_case_optimize ()
 
+            # run and poll queued optimization jobs 
+
+            if self._xo2_queue and self._xo2_queue.update():
+                self.sig_xo2_queue_changed.emit()
+
             # check for new polars 
 
             n_polars = 0 
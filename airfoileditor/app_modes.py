@@ -20,7 +20,7 @@ from .model.case             import Case_Direct_Design, Case_Match_Target
 from .model.airfoil          import Airfoil_BSpline, Airfoil_CST
 
 from .ui.util_dialogs        import Airfoil_Save_Dialog
-from .ui.ae_dialogs          import Airfoil_Export_DXF_Dialog
+from .ui.ae_dialogs          import Airfoil_Export_DXF_Dialog, Airfoils_Export_DXF_Dialog
 from .ui.ae_panels           import *
 
 from .ui.xo2_dialogs         import Xo2_Select_Dialog, Xo2_New_Dialog
@@ -278,6 +278,7 @@ class Mode_View (Mode_Abstract):
             p.sig_new_as_cst.connect            (self.new_as_CST)
             p.sig_save_as.connect               (self.save_as)
             p.sig_export_dxf.connect            (self.export_dxf)
+            p.sig_export_dxf_batch.connect      (self.export_dxf_batch)
             p.sig_rename.connect                (self.rename)
             p.sig_delete.connect                (self.delete)
             p.sig_delete_temp_files.connect     (self.delete_temp_files)
@@ -312,6 +313,7 @@ class Mode_View (Mode_Abstract):
             p.sig_new_as_cst.connect            (self.new_as_CST)
             p.sig_save_as.connect               (self.save_as)
             p.sig_export_dxf.connect            (self.export_dxf)
+            p.sig_export_dxf_batch.connect      (self.export_dxf_batch)
             p.sig_rename.connect                (self.rename)
             p.sig_delete.connect                (self.delete)
             p.sig_delete_temp_files.connect     (self.delete_temp_files)
@@ -410,6 +412,14 @@ class Mode_View (Mode_Abstract):
         dlg.exec()
 
 
+    def export_dxf_batch(self):
+        """export current and reference airfoils as dxf"""
+
+        dlg = Airfoils_Export_DXF_Dialog(self.stacked_panel, self._app_model,
+                                         parentPos=(0.25, 0), dialogPos=(0,1.4))
+        dlg.exec()
+
+
     def delete (self): 
         """ delete current airfoil ..."""
 
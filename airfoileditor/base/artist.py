@@ -33,6 +33,7 @@ from .common_utils      import *
 from .math_util         import JPoint 
 from .spline            import Bezier, BSpline
 from .widgets           import Icon
+from .                  import instrument
 
 import logging
 logger = logging.getLogger(__name__)
@@ -693,11 +694,12 @@ class Movable_Curve (pg.PlotCurveItem):
         self.curve.set_cpoints(*self.points_xy())      
 
 
-    def _update_curve_item (self):
-        """ update curve item from curve - called on move """
+    def _update_curve_item (self, curve = None):
+        """ update curve item from curve (default self.curve) - called on move """
 
         if self._curve_item: 
-            x,y = self.curve.eval(self.u)                  # update of curve
+            curve = curve if curve is not None else self.curve
+            x,y = curve.eval(self.u)                       # update of curve
             self._curve_item.setData (x, y)
             self._curve_item.show()
 
@@ -1115,7 +1117,8 @@ class Artist(QObject):
 
             if self.data_object is not None:
 
-                self._plot()                        # plot data list 
+                with instrument.timer (f"artist.{self.__class__.__name__}"):
+                    self._plot()                    # plot data list 
 
                 if self._plots:
                     logger.debug  (f"{self} of {self._pi} - plot {len(self._plots)} items")
@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Instrumentation - central registry of named counters and timers for hot paths
+
+Disabled by default. When disabled, a timed function costs one flag check
+and counters return immediately. Enable with
+
+    instrument.enable ()                    # or env variable AE_INSTRUMENT=1
+                                            # or app command line --instrument
+
+Usage in code:
+
+    @instrument.timed ("spline.bezier.eval")            # time each call of a function
+    def eval (...):
+
+    with instrument.timer ("artist.plot"):              # time a block
+        ...
+
+    instrument.count ("polar.cache_hit")                # plain counter
+
+    print (instrument.summary_text ())                  # or save_json (path)
+
+No dependencies from other modules.
+"""
+
+import os
+import json
+import functools
+import threading
+from time                   import perf_counter
+from contextlib             import nullcontext
+from dataclasses            import dataclass
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+_enabled = os.environ.get ("AE_INSTRUMENT", "") not in ("", "0")
+_stats : dict [str, 'Stat'] = {}
+_lock  = threading.Lock()                       # stats may be updated from worker threads
+
+_NULL_CONTEXT = nullcontext()
+
+
+@dataclass
+class Stat:
+    """Counter and accumulated time of a named measure point"""
+
+    name    : str
+    count   : int   = 0
+    total   : float = 0.0                       # total time in seconds - 0.0 for plain counters
+    min     : float = float ('inf')
+    max     : float = 0.0
+
+    @property
+    def mean (self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def isTimer (self) -> bool:
+        return self.total > 0.0
+
+    def toDict (self) -> dict:
+        d = {"count": self.count}
+        if self.isTimer:
+            d.update ({"total": self.total, "mean": self.mean, "min": self.min, "max": self.max})
+        return d
+
+
+#------------------------------------------------------------------------------
+# enable / reset
+#------------------------------------------------------------------------------
+
+def enabled () -> bool:
+    """ True if instrumentation is collecting data"""
+    return _enabled
+
+
+def enable (aBool : bool = True):
+    """ switch instrumentation on or off - collected data is kept"""
+    global _enabled
+    _enabled = bool (aBool)
+    logger.info (f"Instrumentation {'enabled' if _enabled else 'disabled'}")
+
+
+def reset ():
+    """ clear all collected counters and timers"""
+    with _lock:
+        _stats.clear()
+
+
+#------------------------------------------------------------------------------
+# collect
+#------------------------------------------------------------------------------
+
+def _get_stat (name : str) -> Stat:
+    stat = _stats.get (name)
+    if stat is None:
+        stat = _stats.setdefault (name, Stat (name))
+    return stat
+
+
+def count (name : str, n : int = 1):
+    """ increase counter 'name' by n"""
+    if not _enabled:
+        return
+    with _lock:
+        _get_stat (name).count += n
+
+
+def add_time (name : str, seconds : float, n : int = 1):
+    """ add an externally measured time for n calls to timer 'name'"""
+    if not _enabled:
+        return
+    with _lock:
+        stat = _get_stat (name)
+        stat.count += n
+        stat.total += seconds
+        stat.min    = min (stat.min, seconds / n if n else seconds)
+        stat.max    = max (stat.max, seconds / n if n else seconds)
+
+
+class _Timer:
+    """ context manager measuring the time of a block"""
+
+    __slots__ = ("_name", "_start")
+
+    def __init__ (self, name : str):
+        self._name  = name
+        self._start = 0.0
+
+    def __enter__ (self):
+        self._start = perf_counter()
+        return self
+
+    def __exit__ (self, *exc):
+        add_time (self._name, perf_counter() - self._start)
+        return False
+
+
+def timer (name : str):
+    """ context manager timing a block as 'name' - no-op when disabled"""
+    if not _enabled:
+        return _NULL_CONTEXT
+    return _Timer (name)
+
+
+def timed (name : str):
+    """ decorator timing each call of a function as 'name'"""
+
+    def decorator (fn):
+
+        @functools.wraps (fn)
+        def wrapper (*args, **kwargs):
+            if not _enabled:
+                return fn (*args, **kwargs)
+            start = perf_counter()
+            try:
+                return fn (*args, **kwargs)
+            finally:
+                add_time (name, perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+#------------------------------------------------------------------------------
+# report
+#------------------------------------------------------------------------------
+
+def stats () -> list [Stat]:
+    """ copy of all stats - timers sorted by total time, then counters by count"""
+
+    with _lock:
+        all_stats = [Stat (s.name, s.count, s.total, s.min, s.max) for s in _stats.values()]
+
+    return sorted (all_stats, key=lambda s: (-s.total, -s.count, s.name))
+
+
+def toDict () -> dict:
+    """ all stats as dict name: values"""
+    return {"enabled": _enabled, "stats": {s.name : s.toDict() for s in stats()}}
+
+
+def save_json (pathFileName : str):
+    """ dump all stats as json file"""
+
+    with open (pathFileName, 'w') as f:
+        json.dump (toDict(), f, indent=2)
+
+    logger.info (f"Instrumentation data written to {pathFileName}")
+
+
+def summary_text () -> str:
+    """ summary table of all stats as plain text"""
+
+    all_stats = stats()
+
+    if not all_stats:
+        return "Instrumentation: no data" + ("" if _enabled else " (disabled)")
+
+    lines = [f"{'Name':32s} {'Count':>8s} {'Total ms':>10s} {'Mean ms':>9s} {'Max ms':>9s}"]
+    for s in all_stats:
+        if s.isTimer:
+            lines.append (f"{s.name:32s} {s.count:8d} {s.total*1000:10.1f} {s.mean*1000:9.3f} {s.max*1000:9.3f}")
+        else:
+            lines.append (f"{s.name:32s} {s.count:8d}")
+    return "\n".join (lines)
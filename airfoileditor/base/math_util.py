@@ -5,10 +5,12 @@
 
 """
 
-import random
 import numpy as np
 import math
+import multiprocessing
 from bisect         import bisect_left
+from dataclasses    import dataclass
+from concurrent.futures import ProcessPoolExecutor
 
 import logging
 logger = logging.getLogger(__name__)
@@ -996,6 +998,285 @@ def nelder_mead (f,
         res = nres
 
 
+#--- multi-start nelder mead ------
+
+@dataclass
+class NM_Start_Result:
+    """Statistics of one start of nelder_mead_multistart"""
+
+    start       : int                       # index of start - 0 is x_start itself 
+    x_start     : np.ndarray
+    x           : np.ndarray                # best position so far 
+    score       : float
+    iterations  : int = 0                   # total nelder mead iterations 
+    rounds      : int = 0                   # rounds run 
+    dropped     : bool = False              # cancelled by successive halving
+
+
+def _nelder_mead_job (job : tuple) -> tuple [np.ndarray, float, int]:
+    """ run one nelder mead round - module level to be usable in a process pool"""
+
+    f, x, kwargs = job
+    (x_best, score), niter = nelder_mead (f, x, **kwargs)
+    return x_best, score, niter
+
+
+def nelder_mead_multistart (f, 
+                x_start,
+                n_starts : int = 4,
+                perturb : float = 0.1,
+                step : float = 0.1,
+                round_iter : int = 100,
+                eta : int = 2,
+                bounds = None,
+                seed : int | None = None,
+                map_fn = None,
+                n_workers : int | None = None,
+                stop_callback = None,
+                **nm_options
+                ) -> tuple [tuple [np.ndarray, float], list [NM_Start_Result]]:
+    '''
+        Multi-start Nelder-Mead with successive halving 
+
+        Launches n_starts: x_start and n_starts-1 random perturbations of it. 
+        Each round runs all remaining starts for round_iter iterations, then only 
+        the best 1/eta of them continue with a smaller step. The last remaining start 
+        runs a final nelder mead with nm_options until convergence. 
+
+        Arguments:
+
+        f       : function to optimize - has to be picklable (module level) for a process pool
+        x_start : initial position
+        n_starts: number of starts 
+        perturb : max perturbation of the starts - as fraction of the bounds span (or absolute without bounds)
+        step    : look-around radius of nelder mead in the first round  
+        round_iter : iterations of each start per round 
+        eta     : 1/eta of the starts survive a round
+        bounds  : list of tuple(float) - (min, max) pair for boundary of x. 
+        seed    : seed of the random perturbations
+        map_fn  : parallel evaluation hook with the signature of map(), e.g. ProcessPoolExecutor.map
+        n_workers : if no map_fn, run rounds in a process pool with n_workers
+        stop_callback : optional method for stop condition - checked between rounds and in the final run
+        nm_options : further arguments of nelder_mead for the final run (max_iter, no_improv_break, ...)
+
+        Returns:
+
+        (xbest,score) : np array tuple - x of minimum, best score 
+        stats   : list of NM_Start_Result - one per start
+    '''
+
+    if n_starts < 1 or eta < 2:
+        raise ValueError ("nelder_mead_multistart needs n_starts >= 1 and eta >= 2")
+    if stop_callback and not callable (stop_callback):
+        stop_callback = False
+
+    rng     = np.random.default_rng (seed)
+    x_start = np.asarray (x_start, dtype=float)
+
+    if bounds is not None:
+        span = np.array ([b[1] - b[0] for b in bounds], dtype=float)
+    else:
+        span = np.ones (len (x_start))
+
+    # -- starts: x_start itself and perturbed positions
+
+    stats = []
+    for i in range (n_starts):
+        x = x_start if i == 0 else x_start + rng.uniform (-perturb, perturb, len (x_start)) * span
+        if bounds is not None:
+            x = enforce_bounds (x, bounds, mode='clip')
+        stats.append (NM_Start_Result (i, x.copy(), x.copy(), float ('inf')))
+
+    # -- rounds of successive halving 
+
+    round_options = {k: v for k, v in nm_options.items() if k not in ('max_iter', 'min_iter', 'stop_callback')}
+    alive = list (stats)
+    executor = None
+
+    try:
+        if map_fn is None and n_workers and len (alive) > 1:
+            executor = ProcessPoolExecutor (max_workers=n_workers,          # spawn - caller may run threads
+                                            mp_context=multiprocessing.get_context ('spawn'))
+            map_fn   = executor.map
+        elif map_fn is None:
+            map_fn   = map
+
+        round_step = step
+        while len (alive) > 1:
+
+            jobs = [(f, st.x, dict (round_options, step=round_step, bounds=bounds, max_iter=round_iter))
+                        for st in alive]
+
+            for st, (x, score, niter) in zip (alive, map_fn (_nelder_mead_job, jobs)):
+                st.x, st.score = x, float (score)
+                st.iterations += niter
+                st.rounds     += 1
+
+            alive.sort (key=lambda st: st.score)
+            n_keep = max (1, len (alive) // eta)
+            for st in alive [n_keep:]:
+                st.dropped = True
+            alive = alive [:n_keep]
+
+            logger.debug (f"nelder_mead_multistart round: best start {alive[0].start} score: {alive[0].score:.6g}")
+
+            if stop_callback and stop_callback():
+                break
+            round_step *= 0.5
+    finally:
+        if executor is not None:
+            executor.shutdown ()
+
+    # -- final run of the best start in this process
+
+    best = alive[0]
+    if not (stop_callback and stop_callback()):
+        final_step = round_step if best.rounds else step
+        (x, score), niter = nelder_mead (f, best.x, step=final_step, bounds=bounds, 
+                                         stop_callback=stop_callback, **nm_options)
+        if score <= best.score:
+            best.x, best.score = x, float (score)
+        best.iterations += niter
+        best.rounds     += 1
+
+    return (best.x, best.score), stats
+
+
+def levenberg_marquardt (residual_fn, 
+                         x_start,
+                         jacobian_fn = None,
+                         bounds = None,
+                         max_iter : int = 50,
+                         lambda_start : float = 1e-3,
+                         ftol : float = 1e-10,
+                         xtol : float = 1e-10,
+                         fd_step : float = 1e-6,
+                         stop_callback = None
+                         ) -> tuple [tuple [np.ndarray, float], int]:
+    '''
+        Levenberg-Marquardt least squares optimization 
+
+        Minimizes the sum of squares of the residual vector returned by residual_fn.
+        Each iteration solves the damped Gauss-Newton system 
+
+            (J^T J + lambda * diag(J^T J)) dx = -J^T r
+
+        lambda is decreased after a successful step (towards Gauss-Newton) and 
+        increased after a failed step (towards gradient descent).
+
+        Arguments:
+
+        residual_fn : function returning the residual vector r(x) 
+        x_start     : initial position
+        jacobian_fn : function returning the Jacobian dr/dx with shape (len(r), len(x)).
+                      None - forward finite differences with fd_step 
+        bounds      : list of tuple(float) - (min, max) pair for boundary of x. None - no boundary. 
+                      Steps are clipped to bounds.
+        max_iter    : always break after this number of iterations
+        lambda_start: initial damping 
+        ftol        : break if relative decrease of sum of squares is lower
+        xtol        : break if relative step size is lower
+        stop_callback : optional method for stop condition
+
+        Returns:
+
+        (xbest,score) : np array tuple - x of minimum, sum of squares of residuals 
+        niter : int - iterations needed 
+    '''
+
+    # sanity
+
+    if stop_callback and not callable (stop_callback):
+        stop_callback = False
+
+    def clip_to_bounds (x):
+        if bounds is None: 
+            return x
+        return enforce_bounds (x, bounds, mode='clip')
+
+    def fd_jacobian (x, r):
+        J = np.empty ((len(r), len(x)))
+        for j in range (len(x)):
+            x_j = np.copy (x)
+            h = fd_step * max (1.0, abs(x[j]))
+            x_j[j] += h
+            J[:, j] = (np.asarray (residual_fn (x_j), dtype=float) - r) / h
+        return J
+
+    # init
+
+    if bounds is not None:
+        lower = np.array ([b[0] for b in bounds], dtype=float)
+        upper = np.array ([b[1] for b in bounds], dtype=float)
+
+    x    = clip_to_bounds (np.asarray (x_start, dtype=float).copy())
+    r    = np.asarray (residual_fn (x), dtype=float)
+    cost = float (r @ r)
+    lam  = lambda_start
+    iters = 0
+
+    while iters < max_iter:
+
+        if stop_callback and stop_callback(): 
+            break
+        iters += 1
+
+        J = jacobian_fn (x) if jacobian_fn is not None else fd_jacobian (x, r)
+
+        A = J.T @ J
+        g = J.T @ r
+
+        # variables at a bound with the gradient pointing outside are kept fixed  
+        if bounds is not None:
+            at_lower = (x <= lower) & (g > 0.0)
+            at_upper = (x >= upper) & (g < 0.0)
+            fixed    = at_lower | at_upper
+            if np.any (fixed):
+                A = np.copy (A)
+                A[fixed, :] = 0.0
+                A[:, fixed] = 0.0
+                A[fixed, fixed] = 1.0
+                g = np.where (fixed, 0.0, g)
+
+        diag_A = np.maximum (np.diag (A), 1e-12)
+
+        # increase damping until a step reduces the sum of squares
+
+        step_accepted = False
+        while lam < 1e10:
+
+            try:
+                dx = -np.linalg.solve (A + lam * np.diag (diag_A), g)
+            except np.linalg.LinAlgError:
+                lam *= 4.0
+                continue
+
+            x_new    = clip_to_bounds (x + dx)
+            r_new    = np.asarray (residual_fn (x_new), dtype=float)
+            cost_new = float (r_new @ r_new)
+
+            if cost_new < cost:
+                step_accepted = True
+                break
+            lam *= 4.0
+
+        if not step_accepted:
+            break
+
+        step      = np.linalg.norm (x_new - x)
+        decrease  = cost - cost_new
+        x, r, cost = x_new, r_new, cost_new
+        lam = max (lam / 3.0, 1e-12)
+
+        if decrease <= ftol * cost or step <= xtol * (np.linalg.norm (x) + xtol):
+            break
+
+    # ensure residual_fn has seen best x as last call (it may have side effects)
+    residual_fn (x)
+
+    return (x, cost), iters
+
+
 #--- wrapper functions for nelder_mead minimum------
 
 def nelder_mead_wrap  (fn, xStart,
@@ -1094,24 +1375,13 @@ def enforce_bounds(trial, bounds, mode='clip'):
         return np.clip(trial, lower, upper)
     
     elif mode == 'reflect':
-        # Reflect values that exceed bounds back into valid range
-        result = trial.copy()
-        
-        # Handle lower bound violations
-        mask_lower = result < lower
-        if np.any(mask_lower):
-            result[mask_lower] = lower[mask_lower] + (lower[mask_lower] - result[mask_lower])
-            # If reflection still outside upper bound, clip
-            result = np.minimum(result, upper)
-        
-        # Handle upper bound violations
-        mask_upper = result > upper
-        if np.any(mask_upper):
-            result[mask_upper] = upper[mask_upper] - (result[mask_upper] - upper[mask_upper])
-            # If reflection still outside lower bound, clip
-            result = np.maximum(result, lower)
-        
-        return result
+        # Reflect values that exceed bounds back into valid range 
+        #   (np.where also works for a population array (n, dim))
+        result = np.where (trial < lower, 2 * lower - trial, trial)
+        result = np.where (trial > upper, 2 * upper - trial, result)
+
+        # If reflection is still outside the bounds, clip
+        return np.clip (result, lower, upper)
     
     else:
         raise ValueError(f"Unknown mode '{mode}'. Use 'clip' or 'reflect'.")
@@ -1129,21 +1399,27 @@ def differential_evolution(
                     no_improve_thr : float = 10e-10,                          # for scalar product
                     bound_mode='clip',
                     seed=None,
-                    stop_callback = None
+                    stop_callback = None,
+                    batch_objective = None,
+                    map_fn = None
                     ) -> tuple[np.ndarray, float, int]:
     
     """
-    Minimize an objective function using Differential Evolution (DE).
+    Minimize an objective function using Differential Evolution (DE/rand/1/bin).
 
     Differential Evolution is a population-based, stochastic global optimizer
     that is robust to local minima and works well for non-smooth or noisy
     objective functions. This implementation is lightweight, dependency-free,
     and suitable for medium-dimensional problems (≈10–30 parameters).
 
+    Each generation is a vectorized step over the population array (pop_size, dim): 
+    all mutants and trials are built at once, then evaluated as one batch.
+
     Args:
         objective (Callable[[np.ndarray], float]):
             The objective function to minimize. Must accept a 1D NumPy array
             representing a candidate solution and return a scalar fitness value.
+            May be None if batch_objective is given. 
         bounds (list[tuple[float, float]]):
             A list of (lower, upper) bounds for each parameter dimension.
             Example: [(-1.0, 1.0), (0.0, 5.0), ...].
@@ -1171,8 +1447,16 @@ def differential_evolution(
             - 'reflect': Reflect values at bounds back into valid range.
             Defaults to 'clip'.
         seed (int | None, optional):
-            Random seed for reproducibility. If None, randomness is uncontrolled.
+            Seed of the local random generator for reproducibility. 
             Defaults to None.
+        stop_callback (Callable[[], bool], optional):
+            Optional method for stop condition, checked after each generation.
+        batch_objective (Callable[[np.ndarray], np.ndarray], optional):
+            Evaluates a whole population array (n, dim) and returns n scores.
+            Takes precedence over objective. 
+        map_fn (Callable, optional):
+            Parallel evaluation hook with the signature of map(), e.g. 
+            ProcessPoolExecutor.map - used to apply objective to the individuals.
 
     Returns:
         tuple[np.ndarray, float, int]:
@@ -1182,7 +1466,6 @@ def differential_evolution(
             - generations: The number of generations completed.
 
     Notes:
-        - This implementation enforces parameter bounds via clipping.
         - The algorithm is fully deterministic if `seed` is provided.
         - Suitable for problems where gradient-based methods fail or get stuck.
 
@@ -1191,53 +1474,56 @@ def differential_evolution(
 
     if stop_callback and not callable (stop_callback):
         stop_callback = False
+    if objective is None and batch_objective is None:
+        raise ValueError ("differential_evolution needs an objective or a batch_objective")
+    if pop_size < 4:
+        raise ValueError ("differential_evolution needs a pop_size of at least 4")
+
+    def evaluate (individuals : np.ndarray) -> np.ndarray:
+        if batch_objective is not None:
+            return np.asarray (batch_objective (individuals), dtype=float)
+        elif map_fn is not None:
+            return np.fromiter (map_fn (objective, list (individuals)), dtype=float, count=len(individuals))
+        else:
+            return np.array ([objective (ind) for ind in individuals], dtype=float)
 
-    if seed is not None:
-        random.seed(seed)
-        np.random.seed(seed)
-
-    dim = len(bounds)
-
-    # --- Initialize population ---
-    population = np.zeros((pop_size, dim))
-    
-    # Fill population randomly within bounds
-    for i in range(pop_size):
-        population[i] = [random.uniform(bounds[j][0], bounds[j][1]) for j in range(dim)]
+    rng   = np.random.default_rng (seed)
+    dim   = len(bounds)
+    lower = np.array([b[0] for b in bounds], dtype=float)
+    upper = np.array([b[1] for b in bounds], dtype=float)
 
-    # Evaluate initial population
-    scores = np.array([objective(ind) for ind in population])
+    # --- Initialize and evaluate population ---
+    population = lower + rng.random ((pop_size, dim)) * (upper - lower)
+    scores     = evaluate (population)
     
     # Early stopping tracking
     no_improve_count = 0
     prev_best = np.min(scores)
+    rows = np.arange (pop_size)
 
     # --- Evolution loop ---
+    gen = -1
     for gen in range(generations):
-        for i in range(pop_size):
-
-            # --- Mutation: select 3 distinct individuals ---
-            idxs = list(range(pop_size))
-            idxs.remove(i)
-            a, b, c = population[random.sample(idxs, 3)]
-
-            # Mutant vector
-            mutant = a + mutation_factor * (b - c)
-
-            # --- Crossover ---
-            trial = np.copy(population[i])
-            for j in range(dim):
-                if random.random() < crossover_rate:
-                    trial[j] = mutant[j]
-
-            # Enforce bounds
-            trial = enforce_bounds(trial, bounds, mode=bound_mode)
-
-            # --- Selection ---
-            trial_score = objective(trial)
-            if trial_score < scores[i]:
-                population[i] = trial
-                scores[i] = trial_score
+
+        # --- Mutation: 3 distinct individuals a, b, c other than i for each i ---
+        keys = rng.random ((pop_size, pop_size))
+        keys [rows, rows] = np.inf                                    # exclude i itself
+        abc  = np.argpartition (keys, 3, axis=1)[:, :3]
+        mutants = population [abc[:,0]] + mutation_factor * (population [abc[:,1]] - population [abc[:,2]])
+
+        # --- Crossover - at least one parameter is taken from the mutant ---
+        cross = rng.random ((pop_size, dim)) < crossover_rate
+        cross [rows, rng.integers (dim, size=pop_size)] = True
+        trials = np.where (cross, mutants, population)
+
+        # Enforce bounds
+        trials = enforce_bounds (trials, bounds, mode=bound_mode)
+
+        # --- Selection ---
+        trial_scores = evaluate (trials)
+        better = trial_scores < scores
+        population [better] = trials [better]
+        scores     [better] = trial_scores [better]
         
         # Check for early stopping
         if no_improve_break is not None:
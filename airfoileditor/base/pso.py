@@ -7,12 +7,15 @@ Particle Swarm Optimization (PSO).
 This module provides a small OO PSO core with:
 - Particle state and updates
 - Swarm-level best tracking
+- Optional surrogate pre-screening of particles (RBF or local quadratic model)
+- Array-backed iteration history and checkpoint/resume of a run
 - A convenience `pso` loop function
 
 """
 
 from __future__ import annotations
 
+import json
 from dataclasses            import dataclass, replace
 from termcolor              import colored
 
@@ -55,7 +58,10 @@ class Pso_Options:
 				 min_iter: int = 20,
 				 min_radius_best: float | None = 0.0001,
 				 bound_mode: str = "reflect",
-				 seed: int | None = 100):
+				 seed: int | None = 100,
+				 surrogate: str | None = None,
+				 surrogate_share: float = 0.3,
+				 surrogate_warmup: int = 3):
 
 		self._pop_size = pop_size
 		self._initial_perturb = initial_perturb
@@ -69,6 +75,9 @@ class Pso_Options:
 		self._min_radius_best = min_radius_best
 		self._bound_mode = bound_mode
 		self._seed = seed
+		self._surrogate = surrogate                     # None, "rbf" or "quadratic"
+		self._surrogate_share = surrogate_share         # share of particles evaluated with the true objective
+		self._surrogate_warmup = surrogate_warmup       # iterations with full evaluation before pre-screening
 
 	@property
 	def pop_size(self) -> int | None:
@@ -198,6 +207,43 @@ class Pso_Options:
 				raise ValueError("seed must be >= 0 or None")
 			self._seed = value
 
+	@property
+	def surrogate(self) -> str | None:
+		return self._surrogate
+
+	def set_surrogate(self, value: str | None):
+		if value not in (None, "rbf", "quadratic"):
+			raise ValueError("surrogate must be None, 'rbf' or 'quadratic'")
+		self._surrogate = value
+
+	@property
+	def surrogate_share(self) -> float:
+		return self._surrogate_share
+
+	def set_surrogate_share(self, value: float):
+		value = float(value)
+		if value <= 0.0 or value > 1.0:
+			raise ValueError("surrogate_share must be in (0, 1]")
+		self._surrogate_share = value
+
+	@property
+	def surrogate_warmup(self) -> int:
+		return self._surrogate_warmup
+
+	def set_surrogate_warmup(self, value: int):
+		value = int(value)
+		if value < 1:
+			raise ValueError("surrogate_warmup must be >= 1")
+		self._surrogate_warmup = value
+
+	@property
+	def surrogate_ui(self) -> str:
+		"""UI helper: show disabled surrogate as 'off'."""
+		return self.surrogate if self.surrogate is not None else "off"
+
+	def set_surrogate_ui(self, value: str):
+		self.set_surrogate(None if value == "off" else value)
+
 	@property
 	def seed_ui(self) -> int:
 		"""UI helper: show random seed mode as -1."""
@@ -226,6 +272,9 @@ class Iteration_Result:
 	r_centroid: float
 	r_best: float
 	inertia: float
+	n_evals: int = 0                          # true objective evaluations in this iteration
+	surrogate_error: float | None = None      # median relative error of surrogate predictions
+	surrogate_rank: float | None = None       # rank correlation surrogate vs. true objective
 
 
 
@@ -240,6 +289,165 @@ class Design_Score:
 
 
 
+class Pso_History:
+	"""
+	Array-backed history of a PSO run - one row per iteration in preallocated arrays.
+	Behaves like a read-only list of Iteration_Result which are created on access.
+	"""
+
+	_SCALARS = ("iteration", "score", "particle_id", "best_iteration", "r_centroid", "r_best",
+				"inertia", "n_evals", "surrogate_error", "surrogate_rank")
+
+	def __init__(self, dim: int, capacity: int = 100):
+		self._dim = int(dim)
+		self._n = 0
+		self._alloc(max(1, int(capacity)))
+
+	def _alloc(self, capacity: int):
+		"""(re)allocate arrays for capacity rows keeping existing rows"""
+		old = getattr(self, "_data", None)
+		self._data = {name: np.full(capacity, np.nan) for name in self._SCALARS}
+		self._data["position"] = np.full((capacity, self._dim), np.nan)
+		if old is not None:
+			for name, values in old.items():
+				self._data[name][:self._n] = values[:self._n]
+
+	def __len__(self) -> int:
+		return self._n
+
+	def __getitem__(self, index: int) -> Iteration_Result:
+		if isinstance(index, slice):
+			return [self[i] for i in range(*index.indices(self._n))]
+		if index < 0:
+			index += self._n
+		if not 0 <= index < self._n:
+			raise IndexError("Pso_History index out of range")
+
+		d = self._data
+		optional = lambda v: None if np.isnan(v) else float(v)
+		best = Design_Score(d["position"][index].copy(), float(d["score"][index]),
+							int(d["particle_id"][index]), int(d["best_iteration"][index]))
+		return Iteration_Result(iteration=int(d["iteration"][index]), best=best,
+								r_centroid=float(d["r_centroid"][index]), r_best=float(d["r_best"][index]),
+								inertia=float(d["inertia"][index]), n_evals=int(d["n_evals"][index]),
+								surrogate_error=optional(d["surrogate_error"][index]),
+								surrogate_rank=optional(d["surrogate_rank"][index]))
+
+	def __iter__(self):
+		return (self[i] for i in range(self._n))
+
+	def append(self, result: Iteration_Result):
+		"""store result in the next row - grows arrays if needed"""
+		if self._n >= len(self._data["iteration"]):
+			self._alloc(2 * len(self._data["iteration"]))
+
+		d, i = self._data, self._n
+		for name, value in (("iteration", result.iteration), ("score", result.best.score),
+							("particle_id", result.best.particle_id), ("best_iteration", result.best.iteration),
+							("r_centroid", result.r_centroid), ("r_best", result.r_best),
+							("inertia", result.inertia), ("n_evals", result.n_evals),
+							("surrogate_error", result.surrogate_error), ("surrogate_rank", result.surrogate_rank)):
+			d[name][i] = np.nan if value is None else value
+		d["position"][i] = result.best.position
+		self._n += 1
+
+	def array(self, name: str) -> np.ndarray:
+		"""column 'name' of all stored iterations, e.g. 'score' or 'position'"""
+		return self._data[name][:self._n]
+
+	def state(self) -> dict[str, np.ndarray]:
+		"""arrays of all stored iterations for a checkpoint"""
+		return {name: values[:self._n].copy() for name, values in self._data.items()}
+
+	def set_state(self, state: dict[str, np.ndarray]):
+		"""restore from arrays of state()"""
+		self._data = None
+		self._alloc(max(1, len(state["iteration"])))
+		self._n = len(state["iteration"])
+		for name in self._data:
+			self._data[name][:self._n] = state[name]
+
+
+
+class Surrogate:
+	"""Cheap model of the objective fitted on the evaluation history - ranks candidate positions."""
+
+	def __init__(self, span: np.ndarray):
+		self._span = np.maximum(np.asarray(span, dtype=float), 1e-12)   # normalize design space
+		self._X = np.empty((0, len(self._span)))
+		self._y = np.empty(0)
+
+	@staticmethod
+	def create(kind: str, span: np.ndarray) -> "Surrogate":
+		"""Surrogate of kind 'rbf' or 'quadratic'"""
+		if kind == "rbf":
+			return Surrogate_RBF(span)
+		elif kind == "quadratic":
+			return Surrogate_Quadratic(span)
+		raise ValueError(f"unknown surrogate '{kind}'")
+
+	def fit(self, X: np.ndarray, y: np.ndarray):
+		"""Fit model on positions X (n, dim) with objective values y (n)."""
+		self._X = np.asarray(X, dtype=float) / self._span
+		self._y = np.asarray(y, dtype=float)
+
+	def predict(self, X: np.ndarray) -> np.ndarray:
+		"""Predicted objective values at positions X (n, dim)."""
+		raise NotImplementedError
+
+
+class Surrogate_RBF(Surrogate):
+	"""Cubic radial basis function interpolation with a linear tail."""
+
+	def fit(self, X: np.ndarray, y: np.ndarray):
+		super().fit(X, y)
+		n, dim = self._X.shape
+
+		phi = self._cubic(self._X, self._X)
+		P   = np.hstack((np.ones((n, 1)), self._X))
+		A   = np.zeros((n + dim + 1, n + dim + 1))
+		A[:n, :n] = phi + 1e-12 * np.eye(n)
+		A[:n, n:] = P
+		A[n:, :n] = P.T
+		rhs = np.concatenate((self._y, np.zeros(dim + 1)))
+
+		try:
+			coef = np.linalg.solve(A, rhs)
+		except np.linalg.LinAlgError:
+			coef = np.linalg.lstsq(A, rhs, rcond=None)[0]
+		self._weights, self._tail = coef[:n], coef[n:]
+
+	@staticmethod
+	def _cubic(X1: np.ndarray, X2: np.ndarray) -> np.ndarray:
+		r = np.linalg.norm(X1[:, None, :] - X2[None, :, :], axis=2)
+		return r * r * r
+
+	def predict(self, X: np.ndarray) -> np.ndarray:
+		Xn = np.asarray(X, dtype=float) / self._span
+		return self._cubic(Xn, self._X) @ self._weights + self._tail[0] + Xn @ self._tail[1:]
+
+
+class Surrogate_Quadratic(Surrogate):
+	"""Local quadratic model (diagonal Hessian) fitted on the nearest neighbours of each position."""
+
+	def predict(self, X: np.ndarray) -> np.ndarray:
+		Xn = np.asarray(X, dtype=float) / self._span
+		n, dim = self._X.shape
+		k = min(n, 3 * (2 * dim + 1))                                  # neighbours for 2*dim+1 coefficients
+
+		y_pred = np.empty(len(Xn))
+		for i, x in enumerate(Xn):
+			dist = np.linalg.norm(self._X - x, axis=1)
+			near = np.argsort(dist)[:k]
+			dx   = self._X[near] - x
+			M    = np.hstack((np.ones((k, 1)), dx, dx * dx))
+			w    = 1.0 / (dist[near] + 1e-12)                           # closer points weigh more
+			coef = np.linalg.lstsq(M * w[:, None], self._y[near] * w, rcond=None)[0]
+			y_pred[i] = coef[0]                                         # model value at dx = 0
+		return y_pred
+
+
+
 class Particle:
 	"""Represents one PSO particle."""
 
@@ -361,7 +569,12 @@ class Swarm:
 		self._iteration = 0
 		self._r_centroid = 0.0            # design radius around the current population centroid
 		self._r_best = 0.0                # design radius around the current best particle position
-		self._history: list[Iteration_Result] = []
+		self._history = Pso_History(self._dim, capacity=options.max_iter)
+
+		# archive of true evaluations for the surrogate 
+		self._archive_X: list[np.ndarray] = []
+		self._archive_y: list[float] = []
+		self._surrogate = Surrogate.create(options.surrogate, self._span) if options.surrogate else None
 
 
 
@@ -393,10 +606,58 @@ class Swarm:
 
 
 	@property
-	def history(self) -> list[Iteration_Result]:
+	def history(self) -> Pso_History:
 		return self._history
 
 
+	def state(self) -> dict:
+		"""complete state of the swarm - positions, velocities, personal and global best, history"""
+		particles = self._particles
+		state = {
+			"positions":       np.array([p.position for p in particles]),
+			"velocities":      np.array([p.velocity for p in particles]),
+			"scores":          np.array([p.score for p in particles]),
+			"best_positions":  np.array([p.best_position for p in particles]),
+			"best_scores":     np.array([p.best_score for p in particles]),
+			"best_iterations": np.array([p.best.iteration for p in particles]),
+			"global_position": self._global_best.position.copy(),
+			"global_score":    self._global_best.score,
+			"global_particle": self._global_best.particle_id,
+			"global_iteration": self._global_best.iteration,
+			"iteration":       self._iteration,
+			"r_centroid":      self._r_centroid,
+			"r_best":          self._r_best,
+			"archive_X":       np.array(self._archive_X).reshape(-1, self._dim),
+			"archive_y":       np.array(self._archive_y),
+		}
+		state.update({f"history_{name}": values for name, values in self._history.state().items()})
+		return state
+
+
+	def set_state(self, state: dict):
+		"""restore swarm from state()"""
+		positions = np.asarray(state["positions"], dtype=float)
+		if positions.shape != (self._pop_size, self._dim):
+			raise ValueError(f"swarm state of shape {positions.shape} doesn't fit swarm ({self._pop_size}, {self._dim})")
+
+		for i, particle in enumerate(self._particles):
+			particle._position = positions[i].copy()
+			particle._velocity = np.array(state["velocities"][i], dtype=float)
+			particle._score = float(state["scores"][i])
+			particle._best = Design_Score(np.array(state["best_positions"][i], dtype=float),
+										  float(state["best_scores"][i]), i, int(state["best_iterations"][i]))
+
+		self._global_best = Design_Score(np.array(state["global_position"], dtype=float), float(state["global_score"]),
+										 int(state["global_particle"]), int(state["global_iteration"]))
+		self._iteration = int(state["iteration"])
+		self._r_centroid = float(state["r_centroid"])
+		self._r_best = float(state["r_best"])
+		self._archive_X = list(np.asarray(state["archive_X"], dtype=float))
+		self._archive_y = list(np.asarray(state["archive_y"], dtype=float))
+		self._history.set_state({name[len("history_"):]: values for name, values in state.items()
+								 if name.startswith("history_")})
+
+
 
 	def _init_particles(self, x_start: np.ndarray) -> list[Particle]:
 		"""Initialize particles from start point plus random swarm spread."""
@@ -417,23 +678,76 @@ class Swarm:
 		return particles
     
 
+	SURROGATE_HISTORY = 300               # max. recent true evaluations the surrogate is fitted on
+
+
+	def _select_by_surrogate(self) -> tuple[list[Particle], np.ndarray | None]:
+		"""
+		Rank particles with the surrogate - return the promising subset to be evaluated 
+		with the true objective and the predictions of all particles (None if inactive).
+		"""
+		if (self._surrogate is None or self._iteration < self._options.surrogate_warmup
+				or len(self._archive_y) <= self._dim + 1):
+			return self._particles, None
+
+		y_arch = np.array(self._archive_y[-self.SURROGATE_HISTORY:])
+		X_arch = np.array(self._archive_X[-self.SURROGATE_HISTORY:])
+		self._surrogate.fit(X_arch, y_arch)
+
+		positions = np.array([particle.position for particle in self._particles])
+		predicted = self._surrogate.predict(positions)
+
+		# promising: predicted to improve the personal best - the most promising first 
+		gain   = predicted - np.array([particle.best_score for particle in self._particles])
+		n_true = max(1, int(np.ceil(self._options.surrogate_share * len(self._particles))))
+		ranked = [i for i in np.argsort(gain)[:n_true] if gain[i] < 0.0] or [int(np.argmin(predicted))]
+		return [self._particles[i] for i in sorted(ranked)], predicted
+
+
+	@staticmethod
+	def _surrogate_accuracy(predicted: np.ndarray, true: np.ndarray) -> tuple[float, float]:
+		"""median relative error and rank correlation of predicted vs. true scores"""
+		error = float(np.median(np.abs(predicted - true) / np.maximum(np.abs(true), 1e-12)))
+		if len(true) < 3:
+			return error, float("nan")
+		rank_pred = np.argsort(np.argsort(predicted))
+		rank_true = np.argsort(np.argsort(true))
+		rank = float(np.corrcoef(rank_pred, rank_true)[0, 1]) if np.std(rank_true) > 0 else float("nan")
+		return error, rank
+
+
 	def evaluate(self, inertia: float):
-		"""Evaluate all particles and update global-best state."""
+		"""Evaluate all (or the promising) particles and update global-best state."""
 		
-		for particle in self._particles:
-			particle.evaluate(self._objective, self._iteration)
+		to_evaluate, predicted = self._select_by_surrogate()
+
+		for particle in to_evaluate:
+			score = particle.evaluate(self._objective, self._iteration)
+
+			if self._surrogate is not None and np.isfinite(score):
+				self._archive_X.append(particle.position.copy())
+				self._archive_y.append(score)
 
 			if particle.best_score < self._global_best.score:
 				self._global_best = replace(particle.best)
 
 		self._update_design_radius()
 
+		surrogate_error, surrogate_rank = None, None
+		if predicted is not None:
+			ids  = [particle.particle_id for particle in to_evaluate]
+			true = np.array([particle.score for particle in to_evaluate])
+			surrogate_error, surrogate_rank = self._surrogate_accuracy(predicted[ids], true)
+
 		result = Iteration_Result(
 			iteration=self._iteration,
 			best=replace(self._global_best),
 			r_centroid=self._r_centroid,
 			r_best=self._r_best,
 			inertia=float(inertia),
+			n_evals=len(to_evaluate),
+			surrogate_error=surrogate_error,
+			surrogate_rank=surrogate_rank,
 		)
 		self._history.append(result)
 		self._log_iteration_status(result)
@@ -471,7 +785,9 @@ class Swarm:
 			f"p:{particle_status}  "
 			f"{colored(f'r_centr:{result.r_centroid:.3e} ', 'white', attrs=['dark'])}"
 			f"{colored(f'r_best:{result.r_best:.3e}  ', 'white', attrs=['dark'])}"
-			f"{colored(f'obj:', 'white', attrs=['dark'])}" + obj_str
+			f"{colored(f'obj:', 'white', attrs=['dark'])}" + obj_str +
+			(colored(f"  surr_err:{result.surrogate_error:.2f} surr_rank:{result.surrogate_rank:.2f}", 'white', attrs=['dark'])
+				if result.surrogate_error is not None else "")
 		)
 
 
@@ -524,6 +840,7 @@ class Pso:
 		self._w_high = float(self._options.w_high)
 		self._w_low = float(self._options.w_low)
 		self._w_curr = float(self._w_high)
+		self._needs_step = False          # run was stopped after evaluation - step before next evaluation
 
 
 	@property
@@ -537,7 +854,7 @@ class Pso:
 
 
 	@property
-	def history(self) -> list[Iteration_Result]:
+	def history(self) -> Pso_History:
 		return self._swarm.history
 
 
@@ -587,16 +904,28 @@ class Pso:
 
 
 	def run(self) -> "Pso":
-		"""Execute PSO loop and collect simple per-iteration history."""
+		"""Execute PSO loop and collect simple per-iteration history.
+
+		A run stopped by stop_callback can be continued by calling run() again
+		or, in another session, via checkpoint() and restore().
+		"""
 		
-		for _ in range(self._options.max_iter):
-			
+		while self._swarm.iteration < self._options.max_iter:
+
+			if self._needs_step:
+				# continue a stopped run - current positions are already evaluated
+				self._swarm.step(inertia=self._w_curr)
+				self._reduce_inertia()
+				self._needs_step = False
+				continue
+
 			self._swarm.evaluate(self._w_curr)
 
 			if self._swarm.iteration >= self._options.min_iter and self._radius_converged():
 				break
 
 			if self._stop_callback and self._stop_callback():
+				self._needs_step = True
 				break
 
 			self._swarm.step(inertia=self._w_curr)
@@ -605,6 +934,38 @@ class Pso:
 		return self
 
 
+	# ---- checkpoint / resume
+
+	def checkpoint(self) -> dict:
+		"""State of the run - swarm, inertia and random generator - to be restored later."""
+		state = self._swarm.state()
+		state["w_curr"] = self._w_curr
+		state["needs_step"] = self._needs_step
+		state["rng_state"] = json.dumps(self._rng.bit_generator.state)
+		return state
+
+
+	def restore(self, checkpoint: dict):
+		"""Restore the run from a checkpoint() - continue with run()."""
+		self._swarm.set_state(checkpoint)
+		self._w_curr = float(checkpoint["w_curr"])
+		self._needs_step = bool(checkpoint["needs_step"])
+		self._rng.bit_generator.state = json.loads(str(checkpoint["rng_state"]))
+
+
+	def save_checkpoint(self, pathFileName: str):
+		"""Write checkpoint() to a numpy .npz file."""
+		with open(pathFileName, "wb") as f:
+			np.savez_compressed(f, **self.checkpoint())
+
+
+	@staticmethod
+	def load_checkpoint(pathFileName: str) -> dict:
+		"""Read a checkpoint written with save_checkpoint()."""
+		with np.load(pathFileName, allow_pickle=False) as data:
+			return {name: data[name] for name in data.files}
+
+
 def pso  (objective: Callable[[np.ndarray], float],
 		  x_start: np.ndarray | list[float],
 		  *,
@@ -10,9 +10,9 @@ import bisect
 import math
 import numpy as np
 from numpy.typing import ArrayLike, NDArray
-from timeit                 import default_timer as timer
 
 from .math_util             import findMin, newton, binary_search, interpolate_non_monotonic
+from .                      import instrument
 
 import logging
 logger = logging.getLogger(__name__)
@@ -129,6 +129,7 @@ class Spline1D:
     """Cubic 1D Spline"""
 
 
+    @instrument.timed ("spline.spline1d.build")
     def __init__ (self, x, y, boundary="notaknot", arccos=False):
         """
         Build cubic spline based on x,y. x must be strongly ascending.
@@ -423,6 +424,7 @@ class Spline1D:
 class Spline2D: 
     """Cubic 2D Spline"""
 
+    @instrument.timed ("spline.spline2d.build")
     def __init__ (self, x, y, boundary="notaknot"):
         """
         Build cubic 2D spline based on x,y. 
@@ -875,6 +877,24 @@ class Bezier:
         return self._eval_1D (self._cpy, u, der=der)
 
 
+    def basis_matrix (self, u) -> np.ndarray:
+        """
+        Bernstein basis values of all control points at u.
+
+        As the curve is linear in its control points, ``basis_matrix(u) @ cpy``
+        equals ``eval_y(u)`` - the matrix is the Jacobian of y(u) w.r.t. the
+        control point coordinates.
+
+        Args:
+            u: Scalar or array of parameter values in ``[0, 1]``.
+
+        Returns:
+            np.ndarray: Basis matrix with shape ``(len(u), ncp)``.
+        """
+
+        return bernstein_basis (self.degree, np.atleast_1d(np.asarray(u, dtype=float))).T
+
+
     def eval_u_on_x(self, x, fast=True, epsilon=10e-10):
         """Evaluate curve parameter u for a given x coordinate.
 
@@ -1047,6 +1067,7 @@ class Bezier:
     # -------------  end public --------------------
 
 
+    @instrument.timed ("spline.bezier.eval")
     def _eval_1D (self, pxy, u, der=0):
         #
         #                    Bezier Core
@@ -1075,8 +1096,6 @@ class Bezier:
 
         # http://math.aalto.fi/~ahniemi/hss2012/Notes06.pdf
 
-        start = timer()
-
         n = np.size(pxy) - 1                            # n - degree of Bezier 
         weights = np.asarray(pxy, dtype=float).copy()   # der = 0: weights = points 
         if der > 0:                                     
@@ -1091,9 +1110,6 @@ class Bezier:
 
         bezier = bernstein_eval(weights, u_eval)
 
-        n = len(u) if not np.isscalar(u) else 1
-        logger.debug(f"Bezier eval 1D: nu={n}, der={der}, time={timer() - start:.6f}s")
-
         if is_scalar:
             return float(bezier[0])
         return bezier
@@ -1139,6 +1155,71 @@ class HicksHenne:
         return self._width 
 
 
+    @staticmethod
+    def as_array (hhs : list['HicksHenne']) -> np.ndarray:
+        """ array (n,3) of strength, location, width of hicks henne functions"""
+        return np.array ([(hh.strength, hh.location, hh.width) for hh in hhs], dtype=float).reshape (-1, 3)
+
+
+    @staticmethod
+    @instrument.timed ("spline.hicks_henne.eval_sum")
+    def eval_sum (x, hh_array : np.ndarray) -> np.ndarray:
+        """
+        Sum of hicks henne functions evaluated in one broadcast over x
+
+        Parameters
+        ----------
+        x :        array of x 0..1 
+        hh_array : array (..., n, 3) of strength, location, width - e.g. (n,3) functions of a side
+                     or (ndesigns, n, 3) functions of many designs - zero strength for padding 
+
+        Returns
+        -------
+        y : array (..., nx) of summed y values 
+        """
+
+        x  = np.asarray (x, dtype=float)
+        hh_array = np.asarray (hh_array, dtype=float)
+
+        st = hh_array [..., 0:1]                                # (..., n, 1) broadcasts against x
+        t1 = np.clip   (hh_array [..., 1:2], 0.001, 0.999)
+        t2 = np.maximum (hh_array [..., 2:3], 0.01)
+        power = math.log10 (0.5) / np.log10 (t1)
+
+        # Fortran: y(i) = st * sin (pi * x(i) **power)**t2 - each function rounded like 'eval'
+
+        y = st * np.power (np.sin (math.pi * np.power (x, power)), t2)
+        y = np.round (y, 10)
+
+        return y.sum (axis=-2)
+
+
+    @staticmethod
+    def eval_sum_designs (x, hh_arrays : list[np.ndarray], chunk_size : int = 256) -> np.ndarray:
+        """
+        Summed hicks henne functions of many designs - array (ndesigns, nx) 
+
+        Parameters
+        ----------
+        x :         array of x 0..1 
+        hh_arrays : list of arrays (n,3) of each design - n may differ 
+        chunk_size: designs per broadcast to limit memory 
+        """
+
+        x = np.asarray (x, dtype=float)
+        n_max = max ((len(a) for a in hh_arrays), default=0)
+        y = np.zeros ((len(hh_arrays), x.size))
+        if n_max == 0: return y
+
+        padded = np.zeros ((len(hh_arrays), n_max, 3))          # zero strength adds nothing 
+        padded [..., 1:] = 0.5
+        for i, a in enumerate (hh_arrays):
+            padded [i, :len(a)] = a
+
+        for start in range (0, len(hh_arrays), chunk_size):
+            y [start:start+chunk_size] = HicksHenne.eval_sum (x, padded [start:start+chunk_size])
+        return y
+
 
     def eval (self, x):
         """
@@ -1873,6 +1954,7 @@ class BSpline:
         self.set_cpoints(new_cpx, new_cpy)
 
 
+    @instrument.timed ("spline.bspline.eval")
     def _eval_polynomials (self,u, der=0):
         """
         Evaluate the cached span polynomials or their derivatives.
@@ -1884,7 +1966,6 @@ class BSpline:
         Returns:
             tuple[np.ndarray | float, np.ndarray | float]: x and y values for ``u``.
         """
-        start = timer()
 
         scalar_input = np.isscalar(u)
         u = np.atleast_1d(np.asarray(u, dtype=float))
@@ -1935,8 +2016,7 @@ class BSpline:
             y /= dt * dt
         else:
             raise ValueError("der must be 0, 1, or 2")
-        
-        logger.debug(f"B-Spline eval: der={der}, nu={len(u):3},  time={timer() - start:.6f}s")
+
 
         # Only round position values (der=0), not derivatives - rounding derivatives
         # causes numerical issues for Newton iteration on nearly flat curves
@@ -1992,6 +2072,48 @@ class BSpline:
         return x, y
 
 
+    def basis_matrix (self, u) -> np.ndarray:
+        """
+        B-spline basis values of all control points at u.
+
+        As the curve is linear in its control points, ``basis_matrix(u) @ cpy``
+        equals ``eval_y(u)`` - the matrix is the Jacobian of y(u) w.r.t. the
+        control point coordinates. Uses the cached basis polynomials of the knot spans.
+
+        Args:
+            u: Scalar or array of parameter values in ``[0, 1]``.
+
+        Returns:
+            np.ndarray: Basis matrix with shape ``(len(u), ncp)``.
+        """
+
+        u = np.atleast_1d(np.asarray(u, dtype=float))
+        knots          = self._knots
+        segment_starts = self._seg_starts
+        basis          = np.zeros((len(u), self.ncp))
+
+        if len(segment_starts) == 0:
+            return basis
+
+        # map u to knot span and local tau like in _eval_polynomials
+        segment_index = np.sum(knots[segment_starts] <= u[:, None], axis=1) - 1
+        segment_index = np.clip(segment_index, 0, len(segment_starts) - 1)
+        seg = segment_starts[segment_index]
+
+        t0  = knots[seg]
+        dt  = knots[np.clip(seg + 1, 0, len(knots) - 1)] - t0
+        tau = np.clip(np.where(dt > 0, (u - t0) / dt, 0.0), 0.0, 1.0)
+
+        powers = tau[:, None] ** np.arange(self.degree, -1, -1)        # descending powers
+
+        for s in np.unique(seg):
+            active_indices, basis_coeffs = self._basis_cache[s]
+            rows = np.nonzero(seg == s)[0]
+            basis[np.ix_(rows, active_indices)] = powers[rows] @ basis_coeffs.T
+
+        return basis
+
+
     def eval_y_on_x (self, x, u0=None, epsilon=10e-10, fast=False):
         """
         Evaluate ``y`` for a given x coordinate on the spline.
@@ -2105,6 +2227,7 @@ class BSpline:
 
 
     @classmethod
+    @instrument.timed ("spline.bspline.fit")
     def fit_curve (cls, x_data, y_data, degree=3, ncp=10,
                    le_tangent_vertical=True, le_exponent=0.5, te_exponent=1.0) -> list[tuple]:
         """
@@ -2130,8 +2253,6 @@ class BSpline:
         # to avoid numerical issues of parameterization and fitting
         epsilon = 1e-4
 
-        start = timer()
-
         mask = np.ones_like(x_data, dtype=bool)
         for i in range(1,len(x_data)-1):
             if abs(x_data[i]) < epsilon or abs(y_data[i]) < epsilon:
@@ -2201,9 +2322,5 @@ class BSpline:
         if N_free_y.shape[1] >= 2:
             rhs_y = y_m - N_fixed_y @ np.array([y_le, y_te])
             y_cp[1:-1] = np.linalg.lstsq(N_free_y, rhs_y, rcond=None)[0]
-        
 
-        logger.debug(f"Fitting B-Spline: degree={degree}, ncp={ncp}, "
-                     f"le_exp={le_exponent}, te_exp={te_exponent}, time={timer() - start:.6f}s")
-        
         return list(zip(x_cp, y_cp))
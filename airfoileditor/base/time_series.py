@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+    Time series store with decimation for plotting
+
+    Values are appended incrementally into growing numpy buffers and kept
+    in full resolution. For plotting a series is decimated to about the pixel
+    width of the plot - either for the complete series or a zoomed x range.
+
+        series = Time_Series ()
+        series.append (step, value)                         # e.g. while tailing a result file
+        x, y = series.decimated (n_out=800)                 # min/max per pixel bucket
+        x, y = series.decimated (n_out=800, x_range=(1000, 1200), method='lttb')
+
+    No dependencies from other modules.
+"""
+
+import numpy as np
+
+import logging
+logger = logging.getLogger(__name__)
+# logger.setLevel(logging.WARNING)
+
+
+METHOD_MINMAX   = 'minmax'                          # min and max of each bucket - keeps peaks
+METHOD_LTTB     = 'lttb'                            # largest triangle three buckets - keeps shape
+
+
+#------------ decimation -----------------------------------
+
+
+def decimate_minmax (x : np.ndarray, y : np.ndarray, n_out : int) -> tuple [np.ndarray, np.ndarray]:
+    """
+    Decimate x,y to about n_out points taking min and max of n_out/2 buckets
+
+    First and last point are always kept, the points remain in x order.
+    """
+
+    n = len (x)
+    n_buckets = max (n_out // 2, 1)
+    if n <= max (n_out, 2):
+        return x, y
+
+    size  = n // n_buckets                          # points per bucket - rest goes to last bucket
+    n_reg = size * n_buckets
+
+    buckets = y [:n_reg].reshape (n_buckets, size)
+    offset  = np.arange (n_buckets) * size
+    indexes = [offset + np.argmin (buckets, axis=1),
+               offset + np.argmax (buckets, axis=1),
+               [0, n - 1]]
+    if n_reg < n:
+        indexes.append ([n_reg + np.argmin (y [n_reg:]), n_reg + np.argmax (y [n_reg:])])
+
+    indexes = np.unique (np.concatenate (indexes))  # sorted - min and max could be the same
+    return x [indexes], y [indexes]
+
+
+def decimate_lttb (x : np.ndarray, y : np.ndarray, n_out : int) -> tuple [np.ndarray, np.ndarray]:
+    """
+    Decimate x,y to n_out points with 'Largest Triangle Three Buckets' (Steinarsson)
+
+    First and last point are always kept. Each bucket in between contributes the
+    point spanning the largest triangle with the last selected point and the
+    average of the next bucket.
+    """
+
+    n = len (x)
+    if n <= max (n_out, 3):
+        return x, y
+
+    edges = np.linspace (1, n - 1, n_out - 1).astype (int)     # n_out-2 buckets between first and last
+
+    indexes = np.empty (n_out, dtype=int)
+    indexes [0]  = 0
+    indexes [-1] = n - 1
+
+    a = 0
+    for i in range (n_out - 2):
+
+        start, end = edges [i], edges [i + 1]
+        next_start = end
+        next_end   = edges [i + 2] if i + 2 < len (edges) else n
+        x_avg = x [next_start:next_end].mean ()
+        y_avg = y [next_start:next_end].mean ()
+
+        xb, yb = x [start:end], y [start:end]
+        area = np.abs ((x [a] - x_avg) * (yb - y [a]) - (x [a] - xb) * (y_avg - y [a]))
+
+        a = start + int (np.argmax (area))
+        indexes [i + 1] = a
+
+    return x [indexes], y [indexes]
+
+
+
+#------------ Time_Series -----------------------------------
+
+
+class Time_Series:
+    """
+    Growing x,y series in full resolution which can be decimated for plotting
+    """
+
+    CAPACITY_MIN = 256
+
+    def __init__ (self, name : str = ''):
+
+        self._name = name
+        self._x = np.empty (self.CAPACITY_MIN)
+        self._y = np.empty (self.CAPACITY_MIN)
+        self._n = 0
+
+        self._decimated_key = None                  # last decimation request and its result
+        self._decimated     = None
+
+
+    def __repr__(self) -> str:
+        """ nice representation of self """
+        return f"<{type(self).__name__} {self._name} n={self._n}>"
+
+    def __len__ (self) -> int:
+        return self._n
+
+
+    @property
+    def name (self) -> str:
+        return self._name
+
+    @property
+    def x (self) -> np.ndarray:
+        """ x values in full resolution (view - not a copy)"""
+        return self._x [:self._n]
+
+    @property
+    def y (self) -> np.ndarray:
+        """ y values in full resolution (view - not a copy)"""
+        return self._y [:self._n]
+
+    @property
+    def last (self) -> tuple [float, float] | None:
+        """ last x,y of self"""
+        return (self._x [self._n-1], self._y [self._n-1]) if self._n else None
+
+
+    def append (self, x : float, y : float):
+        """ append a single x,y value"""
+
+        self._ensure_capacity (self._n + 1)
+        self._x [self._n] = x
+        self._y [self._n] = y
+        self._n += 1
+
+
+    def extend (self, x, y):
+        """ append arrays of x,y values """
+
+        x = np.asarray (x, dtype=float).ravel()
+        y = np.asarray (y, dtype=float).ravel()
+        if len (x) != len (y):
+            raise ValueError (f"{self} x and y differ in length: {len (x)} {len (y)}")
+
+        self._ensure_capacity (self._n + len (x))
+        self._x [self._n : self._n + len (x)] = x
+        self._y [self._n : self._n + len (x)] = y
+        self._n += len (x)
+
+
+    def clear (self):
+        """ remove all values"""
+        self._n = 0
+        self._decimated_key = None
+
+
+    def decimated (self, n_out : int,
+                   x_range : tuple [float, float] | None = None,
+                   method : str = METHOD_MINMAX) -> tuple [np.ndarray, np.ndarray]:
+        """
+        x,y decimated to about n_out points
+
+        Args:
+            n_out: number of points wanted - typically the pixel width of the plot
+            x_range: optional (x_min, x_max) of a zoomed view - the neighbour point
+                outside the range on each side is included for a continuous line
+            method: METHOD_MINMAX or METHOD_LTTB
+        """
+
+        key = (self._n, n_out, x_range, method)
+        if key == self._decimated_key:
+            return self._decimated
+
+        x, y = self.x, self.y
+
+        if x_range is not None and self._n:
+            i_from = max (np.searchsorted (x, x_range[0], side='left') - 1, 0)      # x is increasing
+            i_to   = min (np.searchsorted (x, x_range[1], side='right') + 1, self._n)
+            x, y = x [i_from:i_to], y [i_from:i_to]
+
+        if method == METHOD_LTTB:
+            x, y = decimate_lttb (x, y, n_out)
+        elif method == METHOD_MINMAX:
+            x, y = decimate_minmax (x, y, n_out)
+        else:
+            raise ValueError (f"{self} unknown decimation method '{method}'")
+
+        self._decimated_key = key
+        self._decimated     = (x, y)
+        return x, y
+
+
+    def _ensure_capacity (self, n : int):
+        """ grow buffers by doubling if n values don't fit """
+
+        capacity = len (self._x)
+        if n <= capacity: return
+
+        while capacity < n:
+            capacity *= 2
+        self._x = np.concatenate ((self._x [:self._n], np.empty (capacity - self._n)))
+        self._y = np.concatenate ((self._y [:self._n], np.empty (capacity - self._n)))
@@ -8,16 +8,22 @@
     Bezier or B-Spline curves to target lines.
 """
 
+import os
+import copy
+import functools
+import json
 import numpy as np
+from dataclasses                    import dataclass
 from timeit                         import default_timer as timer
 from typing                         import Type, override
 
 from PyQt6.QtCore                   import QThread, pyqtSignal, QEventLoop
 
-from .base.math_util                import nelder_mead, derivative1, interpolate, differential_evolution
+from .base.math_util                import nelder_mead, nelder_mead_multistart, levenberg_marquardt, derivative1, interpolate, differential_evolution
 from .base.pso                      import Pso
 from .base.spline                   import Bezier
 from .base.widgets                  import style 
+from .base                          import instrument
 from .model.airfoil                 import Airfoil, Airfoil_Bezier, Airfoil_BSpline
 from .model.geometry                import Line
 from .model.geometry_spline         import Geometry_Splined
@@ -31,13 +37,169 @@ logger = logging.getLogger(__name__)
 
 #--------------------
 
+@dataclass
+class Match_Progress:
+    """Compact snapshot of a running match - signaled by the Matcher at most PROGRESS_RATE per second"""
+
+    ipass       : int
+    nevals      : int
+    cpoints     : np.ndarray                        # copy of the current control points
+    rms         : float
+    objective   : float | None = None
+    knots       : np.ndarray | None = None          # copy of the knots - only B-Spline
+    degree      : int | None = None                 # degree - only B-Spline
+
+    @property
+    def ncp (self) -> int:
+        return len (self.cpoints)
+
+    def curve (self) -> Bezier | BSpline:
+        """ new curve of this snapshot - independent of the curve being matched"""
+        if self.knots is not None:
+            return BSpline (self.cpoints, degree=self.degree, knots=self.knots)
+        return Bezier (self.cpoints)
+
+    def result (self, side : Side_Airfoil_Curve, targets : Match_Targets) -> 'Match_Result':
+        """ 
+        Match_Result with all metrics for this snapshot. 
+        'side' should be a private copy of the matched side as its control points will be set.
+        """
+        side.set_cPoints (self.cpoints)
+        side.reset_target_deviation ()
+        return Match_Result (side, targets, rms=self.rms, objective=self.objective)
+
+
+#--------------------
+
+def _map_dv_to_curve (curve : Bezier | BSpline, vars : list, isLower : bool, le_curvature : float):
+    """Map optimization variables to the control points of curve - LE (cp0), cp1 and TE (cp-1) are fixed."""
+
+    sign   = -1 if isLower else 1                   # lower side: y is inverted in solution space
+    cp_x   = curve.cpoints_x
+    cp_y   = curve.cpoints_y
+    ncp    = len( cp_x )
+    ivar   = 0
+
+    for icp in range (2, ncp-1):                    # skip LE (0), cp1 (1) and TE (ncp-1)
+        cp_x[icp] = vars[ivar];  ivar += 1
+        cp_y[icp] = sign * vars[ivar];  ivar += 1
+
+    # cp_y[1] is determined analytically from target LE curvature and current cp_x[2]
+
+    cp_y[1] = sign * curve.cp_y1_from_curvature (le_curvature, cp_x[2], 
+                                                 degree=curve.degree, ncp=ncp)    # negative for lower side
+
+    curve.set_cpoints (cp_x, cp_y)
+
+
+def _objective_of (x : np.ndarray, curv : np.ndarray, obj_rms : float, 
+                   targets : Match_Targets) -> tuple [float, dict [str, float]]:
+    """ 
+    Objective of a curve shape - rms of deviation plus penalties
+
+    Returns:
+        objective, dict of the penalties {name: value}
+    """
+
+    penalties = {}
+
+    # -- le curvature is analytically enforced via cp_y[1] - but for low ncp it could be wrong
+
+    if targets.le_curvature is not None:
+        penalties['le_curv']    = Matcher._penalty_le_curv (curv[0], targets.le_curvature, threshold = 0.01, scale = 0.00001)
+
+    # -- le curvature should be monotonically decreasing in the leading-edge region 
+
+    if targets.le_monoton:
+        penalties['le_monoton'] = Matcher._penalty_le_curv_monoton (curv, scale=0.1) 
+
+    # -- te curvature limit
+
+    if targets.max_te_curvature is not None:
+        penalties['te_curv']    = Matcher._penalty_te_curv (curv[-1], targets.max_te_curvature, targets.max_nreversals,
+                                                            scale = 0.01)    
+
+    # -- penalty for curvature derivatives not being smooth to avoid bumps 
+
+    if targets.bump_control:
+        penalties['bumps']      = Matcher._penalty_bumpiness (x, curv, targets.max_nreversals, scale=0.001)
+
+    # -- penalty for curvature reversals
+
+    penalties['reversals']      = Matcher._penalty_reversals (x, curv, region = (0.1, 1.0),
+                                                              max_reversals = targets.max_nreversals, scale = 0.005) 
+
+    # objective function is sum of single objectives and penalties - should be as low as possible
+
+    return obj_rms + sum (penalties.values()), penalties
+
+
+
+@dataclass
+class Match_Spec:
+    """
+    Picklable spec of a side match - curve, panel distribution, target arrays and targets. 
+    Allows to evaluate the objective in a worker process without side and Qt objects.
+    """
+
+    isLower     : bool
+    cpoints     : np.ndarray                        # control points at start - define ncp
+    knots       : np.ndarray | None                 # knots - only B-Spline
+    degree      : int | None                        # degree - only B-Spline
+    u           : np.ndarray                        # panel distribution of side
+    u_dense     : np.ndarray                        # dense u of target deviation 
+    target_x    : np.ndarray
+    target_y    : np.ndarray
+    targets     : Match_Targets
+
+    def curve (self) -> Bezier | BSpline:
+        """ new curve of this spec"""
+        if self.knots is not None:
+            return BSpline (self.cpoints, degree=self.degree, knots=self.knots)
+        return Bezier (self.cpoints)
+
+
+def match_objective (variables : list, spec : Match_Spec) -> float:
+    """ 
+    Objective of a match for design variables - like Matcher with fast target deviation. 
+    Module level to be usable in a process pool.
+    """
+
+    curve = spec.curve ()
+    _map_dv_to_curve (curve, variables, spec.isLower, spec.targets.le_curvature)
+
+    x      = curve.eval (spec.u)[0]
+    curv   = curve.curvature (spec.u)
+    curv   = curv if spec.isLower else -curv                    # curve for upper side has to be negated
+
+    x_dense, y_dense = curve.eval (spec.u_dense)
+    dy      = np.interp (spec.target_x, x_dense, y_dense) - spec.target_y
+    obj_rms = np.sqrt (np.mean (dy ** 2))
+
+    return _objective_of (x, curv, obj_rms, spec.targets)[0]
+
+
+
 class Matcher (QThread):
     """Base worker thread for Bezier and B-spline airfoil matching."""
 
-    sig_new_results     = pyqtSignal(int, int, object)  # ipass, nevals, Match_Result
+    sig_progress        = pyqtSignal(object)            # Match_Progress
     sig_pass_start      = pyqtSignal (int, int, bool)   # ipass, new ncp
     sig_finished        = pyqtSignal(object)            # final Match_Result
 
+    PROGRESS_RATE       = 20                            # max progress signals per second 
+
+    WARM_START_SHRINK   = 0.5                           # simplex/swarm spread factor for a warm started pass
+
+    OBJECTIVE_GOOD      = 0.000040                      # objective good enough to stop ncp_auto search
+    NCP_DEVALUATION     = 1.05                          # devaluation per additional ncp to prefer simpler solutions
+
+    BUDGET_PROBE_SHARE  = 0.3                           # share of budget for the coarse probes of all ncp
+    BUDGET_FINALISTS    = 2                             # number of ncp getting the remaining budget
+
+    MEMO_SIZE           = 2000                          # max entries of objective memo cache per pass
+    MEMO_QUANTUM        = 1e-9                          # design vectors closer than this share a memo entry
+
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -48,6 +210,12 @@ class Matcher (QThread):
         self._ncp    = None
         self._nevals = 0
 
+        self._last_progress = 0.0                               # time of last progress signal
+
+        self._memo        = {}                                  # objective memo cache {quantized dv: objective}
+        self._memo_hits   = 0
+        self._memo_misses = 0
+
 
     def __del__(self):  
         try:
@@ -367,22 +535,7 @@ class Matcher (QThread):
     def _map_dv_to_curve (self, vars: list): 
         """Map optimization variables back to curve control points."""
 
-        sign   = -1 if self._side.isLower else 1         # lower side: y is inverted in solution space
-        cp_x   = self._curve.cpoints_x
-        cp_y   = self._curve.cpoints_y
-        ncp    = len( cp_x )
-        ivar   = 0
-
-        for icp in range (2, ncp-1):                # skip LE (0), cp1 (1) and TE (ncp-1)
-            cp_x[icp] = vars[ivar];  ivar += 1
-            cp_y[icp] = sign * vars[ivar];  ivar += 1
-
-        # cp_y[1] is determined analytically from target LE curvature and current cp_x[2]
-
-        cp_y[1] = sign * self._curve.cp_y1_from_curvature (self._targets.le_curvature, cp_x[2], 
-                                                           degree=self._curve.degree, ncp=ncp)    # negative for lower side
-
-        self._curve.set_cpoints (cp_x, cp_y)
+        _map_dv_to_curve (self._curve, vars, self._side.isLower, self._targets.le_curvature)
         # Note: _u (panel distribution) is NOT reset here for performance - it's set once per optimization pass
         # and stays fixed. Arc-length recalculation on every objective evaluation would be too expensive.
 
@@ -412,109 +565,363 @@ class Matcher (QThread):
         self._side.reset_target_deviation ()                        # update target deviation line for current bspline shape
         obj_rms = self._side.target_deviation.rms()                 # get current rms from target deviation line
 
-        # -- le curvature is analytically enforced via cp_y[1] - but for low ncp it could be wrong
+        obj, penalties = _objective_of (x, curv, obj_rms, targets)
+
+        if self._nevals%100 == 0 or show_info:  
+            logger.info (f"{self._nevals:4d}:  "
+                    f"obj: {obj:.6f}   "
+                    f"{('rms: '        + f'{obj_rms:.6f}   ') if obj_rms > 1e-9 else ''}"
+                    + "".join (f"{name}: {value:.6f}   " for name, value in penalties.items() if value > 1e-9))
+
+        # signal parent with new progress 
+        self._signal_progress (obj_rms, obj, force=show_info)
+
+        return obj 
+
 
-        penalty_le_curv = 0.0
-        if targets.le_curvature is not None:
-            penalty_le_curv = self._penalty_le_curv (curv[0], targets.le_curvature, threshold = 0.01, scale = 0.00001)
+    def _match_spec (self) -> Match_Spec:
+        """ picklable spec of the current match for the objective in a worker process"""
 
-        # -- le curvature should be monotonically decreasing in the leading-edge region 
+        knots, degree = None, None
+        if self._side.isBSpline:
+            knots, degree = np.array (self._curve.knots()), self._curve.degree
+        deviation = self._side.target_deviation
 
-        penalty_le_curv_monoton = 0.0   
-        if targets.le_monoton:
-            penalty_le_curv_monoton = self._penalty_le_curv_monoton (curv, scale=0.1) 
+        return Match_Spec (self._side.isLower, np.array (self._curve.cpoints), knots, degree,
+                           np.array (self._side.u), np.array (deviation.u_dense), 
+                           np.array (deviation.x), np.array (deviation.y), self._targets)
 
-        # -- te curvature limit
 
-        penalty_te_curv = 0.0
+    def _signal_progress (self, rms : float, objective : float | None = None, force = False):
+        """signal a compact progress snapshot - throttled to PROGRESS_RATE per second"""
+
+        now = timer()
+        if not force and (now - self._last_progress) < 1.0 / self.PROGRESS_RATE:
+            return
+        self._last_progress = now
+
+        knots, degree = None, None
+        if self._side.isBSpline:
+            knots, degree = np.array (self._curve.knots()), self._curve.degree
+
+        self.sig_progress.emit (Match_Progress (self._ipass, self._nevals, np.array (self._curve.cpoints), 
+                                                float (rms), objective, knots=knots, degree=degree))
+
+
+    def _reset_memo (self):
+        """clear the objective memo cache and its statistics - at the start of a pass"""
+        self._memo        = {}
+        self._memo_hits   = 0
+        self._memo_misses = 0
+
+
+    def _objectiveFn_memo (self, variables : list) -> float:
+        """
+        Objective with a bounded memo cache keyed by the quantized design vector. 
+        Optimizers often re-evaluate (nearly) identical design vectors, e.g. Nelder-Mead 
+        shrink steps or PSO particles clipped to a bound.
+
+        Note: On a hit the curve is not rebuilt and may not reflect 'variables'.
+        """
+
+        key = np.round (np.asarray (variables, dtype=float) / self.MEMO_QUANTUM).astype (np.int64).tobytes()
+
+        obj = self._memo.get (key)
+        if obj is not None:
+            self._memo_hits += 1
+            return obj
+
+        self._memo_misses += 1
+        obj = self._objectiveFn (variables)
+
+        if len (self._memo) >= self.MEMO_SIZE:
+            del self._memo [next (iter (self._memo))]          # drop oldest entry 
+        self._memo [key] = obj
+        return obj
+
+
+    def _memo_info (self) -> str:
+        """memo cache statistics for the pass log"""
+
+        n = self._memo_hits + self._memo_misses
+        instrument.count ("match.memo_hit",  self._memo_hits)
+        instrument.count ("match.memo_miss", self._memo_misses)
+        return f"memo hits: {self._memo_hits}/{n} ({self._memo_hits / n if n else 0.0:.1%})"
+
+
+    # ------ least squares (Levenberg-Marquardt) --------------
+
+    def _lsq_penalty_residuals (self) -> np.ndarray:
+        """
+        Smooth residuals of the curvature penalties for the current curve.
+
+        Each residual is linear in the violation and scaled like the penalty in 
+        _objectiveFn, so that the sum of squares weights penalties similar to the objective.
+        """
+
+        targets = self._targets
+
+        x      = self._side.x
+        c_line = self._side.curvature ()
+        curv   = -c_line.y if self._side.isUpper else c_line.y      # curve for upper side has to be negated
+
+        residuals = []
+
+        # -- te curvature outside allowed range (see _penalty_te_curv)
+
         if targets.max_te_curvature is not None:
-            penalty_te_curv = self._penalty_te_curv (curv[-1], targets.max_te_curvature, targets.max_nreversals,
-                                        scale = 0.01)    
+            max_curv_te = abs(targets.max_te_curvature) * (-1) ** targets.max_nreversals
+            min_allowed = min(0.0, max_curv_te) - 0.05
+            max_allowed = max(0.0, max_curv_te) + 0.05
+            excess = max(0.0, min_allowed - curv[-1]) + max(0.0, curv[-1] - max_allowed)
+            residuals.append (excess * 0.01)
+
+        body_mask = (x >= 0.1) & (x <= 1.0)
+        n_body    = max (1, np.count_nonzero (body_mask))
+
+        # -- no reversals allowed: negative curvature in body (see _penalty_reversals)
+
+        if targets.max_nreversals == 0:
+            below = np.minimum (0.0, curv[body_mask] + Line.CURV_THRESHOLD)
+            residuals.extend (below * 0.005 / np.sqrt (n_body))
 
-        # -- penalty for curvature derivatives not being smooth to avoid bumps 
+        # -- smooth curvature: second derivative of curvature in body (see _penalty_bumpiness)
 
-        penalty_bumps = 0.0
         if targets.bump_control:
-            if self._side.isBSpline:
-                penalty_bumps = self._penalty_bumpiness (x, curv, targets.max_nreversals, scale=0.001)
-            else:
-                penalty_bumps = self._penalty_bumpiness (x, curv, targets.max_nreversals, scale=0.001)
+            x_body  = x [body_mask]
+            curv_dd = derivative1 (x_body, derivative1 (x_body, curv [body_mask])) / 100.0
+            residuals.extend (curv_dd * 0.0001 / np.sqrt (n_body))
 
-        # -- penalty for curvature reversals
+        return np.asarray (residuals, dtype=float)
 
-        penalty_reversals = self._penalty_reversals (x, curv, region = (0.1, 1.0),
-                                        max_reversals = targets.max_nreversals, scale = 0.005) 
 
-        # objective function is sum of single objectives and penalties - should be as low as possible
-        
-        obj = obj_rms + penalty_le_curv + penalty_le_curv_monoton + penalty_te_curv + penalty_bumps + penalty_reversals
+    def _lsq_residuals (self, variables) -> np.ndarray:
+        """
+        Residual vector for least squares: deviation to target scaled so its sum 
+        of squares is rms**2, followed by the smooth penalty residuals.
+        """
 
-        if self._nevals%100 == 0 or show_info:  
-            logger.info (f"{self._nevals:4d}:  "
-                    f"obj: {obj:.6f}   "
-                    f"{('rms: '        + f'{obj_rms:.6f}   ') if obj_rms > 1e-9 else ''}"
-                    f"{('le_curv: '    + f'{penalty_le_curv:.6f}   ') if penalty_le_curv > 1e-9 else ''}"
-                    f"{('le_monoton: ' + f'{penalty_le_curv_monoton:.6f}   ') if penalty_le_curv_monoton > 1e-9 else ''}"
-                    f"{('te_curv: '    + f'{penalty_te_curv:.6f}   ') if penalty_te_curv > 1e-9 else ''}"
-                    f"{('bumps: '      + f'{penalty_bumps:.6f}   ')   if penalty_bumps > 1e-9 else ''}"
-                    f"{('reversals: '  + f'{penalty_reversals:.6f}')  if penalty_reversals > 1e-9 else ''}")
+        self._nevals += 1
 
-        # signal parent with new results 
-        if self._nevals%100 == 0 or show_info:  
-            result = Match_Result(self._side, self._targets, rms=obj_rms, objective=obj, curv=curv)
-            self.sig_new_results.emit (self._ipass, self._nevals, result)
-            self.msleep(2)                      # give parent some time to do updates
+        self._map_dv_to_curve (variables)
+        self._side.reset_target_deviation ()
+
+        dy = self._side.target_deviation.dy
+        r_dev = dy / np.sqrt (len(dy))
+
+        self._signal_progress (float (np.sqrt (np.mean (dy**2))))
+
+        return np.concatenate ((r_dev, self._lsq_penalty_residuals ()))
 
-        return obj 
+
+    def _lsq_jacobian_deviation (self) -> np.ndarray:
+        """
+        Analytic Jacobian of the scaled target deviation w.r.t. the design variables.
+
+        For target x_i with x(u_i) = x_i the curve value at x_i changes with 
+            d y / d cp_y[j] =  B_j(u_i)
+            d y / d cp_x[j] = -B_j(u_i) * y'(u_i) / x'(u_i)
+        where B_j is the basis function of control point j. cp_y[1] depends on cp_x[2] 
+        via the LE curvature constraint (cp_y1 ~ sqrt(cp_x2)).
+        """
+
+        curve  = self._curve
+        sign   = -1 if self._side.isLower else 1
+        x_t    = self._side.target_deviation.x
+        ncp    = curve.ncp
+
+        # parameter u at target x - by interpolation on a dense curve sample
+        u_dense = np.linspace (0.0, 1.0, 500)
+        x_dense, _ = curve.eval (u_dense, update_cache=False)
+        u_t = np.interp (x_t, x_dense, u_dense)
+
+        B        = curve.basis_matrix (u_t)
+        dxdu, dydu = curve.eval (u_t, der=1, update_cache=False)
+        slope    = np.divide (dydu, dxdu, out=np.zeros_like(dydu), where=np.abs(dxdu) > 1e-10)
+
+        cp_x  = curve.cpoints_x
+        cp_y1 = curve.cpoints_y[1]
+        dcp_y1_dcp_x2 = cp_y1 / (2.0 * cp_x[2]) if cp_x[2] > 0.0 else 0.0
+
+        J = np.empty ((len(x_t), 2 * (ncp - 3)))
+        ivar = 0
+        for icp in range (2, ncp-1):
+            J[:, ivar]   = -B[:, icp] * slope;  ivar += 1           # d / d cp_x 
+            J[:, ivar]   =  B[:, icp] * sign;   ivar += 1           # d / d (sign * cp_y) 
+
+        J[:, 0] += B[:, 1] * dcp_y1_dcp_x2                          # cp_y[1] coupled to cp_x[2]
+
+        return J / np.sqrt (len(x_t))
+
+
+    def _lsq_jacobian (self, variables) -> np.ndarray:
+        """
+        Jacobian of _lsq_residuals - analytic for the deviation, 
+        forward differences for the (few) penalty residuals.
+        """
+
+        variables = np.asarray (variables, dtype=float)
+
+        self._map_dv_to_curve (variables)
+        J_dev = self._lsq_jacobian_deviation ()
+
+        r_pen = self._lsq_penalty_residuals ()
+        J_pen = np.zeros ((len(r_pen), len(variables)))
+
+        if len(r_pen):
+            for j in range (len(variables)):
+                h = 1e-6
+                v_j = np.copy (variables)
+                v_j[j] += h
+                self._map_dv_to_curve (v_j)
+                J_pen[:, j] = (self._lsq_penalty_residuals () - r_pen) / h
+            self._map_dv_to_curve (variables)
+
+        return np.vstack ((J_dev, J_pen))
 
     
 
-    def _run_single_pass (self, ncp = 6) -> float: 
-        """Run one Nelder-Mead optimization pass for a fixed control-point count."""
+    def _warm_start_curve (self, ncp : int, bounds : list [tuple]) -> bool:
+        """
+        Seed the curve for a pass with ncp control points from the current result 
+        having ncp-1 control points: 
+            - Bezier: degree elevation (shape is preserved exactly)
+            - B-Spline: knot insertion at the position of max deviation 
+        The warm start is only taken if it is better than a fresh re-fit. 
+
+        Returns:
+            bool: True if the curve was warm started 
+        """
+
+        if self._curve.ncp != ncp - 1:
+            return False
+
+        def start_objective () -> float:
+            dv = np.clip (self._map_curve_to_dv (), [b[0] for b in bounds], [b[1] for b in bounds])
+            return self._objectiveFn (dv)
+
+        # -- warm: refine the result of the previous pass
+
+        if self._side.isBezier:
+            self._curve.elevate_degree ()
+        else:
+            x_max_dy, _ = self._side.target_deviation.max_dy ()
+            self._curve.insert_knot (float (np.clip (x_max_dy, 0.05, 0.95)))
+        self._side.set_cPoints (self._curve.cpoints)
+
+        cpoints_warm = self._curve.cpoints
+        obj_warm     = start_objective ()
+
+        # -- cold: standard start position 
+
+        self._side.re_fit_curve(self._targets.side, le_curvature=self._targets.le_curvature, ncp=ncp)   
+        obj_cold = start_objective ()
+
+        if obj_warm < obj_cold:
+            self._side.set_cPoints (cpoints_warm)
+            logger.info (f"Warm start ncp: {ncp}  objective: {obj_warm:.6f} (fresh fit: {obj_cold:.6f})")
+            return True
+        else:
+            return False
+
+
+    def _run_single_pass (self, ncp = 6, warm_start = False, resume = False,
+                          max_evals : int | None = None, deadline : float | None = None) -> float: 
+        """
+        Run one Nelder-Mead optimization pass for a fixed control-point count.
+
+        'warm_start' seeds the pass with the refined result of the previous pass (ncp-1)
+        and shrinks the initial simplex or swarm spread.
+        'resume' continues from the current curve having ncp control points.
+        'max_evals' and 'deadline' (timer value) end the pass early.
+        """
     
         # ----- objective function
 
-        f = lambda dv : self._objectiveFn (dv) 
+        f = self._objectiveFn_memo
+        self._reset_memo ()
 
         bounds      = self._calc_dv_bounds (ncp, self._targets._side.max_xy[1])   
 
+        def stop_pass () -> bool:
+            return (self.isInterruptionRequested()                           # QThread method 
+                    or (max_evals is not None and self._nevals >= max_evals)
+                    or (deadline  is not None and timer() >= deadline))
+
         # -- reset Bezier/B-Spline to standard start position before each run 
         #       Global search don't need it - but cp arrays must be resized to ncp
 
-        self._side.re_fit_curve(self._targets.side, le_curvature=self._targets.le_curvature, ncp=ncp)   
+        is_warm = resume and self._curve.ncp == ncp
+        is_warm = is_warm or (warm_start and self._warm_start_curve (ncp, bounds))
 
-        step_size = self._step_size(ncp)                        # step size based on number of control points
+        if not is_warm:
+            self._side.re_fit_curve(self._targets.side, le_curvature=self._targets.le_curvature, ncp=ncp)   
+
+        spread    = self.WARM_START_SHRINK if is_warm else 1.0
+        step_size = self._step_size(ncp) * spread               # step size based on number of control points
         dv_start  = self._map_curve_to_dv ()
+        if is_warm:
+            dv_start = list (np.clip (dv_start, [b[0] for b in bounds], [b[1] for b in bounds]))
 
         # ----- local optimizer find minimum --------
 
         self.sig_pass_start.emit (self._ipass, ncp, False)      # dialog can update UI, new ncp
-        self.msleep(10)                                         # give parent some time to do updates
 
         self._nevals = 0 
 
         max_iter  = len(dv_start) * 300                         # max_iter based on current number of variables
 
-        if self._targets.use_pso:
+        if self._targets.use_lsq:                               # gradient based - no spread to shrink
+
+            res, niter = levenberg_marquardt (self._lsq_residuals, dv_start,
+                        jacobian_fn=self._lsq_jacobian,
+                        bounds=bounds, max_iter=100, ftol=1e-6,
+                        stop_callback=stop_pass)
+
+            logger.info (f"Finished Levenberg-Marquardt after {niter} iterations and {self._nevals} evaluations.")
+
+        elif self._targets.use_pso:
             pso_options = self._targets.pso_options
+            if is_warm:
+                pso_options = copy.copy (pso_options)
+                pso_options.set_initial_perturb (pso_options.initial_perturb * spread)
 
             pso_runner = Pso (f, dv_start, bounds, pso_options,
-                                stop_callback=self.isInterruptionRequested)
+                                stop_callback=stop_pass)
             pso_runner.run()
 
             res = (pso_runner.best_position, pso_runner.best_score)
             niter = pso_runner.iterations
 
-            logger.info (f"Finished PSO after {niter} generations and {self._nevals} evaluations.")
+            logger.info (f"Finished PSO after {niter} generations and {self._nevals} evaluations - {self._memo_info()}")
+
+        elif self._targets.nm_starts > 1:                       # rounds of the starts run in a process pool
+
+            n_workers = min (self._targets.nm_starts, os.cpu_count() or 1)
+            if n_workers > 1:                                   # picklable objective on a copy of the match 
+                f_starts = functools.partial (match_objective, spec=self._match_spec())
+            else:
+                f_starts, n_workers = f, None
+
+            res, starts = nelder_mead_multistart (f_starts, dv_start, n_starts=self._targets.nm_starts,
+                        perturb=0.1 * spread, step=step_size, round_iter=100, 
+                        bounds=bounds, seed=self._targets.nm_seed, n_workers=n_workers,
+                        no_improve_thr=1e-7, no_improv_break_beginning=150, no_improv_break=100,
+                        min_iter=200, max_iter=max_iter,
+                        stop_callback=stop_pass)
+            niter = sum (st.iterations for st in starts)
+
+            logger.info (f"Finished multi-start nelder mead, best start {min(starts, key=lambda st: st.score).start} "
+                         f"after {niter} iterations and {self._nevals} evaluations - {self._memo_info()}")
         else:
             res, niter = nelder_mead (f, dv_start,
                         step=step_size, no_improve_thr=1e-7,
                         no_improv_break_beginning=150, no_improv_break=100, #20
                         min_iter=200, max_iter=max_iter,
                         bounds=bounds,
-                        stop_callback=self.isInterruptionRequested)  # QThread method
+                        stop_callback=stop_pass)
 
-            logger.info (f"Finished nelder mead after {niter} iterations and {self._nevals} evaluations.")
+            logger.info (f"Finished nelder mead after {niter} iterations and {self._nevals} evaluations - {self._memo_info()}")
 
         dv = res[0]
 
@@ -542,53 +949,164 @@ class Matcher (QThread):
         self._ncp     = side.curve.ncp
 
 
-    def run (self):
-        """ 
-        Run the multi-pass optimization process for the configured side.
+    def apply_cached (self) -> bool:
         """
+        Set the control points of side from a cached result of the same match. 
 
-        # Note: This is never called directly. It is called by Qt once the
-        # thread environment has been set up and the thread is started with start().
+        Returns:
+            bool: True if there was a cache hit 
+        """
 
-        logger.info (f"---- Matcher starting for {self._side} side"
-                            f"   target_curv_le: {self._targets.le_curvature:.0f}"
-                            f"   max_curv_te: {self._targets.max_te_curvature:.1f}"
-                            f"   max_reversals: {self._targets.max_nreversals}")
+        entry = Match_Cache.get (Match_Cache.key (self._side, self._targets))
+        if entry is None:
+            return False
 
-        self._ipass    = 0
+        self._side.set_cPoints (np.array (entry["cpoints"]))
+        logger.info (f"---- Matcher cache hit for {self._side} side  ncp: {entry['ncp']}  rms: {entry['rms']:.6f}")
+        return True
 
-        self._side.target_deviation.set_fast (True)             # needed for fast rms evaluation
 
-        # set ncp for auto mode 
-        if self._targets.ncp_auto:
-            npc_list = range(self._side.NCP_AUTO_RANGE[0], self._side.NCP_AUTO_RANGE[1] + 1)  
-        else:
-            npc_list = [self._ncp]
+    def _run_linear (self, ncp_list : list [int]) -> dict [float, np.ndarray]:
+        """
+        Run a full pass for each ncp in order until the objective is good enough. 
+
+        Returns:
+            dict: {devaluated objective: control points}
+        """
 
-        # Dictionary to store all results: {objective: control_points}
         results = {}
         ncp_devaluation = 1.0
 
-        for ncp in npc_list:
+        for ncp in ncp_list:
 
             self._ipass += 1
             logger.info (f"---- Pass {self._ipass}  ncp: {ncp} ")
 
             # run single nelder mead optimization 
 
-            objective = self._run_single_pass (ncp=ncp)
+            warm_start = self._targets.ncp_auto and self._ipass > 1
+
+            objective = self._run_single_pass (ncp=ncp, warm_start=warm_start)
 
             # Store result and decide if good enough to end 
 
             objective_devaluated = objective * ncp_devaluation
             results[objective_devaluated] = self._curve.cpoints.copy()
-            ncp_devaluation *= 1.05   # slightly devalue higher ncp results to prefer simpler solutions if objective is similar
+            ncp_devaluation *= self.NCP_DEVALUATION   # slightly devalue higher ncp results to prefer simpler solutions if objective is similar
 
-            if objective < 0.000040:                
+            if objective < self.OBJECTIVE_GOOD:                
                 break
             elif self.isInterruptionRequested():
                 break
 
+        return results
+
+
+    def _run_budgeted (self, ncp_list : list [int]) -> dict [float, np.ndarray]:
+        """
+        Search ncp as a discrete dimension within the evaluation and/or time budget of targets:
+
+            - probe: a coarse pass with a small share of the budget for each ncp 
+            - refine: the most promising ncp continue with the remaining budget 
+
+        Returns:
+            dict: {devaluated objective: control points}
+        """
+
+        max_evals = self._targets.max_evals
+        max_time  = self._targets.max_time
+        start     = timer()
+        n_probes  = len (ncp_list)
+
+        def share_deadline (share : float) -> float | None:
+            return start + max_time * share if max_time else None
+
+        results = {}
+        probes  = {}                                            # {ncp: (devaluated objective, control points)}
+        nevals  = 0
+
+        # -- probe each ncp with a small budget 
+
+        probe_evals = max (1, int (max_evals * self.BUDGET_PROBE_SHARE / n_probes)) if max_evals else None
+
+        for i, ncp in enumerate (ncp_list):
+
+            self._ipass += 1
+            logger.info (f"---- Probe {self._ipass}  ncp: {ncp} ")
+
+            deadline  = share_deadline (self.BUDGET_PROBE_SHARE * (i + 1) / n_probes)
+            objective = self._run_single_pass (ncp=ncp, warm_start=i > 0, max_evals=probe_evals, deadline=deadline)
+            nevals   += self._nevals
+
+            objective_devaluated = objective * self.NCP_DEVALUATION ** i
+            probes[ncp] = (objective_devaluated, self._curve.cpoints.copy())
+            results[objective_devaluated] = probes[ncp][1]
+
+            if objective < self.OBJECTIVE_GOOD or self.isInterruptionRequested():
+                return results
+
+        # -- refine the best probes with the remaining budget 
+
+        finalists = sorted (probes, key=lambda ncp: probes[ncp][0])[:self.BUDGET_FINALISTS]
+
+        for i, ncp in enumerate (finalists):
+
+            n_left   = len (finalists) - i
+            evals    = max (1, (max_evals - nevals) // n_left) if max_evals else None
+            deadline = (timer() + (start + max_time - timer()) / n_left) if max_time else None
+
+            self._ipass += 1
+            logger.info (f"---- Refine {self._ipass}  ncp: {ncp} ")
+
+            self._side.set_cPoints (probes[ncp][1])
+            objective = self._run_single_pass (ncp=ncp, resume=True, max_evals=evals, deadline=deadline)
+            nevals   += self._nevals
+
+            objective_devaluated = objective * self.NCP_DEVALUATION ** ncp_list.index (ncp)
+            results[objective_devaluated] = self._curve.cpoints.copy()
+
+            if objective < self.OBJECTIVE_GOOD or self.isInterruptionRequested():
+                break
+
+        logger.info (f"Budgeted ncp search: {nevals} evaluations in {timer() - start:.1f}s")
+
+        return results
+
+
+    def run (self):
+        """ 
+        Run the multi-pass optimization process for the configured side.
+        """
+
+        # Note: This is never called directly. It is called by Qt once the
+        # thread environment has been set up and the thread is started with start().
+
+        logger.info (f"---- Matcher starting for {self._side} side"
+                            f"   target_curv_le: {self._targets.le_curvature:.0f}"
+                            f"   max_curv_te: {self._targets.max_te_curvature:.1f}"
+                            f"   max_reversals: {self._targets.max_nreversals}")
+
+        self._ipass    = 0
+
+        if self.apply_cached ():
+            self.sig_finished.emit (Match_Result (self._side, self._targets))
+            return
+
+        self._side.target_deviation.set_fast (True)             # needed for fast rms evaluation
+
+        # set ncp for auto mode 
+        if self._targets.ncp_auto:
+            npc_list = range(self._side.NCP_AUTO_RANGE[0], self._side.NCP_AUTO_RANGE[1] + 1)  
+        else:
+            npc_list = [self._ncp]
+
+        # Dictionary to store all results: {objective: control_points}
+
+        if self._targets.ncp_auto and self._targets.has_budget:
+            results = self._run_budgeted (npc_list)
+        else:
+            results = self._run_linear (npc_list)
+
         # Select best result (minimum objective)
         if results:
             best_objective = min(results.keys())
@@ -600,6 +1118,10 @@ class Matcher (QThread):
         self._side.target_deviation.set_fast (False)            # needed for accurate rms evaluation
 
         result = Match_Result (self._side, self._targets)
+
+        if not self.isInterruptionRequested():
+            Match_Cache.put (Match_Cache.key (self._side, self._targets), self._curve.cpoints, result)
+
         self.sig_finished.emit (result)
 
 
@@ -847,6 +1369,119 @@ class Match_Result:
 # --------------------
 
 
+class Match_Cache:
+    """
+    Persistent cache of match results - one small json file per entry in a cache directory. 
+
+    Key is the fingerprint of Match_Targets (target side coordinates and all settings) 
+    together with the curve type. An entry holds the resulting control points and 
+    the metrics of the Match_Result. 
+    
+    The cache is disabled until a directory is set with Match_Cache.set_dir().
+    """
+
+    VERSION     = 1                                     # increase if matcher results change 
+    MAX_ENTRIES = 500                                   # oldest entries are removed beyond
+
+    _dir : str | None = None                            # the directory of the cache files
+
+
+    @classmethod
+    def set_dir (cls, aDir : str | None):
+        """ set the directory of the cache - None disables the cache"""
+
+        if aDir:
+            os.makedirs (aDir, exist_ok=True)
+        cls._dir = aDir
+
+
+    @classmethod
+    def enabled (cls) -> bool:
+        return cls._dir is not None
+
+
+    @classmethod
+    def key (cls, side : Side_Airfoil_Curve, targets : Match_Targets) -> str:
+        """ cache key of a match of 'side' (curve type) to 'targets'"""
+        return f"{type(side).__name__}_{cls.VERSION}_{targets.fingerprint()}"
+
+
+    @classmethod
+    def _pathFileName (cls, key : str) -> str:
+        return os.path.join (cls._dir, key + ".json")
+
+
+    @classmethod
+    def get (cls, key : str) -> dict | None:
+        """ cache entry for key or None"""
+
+        if not cls.enabled():
+            return None
+        try:
+            with open (cls._pathFileName (key)) as f:
+                entry = json.load (f)
+        except (OSError, ValueError):
+            return None
+
+        instrument.count ("match.cache_hit")
+        return entry
+
+
+    @classmethod
+    def put (cls, key : str, cpoints : np.ndarray, result : 'Match_Result'):
+        """ store the control points and metrics of a match result"""
+
+        if not cls.enabled():
+            return
+
+        entry = {"cpoints"      : np.asarray (cpoints).tolist(),
+                 "ncp"          : result.ncp,
+                 "rms"          : float (result._rms),
+                 "le_curvature" : float (result._le_curvature),
+                 "te_curvature" : float (result._te_curvature),
+                 "nreversals"   : int (result._nreversals)}
+
+        pathFileName = cls._pathFileName (key)
+        try:
+            with open (pathFileName + ".tmp", 'w') as f:
+                json.dump (entry, f)
+            os.replace (pathFileName + ".tmp", pathFileName)        # atomic - both sides may write 
+        except OSError as exc:
+            logger.warning (f"Match result could not be cached: {exc}")
+            return
+
+        cls._prune ()
+
+
+    @classmethod
+    def _prune (cls):
+        """ remove oldest entries beyond MAX_ENTRIES"""
+
+        files = [e for e in os.scandir (cls._dir) if e.is_file() and e.name.endswith (".json")]
+        if len (files) <= cls.MAX_ENTRIES:
+            return
+
+        files.sort (key=lambda e: e.stat().st_mtime)
+        for e in files [:len (files) - cls.MAX_ENTRIES]:
+            try:
+                os.remove (e.path)
+            except OSError:
+                pass
+
+
+    @classmethod
+    def clear (cls):
+        """ remove all cache entries"""
+
+        if cls.enabled():
+            for e in os.scandir (cls._dir):
+                if e.is_file() and e.name.endswith (".json"):
+                    os.remove (e.path)
+
+
+# --------------------
+
+
 class Match_Airfoil:
     """Utility class for matching both sides of a single airfoil.
     
@@ -928,6 +1563,21 @@ class Match_Airfoil:
         """Match targets for lower side."""
         return self._targets_lower
 
+    def set_use_lsq(self, use_lsq: bool):
+        """Use gradient based least squares (Levenberg-Marquardt) for both sides."""
+        self._targets_upper.set_use_lsq(use_lsq)
+        self._targets_lower.set_use_lsq(use_lsq)
+
+    def set_nm_starts(self, n_starts: int):
+        """Use multi-start Nelder-Mead with n_starts for both sides."""
+        self._targets_upper.set_nm_starts(n_starts)
+        self._targets_lower.set_nm_starts(n_starts)
+
+    def set_budget(self, max_evals: int | None = None, max_time: float | None = None):
+        """Bound the ncp_auto search of each side by a total evaluation and/or time budget."""
+        self._targets_upper.set_budget(max_evals, max_time)
+        self._targets_lower.set_budget(max_evals, max_time)
+
     def set_use_pso(self, use_pso: bool, seed: int = 42):
         """Enable or disable PSO for both side matchers."""
         self._targets_upper.set_use_pso(use_pso)
@@ -951,38 +1601,36 @@ class Match_Airfoil:
         """
         # Reset interruption flag
         self._interrupted = False
+
+        # Results of previous runs with the same targets are taken from the cache 
+        matchers = [m for m in (self._matcher_upper, self._matcher_lower) if not m.apply_cached()]
+        if not matchers:
+            logger.info(f"Match of {self._airfoil.name} taken from cache")
+            return True
         
         # Create event loop for blocking
         loop = QEventLoop()
         
         # Track completion
-        finished = {'upper': False, 'lower': False}
-        
-        def on_upper_finished():
-            finished['upper'] = True
-            if finished['lower']:
-                loop.quit()
+        n_running = [len(matchers)]
         
-        def on_lower_finished():
-            finished['lower'] = True
-            if finished['upper']:
+        def on_finished():
+            n_running[0] -= 1
+            if n_running[0] == 0:
                 loop.quit()
         
-        # Connect finished signals
-        self._matcher_upper.finished.connect(on_upper_finished)
-        self._matcher_lower.finished.connect(on_lower_finished)
-        
-        # Start both threads
+        # Connect finished signals and start threads
         logger.info(f"Starting match for {self._airfoil.name}")
-        self._matcher_upper.start()
-        self._matcher_lower.start()
+        for matcher in matchers:
+            matcher.finished.connect(on_finished)
+            matcher.start()
         
-        # Block until both finish
+        # Block until all finish
         loop.exec()
         
         # Wait for threads to fully terminate
-        self._matcher_upper.wait()
-        self._matcher_lower.wait()
+        for matcher in matchers:
+            matcher.wait()
         
         success = not self._interrupted
         if success:
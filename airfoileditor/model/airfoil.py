@@ -9,6 +9,7 @@ import os
 import ast
 import json
 import logging
+import threading
 from datetime               import datetime, timedelta
 from copy                   import copy
 from typing                 import Type, override
@@ -20,9 +21,10 @@ import numpy as np
 
 from ..base.common_utils    import fromDict, toDict, clip 
 from ..base.spline          import HicksHenne
+from ..base                 import instrument
 
 from .geometry              import (Geometry, Line, GeometryException,
-                                    Flap_Definition, Flap_Setter)
+                                    Flap_Definition, Flap_Setter, Blend_Series)
 from .geometry_spline       import Geometry_Splined, Paneling_Spline
 from .geometry_hicks_henne  import Geometry_HicksHenne
 
@@ -978,6 +980,57 @@ class Airfoil:
         self.set_isBlendAirfoil (True)
 
 
+    @staticmethod
+    def blend_series (airfoil1 : 'Airfoil', airfoil2 : 'Airfoil', 
+                      blendBys : list[float],
+                      geometry_class = None,
+                      moving = False) -> list['Airfoil']:
+        """ 
+        Returns a series of new airfoils blended out of two airfoils. 
+            Both airfoils are prepared only once (see Blend_Series) 
+
+        Args: 
+            airfoil1, airfoil2: Airfoils to the left and right 
+            blendBys: list of blend factors - 0.0 equals to the left, 1.0 equals to the right airfoil  
+            geometry_class: optional - geo strategy for blend - either GEO_BASIC or GEO_SPLINE
+            moving: linear interpolation of airfoil2 (fast) instead of spline interpolation 
+        """
+
+        geometry_class = geometry_class if geometry_class else airfoil1._geometry_class
+
+        blend_series = Blend_Series (airfoil1.geo, airfoil2.geo, geometry_class=geometry_class, moving=moving)
+
+        blendBys = [clip (blendBy, 0.0, 1.0) for blendBy in blendBys]
+
+        # as many decimals as needed for unique names - identical blend factors get an index 
+        def _blend_strs (dec : int) -> list[str]:
+            return [f"{blendBy*100:.{dec}f}".rstrip('0').rstrip('.') for blendBy in blendBys]
+
+        dec = 1
+        while len (set (_blend_strs (dec))) < len (set (blendBys)) and dec < 8:
+            dec += 1
+        blend_strs = _blend_strs (dec)
+
+        n_used = {}
+        for i, blend_str in enumerate (blend_strs):
+            n_used [blend_str] = n_used.get (blend_str, 0) + 1
+            if n_used [blend_str] > 1:
+                blend_strs[i] = f"{blend_str}_{n_used [blend_str]}"
+
+        airfoils = []
+        for blend_str, (x, y) in zip (blend_strs, blend_series.xy_list (blendBys)):
+
+            name      = f"{airfoil1.name}_{Geometry.MOD_BLEND}{blend_str}"
+            pathFileName = os.path.join (airfoil1.pathName, f"{airfoil1.fileName_stem}_{Geometry.MOD_BLEND}{blend_str}{Airfoil.Extension}")
+
+            airfoil = Airfoil (x=x, y=y, name=name, pathFileName=pathFileName, 
+                               workingDir=airfoil1.workingDir, geometry=geometry_class)
+            airfoil.set_isBlendAirfoil (True)
+            airfoils.append (airfoil)
+
+        return airfoils
+
+
     @property
     def flap_setter (self) -> Flap_Setter:
         """ proxy to flap setter of geometry"""
@@ -1730,8 +1783,8 @@ class Airfoil_Hicks_Henne(Airfoil):
 
 
 
-    def set_hh_data (self, name, seed_name, seed_x, seed_y, top_hhs, bot_hhs): 
-        """ set all data needed for a Hicks Henne airfoil"""
+    def set_hh_data (self, name, seed_name, seed_x, seed_y, top_hhs, bot_hhs, y=None): 
+        """ set all data needed for a Hicks Henne airfoil - optional y already evaluated at seed_x"""
 
         self._name = name                       # don't use set_ (isModified)
 
@@ -1741,8 +1794,7 @@ class Airfoil_Hicks_Henne(Airfoil):
 
             if seed_foil.isLoaded: 
                 self._geo = Geometry_HicksHenne (seed_foil.x, seed_foil.y)
-                self._geo.upper.set_hhs (top_hhs)
-                self._geo.lower.set_hhs (bot_hhs)
+                self._geo.set_hhs (top_hhs, bot_hhs, y=y)
 
                 self._isLoaded = True 
                 logger.debug (f"Hicks Henne definition for {self.name} loaded")
@@ -1834,6 +1886,152 @@ class Airfoil_Hicks_Henne(Airfoil):
 
 
 
+#------------------------------------------------------
+
+class Airfoil_Writer:
+    """ 
+    Background writer of airfoil files 
+
+    Writes are queued and done by a worker thread - a queued write of the same 
+    file is replaced by the newer one. Each file is written to a temporary file
+    in the same directory which is renamed to the real file, so a file is either
+    complete or not there. Use flush() before the files are needed.
+    """
+
+    TMP_PREFIX = ".~"                                       # temporary file - not matched by design prefix
+
+    instances : list ['Airfoil_Writer'] = []                # all open writers - to flush by polar generation
+
+
+    def __init__ (self):
+
+        self._cond    = threading.Condition ()
+        self._pending : dict [str, tuple [Airfoil, bool]] = {}     # path: airfoil, onlyShapeFile
+        self._writing = None                                # path of the file being written
+        self._thread  = None                                # worker thread - ends if nothing pending
+        self._n_written = 0
+
+        Airfoil_Writer.instances.append (self)
+
+
+    def __repr__(self) -> str:
+        """ nice representation of self """
+        return f"<{type(self).__name__} pending: {len(self._pending)}>"
+
+
+    @classmethod
+    def flush_all (cls, pathFileName_abs : str = None):
+        """ flush pending writes of all writers - optionally only of one file"""
+        for writer in cls.instances[:]:
+            writer.flush (pathFileName_abs)
+
+
+    @property
+    def n_pending (self) -> int:
+        """ number of files waiting to be written"""
+        return len (self._pending)
+
+    @property
+    def n_written (self) -> int:
+        """ number of files written up to now"""
+        return self._n_written
+
+
+    def write (self, airfoil : Airfoil, onlyShapeFile = False):
+        """ queue airfoil to be written to its pathFileName_abs - returns immediately"""
+
+        key = os.path.normpath (airfoil.pathFileName_abs)
+
+        with self._cond:
+            if key in self._pending:
+                instrument.count ("airfoil.writer.coalesced")
+            self._pending [key] = (airfoil, onlyShapeFile)
+
+            if self._thread is None:
+                self._thread = threading.Thread (target=self._run, name="Airfoil_Writer", daemon=True)
+                self._thread.start()
+
+
+    def discard (self, pathFileName_abs : str) -> bool:
+        """ remove pending write of a file - returns True if there was one """
+
+        key = os.path.normpath (pathFileName_abs)
+
+        with self._cond:
+            while self._writing == key:                     # let a running write finish
+                self._cond.wait ()
+            return self._pending.pop (key, None) is not None
+
+
+    def flush (self, pathFileName_abs : str = None, timeout : float = None) -> bool:
+        """ 
+        Wait until pending writes are done - optionally only the write of one file
+            Returns False if timeout occurred
+        """
+
+        key = os.path.normpath (pathFileName_abs) if pathFileName_abs else None
+
+        def done () -> bool:
+            if key is None:
+                return not self._pending and self._writing is None
+            return key not in self._pending and self._writing != key
+
+        with self._cond:
+            return self._cond.wait_for (done, timeout=timeout)
+
+
+    def close (self):
+        """ flush and remove self from the open writers"""
+
+        self.flush ()
+        if self in Airfoil_Writer.instances:
+            Airfoil_Writer.instances.remove (self)
+
+
+    def _run (self):
+        """ worker thread - write pending files in queued order until nothing is left"""
+
+        while True:
+
+            with self._cond:
+                if not self._pending:
+                    self._thread = None
+                    return
+                key = next (iter (self._pending))
+                airfoil, onlyShapeFile = self._pending.pop (key)
+                self._writing = key
+
+            try:
+                self._write_atomic (airfoil, onlyShapeFile)
+                self._n_written += 1
+            except Exception as exc:
+                logger.error (f"{self} {airfoil} couldn't be written: {exc}")
+
+            with self._cond:
+                self._writing = None
+                self._cond.notify_all ()
+
+
+    def _write_atomic (self, airfoil : Airfoil, onlyShapeFile : bool):
+        """ save a copy of airfoil to temporary files and rename them to the real files"""
+
+        pathFileName_abs = airfoil.pathFileName_abs
+        pathName, fileName = os.path.split (pathFileName_abs)
+        tmp_pathFileName = os.path.join (pathName, self.TMP_PREFIX + fileName)
+
+        tmp_airfoil = airfoil.asCopy_design (pathFileName=tmp_pathFileName)
+        tmp_airfoil.save (onlyShapeFile=onlyShapeFile)
+
+        # save could have written .dat and shape file (.bez, .hicks)
+        for ext in {Airfoil.Extension, os.path.splitext (fileName)[1]}:
+            tmp_file = os.path.splitext (tmp_pathFileName)[0] + ext
+            if os.path.isfile (tmp_file):
+                os.replace (tmp_file, os.path.splitext (pathFileName_abs)[0] + ext)
+
+        airfoil.set_isModified (False)
+
+
+
 # ------------ test functions - to activate  -----------------------------------
 
 if __name__ == "__main__":
@@ -3,20 +3,31 @@
 
 """
 
-Handle export of a single airfoil to external file formats.
+Handle export of a single airfoil or a set of airfoils to external file formats.
+
+A batch of airfoils can be exported to DXF in a process pool (Export_Airfoils_Dxf).
+As airfoils are not picklable, each airfoil is sent to the pool as a compact 
+spec (coordinates or control points) and rebuilt within the worker process.
 
 """
 
 import logging
+import multiprocessing
 import os
 import shutil
 
-from typing import override
+from concurrent.futures     import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses            import dataclass, field
+from typing                 import Callable, override
 
 from airfoileditor.base.dxf_artist          import *
 from airfoileditor.base.common_utils        import PathHandler, fromDict, toDict
-from airfoileditor.model.airfoil            import Airfoil, Flap_Definition
+from airfoileditor.model.airfoil            import (Airfoil, Airfoil_Bezier, Airfoil_BSpline, 
+                                                    Flap_Definition, GEO_BASIC, GEO_SPLINE)
+from airfoileditor.model.geometry           import Line
 from airfoileditor.model.geometry_curve     import Geometry_Curve
+from airfoileditor.model.geometry_bspline   import Side_Airfoil_BSpline
 
 logger = logging.getLogger(__name__)
 # logger.setLevel(logging.DEBUG)
@@ -243,6 +254,47 @@ class Export_Abstract:
 
 
 
+class Export_Airfoil_Set (Export_Abstract):
+    """Handle export of a set of airfoils (e.g. a blend series) as .dat files into one directory."""
+
+    EXPORT_DIR_SUFFIX = "_set"
+
+    def __init__(self, airfoils: list[Airfoil], dataDict: dict = None):
+        super().__init__(airfoils[0] if airfoils else None, dataDict=dataDict)
+
+        self._airfoils = list(airfoils)
+
+
+    @property
+    def airfoils(self) -> list[Airfoil]:
+        return self._airfoils
+
+
+    @property
+    def issues (self) -> list[str]:
+        """ list of issues of all airfoil geometries - prefixed with airfoil name"""
+        issues = []
+        for airfoil in self.airfoils:
+            issues.extend ([f"{airfoil.name}: {issue}" for issue in airfoil.geo.assess_quality()])
+        return issues
+
+
+    def do_it(self) -> list[str]:
+        """ Export all airfoils as .dat files and return the paths of the exported files."""
+
+        self._ensure_export_dir()
+
+        pathFileNames = []
+        for airfoil in self.airfoils:
+            airfoil_copy = airfoil.asCopy (pathFileName=os.path.join(self.export_dir_abs, airfoil.fileName_stem + Airfoil.Extension))
+            airfoil_copy._write_dat ()
+            pathFileNames.append (airfoil_copy.pathFileName_abs)
+
+        logger.info(f"{len(pathFileNames)} airfoils exported to '{self.export_dir_abs}'")
+        return pathFileNames
+
+
+
 class Export_Airfoil_Dxf (Export_Abstract):
     """Handle export of a single airfoil to DXF."""
 
@@ -356,3 +408,246 @@ class Export_Airfoil_Dxf (Export_Abstract):
         else:
             logger.info("Airfoil plotted to provided drawing.")
             return None
+
+
+
+# -----------------------------------------------------------------------------
+#  Batch export of airfoils to DXF 
+# -----------------------------------------------------------------------------
+
+
+@dataclass
+class Dxf_Batch_Item:
+    """A single airfoil of a DXF batch export with its own chord and TE gap."""
+
+    airfoil     : Airfoil
+    chord_mm    : float = 1.0
+    te_gap_mm   : float | None = None               # None - keep TE gap of airfoil
+    nick_name   : str | None = None
+
+    def set_chord_mm (self, chord_mm: float):
+        self.chord_mm = chord_mm
+
+    def set_te_gap_mm (self, te_gap_mm: float | None):
+        self.te_gap_mm = te_gap_mm
+
+
+@dataclass
+class Dxf_Batch_Result:
+    """Result of a single airfoil of a DXF batch export."""
+
+    name        : str
+    pathFileName: str | None = None                 # None if export failed
+    issues      : list[str] = field(default_factory=list)
+    error       : str | None = None
+
+    @property
+    def ok (self) -> bool:
+        return self.error is None
+
+
+def _airfoil_as_spec (airfoil: Airfoil) -> dict:
+    """ picklable spec of airfoil - either control points of curve or coordinates"""
+
+    spec = {"name": airfoil.name, "fileName": airfoil.fileName}
+
+    if airfoil.isBezierBased:
+        spec["type"]     = "bezier"
+        spec["cp_upper"] = airfoil.geo.upper.cPoints
+        spec["cp_lower"] = airfoil.geo.lower.cPoints
+    elif airfoil.isBSplineBased:
+        spec["type"]     = "bspline"
+        spec["upper"]    = airfoil.geo.upper._as_dict()
+        spec["lower"]    = airfoil.geo.lower._as_dict()
+    else:
+        spec["type"]     = "dat"
+        spec["x"]        = airfoil.x
+        spec["y"]        = airfoil.y
+        spec["geometry"] = airfoil._geometry_class if airfoil._geometry_class in (GEO_BASIC, GEO_SPLINE) else None
+    return spec
+
+
+def _airfoil_from_spec (spec: dict) -> Airfoil:
+    """ rebuild airfoil from spec within a worker process"""
+
+    name     = spec["name"]
+    fileName = spec["fileName"]
+
+    if spec["type"] == "bezier":
+        airfoil = Airfoil_Bezier (name=name, pathFileName=fileName, 
+                                  cp_upper=spec["cp_upper"], cp_lower=spec["cp_lower"])
+    elif spec["type"] == "bspline":
+        airfoil = Airfoil_BSpline (name=name, pathFileName=fileName)
+        airfoil.geo.set_side (Side_Airfoil_BSpline.on_dict (spec["upper"], linetype=Line.Type.UPPER))
+        airfoil.geo.set_side (Side_Airfoil_BSpline.on_dict (spec["lower"], linetype=Line.Type.LOWER))
+    else:
+        airfoil = Airfoil (x=spec["x"], y=spec["y"], name=name, pathFileName=fileName, 
+                           geometry=spec["geometry"])
+    return airfoil
+
+
+def _export_dxf_spec (spec: dict, chord_mm: float, te_gap_mm: float | None, nick_name: str | None,
+                      always_as_cubic_fit: bool, pathFileName: str) -> Dxf_Batch_Result:
+    """ assess quality and export a single airfoil spec to DXF - runs in worker process"""
+
+    result = Dxf_Batch_Result (name=spec["name"])
+    try:
+        airfoil = _airfoil_from_spec (spec)
+        result.issues = airfoil.geo.assess_quality()
+
+        artist = Dxf_Airfoil_Artist(airfoil, 
+                                    nick_name=nick_name,
+                                    chord_mm=chord_mm, 
+                                    te_gap_mm=te_gap_mm,
+                                    always_as_cubic_fit=always_as_cubic_fit)
+        artist.plot()
+        artist.save(pathFileName)
+        result.pathFileName = pathFileName
+
+    except Exception as exc:
+        result.error = str(exc)
+
+    return result
+
+
+
+class Export_Airfoils_Dxf (Export_Abstract):
+    """
+    Handle export of a batch of airfoils (e.g. all designs of a case or a blend series) 
+    to DXF - one file per airfoil with individual chord and TE gap. 
+
+    The DXF files are rendered in a process pool. 
+    """
+
+    EXPORT_DIR_SUFFIX = "_dxf"
+
+    MIN_ITEMS_FOR_POOL  = 3                 # less items will be exported in-process 
+
+    def __init__(self, items: list[Dxf_Batch_Item | Airfoil], dataDict: dict = None):
+
+        items = [item if isinstance (item, Dxf_Batch_Item) else Dxf_Batch_Item (item) for item in items]
+
+        super().__init__(items[0].airfoil if items else None, dataDict=dataDict)
+
+        self._items = items
+        self._always_as_cubic_fit = fromDict(dataDict, "always_as_cubic_fit", False)
+        self._results : list[Dxf_Batch_Result] = []
+
+
+    @property
+    def items(self) -> list[Dxf_Batch_Item]:
+        return self._items
+
+    def set_items (self, items: list[Dxf_Batch_Item | Airfoil]):
+        """ replace the airfoils of the batch"""
+        self._items = [item if isinstance (item, Dxf_Batch_Item) else Dxf_Batch_Item (item) for item in items]
+        if self.airfoil is None and self._items:
+            self.set_airfoil (self._items[0].airfoil)
+
+    def add_airfoil (self, airfoil: Airfoil, chord_mm: float = 1.0, te_gap_mm: float | None = None,
+                     nick_name: str | None = None):
+        """ add an airfoil with its chord and TE gap to the batch"""
+        self._items.append (Dxf_Batch_Item (airfoil, chord_mm=chord_mm, te_gap_mm=te_gap_mm, nick_name=nick_name))
+        if self.airfoil is None:
+            self.set_airfoil (airfoil)
+
+
+    @property
+    def always_as_cubic_fit(self) -> bool:
+        return self._always_as_cubic_fit
+
+    def set_always_as_cubic_fit(self, aBool: bool):
+        self._always_as_cubic_fit = aBool
+
+
+    @property
+    def results (self) -> list[Dxf_Batch_Result]:
+        """ results of the last export in the order of items"""
+        return self._results
+
+
+    @property
+    def issues (self) -> list[str]:
+        """ list of quality issues of the last export - prefixed with airfoil name"""
+        issues = []
+        for result in self._results:
+            issues.extend ([f"{result.name}: {issue}" for issue in result.issues])
+        return issues
+
+
+    def export_pathFileName_abs (self, item: Dxf_Batch_Item) -> str:
+        """ path of the DXF file of item - a file name already used by another item gets an index"""
+        i = next (i for i, an_item in enumerate (self.items) if an_item is item)
+        return os.path.join(self.export_dir_abs, self._unique_fileName_stems()[i] + ".dxf")
+
+
+    def _unique_fileName_stems (self) -> list[str]:
+        """ file name stems of items - made unique with an index like 'name_2' """
+
+        stems, used = [], set()
+        for item in self.items:
+            stem = unique = item.airfoil.fileName_stem
+            n = 1
+            while unique.lower() in used:                       # file systems may be case insensitive
+                n += 1
+                unique = f"{stem}_{n}"
+            used.add (unique.lower())
+            stems.append (unique)
+        return stems
+
+
+    def do_it (self, 
+               max_workers : int | None = None,
+               progress_callback : Callable[[int, int, Dxf_Batch_Result], None] | None = None,
+               stop_callback : Callable[[], bool] | None = None) -> list[Dxf_Batch_Result]:
+        """ 
+        Export all airfoils to DXF files and return the results in the order of items.
+
+        Args:
+            max_workers: optional number of worker processes - default is number of cpus 
+            progress_callback: optional - called with (n_done, n_total, result) after each item
+            stop_callback: optional - returns True if the export should be stopped
+        """
+
+        self._ensure_export_dir()
+
+        n_total = len(self.items)
+        stems   = self._unique_fileName_stems()
+        jobs = [(_airfoil_as_spec (item.airfoil), item.chord_mm, item.te_gap_mm, item.nick_name,
+                 self.always_as_cubic_fit, os.path.join(self.export_dir_abs, stem + ".dxf")) 
+                for item, stem in zip (self.items, stems)]
+
+        results : list[Dxf_Batch_Result] = [None] * n_total
+
+        def _done (i, result):
+            results[i] = result
+            if callable (progress_callback):
+                progress_callback (sum (r is not None for r in results), n_total, result)
+
+        pool_used = False
+        if n_total >= self.MIN_ITEMS_FOR_POOL and max_workers != 1:
+            try:
+                # spawn - forking the Qt app with its threads could deadlock the children 
+                with ProcessPoolExecutor (max_workers=max_workers, 
+                                          mp_context=multiprocessing.get_context ("spawn")) as pool:
+                    futures = {pool.submit (_export_dxf_spec, *job): i for i, job in enumerate (jobs)}
+                    for future in as_completed (futures):
+                        _done (futures[future], future.result())
+                        if callable (stop_callback) and stop_callback():
+                            for f in futures: f.cancel()
+                            break
+                pool_used = True
+            except (BrokenProcessPool, OSError) as exc:
+                logger.warning (f"DXF batch export: process pool failed ({exc}) - exporting in-process")
+
+        if not pool_used:
+            for i, job in enumerate (jobs):
+                if results[i] is not None: continue
+                if callable (stop_callback) and stop_callback(): break
+                _done (i, _export_dxf_spec (*job))
+
+        self._results = [r for r in results if r is not None]
+
+        n_ok = sum (r.ok for r in self._results)
+        logger.info(f"{n_ok} of {n_total} airfoils exported to '{self.export_dir_abs}'")
+        return self._results
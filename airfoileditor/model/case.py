@@ -4,6 +4,7 @@
 import os
 import fnmatch      
 import shutil   
+import hashlib
 
 import numpy as np
 
@@ -12,6 +13,7 @@ from pathlib                import Path
 from typing                 import override, Type
 
 from .airfoil               import Airfoil, Airfoil_BSpline, Airfoil_Bezier, Airfoil_CST, GEO_SPLINE, usedAs
+from .airfoil               import Airfoil_Writer
 from .geometry              import Line
 from .geometry_spline       import Geometry_Splined
 from .geometry_curve        import Geometry_Curve, LE_Mode
@@ -22,6 +24,7 @@ from .xo2_input             import Input_File
 from .xo2_controller        import Xo2_Controller
 from .xo2_results           import Xo2_Results
 from ..base.pso             import Pso_Options
+from ..base                 import instrument
 
 import logging
 import time
@@ -142,6 +145,10 @@ class Case_Abstract:
     def airfoil_designs (self) -> list[Airfoil]: 
         """ list of airfoil designs - to be overridden"""
         return self._airfoil_designs     
+
+    def airfoil_designs_fileNames (self) -> list[str]:
+        """ fileNames of airfoil designs"""
+        return [airfoil.fileName for airfoil in self.airfoil_designs]
       
     @property
     def airfoils_ref (self) -> list[Airfoil]:
@@ -201,6 +208,7 @@ class Case_Direct_Design (Case_Abstract):
 
         self._airfoil_seed = airfoil
         self._workingDir   = airfoil.pathName_abs 
+        self._writer       = Airfoil_Writer ()                  # design files are written in background
 
         # create design directory or read existing designs 
         if not os.path.isdir (self.design_dir_abs):
@@ -273,7 +281,7 @@ class Case_Direct_Design (Case_Abstract):
         pathFileName = os.path.join (self.design_dir, fileName)
 
         airfoil_copy = airfoil.asCopy_design (pathFileName=pathFileName)
-        airfoil_copy.save   (onlyShapeFile=True)            # save to file - in case of Bezier only .bez
+        self._writer.write  (airfoil_copy, onlyShapeFile=True)   # save in background - in case of Bezier only .bez
 
         self.airfoil_designs.append (airfoil_copy)
 
@@ -306,8 +314,9 @@ class Case_Direct_Design (Case_Abstract):
             i = self.airfoil_designs.index (airfoil)
             self.airfoil_designs.pop (i)
 
-            # remove file 
-            os.remove (airfoil.pathFileName_abs)
+            # remove file - or its pending write 
+            if not self._writer.discard (airfoil.pathFileName_abs):
+                os.remove (airfoil.pathFileName_abs)
 
             if i < (len (self.airfoil_designs) - 1):
                 next_airfoil = self.airfoil_designs [i]
@@ -369,10 +378,17 @@ class Case_Direct_Design (Case_Abstract):
         self._airfoil_final = self.get_final_from_design (airfoil_design)
 
 
+    def flush (self):
+        """ wait until all design files are written """
+        self._writer.flush ()
+
+
     @override
     def close (self):
         """ shut down activities - remove design dir if requested """
 
+        self._writer.close ()                                   # all design files written 
+
         # remove design dir if requested or only one (initial) design there
         if self.remove_designs_on_close or len(self.airfoil_designs) < 2:
             shutil.rmtree (self.design_dir_abs, ignore_errors=True) 
@@ -434,7 +450,7 @@ class Case_Direct_Design (Case_Abstract):
             if airfoil_loaded:
                 airfoils.append (airfoil)
                 loaded_count += 1
-                logger.debug (f"Loaded '{fileName}' in {t_file:.3f}s")
+                instrument.add_time ("case.read_design", t_file)
             else:
                 logger.error (f"Could not load '{fileName}' after {t_file:.3f}s")
 
@@ -479,8 +495,14 @@ class Match_Targets:
         self._bump_control      = True                              # avoid bumps in curvature
 
         self._use_pso           = False                             # runtime switch: "nelder_mead" or "pso"
+        self._use_lsq           = False                             # runtime switch: gradient based least squares 
+        self._nm_starts         = 1                                 # runtime switch: starts of multi-start nelder mead 
+        self._nm_seed           = 100                               # seed of multi-start perturbations - None: random
         self._pso_options       = Pso_Options()
 
+        self._max_evals         = None                              # total evaluation budget of ncp_auto search
+        self._max_time          = None                              # total time budget in seconds of ncp_auto search
+
         self._fit_smooth_lambda = Geometry_CST.SMOOTH_LAMBDA_DEFAULT
 
 
@@ -514,6 +536,22 @@ class Match_Targets:
 
         return instance
 
+    def fingerprint (self) -> str:
+        """ hash of the target side coordinates and all settings which influence a match result"""
+
+        h = hashlib.sha1 ()
+        h.update (np.ascontiguousarray (self._side.x, dtype=np.float64).tobytes())
+        h.update (np.ascontiguousarray (self._side.y, dtype=np.float64).tobytes())
+
+        settings = (self._ncp, self._ncp_auto, self._le_curvature, str(self._le_mode), self._le_monoton,
+                    self._max_te_curvature, int(self._max_nreversals), self._bump_control,
+                    self._use_pso, self._use_lsq, self._nm_starts, self._nm_seed if self._nm_starts > 1 else None,
+                    self._max_evals, self._max_time,
+                    sorted (vars (self._pso_options).items()) if self._use_pso else None)
+        h.update (repr (settings).encode())
+
+        return h.hexdigest()
+
     #---------------
 
     @property
@@ -560,6 +598,36 @@ class Match_Targets:
     def use_pso(self) -> bool:
         return self._use_pso
 
+    @property
+    def use_lsq(self) -> bool:
+        """use gradient based least squares (Levenberg-Marquardt) instead of nelder_mead or pso"""
+        return self._use_lsq
+
+    @property
+    def nm_starts(self) -> int:
+        """number of starts of nelder mead - > 1: multi-start with successive halving"""
+        return self._nm_starts
+
+    @property
+    def nm_seed(self) -> int | None:
+        """seed of the random perturbations of multi-start nelder mead - None: random"""
+        return self._nm_seed
+
+    @property
+    def max_evals(self) -> int | None:
+        """total objective evaluation budget for the ncp_auto search - None: no budget"""
+        return self._max_evals
+
+    @property
+    def max_time(self) -> float | None:
+        """total time budget in seconds for the ncp_auto search - None: no budget"""
+        return self._max_time
+
+    @property
+    def has_budget(self) -> bool:
+        """True if the ncp_auto search is bounded by an evaluation or time budget"""
+        return self._max_evals is not None or self._max_time is not None
+
     @property
     def pso_seed(self) -> int:
         return self._pso_options.seed if self._pso_options.seed is not None else -1
@@ -607,6 +675,19 @@ class Match_Targets:
     def set_use_pso(self, val: bool):
         self._use_pso = val
 
+    def set_use_lsq(self, val: bool):
+        self._use_lsq = val
+
+    def set_nm_starts(self, n: int):
+        self._nm_starts = max (1, int(n))
+
+    def set_nm_seed(self, seed: int | None):
+        self._nm_seed = int(seed) if seed is not None else None
+
+    def set_budget(self, max_evals: int | None = None, max_time: float | None = None):
+        self._max_evals = max (1, int(max_evals)) if max_evals else None
+        self._max_time  = max (0.1, float(max_time)) if max_time else None
+
     def set_pso_seed(self, seed: int):
         self._pso_options.set_seed(int(seed))
 
@@ -848,9 +929,14 @@ class Case_Optimize (Case_Abstract):
     @override
     @property
     def airfoil_designs (self) -> list [Airfoil]:
-        """ list of airfoil designs"""
+        """ list of airfoil designs - Airfoil objects are created on demand"""
         return self.results.designs_airfoil
 
+    @override
+    def airfoil_designs_fileNames (self) -> list[str]:
+        """ fileNames of airfoil designs - without creating the airfoils"""
+        return self.results.designs_airfoil.fileNames
+
     @override
     @property
     def airfoils_ref (self) -> list[Airfoil]:
@@ -64,6 +64,7 @@ import numpy as np
 from ..base.common_utils    import clip, StrEnum_Extended, fromDict, toDict
 from ..base.math_util       import JPoint, findMax, findMin, newton, panel_angles
 from ..base.spline          import Spline1D, Spline2D
+from ..base                 import instrument
 
 import logging
 logger = logging.getLogger(__name__)
@@ -389,6 +390,73 @@ class Flap_Setter (Flap_Definition):
         return float(x_corner), float(y_corner)
 
 
+    @staticmethod
+    def _find_concave_corners (side_x, side_y, x_hinge, y_hinge, betas_degrees) -> tuple[np.ndarray, np.ndarray]:
+        """Find the concave hinge corners for an array of flap angles at once.
+
+        Instead of building a spline through the rotated flap points for every angle, 
+        the local side spline is built once. A corner candidate (x, s(x)) is rotated 
+        back by the flap angle - it is the corner if it then lies on the side again.
+        Newton's method runs on all angles in parallel.
+        """
+        side_x = np.asarray(side_x, dtype=float)
+        side_y = np.asarray(side_y, dtype=float)
+        betas  = np.atleast_1d (np.asarray(betas_degrees, dtype=float))
+
+        x_corners = np.full (betas.shape, float(x_hinge))
+        y_corners = np.full (betas.shape, float(y_hinge))
+
+        if side_x.size < 2:
+            return x_corners, y_corners
+
+        if np.any(np.isclose(side_x, x_hinge, rtol=0.0, atol=1e-12) &
+                  np.isclose(side_y, y_hinge, rtol=0.0, atol=1e-12)):
+            return x_corners, y_corners
+
+        idx = np.searchsorted(side_x, x_hinge)
+        i0 = max(0, idx - 5)
+        i1 = min(len(side_x), idx + 5)
+        local_x = side_x[i0:i1].copy()
+        local_y = side_y[i0:i1].copy()
+
+        if local_x.size < 3:
+            return x_corners, y_corners
+
+        local_spline = Spline1D(local_x, local_y, boundary='natural')
+
+        beta_rad = np.radians(-betas)
+        cos_b, sin_b = np.cos(beta_rad), np.sin(beta_rad)
+
+        x = np.full (betas.shape, x_hinge + max(1e-8, 1e-6 * max(1.0, abs(x_hinge))))
+        g = np.ones (betas.shape)
+
+        for _ in range (25):
+
+            x     = np.clip (x, local_x[0], local_x[-1])
+            y     = local_spline.eval (x)
+            dy_dx = local_spline.eval (x, der=1)
+
+            # rotate candidate back into the unflapped side  
+            dx, dy = x - x_hinge, y - y_hinge
+            x_back = x_hinge + dx * cos_b + dy * sin_b
+            y_back = y_hinge - dx * sin_b + dy * cos_b
+
+            g = local_spline.eval (x_back) - y_back
+            if np.all (np.abs(g) < 1e-10):
+                break
+
+            dg = local_spline.eval (x_back, der=1) * (cos_b + dy_dx * sin_b) - (dy_dx * cos_b - sin_b)
+            step = np.divide (g, dg, out=np.zeros_like(g), where=(dg != 0.0))
+            x = x - step
+
+        if np.any (np.abs(g) >= 1e-10):
+            logger.debug (f"Flap sweep: Newton's method did not fully converge for concave corners")
+
+        x_corners = np.clip (x, local_x[0], local_x[-1])
+        y_corners = local_spline.eval (x_corners)
+        return x_corners, y_corners
+
+
     @staticmethod
     def _repanel_around_corner(side_x: np.ndarray, side_y: np.ndarray, x_corner: float, y_corner: float):
         """Repanel the immediate neighbours of a real corner without crossing it.
@@ -524,11 +592,7 @@ class Flap_Setter (Flap_Definition):
         lower_x, lower_y = self._lower.x, self._lower.y
 
         # Determine local thickness and vertical hinge pivot coordinate
-        x_hinge = self.x_flap
-
-        y_h_upper = Line.yFn_splined(x_hinge, upper_x, upper_y)
-        y_h_lower = Line.yFn_splined(x_hinge, lower_x, lower_y)
-        y_hinge = y_h_lower + (self.y_flap * (y_h_upper - y_h_lower))
+        x_hinge, y_hinge = self.hinge_point
         
         # Evaluate routing distribution based on deflection angle
         if self.flap_angle >= 0:
@@ -546,6 +610,206 @@ class Flap_Setter (Flap_Definition):
         return upper_new, lower_new
 
 
+    @staticmethod
+    def _sweep_convex_side (side_x, side_y, x_hinge, y_hinge, betas_degrees) -> list[tuple[np.ndarray, np.ndarray]]:
+        """Convex side for an array of flap angles - footpoint is found only once."""
+
+        x0, y0 = Flap_Setter._find_hinge_footpoint(side_x, side_y, x_hinge, y_hinge)
+
+        main_x = side_x[side_x < x0]
+        main_y = side_y[side_x < x0]
+        x_flap = side_x[side_x > x0]
+        y_flap = side_y[side_x > x0]
+
+        # rotate the flap tail for all angles in one go - shape (n_angles, n_flap)
+        beta_rad = np.radians(-np.asarray(betas_degrees, dtype=float))[:, None]
+        cos_b, sin_b = np.cos(beta_rad), np.sin(beta_rad)
+
+        flapped_x = x_hinge + (x_flap - x_hinge) * cos_b - (y_flap - y_hinge) * sin_b
+        flapped_y = y_hinge + (x_flap - x_hinge) * sin_b + (y_flap - y_hinge) * cos_b
+
+        sides = []
+        for i, beta in enumerate (beta_rad[:, 0]):
+            add_x, add_y = Flap_Setter._get_additional_points_for_gap(
+                side_x, side_y, x_hinge, y_hinge, x0, y0, beta)
+            sides.append ((np.concatenate([main_x, add_x, flapped_x[i]]),
+                           np.concatenate([main_y, add_y, flapped_y[i]])))
+        return sides
+
+
+    @staticmethod
+    def _sweep_concave_side (side_x, side_y, x_hinge, y_hinge, betas_degrees) -> list[tuple[np.ndarray, np.ndarray]]:
+        """Concave side for an array of flap angles - corners are found in one Newton run."""
+
+        side_x = np.asarray(side_x, dtype=float)
+        side_y = np.asarray(side_y, dtype=float)
+        betas  = np.asarray(betas_degrees, dtype=float)
+
+        x_corners, y_corners = Flap_Setter._find_concave_corners(side_x, side_y, x_hinge, y_hinge, betas)
+
+        # rotate all points which could belong to a flap tail for all angles at once
+        tail_mask = side_x >= np.min (x_corners)
+        x_tail    = side_x[tail_mask]
+        y_tail    = side_y[tail_mask]
+
+        beta_rad = np.radians(-betas)[:, None]
+        dx_f, dy_f = x_tail - x_hinge, y_tail - y_hinge
+        x_tail_rot = x_hinge + dx_f * np.cos(beta_rad) - dy_f * np.sin(beta_rad)
+        y_tail_rot = y_hinge + dx_f * np.sin(beta_rad) + dy_f * np.cos(beta_rad)
+
+        sides = []
+        for i, (x_corner, y_corner) in enumerate (zip (x_corners, y_corners)):
+
+            x_main = np.append(side_x[side_x < x_corner], x_corner)
+            y_main = np.append(side_y[side_x < x_corner], y_corner)
+
+            keep_mask = (x_tail >= x_corner) & (x_tail_rot[i] > x_corner + 1e-12)
+
+            side_x_new = np.concatenate([x_main, x_tail_rot[i][keep_mask]])
+            side_y_new = np.concatenate([y_main, y_tail_rot[i][keep_mask]])
+
+            sides.append (Flap_Setter._repanel_around_corner(side_x_new, side_y_new, x_corner, y_corner))
+        return sides
+
+
+    def set_flap_sweep (self, flap_angles, flap_def: Flap_Definition | None = None) -> list[tuple['Line', 'Line']]:
+        """
+        Flap the airfoil for a whole array of flap angles.
+
+        The hinge, the hinge footpoint and the local side splines are determined 
+        only once. Rotation of the flap tails and the concave corner search is done 
+        for all angles at once. Flap angle of self is not changed.
+
+        Args:
+            flap_angles: array like of flap deflection angles in degrees.
+            flap_def: Optional Flap_Definition object to set the hinge parameters.
+
+        Returns:
+            list of (upper, lower) Lines - one for each flap angle
+        """
+
+        if isinstance(flap_def, Flap_Definition):
+            self.set_x_flap (flap_def.x_flap)
+            self.set_y_flap (flap_def.y_flap)
+            self.set_y_flap_spec (flap_def.y_flap_spec)
+
+        angles = np.clip (np.atleast_1d (np.asarray (flap_angles, dtype=float)), -20.0, 20.0)
+
+        upper_x, upper_y = self._upper.x, self._upper.y
+        lower_x, lower_y = self._lower.x, self._lower.y
+
+        x_hinge, y_hinge = self.hinge_point
+
+        # result for each angle as (upper_x, upper_y, lower_x, lower_y) - zero angle is unflapped 
+        results = [(upper_x, upper_y, lower_x, lower_y)] * len(angles)
+
+        down = np.flatnonzero (angles > 0.0)
+        if down.size:
+            # DOWNWARD Deflection: Upper surface is convex, Lower surface is concave
+            uppers = self._sweep_convex_side  (upper_x, upper_y, x_hinge, y_hinge, angles[down])
+            lowers = self._sweep_concave_side (lower_x, lower_y, x_hinge, y_hinge, angles[down])
+            for i, upper, lower in zip (down, uppers, lowers):
+                results[i] = (*upper, *lower)
+
+        up = np.flatnonzero (angles < 0.0)
+        if up.size:
+            # UPWARD Deflection: Upper surface is concave, Lower surface is convex
+            uppers = self._sweep_concave_side (upper_x, upper_y, x_hinge, y_hinge, angles[up])
+            lowers = self._sweep_convex_side  (lower_x, lower_y, x_hinge, y_hinge, angles[up])
+            for i, upper, lower in zip (up, uppers, lowers):
+                results[i] = (*upper, *lower)
+
+        return [(Line(ux, uy, linetype=Line.Type.UPPER), Line(lx, ly, linetype=Line.Type.LOWER)) 
+                for ux, uy, lx, ly in results]
+
+
+
+# -----------------------------------------------------------------------------
+#  Blend handling  
+# -----------------------------------------------------------------------------
+
+class Blend_Series:
+    """
+    Blend a series of geometries out of two geometries 
+
+    Both geometries are prepared only once: geo1 is normalized and geo2 is 
+    re-gridded to the x-coordinates of geo1. Blending a series of blend factors 
+    is then a single array operation.
+    """
+
+    def __init__(self, geo1_in : 'Geometry', geo2_in : 'Geometry', 
+                 geometry_class = None, moving=False):
+        """
+        Args:
+            geo1_in, geo2_in: geometries to the left and right 
+            geometry_class: optional - geo strategy of the blended geometries - default Geometry_Splined 
+            moving: linear interpolation of geo2 (fast) instead of spline interpolation 
+        """
+
+        if geometry_class is None:
+            from .geometry_spline import Geometry_Splined
+            geometry_class = Geometry_Splined
+
+        self._geometry_class = geometry_class
+
+        geo1, geo2 = geometry_class._prepare_blend (geo1_in, geo2_in, moving=moving)
+
+        self._xy1 = (np.copy(geo1.x), np.copy(geo1.y))
+        self._xy2 = (np.copy(geo2.x), np.copy(geo2.y))
+
+        # common x-grid is the grid of geo1 
+
+        self._x = np.copy (geo1.x)
+
+        upper2_y = geo2.upper_new_x (geo1.upper.x)
+        lower2_y = geo2.lower_new_x (geo1.lower.x)
+
+        self._y1 = np.copy (geo1.y)
+        self._y2 = np.concatenate ((np.flip(upper2_y), lower2_y[1:]))
+
+
+    @property
+    def x (self) -> np.ndarray:
+        """ common x coordinates of the blended geometries"""
+        return self._x
+
+
+    def y_blended (self, blendBys) -> np.ndarray:
+        """ 
+        y coordinates of all blend factors on the common x-grid as array (n blendBys, n points)
+        """
+
+        blendBys = np.clip (np.atleast_1d (np.asarray (blendBys, dtype=float)), 0.0, 1.0)[:, None]
+
+        return (1.0 - blendBys) * self._y1 + blendBys * self._y2
+
+
+    def xy_list (self, blendBys) -> list[tuple[np.ndarray, np.ndarray]]:
+        """ 
+        list of x,y coordinates for each blend factor - 
+            edge cases 0.0 and 1.0 return geo1 and geo2 as they are (like Geometry.blend)
+        """
+
+        blendBys = np.clip (np.atleast_1d (np.asarray (blendBys, dtype=float)), 0.0, 1.0)
+        ys = self.y_blended (blendBys)
+
+        xy_list = []
+        for blendBy, y in zip (blendBys, ys):
+            if blendBy == 0.0:
+                xy_list.append ((np.copy(self._xy1[0]), np.copy(self._xy1[1])))
+            elif blendBy == 1.0:
+                xy_list.append ((np.copy(self._xy2[0]), np.copy(self._xy2[1])))
+            else:
+                xy_list.append ((np.copy(self._x), y))
+        return xy_list
+
+
+    def geometries (self, blendBys) -> list['Geometry']:
+        """ new geometries of geometry_class for each blend factor"""
+
+        return [self._geometry_class (x, y) for x, y in self.xy_list (blendBys)]
+
+
 
 # -----------------------------------------------------------------------------
 #  Panel Distribution  
@@ -2234,6 +2498,26 @@ class Geometry ():
             self._changed (Geometry.MOD_FLAP, mod_str, moving=moving)
 
  
+    def flapped_sweep (self, 
+                       flap_angles, 
+                       flap_def: Flap_Definition | None = None) -> list['Geometry']:
+        """ 
+        returns a list of new basic Geometries flapped with flap_angles - self isn't changed.
+        The hinge geometry is determined only once for all angles (see Flap_Setter.set_flap_sweep)
+        """
+
+        if self.flap_setter is None:
+            logger.warning (f"{self} cannot flap (either already flapped or curved)")
+            return []
+
+        geos = []
+        for upper, lower in self.flap_setter.set_flap_sweep (flap_angles, flap_def=flap_def):
+            geo = Geometry (np.concatenate ((np.flip(upper.x), lower.x[1:])),
+                            np.concatenate ((np.flip(upper.y), lower.y[1:])))
+            geos.append (geo)
+        return geos
+
+
     def set_max_thick (self, val : float): 
         """ change max thickness"""
         self.set_highpoint_of (Line.Type.THICKNESS,(None, val))
@@ -2332,6 +2616,7 @@ class Geometry ():
         return lower_y
 
 
+    @instrument.timed ("geometry.normalize")
     def normalize (self, just_basic=False) -> bool:
         """
         Shift, rotate, scale airfoil so LE is at 0,0 and TE is symmetric at 1,y
@@ -2448,15 +2733,17 @@ class Geometry ():
         raise NotImplementedError
 
 
-    def blend (self, geo1_in : 'Geometry', geo2_in : 'Geometry', blendBy : float, moving=False):
-        """ blends  self out of two geometries depending on the blendBy factor"""
+    @classmethod
+    def _prepare_blend (cls, geo1_in : 'Geometry', geo2_in : 'Geometry', moving=False) -> tuple['Geometry', 'Geometry']:
+        """ 
+        returns normalized geo1 and geo2 ready for blending - 
+            geo2 has linear (moving) or splined interpolation for the re-grid 
+        """
 
-        if not (geo1_in and geo2_in):
-            return
         # ensure geo1 is normalized - to this on a copy 
         
         if not geo1_in._isNormalized():
-            geo1 = self.__class__(np.copy(geo1_in.x), np.copy(geo1_in.y))
+            geo1 = cls(np.copy(geo1_in.x), np.copy(geo1_in.y))
             geo1.normalize()
         else: 
             geo1 = geo1_in
@@ -2476,8 +2763,19 @@ class Geometry ():
         # ensure geo2 is normalized - to this on a copy 
 
         if not geo2._isNormalized():
-            geo2 = self.__class__(np.copy(geo2.x), np.copy(geo2.y))
+            geo2 = cls(np.copy(geo2.x), np.copy(geo2.y))
             geo2.normalize()
+
+        return geo1, geo2
+
+
+    def blend (self, geo1_in : 'Geometry', geo2_in : 'Geometry', blendBy : float, moving=False):
+        """ blends  self out of two geometries depending on the blendBy factor"""
+
+        if not (geo1_in and geo2_in):
+            return
+
+        geo1, geo2 = self._prepare_blend (geo1_in, geo2_in, moving=moving)
         
         # blend - optimze edge cases 
 
@@ -11,6 +11,7 @@ from typing import override
 from ..base.common_utils  import clip
 from ..base.cst           import CST, fit_cst_from_xy
 from ..base.math_util     import JPoint
+from ..base                import instrument
 
 from .geometry            import Geometry, Line, Paneling
 from .geometry_curve      import Geometry_Curve, Side_Airfoil_Curve, LE_Mode
@@ -441,11 +442,14 @@ class Geometry_CST(Geometry_Curve):
             geo_norm = geo
             derotation_angle = 0.0
 
-        return (*fit_cst_from_xy (
-            geo_norm.upper.x, geo_norm.upper.y, geo_norm.lower.x, geo_norm.lower.y,
-            n_weights    = n_weights,
-            le_mode = 'free',               # fully independent a0 for upper and lower
-            smooth_lambda = smooth_lambda), derotation_angle)
+        with instrument.timer ("cst.fit"):
+            weights_upper, weights_lower, le_weight, te_thickness = fit_cst_from_xy (
+                geo_norm.upper.x, geo_norm.upper.y, geo_norm.lower.x, geo_norm.lower.y,
+                n_weights    = n_weights,
+                le_mode = 'free',               # fully independent a0 for upper and lower
+                smooth_lambda = smooth_lambda)
+
+        return weights_upper, weights_lower, le_weight, te_thickness, derotation_angle
 
 
     @override
@@ -470,7 +474,8 @@ class Geometry_CST(Geometry_Curve):
         else:
             le_mode_str = "free"
 
-        weights_upper, weights_lower, le_weight, te_thickness = fit_cst_from_xy (
+        with instrument.timer ("cst.fit"):
+            weights_upper, weights_lower, le_weight, te_thickness = fit_cst_from_xy (
                                                 target_side_upper.x, target_side_upper.y,
                                                 target_side_lower.x, target_side_lower.y,
                                                 n_weights=ncp,
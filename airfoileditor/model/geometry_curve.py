@@ -392,6 +392,11 @@ class Deviation_Line (Line):
         """ y deviation at x of target line"""
         return self._dy
 
+    @property
+    def u_dense (self) -> np.ndarray:
+        """ dense u values of curve for fast deviation calculation"""
+        return self._u_dense
+
 
     def norm2 (self) -> float:
         """returns norm2 of deviation to target line"""
@@ -58,9 +58,11 @@ class Side_Airfoil_HicksHenne (Line):
         """ returns the hicks henne functions of self"""
         return self._hhs
 
-    def set_hhs (self, hhs : list):
-        """ set the hicks henne functions of self"""
+    def set_hhs (self, hhs : list, y : np.ndarray = None):
+        """ set the hicks henne functions of self - optional y of hhs already evaluated at x"""
         self._hhs = hhs
+        if y is not None: 
+            self._y = np.asarray (y, dtype=float)
 
     @property
     def nhhs (self): 
@@ -78,11 +80,10 @@ class Side_Airfoil_HicksHenne (Line):
         # overloaded  - sum up hicks henne functions to seed_y
 
         if isinstance(self._y, np.ndarray) and not self._y.any(): 
-            self._y = self._seed_y
-            hh : HicksHenne
-
-            for hh in self._hhs: 
-                self._y = self._y + hh.eval (self.x)
+            if self._hhs:
+                self._y = self._seed_y + HicksHenne.eval_sum (self.x, HicksHenne.as_array (self._hhs))
+            else:
+                self._y = self._seed_y
 
         return self._y
         # return self._seed_y
@@ -132,6 +133,20 @@ class Geometry_HicksHenne (Geometry):
             self._lower = Side_Airfoil_HicksHenne (lower_x, lower_y, [], linetype=Line.Type.LOWER)
         return self._lower 
             
+    def set_hhs (self, top_hhs : list, bot_hhs : list, y : np.ndarray = None):
+        """ 
+        set the hicks henne functions of upper and lower side 
+            - y: optional y of the hh airfoil at seed x, e.g. batch evaluated for all designs
+        """
+
+        if y is None: 
+            self.upper.set_hhs (top_hhs)
+            self.lower.set_hhs (bot_hhs)
+        else: 
+            iLe = int(np.argmin (self._seed_x))
+            self.upper.set_hhs (top_hhs, y=np.flip (y [0: iLe + 1]))
+            self.lower.set_hhs (bot_hhs, y=y [iLe:])
+
     @property
     def x (self):
         # overloaded  - take from hicks henne 
@@ -15,6 +15,7 @@ from typing                 import override
 
 from ..base.math_util       import * 
 from ..base.spline          import Spline1D, Spline2D
+from ..base                 import instrument
 
 from .geometry              import (Line, Geometry, Curvature_Abstract, 
                                     Paneling, GeometryException)
@@ -433,6 +434,7 @@ class Geometry_Splined (Geometry):
         return  self.spline.eval (u)
 
 
+    @instrument.timed ("geometry.repanel")
     def repanel (self,  nPanels : int = None,  moving = False):
         """
         Repanel self with a new panel distribution.
@@ -13,6 +13,7 @@ import time
 
 from dataclasses        import dataclass
 from .polar_dto         import Polar_Data_Row, Polar_Data_Set, Polar_File_Meta
+from ..base             import instrument
 
 import logging
 logger = logging.getLogger(__name__)
@@ -80,6 +81,7 @@ class Neuralfoil_Evaluator:
 
 
     @classmethod
+    @instrument.timed ("neuralfoil.polar")
     def get_polar_data_set (cls,
                             airfoil_as_cst: Airfoil_As_CST,
                             meta: Polar_File_Meta,
@@ -26,6 +26,7 @@
             |-- Polar_Set                           - manage polars of an airfoil
                 -- Polar                            - a single polar  
                     |-- OpPoint                     - operating point holding aero values 
+                -- Polar_Surface                    - loaded polars indexed by Re for interpolation
 
 """
 
@@ -38,11 +39,12 @@ import numpy as np
 
 from ..base.common_utils    import * 
 from ..base.math_util       import * 
+from ..base                 import instrument
 
-from .airfoil               import Airfoil, Flap_Definition
+from .airfoil               import Airfoil, Airfoil_Writer, Flap_Definition
 from .geometry              import Geometry
 from .geometry_cst          import Geometry_CST
-from .polar_dto             import Polar_Data_Set, Polar_File_Meta
+from .polar_dto             import Polar_Data_Set, Polar_Data_Row, Polar_File_Meta
 from .xo2_driver            import Worker
 from .nf_driver             import Neuralfoil_Evaluator, Airfoil_As_CST
 
@@ -769,6 +771,7 @@ class Polar_Set:
 
         self._airfoil           = myAirfoil
         self._polars            = []                    # list of Polars of self is holding
+        self._surface           = None                  # Polar_Surface of loaded polars (lazy)
 
         re_scale = re_scale if re_scale is not None else 1.0 
         self._re_scale = clip (re_scale, 0.001, 100)
@@ -784,6 +787,10 @@ class Polar_Set:
     @property
     def airfoil (self) -> Airfoil: return self._airfoil
 
+    def set_airfoil (self, airfoil : Airfoil):
+        """ hand over self to an airfoil with the same coordinates - e.g. polars prepared on a copy"""
+        self._airfoil = airfoil
+
     @property
     def airfoil_pathFileName_abs (self) -> str:
         """ returns absolute path of airfoil used for polar generation"""
@@ -800,6 +807,9 @@ class Polar_Set:
     def airfoil_ensure_being_saved (self):
         """ check and ensure that airfoil is saved to file (Worker needs it)"""
 
+        # a design file could still be in the background write queue 
+        Airfoil_Writer.flush_all (self.airfoil_pathFileName_abs)
+
         # worker can handle .dat and .bez files 
         if os.path.isfile (self.airfoil_pathFileName_abs) and not self.airfoil.isModified:
             pass 
@@ -816,6 +826,14 @@ class Polar_Set:
         return self._polars
 
 
+    @property
+    def surface (self) -> 'Polar_Surface':
+        """ loaded polars of self indexed by Re for interpolation and queries across Re"""
+        if self._surface is None:
+            self._surface = Polar_Surface (self)
+        return self._surface
+
+
     @property
     def polars_VLM (self) -> list ['Polar']: 
         """ VLM polars of self which typically have a forced transition"""
@@ -942,6 +960,43 @@ class Polar_Set:
                 self.polars.remove(polar)
 
 
+    def _prepare_flapped_CSTs (self, polars : list['Polar']):
+        """ 
+        Prepare the CST representation of flapped NeuralFoil polars. 
+        Polars having the same hinge are flapped in a single sweep and polars 
+        with the same flap angle share the CST representation. 
+        """
+
+        if self.airfoil is None: return
+
+        # collect flap angles of polars having the same hinge 
+
+        hinge_groups : dict[tuple, list['Polar']] = {}
+        for polar in polars:
+            if polar.is_neuralfoil and polar.flap_def and not polar.isLoaded and polar._airfoil_as_CST is None:
+                flap_def = polar.flap_def
+                hinge = (flap_def.x_flap, flap_def.y_flap, flap_def.y_flap_spec)
+                hinge_groups.setdefault (hinge, []).append (polar)
+
+        geo = self.airfoil.geo
+
+        for group in hinge_groups.values():
+
+            flap_angles = sorted ({polar.flap_def.flap_angle for polar in group})
+            if len (group) < 2: continue                                # single polar will do it itself 
+
+            geo_base = Geometry (geo.x, geo.y)
+            flapped_geos = geo_base.flapped_sweep (flap_angles, flap_def=group[0].flap_def)
+            if len (flapped_geos) != len (flap_angles): continue
+
+            csts = {angle: Polar._geo_as_CST (flapped_geo) for angle, flapped_geo in zip (flap_angles, flapped_geos)}
+
+            for polar in group:
+                polar.set_airfoil_as_CST (csts[polar.flap_def.flap_angle])
+
+            logger.debug (f'Airfoil {self.airfoil} flap sweep {flap_angles} prepared for {len(group)} polars')
+
+
     def load_or_generate_polars (self, normal=True, VLM=True):
         """ 
         Either loads or (if not already exist) generate polars of myAirfoil 
@@ -956,6 +1011,10 @@ class Polar_Set:
         if VLM:
             polars.extend (self.polars_VLM)
 
+        # flapped NeuralFoil polars - prepare all flap angles in one sweep 
+
+        self._prepare_flapped_CSTs (polars)
+
         # load already existing polar file (xfoil) or generate and load polar (Neuralfoil)
 
         polars_not_loaded = []
@@ -995,6 +1054,10 @@ class Polar_Set:
             for task in new_tasks:
                 task.run ()
 
+            # meanwhile interpolate a preview from loaded polars at neighbour Re 
+
+            self.surface.preview_polars (polars_not_loaded)
+
         return 
 
 #------------------------------------------------------------------------------
@@ -1233,6 +1296,7 @@ class Polar (Polar_Definition):
         self._airfoil_as_CST    = None                      # CST repersentation of airfoil for NeuralFoil (lazy loaded)
         self._re_scale          = re_scale  
         self._error_reason      = None                      # if error occurred during polar generation 
+        self._is_preview        = False                     # values are interpolated - real polar to come
 
         self._values : dict[var, np.ndarray] = {}           # cached polar values: var → array
 
@@ -1297,16 +1361,27 @@ class Polar (Polar_Definition):
 
                 logger.debug (f'Airfoil {self.polar_set.airfoil} with flap {self.flap_def.flap_angle:.1f}° applied for CST conversion')
 
-            u, l, le, te, derot = Geometry_CST.as_CST (geo, n_weights=8)
-
-            self._airfoil_as_CST = Airfoil_As_CST (upper_weights = u, lower_weights = l,
-                                                   le_weight = le, te_thickness = te,
-                                                   derotation_angle = derot)
+            self._airfoil_as_CST = self._geo_as_CST (geo)
 
-            logger.debug (f'Airfoil {self.polar_set.airfoil} converted to CST. Derotation angle: {derot:.2f}°')
+            logger.debug (f'Airfoil {self.polar_set.airfoil} converted to CST. Derotation angle: {self._airfoil_as_CST.derotation_angle:.2f}°')
             
         return self._airfoil_as_CST
 
+    def set_airfoil_as_CST (self, cst : Airfoil_As_CST):
+        """ set an already prepared CST representation (e.g. of a flap sweep)"""
+        self._airfoil_as_CST = cst
+
+
+    @staticmethod
+    def _geo_as_CST (geo : Geometry) -> Airfoil_As_CST:
+        """ CST representation of geo for NeuralFoil"""
+
+        u, l, le, te, derot = Geometry_CST.as_CST (geo, n_weights=8)
+
+        return Airfoil_As_CST (upper_weights = u, lower_weights = l,
+                               le_weight = le, te_thickness = te,
+                               derotation_angle = derot)
+
 
     def point_at (self, index: int) -> Polar_Point | None:
         """Return one Polar_Point view at index."""
@@ -1333,7 +1408,17 @@ class Polar (Polar_Definition):
     @property
     def isLoaded (self) -> bool: 
         """ is polar data loaded from file (for async polar generation)"""
-        return bool (self._values) or self.error_occurred
+        return (bool (self._values) and not self._is_preview) or self.error_occurred
+
+    @property
+    def is_preview (self) -> bool:
+        """ True if values are a preview interpolated in Re - the real polar is still generated"""
+        return self._is_preview and not self.error_occurred
+
+    def set_preview (self, data_set: Polar_Data_Set):
+        """ set interpolated values as preview until the real polar is loaded"""
+        self._import_from_data_set (data_set)
+        self._is_preview = True
     
     @property 
     def error_occurred (self) -> bool:
@@ -1709,6 +1794,7 @@ class Polar (Polar_Definition):
         """ unloads self - clears cached polar values """
         self._values.clear ()
         self._error_reason = None
+        self._is_preview   = False
 
 
     def _import_from_data_set (self, data_set: Polar_Data_Set):
@@ -1722,6 +1808,7 @@ class Polar (Polar_Definition):
             raise RuntimeError("Could not map polar dataset")
 
         self._values.clear ()
+        self._is_preview = False
 
         n_points = len (data_set.rows)
 
@@ -1807,6 +1894,161 @@ class Polar (Polar_Definition):
 
 
 
+#------------------------------------------------------------------------------
+
+
+class Polar_Surface:
+    """ 
+    Loaded polars of a polar set indexed by Re 
+
+    Polars are grouped by type, ncrit, ma, flap and transition and sorted by Re. 
+    This allows a preview of a polar at an intermediate Re - interpolated in log(Re) 
+    between the neighbour polars - and vectorized queries across Re like 
+    cl/cd at given alpha.
+
+        surface = airfoil.polarSet.surface
+        re, glide = surface.values_at (polar, var.ALPHA, [2.0, 4.0], var.GLIDE)
+    """
+
+    PREVIEW_VARS = [var.CL, var.CD, var.CDP, var.CM, var.CP_MIN, var.XTRT, var.XTRB, var.NF_CONFIDENCE]
+
+    def __init__(self, polar_set: Polar_Set):
+
+        self._polar_set = polar_set
+
+        self._index : dict [tuple, list[Polar]] = {}    # key: loaded polars sorted by re
+        self._index_polars = None                       # loaded polars the index was built of
+
+
+    def __repr__(self) -> str:
+        """ nice representation of self """
+        return f"<{type(self).__name__} of {self._polar_set.airfoil}>"
+
+
+    @staticmethod
+    def key_of (polar: Polar_Definition) -> tuple:
+        """ key of polars which differ only in Re"""
+
+        flap_def = polar.flap_def
+        flap = (flap_def.flap_angle, flap_def.x_flap, flap_def.y_flap, flap_def.y_flap_spec) if flap_def else None
+        return (polar.type, polar.ncrit, polar.ma, flap, polar.xtript, polar.xtripb, polar.nf_model_size)
+
+
+    @property
+    def index (self) -> dict [tuple, list[Polar]]:
+        """ loaded polars grouped by key and sorted by Re - rebuilt when loaded polars changed"""
+
+        loaded = [polar for polar in self._polar_set.polars 
+                        if polar.isLoaded and not polar.error_occurred and polar.re]
+
+        if loaded != self._index_polars:
+            self._index = {}
+            for polar in sorted (loaded, key=lambda p: p.re):
+                self._index.setdefault (self.key_of (polar), []).append (polar)
+            self._index_polars = loaded
+        return self._index
+
+
+    def polars_of (self, polar_or_key: Polar_Definition | tuple) -> list [Polar]:
+        """ loaded polars having the same key as polar sorted by Re"""
+
+        key = polar_or_key if isinstance (polar_or_key, tuple) else self.key_of (polar_or_key)
+        return self.index.get (key, [])
+
+
+    def neighbours (self, polar: Polar_Definition) -> tuple [Polar, Polar] | None:
+        """ loaded polars with next lower and next higher Re than polar - None if there aren't both"""
+
+        lower, higher = None, None
+        for other in self.polars_of (polar):
+            if other.re < polar.re:
+                lower = other
+            elif other.re > polar.re:
+                higher = other
+                break
+        return (lower, higher) if lower and higher else None
+
+
+    def values_at (self, polar_or_key: Polar_Definition | tuple, 
+                   xVar : var, xVals : float | list | np.ndarray, yVar : var) -> tuple [np.ndarray, np.ndarray]:
+        """
+        yVar at xVals for all loaded polars of polar_or_key 
+            If xVar isn't increasing along a polar (like cl) the part up to its max is taken
+
+        Returns:
+            re: Re of the polars (n_re)
+            values: yVar with shape (n_re, n_x) - nan where xVal is outside a polar
+        """
+
+        polars = self.polars_of (polar_or_key)
+        xVals  = np.atleast_1d (np.asarray (xVals, dtype=float))
+
+        re     = np.array ([polar.re for polar in polars], dtype=float)
+        values = np.full ((len (polars), len (xVals)), np.nan)
+
+        for i, polar in enumerate (polars):
+            x, y = polar.ofVars ((xVar, yVar))
+            if len (x) < 2: continue
+            if not np.all (np.diff (x) > 0.0):
+                n = int (np.argmax (x)) + 1                 # rising part up to max
+                x, y = x [:n], y [:n]
+            values [i] = np.interp (xVals, x, y, left=np.nan, right=np.nan)
+
+        return re, values
+
+
+    def preview_data_set (self, polar: Polar) -> Polar_Data_Set | None:
+        """ polar data of polar interpolated in log(Re) between its neighbours - None if not possible"""
+
+        neighbours = self.neighbours (polar)
+        if not neighbours: return None
+        lower, higher = neighbours
+
+        # common alpha range of both polars 
+        alpha_low, alpha_high = np.sort (lower.alpha), np.sort (higher.alpha)
+        alpha_min = max (alpha_low [0],  alpha_high [0])
+        alpha_max = min (alpha_low [-1], alpha_high [-1])
+        alpha = np.union1d (alpha_low, alpha_high)
+        alpha = alpha [(alpha >= alpha_min) & (alpha <= alpha_max)]
+        if len (alpha) < 2: return None
+
+        w = (np.log (polar.re) - np.log (lower.re)) / (np.log (higher.re) - np.log (lower.re))
+
+        values = {}
+        for polar_var in self.PREVIEW_VARS:
+            y_low  = np.interp (alpha, lower.alpha,  lower._ofVar  (polar_var))
+            y_high = np.interp (alpha, higher.alpha, higher._ofVar (polar_var))
+            values [polar_var] = (1.0 - w) * y_low + w * y_high
+
+        rows = [Polar_Data_Row (alpha = float (alpha[i]),
+                                cl    = float (values [var.CL][i]),
+                                cd    = float (values [var.CD][i]),
+                                cdp   = float (values [var.CDP][i]),
+                                cm    = float (values [var.CM][i]),
+                                xtrt  = float (values [var.XTRT][i]),
+                                xtrb  = float (values [var.XTRB][i]),
+                                xf_cp_min     = float (values [var.CP_MIN][i]),
+                                nf_confidence = float (values [var.NF_CONFIDENCE][i])) for i in range (len (alpha))]
+
+        return Polar_Data_Set (meta=polar.as_meta(), rows=rows)
+
+
+    def preview_polars (self, polars : list[Polar]) -> int:
+        """ set interpolated preview into polars not loaded up to now - returns number of previews"""
+
+        n = 0
+        for polar in polars:
+            if polar.isLoaded or polar.is_preview: continue
+
+            data_set = self.preview_data_set (polar)
+            if data_set:
+                polar.set_preview (data_set)
+                instrument.count ("polar.preview")
+                n += 1
+        return n
+
+
+
 #------------------------------------------------------------------------------
 
 
@@ -181,12 +181,12 @@ class Xo2_Controller:
         return 1.0 - self._objective
     
 
-    def run (self, outName, input_file : str) -> int:
+    def run (self, outName, input_file : str, seed_airfoil : str = None, n_threads : int = None) -> int:
         """ 
         start a new optimization run - returns rc 
         """
 
-        rc = self.xoptfoil2.run (outName, input_file=input_file)
+        rc = self.xoptfoil2.run (outName, input_file=input_file, seed_airfoil=seed_airfoil, n_threads=n_threads)
 
         if rc == 0: 
             self._state = None                      # will re-eval state 
@@ -22,6 +22,8 @@ import shutil
 import logging
 import datetime 
 import fnmatch
+import hashlib
+import json
 
 from subprocess             import Popen, run, PIPE
 if os.name == 'nt':                                 # startupinfo only available in windows environment  
@@ -34,6 +36,7 @@ logger = logging.getLogger(__name__)
 
 from dataclasses import replace as dataclass_replace
 from .polar_dto import Polar_Bubble_Range, Polar_Data_Row, Polar_Data_Set, Polar_File_Meta
+from ..base      import instrument
 
 
 SW_NORMAL = 1 
@@ -53,6 +56,7 @@ class Xfoil_Polar_Parser:
     AIRFOIL_NAME_TAG = "Calculated polar for:"
 
     @staticmethod
+    @instrument.timed ("xfoil.parse_polar")
     def parse_file(path_file_name: str) -> Polar_Data_Set:
         """Parse an XFOIL polar file and return a neutral DTO payload."""
 
@@ -550,12 +554,14 @@ class X_Program:
         return  returncode
 
 
-    def _execute_async (self, args = [], workingDir = None, capture_output : bool =False):
+    def _execute_async (self, args = [], workingDir = None, capture_output : bool =False,
+                        env : dict = None):
         """async execute self in workingDir 
 
         Args:
             args: arguments of subprocess as list of strings
             capture_output: capture output in pipe. Defaults to False.
+            env: optional environment variables added to os environment 
         Returns:
             returncode: = 0 if no error
         """
@@ -608,8 +614,10 @@ class X_Program:
 
             logger.info (f"... {self.NAME_EXE} run async: '{" ".join(args)}' in: {workingDir}")
 
+            popen_env = {**os.environ, **env} if env else None
+
             popen = Popen (arg_list, creationflags=flags, text=True, **startupinfo, 
-                                stdout=stdout, stderr=stderr)  
+                                stdout=stdout, stderr=stderr, env=popen_env)  
 
             popen.poll()                            # update returncode
 
@@ -741,13 +749,14 @@ class Xoptfoil2 (X_Program):
             return Xoptfoil2.RUN_CONTROL
 
 
-    def run (self, outname:str, input_file:str=None, seed_airfoil:str =None):
+    def run (self, outname:str, input_file:str=None, seed_airfoil:str =None, n_threads : int = None):
         """ run self async in self workingDir
 
         Args:
             outname: output name for generated airfoil
             inputfile: name of input file. Defaults to 'outname'.inp.
             seed_airfoil: optional seed airfoil filename.
+            n_threads: optional max. number of OpenMP threads of the run 
         Returns: 
             returncode: = 0 - no errors (which could be retrieved via 'finished_errortext' )
         """
@@ -762,7 +771,9 @@ class Xoptfoil2 (X_Program):
         # add 'mode' option - will write error to stderr
         args.extend(['-m', 'child']) 
 
-        returncode = self._execute_async (args=args, workingDir=self.workingDir)
+        env = {'OMP_NUM_THREADS': str(n_threads)} if n_threads else None
+
+        returncode = self._execute_async (args=args, workingDir=self.workingDir, env=env)
 
         return returncode
 
@@ -837,6 +848,13 @@ class Worker (X_Program):
     NAME        = 'Worker'
     NAME_EXE    = 'worker'                             # stem of of exe file 
 
+    CHECK_RESULTS_MAX = 100                             # max memoized input file checks
+    _check_results : dict [str, tuple] = {}             # input hash: (returncode, error_text) 
+
+    POLAR_MANIFEST    = 'polars.json'                   # manifest in polar dir with hash of coordinates
+    _coordinates_hashes : dict [str, tuple] = {}        # airfoil path: ((mtime, size), hash)
+    _manifests          : dict [str, tuple] = {}        # polar dir: (mtime, manifest dict)
+
     
     # -- static methods --------------------------------------------
 
@@ -856,11 +874,90 @@ class Worker (X_Program):
         return str(Path(airfoil_pathFileName).with_suffix('')) + '_polars'
 
 
+    @staticmethod
+    def coordinates_hash (airfoil_pathFileName : str) -> str | None:
+        """ 
+        hash of the normalized coordinates (or shape data) of an airfoil file 
+            The name in the first line and number formatting don't matter - 
+            None if the file doesn't exist
+        """
+
+        pathFileName = os.path.abspath (airfoil_pathFileName)
+        try: 
+            stat = os.stat (pathFileName)
+        except OSError:
+            return None
+
+        file_key = (stat.st_mtime_ns, stat.st_size)
+        cached   = Worker._coordinates_hashes.get (pathFileName)
+        if cached and cached[0] == file_key:
+            return cached[1]
+
+        h = hashlib.sha1 ()
+        with open (pathFileName, 'r', errors='replace') as f:
+            lines = f.readlines()[1:]                               # skip airfoil name
+
+        for line in lines:
+            tokens = line.split()
+            if not tokens: continue
+            try: 
+                h.update (" ".join (repr (float (token)) for token in tokens).encode())
+            except ValueError:
+                h.update (" ".join (tokens).lower().encode())      # e.g. 'Top Start' of bezier
+            h.update (b"\n")
+
+        coordinates_hash = h.hexdigest()
+        Worker._coordinates_hashes [pathFileName] = (file_key, coordinates_hash)
+        return coordinates_hash
+
+
+    @staticmethod
+    def polar_manifest (polarDir : str) -> dict | None:
+        """ manifest of a polar directory like {'coordinates_hash': ...} - None if there is none"""
+
+        pathFileName = os.path.join (polarDir, Worker.POLAR_MANIFEST)
+        try: 
+            mtime = os.path.getmtime (pathFileName)
+        except OSError:
+            return None
+
+        cached = Worker._manifests.get (polarDir)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        try: 
+            with open (pathFileName, 'r') as f:
+                manifest = json.load (f)
+        except (OSError, ValueError):
+            manifest = None
+        Worker._manifests [polarDir] = (mtime, manifest)
+        return manifest
+
+
+    @staticmethod
+    def write_polar_manifest (airfoil_pathFileName : str):
+        """ create polar directory of airfoil with a manifest of the current coordinates hash"""
+
+        coordinates_hash = Worker.coordinates_hash (airfoil_pathFileName)
+        if coordinates_hash is None: return 
+
+        polarDir = Worker.polarDir (airfoil_pathFileName)
+        manifest = Worker.polar_manifest (polarDir)
+        if manifest and manifest.get ('coordinates_hash') == coordinates_hash: return
+
+        os.makedirs (polarDir, exist_ok=True)
+        manifest = {'coordinates_hash' : coordinates_hash, 
+                    'airfoil'          : os.path.basename (airfoil_pathFileName)}
+        with open (os.path.join (polarDir, Worker.POLAR_MANIFEST), 'w') as f:
+            json.dump (manifest, f)
+
+
     @staticmethod
     def remove_polarDir (airfoil_pathFileName : str, only_if_older = False):
         """ 
         deletes polar directory 
-        If only_if_older the directory is not removed if it is younger than of airfoilPathFileName
+        If only_if_older the directory is only removed if the polars belong to other 
+        coordinates than those of airfoilPathFileName (hash in manifest). 
         """ 
 
         polarDir = Worker.polarDir (airfoil_pathFileName) if airfoil_pathFileName else None
@@ -871,23 +968,26 @@ class Worker (X_Program):
         remove = True 
 
         if only_if_older:
-            if os.path.isfile(airfoil_pathFileName):
-
-                # compare datetime of airfoil file and polar dir 
-                ts = os.path.getmtime(polarDir)                 # file modification timestamp of a file
-                polarDir_dt = datetime.datetime.fromtimestamp(ts)        # convert timestamp into DateTime object
+            coordinates_hash = Worker.coordinates_hash (airfoil_pathFileName)
+            manifest         = Worker.polar_manifest (polarDir)
 
-                ts = os.path.getmtime(airfoil_pathFileName)              # file modification timestamp of a file
-                airfoil_dt = datetime.datetime.fromtimestamp(ts)         # convert timestamp into DateTime object
+            if coordinates_hash is None:
+                remove = False 
+            elif manifest:
+                remove = manifest.get ('coordinates_hash') != coordinates_hash
+            else: 
+                # legacy polar dir without manifest - compare datetime of airfoil file and polar dir 
+                polarDir_dt = datetime.datetime.fromtimestamp(os.path.getmtime(polarDir))
+                airfoil_dt  = datetime.datetime.fromtimestamp(os.path.getmtime(airfoil_pathFileName))
 
                 # add safety seconds (async stuff?) 
                 if (airfoil_dt < (polarDir_dt + datetime.timedelta(seconds=2))):
                     remove = False 
-            else: 
-                remove = False 
+                    Worker.write_polar_manifest (airfoil_pathFileName)     # from now on by hash 
 
         if remove: 
             shutil.rmtree(polarDir, ignore_errors=True)
+            Worker._manifests.pop (polarDir, None)
 
 
     @staticmethod
@@ -897,7 +997,9 @@ class Worker (X_Program):
                                flap_angle : float = 0.0, x_flap : float = 0.75,
                                y_flap : float = 0.0, y_flap_spec : str = 'y/t') -> str:
         """ 
-        Get pathFileName of polar file if it exists 
+        Get pathFileName of polar file if it exists.
+            If not, a polar of an airfoil with identical coordinates in the same directory 
+            is copied into the polar directory of airfoil 
         """      
 
         def parm_is_ok (id:str, val : float|None, decimals, args :list[str]) -> bool:
@@ -922,12 +1024,8 @@ class Worker (X_Program):
                 return False                                # this arg is missing
 
 
-        # remove a maybe older polarDir
-        Worker.remove_polarDir (airfoil_pathFileName, only_if_older=True)    
-
-        # build name of polar dir from airfoil file 
-        polarDir = Worker.polarDir (airfoil_pathFileName)
-        if os.path.isdir (polarDir):         
+        def polarFile_in (polarDir : str) -> str | None:
+            """ inner func: fileName of matching polar file in polarDir"""
 
             fileNames = fnmatch.filter(os.listdir(polarDir), '*.txt')
             for fileName in fileNames:
@@ -964,13 +1062,54 @@ class Worker (X_Program):
                 ok = ok and parm_is_ok ("yspec", y_flap_spec_arg, None, args)
 
                 if ok:
-                    # logger.debug (f"<class Worker> found polar file {fileName} in {polarDir}")
-                    return os.path.join (polarDir, fileName)        # return pathFileName
+                    return fileName
+            return None
+
+
+        # remove polarDir which belongs to other coordinates 
+        Worker.remove_polarDir (airfoil_pathFileName, only_if_older=True)    
+
+        # build name of polar dir from airfoil file 
+        polarDir = Worker.polarDir (airfoil_pathFileName)
+        if os.path.isdir (polarDir):         
+            fileName = polarFile_in (polarDir)
+            if fileName:
+                # logger.debug (f"<class Worker> found polar file {fileName} in {polarDir}")
+                return os.path.join (polarDir, fileName)        # return pathFileName
+
+        # polar of an airfoil with same coordinates (e.g. design copy) 
+        for other_polarDir in Worker._polarDirs_same_coordinates (airfoil_pathFileName):
+            fileName = polarFile_in (other_polarDir)
+            if fileName and not file_in_use (os.path.join (other_polarDir, fileName)):
+                Worker.write_polar_manifest (airfoil_pathFileName)
+                shutil.copy2 (os.path.join (other_polarDir, fileName), polarDir)
+                instrument.count ("worker.polar.shared")
+                logger.debug (f"<class Worker> polar file {fileName} taken from {other_polarDir}")
+                return os.path.join (polarDir, fileName)
 
         logger.debug (f"<class Worker> No polar file in {polarDir}")
         return None
 
 
+    @staticmethod
+    def _polarDirs_same_coordinates (airfoil_pathFileName : str) -> list [str]:
+        """ other polar dirs in directory of airfoil having the same coordinates hash in manifest"""
+
+        coordinates_hash = Worker.coordinates_hash (airfoil_pathFileName)
+        if coordinates_hash is None: return []
+
+        own_polarDir = Worker.polarDir (airfoil_pathFileName)
+        airfoil_dir  = os.path.dirname (own_polarDir)
+        polarDirs = []
+        for dirName in fnmatch.filter (os.listdir (airfoil_dir or '.'), '*_polars'):
+            polarDir = os.path.join (airfoil_dir, dirName)
+            if polarDir == own_polarDir: continue
+            manifest = Worker.polar_manifest (polarDir)
+            if manifest and manifest.get ('coordinates_hash') == coordinates_hash:
+                polarDirs.append (polarDir)
+        return polarDirs
+
+
     @staticmethod
     def load_polar_data_set (airfoil_pathFileName: str,
                              meta: 'Polar_File_Meta'
@@ -990,11 +1129,47 @@ class Worker (X_Program):
     #---------------------------------------------------------------
 
 
+    @classmethod
+    def input_hash (cls, inputFile : str) -> str:
+        """ hash of the content of inputFile, its directory, its seed airfoil file and Worker version"""
+
+        h = hashlib.sha1 ()
+        with open (inputFile, 'rb') as f:
+            content = f.read()
+        h.update (content)
+        inputDir = os.path.dirname (os.path.abspath (inputFile))
+        h.update (inputDir.encode())                                        # seed airfoil is relative to dir
+
+        # seed airfoil may be modified while the input file stays the same  
+        match = re.search (r"^\s*airfoil_file\s*=\s*['\"]([^'\"]+)['\"]", 
+                           content.decode (errors='replace'), re.MULTILINE | re.IGNORECASE)
+        if match:
+            airfoil_file = os.path.join (inputDir, match.group(1))
+            if os.path.isfile (airfoil_file):
+                with open (airfoil_file, 'rb') as f:
+                    h.update (f.read())
+            else: 
+                h.update (b'<seed missing>')
+
+        h.update (str (cls.version).encode())
+        return h.hexdigest()
+
+
     def check_inputFile (self, inputFile=None):
-        """ uses Worker to check an Xoptfoil2"""
+        """ 
+        uses Worker to check an Xoptfoil2 input file
+            The result is memoized by the content hash of the file - an unchanged
+            input won't start the Worker again
+        """
 
         if not self.ready: return 1, self.NAME + " not ready"
 
+        key = self.input_hash (inputFile)
+        result = Worker._check_results.get (key)
+        if result is not None:
+            instrument.count ("worker.check_input.cached")
+            return result
+
         error_text = ""
         args = ['-w', 'check-input', '-i', inputFile]
 
@@ -1015,6 +1190,10 @@ class Worker (X_Program):
             if error_text == '':
                 raise ValueError ("Errortext not found in Workers")
 
+        if len (Worker._check_results) >= self.CHECK_RESULTS_MAX:
+            Worker._check_results.pop (next (iter (Worker._check_results)))       # remove oldest 
+        Worker._check_results [key] = (returncode, error_text)
+
         return returncode, error_text 
 
 
@@ -1059,6 +1238,11 @@ class Worker (X_Program):
 
         workingDir = self._get_workingDir (airfoil_pathFileName)
 
+        # polar dir gets manifest with hash of coordinates the polars will belong to  
+
+        self.remove_polarDir (airfoil_pathFileName, only_if_older=True)
+        self.write_polar_manifest (airfoil_pathFileName)
+
         # a temporary input file for polar generation is created
 
         self._tmp_inpFile = self._generate_polar_inputFile (workingDir, 
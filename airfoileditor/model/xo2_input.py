@@ -170,6 +170,7 @@ class Input_File:
         self._nml_file_dict = None                                              # f90nml namelist as dict 
         self._parse_error_text = None                                           # reset parse state per load
         self._migration_warnings = []                                           # reset per load
+        self._check_warnings = []                                               # findings of last check_nml
 
         # single namelists within the input file 
 
@@ -205,6 +206,8 @@ class Input_File:
             if self.airfoil_seed.isBezierBased:
                 self.set_airfoil_seed (self.airfoil_seed)                       # will asign control points of seed to shape functions
 
+            self.check_nml ()                                                   # in-process findings as warnings 
+
 
     @property
     def workingDir (self) -> str: 
@@ -314,6 +317,14 @@ class Input_File:
     def nml_geometry_targets (self) -> 'Nml_geometry_targets':
         return self._nml_geometry_targets
 
+    @property
+    def nmls (self) -> list['Nml_Abstract']:
+        """ all single namelist objects of self"""
+        return [self._nml_info, self._nml_operating_conditions, self._nml_optimization_options,
+                self._nml_hicks_henne_options, self._nml_bezier_options, self._nml_paneling_options,
+                self._nml_particle_swarm_options, self._nml_xfoil_run_options, self._nml_curvature,
+                self._nml_constraints, self._nml_geometry_targets]
+
     @property
     def has_parse_error(self) -> bool:
         """True if the input file had a parse/load error."""
@@ -335,7 +346,7 @@ class Input_File:
     def get_issue_messages(self) -> dict[str, list[str]]:
         """Return current user-visible issues grouped by severity."""
         errors = [self.parse_error_text] if self.parse_error_text else []
-        warnings = self._migration_warnings[:]
+        warnings = self._migration_warnings + self._check_warnings
         return {"errors": errors, "warnings": warnings}
 
 
@@ -492,15 +503,33 @@ class Input_File:
         self._init_nml ()
 
 
+    def check_nml (self) -> list [str]:
+        """ 
+        in-process check of the current namelists of self - fast enough for every edit.
+            The findings are warnings of the issue messages - Xoptfoil2 has the final say 
+        """
+
+        self._check_warnings = []
+        if not self.has_parse_error:
+            for nml in self.nmls:
+                self._check_warnings.extend (nml.check())
+        return self._check_warnings
+
+
     def check_content (self, text) -> tuple: 
-        """check text being input definition with Worker for errors
+        """check text being input definition for errors with Worker - a parse error in-process
 
         Returns:
             returncode: = 0 no errors 
             error_text: the error text from Xoptfoil2
         """
 
-        # create a temporary input file to check with Worker 
+        # namelist syntax can be checked without Worker 
+        parse_error = Input_Text.parse_error_of (text)
+        if parse_error: 
+            return 1, parse_error
+
+        # create a temporary input file to check with Worker (result is memoized)
         tmpFile = self.fileName + '.tmp'
         tmpFilePath = os.path.join (self.workingDir, tmpFile)
         self.text_save (text, pathFileName=tmpFilePath)
@@ -563,6 +592,40 @@ class Input_File:
 
 
 
+class Input_Text:
+    """ 
+    Parsed text of an input file - stand-in of Input_File to check namelists 
+    without loading seed airfoil, polars, ...
+    """
+
+    def __init__(self, text : str, workingDir : str = ''):
+
+        self.workingDir = workingDir
+
+        parser = f90nml.Parser()
+        parser.global_start_index = 1
+        self.nml_file = parser.reads (text)                                     # raises on parse error 
+
+        self.nmls : list[Nml_Abstract] = [nml_class (self) for nml_class in Nml_Abstract.__subclasses__()]
+
+
+    @staticmethod
+    def parse_error_of (text : str) -> str | None:
+        """ namelist parse error of text - or None"""
+        try: 
+            Input_Text (text)
+        except Exception as e: 
+            msg = str(e) if str(e) else repr(e)
+            return f"Namelist parse error: {msg}"
+        return None
+
+
+    def add_migration_warning (self, message: str):
+        """ migration warnings of Nml objects are not of interest here"""
+        pass
+
+
+
 #-------------------------------------------------------------------------------
 # OpPoint Definition 
 #-------------------------------------------------------------------------------
@@ -1954,6 +2017,8 @@ class Nml_Abstract:
 
     INDENT = '  '                               #  spaces to indent when writing vars to file
 
+    RANGES : dict [str, tuple] = {}             # plausible (min, max) of numeric entries - check warns
+
     def __init__(self, input_file: Input_File):
 
         self._input_file = input_file 
@@ -2093,6 +2158,29 @@ class Nml_Abstract:
         nml.pop (self.name, None) 
 
 
+    def check (self) -> list [str]:
+        """ 
+        check the entries of self in-process - a subset of Xoptfoil2 'check-input' 
+        and plausible ranges. The findings are warnings, Xoptfoil2 has the final say.
+
+        Returns:
+            warnings: list of warning texts like 'namelist <name> - ...' 
+        """
+
+        errors = []
+        for key, (min_val, max_val) in self.RANGES.items():
+            val = self.nml.get (key)                                # no _get - would clean up defaults
+            if val is None: continue
+            if isinstance (val, bool) or not isinstance (val, Real) or not (min_val <= val <= max_val):
+                errors.append (self._error_text (f"{key} should be between {min_val} and {max_val}"))
+        return errors
+
+
+    def _error_text (self, text : str) -> str:
+        """ error text which names the namelist - the editor will highlight it"""
+        return f"namelist {self.name} - {text}"
+
+
 # --------- Concrete subclasses ------------------------------------
 
 
@@ -2192,6 +2280,25 @@ class Nml_optimization_options (Nml_Abstract):
                 "Legacy shape_functions 'camb-thick' was migrated to 'bezier'."
             )
             self._set('shape_functions', self.BEZIER)
+
+
+    @override
+    def check (self) -> list [str]:
+        """ shape functions and seed airfoil file"""
+
+        errors = super().check()
+
+        shape = self.nml.get ('shape_functions')
+        if shape is not None and shape not in self.SHAPE_FUNCTIONS:
+            errors.append (self._error_text (f"shape_functions '{shape}' should be one of {', '.join (self.SHAPE_FUNCTIONS)}"))
+
+        airfoil_file = self.nml.get ('airfoil_file')
+        if not airfoil_file:
+            errors.append (self._error_text ("airfoil_file of seed airfoil is missing"))
+        elif not os.path.isfile (os.path.join (self._input_file.workingDir, airfoil_file)):
+            errors.append (self._error_text (f"airfoil_file '{airfoil_file}' doesn't exist"))
+        return errors
+
   
     @property
     def airfoil_file (self) -> str:             return self._get ('airfoil_file', default=None) 
@@ -2255,6 +2362,8 @@ class Nml_hicks_henne_options (Nml_Abstract):
     """
     name = "hicks_henne_options"
 
+    RANGES = {'nfunctions_top': (0, 10), 'nfunctions_bot': (0, 10), 'initial_perturb': (0.01, 0.5)}
+
     def __init__(self, *args):
 
         super().__init__(*args)
@@ -2294,6 +2403,8 @@ class Nml_bezier_options (Nml_Abstract):
     """
     name = "bezier_options"
 
+    RANGES = {'ncp_top': (3, 10), 'ncp_bot': (3, 10), 'initial_perturb': (0.01, 0.5)}
+
     @property
     def label_long (self) -> str:
         return f"Bezier  ({self.ncp_top} top, {self.ncp_bot} bot)"
@@ -2351,12 +2462,43 @@ class Nml_operating_conditions (Nml_Abstract):
 
     name = "operating_conditions"
 
+    RANGES = {'re_default': (1000, 1e8-1), 'mach_default': (0, 10), 'x_flap': (0.0, 1.0), 'y_flap': (0.0, 1.0),
+              'flap_angle_default': (-45.0, 45.0), 'noppoint': (0, 50)}
+
+    OP_MODES            = ['spec-cl', 'spec-al']
+    OPTIMIZATION_TYPES  = ['min-drag', 'max-glide', 'min-sink', 'max-lift', 'max-xtr',
+                           'target-drag', 'target-glide', 'target-lift', 'target-moment', 'target-cp-min']
+
     def __init__ (self, *args):
 
         self._opPoint_defs = None 
         super().__init__(*args)
 
 
+    @override
+    def check (self) -> list [str]:
+        """ ranges and the arrays of the op points"""
+
+        errors = super().check()
+
+        noppoint = self.nml.get ('noppoint', 0)
+        if not isinstance (noppoint, int): return errors                       # already reported
+
+        for key in ['op_point', 'optimization_type']:
+            values = self.nml.get (key, [])
+            values = values if isinstance (values, list) else [values]
+            if len ([v for v in values [:noppoint] if v is not None]) < noppoint:
+                errors.append (self._error_text (f"{key} is missing for some of {noppoint} op points"))
+
+        for key, allowed in [('op_mode', self.OP_MODES), ('optimization_type', self.OPTIMIZATION_TYPES)]:
+            values = self.nml.get (key, [])
+            values = values if isinstance (values, list) else [values]
+            for iop, val in enumerate (values [:noppoint]):
+                if val is not None and val not in allowed:
+                    errors.append (self._error_text (f"{key}({iop+1}) '{val}' should be one of {', '.join (allowed)}"))
+        return errors
+
+
     @override
     def _write_arrays (self, aStream : TextIO):
         """ write arrays to stream"""
@@ -2467,6 +2609,8 @@ class Nml_paneling_options (Nml_Abstract):
     """
     name = "paneling_options"
 
+    RANGES = {'npoint': (80, 300), 'le_bunch': (0.0, 1.0), 'te_bunch': (0.0, 1.0)}
+
     @property
     def npoint (self) -> int:                   return self._get('npoint', default=161) 
     def set_npoint (self, aVal : int):          self._set ('npoint', clip (int(aVal), 80, 300)) 
@@ -2498,6 +2642,9 @@ class Nml_particle_swarm_options (Nml_Abstract):
     """
     name = "particle_swarm_options"
 
+    RANGES = {'pop': (5, 100), 'max_iterations': (0, 9999), 'min_radius': (0.0, 1.0), 'max_retries': (0, 5),
+              'max_speed': (0.01, 0.7), 'init_attempts': (0, 9999)}
+
     EXHAUSTIVE  = 'exhaustive'
     QUICK       = 'quick'
     LEGACY_QUICK_CAMB  = 'quick_camb_thick'
@@ -2559,6 +2706,8 @@ class Nml_xfoil_run_options (Nml_Abstract):
     """
     name = "xfoil_run_options"
 
+    RANGES = {'ncrit': (1.0, 20.0), 'xtript': (0.01, 1.0), 'xtripb': (0.01, 1.0), 'bl_maxit': (1, 500), 'vaccel': (0.0, 0.1)}
+
     @property
     def ncrit (self) -> float:                  return self._get('ncrit', default=9) 
     def set_ncrit (self, aVal : float):         self._set('ncrit', clip (aVal, 1.0, 20.0))
@@ -2601,6 +2750,8 @@ class Nml_curvature (Nml_Abstract):
 /    """
     name = "curvature"
 
+    RANGES = {'curv_threshold': (0.01, 1.0), 'max_te_curvature': (0.01, 50)}
+
     def __init__ (self, *args):
 
         super().__init__(*args)
@@ -3233,6 +3384,8 @@ class Nml_geometry_targets (Nml_Abstract):
     """
     name = "geometry_targets"
 
+    RANGES = {'ngeo_targets': (0, 3)}
+
     def __init__ (self, *args):
 
         self._geoTarget_defs = None 
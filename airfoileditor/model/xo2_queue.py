@@ -0,0 +1,492 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+
+Queue of Xoptfoil2 optimization jobs running concurrently
+
+    |-- Xo2_Job_Queue               - runs jobs up to a core budget
+        |-- Xo2_Job                 - a single input file run in its own job directory
+            |-- Xo2_Controller      - proxy to Xoptfoil2 run state and progress
+
+Each job is executed in its own job directory '<outName>_job' next to the input file,
+as Xoptfoil2 communicates via 'run_control' in its working directory.
+The queue is polled with 'update()' e.g. by the Watchdog thread. State changes of
+the jobs are done under the lock of the queue - pause, resume and terminate jobs via
+the queue when it is polled by another thread.
+
+"""
+
+import os
+import shutil
+import threading
+from datetime               import datetime
+
+import f90nml                                       # fortran namelist parser
+
+from ..base.common_utils    import StrEnum_Extended
+from .xo2_controller        import Xo2_Controller
+
+import logging
+logger = logging.getLogger(__name__)
+# logger.setLevel(logging.DEBUG)
+
+
+#-------------------------------------------------------------------------------
+# enums
+#-------------------------------------------------------------------------------
+
+
+class xo2_job_state (StrEnum_Extended):
+    """ state of a job in the queue """
+
+    QUEUED      = 'queued'
+    RUNNING     = 'running'
+    PAUSING     = 'waiting for pause'
+    PAUSED      = 'paused'
+    FINISHED    = 'finished'
+    FAILED      = 'failed'
+
+
+#-------------------------------------------------------------------------------
+# Job
+#-------------------------------------------------------------------------------
+
+class Xo2_Job:
+    """
+    A single Xoptfoil2 run of an input file in its own job directory
+    """
+
+    JOB_DIR_POSTFIX     = '_job'                            # job directory is postfix of 'outName'
+    RESUME_SEED_POSTFIX = '_resume'                         # seed of a resumed run is the paused final airfoil
+
+    @staticmethod
+    def default_jobDir (input_pathFileName : str) -> str:
+        """ job directory '<outName>_job' next to the input file"""
+
+        sourceDir, fileName = os.path.split (os.path.abspath (input_pathFileName))
+        return os.path.join (sourceDir, os.path.splitext(fileName)[0] + Xo2_Job.JOB_DIR_POSTFIX)
+
+    def __init__(self, input_pathFileName : str, jobDir : str = None, n_threads : int = None):
+        """
+        Args:
+            input_pathFileName: path of the Xoptfoil2 input file
+            jobDir: optional job directory - default '<outName>_job' next to input file
+            n_threads: optional number of threads of this job - default from queue
+        """
+
+        if not os.path.isfile (input_pathFileName):
+            raise ValueError (f"Input file '{input_pathFileName}' doesn't exist")
+
+        self._input_pathFileName = os.path.abspath (input_pathFileName)
+
+        if jobDir is None:
+            jobDir = self.default_jobDir (self._input_pathFileName)
+
+        self._jobDir        = os.path.abspath (jobDir)
+        self._n_threads     = n_threads
+        self._xo2           = None                          # controller of current run
+        self._state         = xo2_job_state.QUEUED
+        self._n_runs        = 0                             # no of started runs incl. resumed ones
+        self._errortext     = None
+
+        self._nSteps        = 0                             # progress of last poll - kept when paused
+        self._nDesigns      = 0
+        self._objective     = 1.0
+        self._time_started  = None
+
+
+    def __repr__(self) -> str:
+        """ nice representation of self """
+        return f"<{type(self).__name__} {self.name} {self.state}>"
+
+
+    # ---- Properties -------------------------------------------
+
+    @property
+    def name (self) -> str:
+        """ name of job - fileName of input file"""
+        return os.path.basename (self._input_pathFileName)
+
+    @property
+    def outName (self) -> str:
+        """ outName of Xoptfoil2 - stem of input file"""
+        return os.path.splitext (self.name)[0]
+
+    @property
+    def input_pathFileName (self) -> str:
+        """ path of the original input file"""
+        return self._input_pathFileName
+
+    @property
+    def workingDir (self) -> str:
+        """ job directory in which Xoptfoil2 is executed"""
+        return self._jobDir
+
+    @property
+    def n_threads (self) -> int | None:
+        """ number of threads of this job - None if not set"""
+        return self._n_threads
+
+    @property
+    def xo2 (self) -> Xo2_Controller | None:
+        """ the Xoptfoil2 controller of the current or last run"""
+        return self._xo2
+
+    @property
+    def state (self) -> xo2_job_state:
+        """ current state of self - updated with 'poll'"""
+        return self._state
+
+    @property
+    def isActive (self) -> bool:
+        """ True if self holds an Xoptfoil2 process"""
+        return self._state in (xo2_job_state.RUNNING, xo2_job_state.PAUSING)
+
+    @property
+    def isDone (self) -> bool:
+        """ True if self is finished or failed"""
+        return self._state in (xo2_job_state.FINISHED, xo2_job_state.FAILED)
+
+    @property
+    def n_runs (self) -> int:
+        """ number of runs started - more than 1 if resumed """
+        return self._n_runs
+
+    @property
+    def errortext (self) -> str | None:
+        """ errortext if the job failed"""
+        return self._errortext
+
+    @property
+    def nSteps (self) -> int:
+        """ no of steps of the current run"""
+        return self._nSteps
+
+    @property
+    def nDesigns (self) -> int:
+        """ no of designs of the current run"""
+        return self._nDesigns
+
+    @property
+    def improvement (self) -> float:
+        """ improvement in fraction of 1.0 reached up to now"""
+        return 1.0 - self._objective
+
+    @property
+    def airfoil_final_pathFileName (self) -> str:
+        """ path of the final airfoil written by Xoptfoil2 into job directory"""
+        return os.path.join (self.workingDir, self.outName + '.dat')
+
+
+    def time_running (self) -> str:
+        """ hours, minutes, seconds since start of current run as string """
+
+        if not self.isActive or self._time_started is None: return ""
+
+        delta = datetime.now() - self._time_started
+        hours, remainder = divmod(delta.total_seconds(), 3600)
+        minutes, seconds = divmod(remainder, 60)
+
+        if hours > 0:
+            return f"{int(hours)}:{int(minutes)}:{int(seconds):02d}"
+        else:
+            return f"{int(minutes)}:{int(seconds):02d}"
+
+
+    # ---- Methods -------------------------------------------
+
+    def start (self, n_threads : int = None) -> int:
+        """
+        start Xoptfoil2 in job directory - returns rc
+
+        A resumed job is seeded with the final airfoil the paused run has written.
+        """
+
+        n_threads = self._n_threads if self._n_threads else n_threads
+
+        os.makedirs (self.workingDir, exist_ok=True)
+        shutil.copy2 (self.input_pathFileName, os.path.join (self.workingDir, self.name))
+
+        if self._n_runs and os.path.isfile (self.airfoil_final_pathFileName):
+            seed_airfoil = os.path.join (self.workingDir, self.outName + self.RESUME_SEED_POSTFIX + '.dat')
+            shutil.copy2 (self.airfoil_final_pathFileName, seed_airfoil)      # final will be overwritten
+        else:
+            seed_airfoil = self._seed_pathFileName ()
+
+        self._xo2 = Xo2_Controller (self.workingDir)
+        rc = self._xo2.run (self.outName, input_file=self.name, seed_airfoil=seed_airfoil, n_threads=n_threads)
+
+        self._n_runs += 1
+        self._nSteps, self._nDesigns, self._objective = 0, 0, 1.0
+
+        if rc == 0:
+            self._state        = xo2_job_state.RUNNING
+            self._errortext    = None
+            self._time_started = datetime.now()
+            logger.info (f"{self} started in {self.workingDir}")
+        else:
+            self._state     = xo2_job_state.FAILED
+            self._errortext = self._xo2.run_errortext or f"Xoptfoil2 couldn't be started (rc={rc})"
+            logger.error (f"{self} {self._errortext}")
+        return rc
+
+
+    def poll (self) -> bool:
+        """ update progress and state from Xoptfoil2 - returns True if something changed """
+
+        if not self.isActive: return False
+
+        changed = False
+
+        if self._xo2.refresh_progress ():
+            self._nSteps    = self._xo2.nSteps
+            self._nDesigns  = self._xo2.nDesigns
+            self._objective = 1.0 - self._xo2.improvement
+            changed = True
+
+        if not self._xo2.isRunning:
+
+            if self._state == xo2_job_state.PAUSING:
+                self._state = xo2_job_state.PAUSED
+            elif self._xo2.isRun_failed:
+                self._state     = xo2_job_state.FAILED
+                self._errortext = self._xo2.run_errortext
+            else:
+                self._state = xo2_job_state.FINISHED
+
+            logger.info (f"{self} after {self.nSteps} steps, {self.nDesigns} designs")
+            changed = True
+
+        return changed
+
+
+    def pause (self):
+        """ pause self - a running Xoptfoil2 is stopped via run_control """
+
+        if self._state == xo2_job_state.QUEUED:
+            self._state = xo2_job_state.PAUSED
+        elif self._state == xo2_job_state.RUNNING:
+            self._xo2.stop ()
+            self._state = xo2_job_state.PAUSING
+
+
+    def resume (self):
+        """ put a paused self back into queue"""
+
+        if self._state == xo2_job_state.PAUSED:
+            self._state = xo2_job_state.QUEUED
+
+
+    def terminate (self):
+        """ hard terminate a running Xoptfoil2 process"""
+
+        if self.isActive:
+            self._xo2.xoptfoil2.terminate ()
+            self._state     = xo2_job_state.FAILED
+            self._errortext = "Terminated"
+
+
+    def _seed_pathFileName (self) -> str | None:
+        """ absolute path of the seed airfoil of input file - as the job runs in another directory"""
+
+        try:
+            nml = f90nml.read (self.input_pathFileName)                 # light weight - no Input_File needed
+            airfoil_fileName = nml.get ('optimization_options', {}).get ('airfoil_file')
+        except Exception as exc:
+            logger.warning (f"{self} seed airfoil couldn't be read from input file: {exc}")
+            return None
+
+        if airfoil_fileName:
+            pathFileName = os.path.join (os.path.dirname (self.input_pathFileName), airfoil_fileName)
+            if os.path.isfile (pathFileName):
+                return os.path.abspath (pathFileName)
+        return None
+
+
+
+#-------------------------------------------------------------------------------
+# Queue
+#-------------------------------------------------------------------------------
+
+class Xo2_Job_Queue:
+    """
+    Runs Xoptfoil2 jobs concurrently within a budget of cores
+
+        Jobs are started in the order they were added. A job needs 'n_threads'
+        cores of the budget - the first queued job which fits is started.
+    """
+
+    def __init__(self, n_cores : int = None, threads_per_job : int = 1):
+        """
+        Args:
+            n_cores: core budget of the queue - default os cpu count
+            threads_per_job: default threads of a job
+        """
+
+        self._n_cores         = max (1, n_cores if n_cores else (os.cpu_count() or 1))
+        self._threads_per_job = max (1, threads_per_job)
+        self._jobs : list [Xo2_Job] = []
+        self._lock = threading.RLock()                      # jobs and their state - changed by UI, polled by Watchdog
+
+
+    def __repr__(self) -> str:
+        """ nice representation of self """
+        return f"<{type(self).__name__} {len(self._jobs)} jobs on {self.n_cores} cores>"
+
+
+    # ---- Properties -------------------------------------------
+
+    @property
+    def n_cores (self) -> int:
+        """ core budget of the queue"""
+        return self._n_cores
+
+    def set_n_cores (self, n : int):
+        self._n_cores = max (1, int(n))
+
+    @property
+    def threads_per_job (self) -> int:
+        """ default number of threads of a job"""
+        return self._threads_per_job
+
+    def set_threads_per_job (self, n : int):
+        self._threads_per_job = max (1, int(n))
+
+    @property
+    def max_parallel (self) -> int:
+        """ max number of jobs running in parallel with default threads"""
+        return max (1, self.n_cores // self.threads_per_job)
+
+    @property
+    def jobs (self) -> list [Xo2_Job]:
+        """ all jobs of queue in order of adding"""
+        with self._lock:
+            return list (self._jobs)
+
+    def jobs_in_state (self, *states : xo2_job_state) -> list [Xo2_Job]:
+        """ jobs being in one of 'states'"""
+        return [job for job in self.jobs if job.state in states]
+
+    @property
+    def cores_used (self) -> int:
+        """ cores used by the active jobs"""
+        return sum (self._job_threads (job) for job in self.jobs if job.isActive)
+
+    @property
+    def isActive (self) -> bool:
+        """ True if there are jobs running or waiting to run"""
+        return any (job.isActive or job.state == xo2_job_state.QUEUED for job in self.jobs)
+
+
+    # ---- Methods -------------------------------------------
+
+    def add (self, input_pathFileName : str, jobDir : str = None, n_threads : int = None) -> Xo2_Job:
+        """ add a new job for input file - returns job """
+
+        job = Xo2_Job (input_pathFileName, jobDir=jobDir, n_threads=n_threads)
+
+        with self._lock:
+            if any (j.workingDir == job.workingDir for j in self._jobs):
+                raise ValueError (f"There is already a job in '{job.workingDir}'")
+            self._jobs.append (job)
+
+        logger.debug (f"{self} added {job}")
+        return job
+
+
+    def add_case (self, case, n_threads : int = None) -> Xo2_Job:
+        """ add a new job for the input file of a Case_Optimize - returns job"""
+
+        case.input_file.save_nml ()
+        return self.add (case.input_file.pathFileName, n_threads=n_threads)
+
+
+    def remove (self, job : Xo2_Job):
+        """ remove a job which isn't running"""
+
+        with self._lock:
+            if job.isActive:
+                raise ValueError (f"{job} is running and can't be removed")
+            self._jobs.remove (job)
+
+
+    def clear_done (self):
+        """ remove all finished and failed jobs"""
+
+        with self._lock:
+            self._jobs = [job for job in self._jobs if not job.isDone]
+
+
+    def update (self) -> bool:
+        """
+        poll running jobs and start queued jobs within core budget
+            - returns True if there was a change of a job
+        """
+
+        changed = False
+
+        with self._lock:                                    # no pause, resume of a job in between 
+
+            for job in self.jobs_in_state (xo2_job_state.RUNNING, xo2_job_state.PAUSING):
+                changed = job.poll () or changed
+
+            cores_free = self.n_cores - self.cores_used
+
+            for job in self.jobs_in_state (xo2_job_state.QUEUED):
+
+                n_threads = self._job_threads (job)
+                if n_threads > cores_free and cores_free < self.n_cores:
+                    continue                                # too big for now - a too big job runs alone
+
+                job.start (n_threads=n_threads)
+                changed = True
+                if job.isActive:
+                    cores_free -= n_threads
+                if cores_free <= 0: break
+
+        return changed
+
+
+    def pause (self, job : Xo2_Job):
+        """ pause job - a running job will be stopped via Xoptfoil2 run_control"""
+        with self._lock:
+            job.pause ()
+
+
+    def resume (self, job : Xo2_Job):
+        """ resume a paused job - it will be queued again"""
+        with self._lock:
+            job.resume ()
+
+
+    def terminate (self, job : Xo2_Job):
+        """ hard terminate a running job"""
+        with self._lock:
+            job.terminate ()
+
+
+    def pause_all (self):
+        """ pause all queued and running jobs"""
+        with self._lock:
+            for job in self._jobs:
+                job.pause ()
+
+
+    def resume_all (self):
+        """ resume all paused jobs"""
+        with self._lock:
+            for job in self._jobs:
+                job.resume ()
+
+
+    def terminate_all (self):
+        """ hard terminate all running jobs"""
+        with self._lock:
+            for job in self._jobs:
+                job.terminate ()
+
+
+    def _job_threads (self, job : Xo2_Job) -> int:
+        """ threads a job needs within budget"""
+        return job.n_threads if job.n_threads else self.threads_per_job
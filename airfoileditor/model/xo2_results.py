@@ -15,12 +15,17 @@
 import os
 import csv
 import shutil
+from collections            import OrderedDict
 from datetime               import datetime
-from timeit                 import default_timer as timer
+from time                   import perf_counter
+
+import numpy as np
 
 
 from ..base.common_utils    import * 
+from ..base                 import instrument
 from ..base.spline          import HicksHenne
+from ..base.time_series     import Time_Series
 from .airfoil               import Airfoil, Airfoil_Bezier, Airfoil_Hicks_Henne, usedAs
 from .airfoil               import GEO_BASIC, Line
 from .polar_set             import * 
@@ -225,10 +230,8 @@ class Xo2_Results:
             return self._reader_airfoils_hh.designs
         elif self._reader_airfoils_bezier.hasResults:
             return self._reader_airfoils_bezier.designs
-        elif self._reader_airfoils.hasResults:
-            return self._reader_airfoils.designs
         else: 
-            return []
+            return self._reader_airfoils.designs                            # could be empty 
 
 
     # ---- Methods -------------------------------------------
@@ -299,6 +302,45 @@ class Optimization_History_Entry:
 
 
 
+class Optimization_History (list):
+    """ 
+    List of Optimization_History_Entry with the time series of objective, improvement 
+    and design radius over steps - appended incrementally for fast plotting 
+    """
+
+    def __init__(self):
+        super().__init__()
+
+        self._objective_series     = Time_Series ('objective')
+        self._improvement_series   = Time_Series ('improvement')
+        self._design_radius_series = Time_Series ('design radius')
+
+
+    def append (self, entry : Optimization_History_Entry):
+        """ append entry and its values to the time series """
+
+        super().append (entry)
+
+        improvement = entry.improvement if entry.improvement is not None else np.nan
+        self._objective_series.append     (entry.step, entry.objective)
+        self._improvement_series.append   (entry.step, improvement)
+        self._design_radius_series.append (entry.step, entry.design_radius)
+
+    @property
+    def objective_series (self) -> Time_Series: 
+        return self._objective_series
+
+    @property
+    def improvement_series (self) -> Time_Series: 
+        """ improvement in % over steps"""
+        return self._improvement_series
+
+    @property
+    def design_radius_series (self) -> Time_Series: 
+        return self._design_radius_series
+
+
+
 #-------------------------------------------------------------------------------
 # Geometry target Result  
 #-------------------------------------------------------------------------------
@@ -418,7 +460,7 @@ class Reader_Abstract:
             resultDir -- directory where designs with 'filename' can be found    
         """
 
-        self._results   = []                        # list of designs red 
+        self._results   = self._new_results ()      # list of designs red 
         self._resultDir = resultDir                 # directory where the designs are generated
         self._resultFile_lastSize = -1              # last file size   
         self._results_could_be_outdated = True      # flag that _results could be outdated 
@@ -493,9 +535,7 @@ class Reader_Abstract:
 
             self._resultFile_lastSize = currentSize
 
-            start = timer()
-            # ...
-            # print("Time ", timer() - start)  
+            start = perf_counter()
 
             try: 
                 f = open(self.resultPathFile, 'r')
@@ -508,15 +548,18 @@ class Reader_Abstract:
             file_lines = f.readlines()
             f.close()
 
-            time_read = timer() - start 
+            time_read = perf_counter() - start 
 
             # parse line, create objects, add to result list 
-            start = timer()
+            start = perf_counter()
 
             n_before = self.nResults
             n_new = self._load_results(file_lines)          # overloaded in sub classes
 
-            time_load = timer() - start 
+            time_load = perf_counter() - start 
+
+            instrument.add_time (f"xo2.read.{self.__class__.__name__}", time_read)
+            instrument.add_time (f"xo2.load.{self.__class__.__name__}", time_load)
 
             # nice message print 
             if n_new > 0: 
@@ -538,6 +581,11 @@ class Reader_Abstract:
         return n_new
 
 
+    def _new_results (self) -> list:
+        """ new, empty container of results"""
+        return []
+
+
     def _load_results (self, file_lines): 
         """ parse new lines and create design results """
         return 0                                           # must be over loaded 
@@ -553,11 +601,16 @@ class Reader_Optimization_History (Reader_Abstract):
     objects_text  = ('optimization step', 'optimization steps')
 
     @property
-    def steps (self) -> list [Optimization_History_Entry]:
+    def steps (self) -> Optimization_History:
         """ no of steps - will re-read if markedoutdated!"""
         return self.results 
 
 
+    def _new_results (self) -> Optimization_History:
+        """ new, empty container of steps"""
+        return Optimization_History ()
+
+
     def _load_results (self, file_lines):
         """ Parse file_lines and create new history objects  
 
@@ -851,7 +904,163 @@ class Reader_GeoTargets (Reader_Abstract):
 
 
 
-class Reader_Airfoils (Reader_Abstract):
+#-------------------------------------------------------------------------------
+# Airfoil designs - raw design data, Airfoil built on demand 
+#-------------------------------------------------------------------------------
+
+
+class Airfoil_Designs:
+    """ 
+    List like sequence of design airfoils of an optimization 
+
+    Only the raw design data (coordinates, control points, hh functions) is kept
+    for all designs. The Airfoil objects are created on demand and held in a 
+    LRU cache of 'max_cached' airfoils, so memory stays flat for long runs.
+    """
+
+    MAX_CACHED = 50                                     # default size of LRU cache 
+
+    def __init__(self, create_airfoil, max_cached : int = None):
+        """
+        Args:
+            create_airfoil: function (idesign, raw) -> Airfoil 
+            max_cached: size of LRU cache of Airfoil objects 
+        """
+
+        self._create_airfoil = create_airfoil
+        self._max_cached     = max_cached if max_cached else self.MAX_CACHED
+        self._raw            = []                       # raw data of designs 
+        self._fileNames      = []                       # fileName of design airfoils 
+        self._index          = {}                       # fileName: idesign  
+        self._cache          = OrderedDict ()           # idesign: Airfoil in LRU order 
+
+    def __repr__(self) -> str:
+        """ nice print string"""
+        return f"<{type(self).__name__} {len(self)} designs, {self.n_cached} cached>"
+
+    def __len__ (self) -> int:
+        return len (self._raw)
+
+    def __bool__ (self) -> bool:
+        return len (self._raw) > 0
+
+    def __getitem__ (self, i : int | slice) -> Airfoil | list [Airfoil]:
+
+        if isinstance (i, slice):
+            return [self._get (j) for j in range (*i.indices (len (self)))]
+
+        if i < 0: i += len (self)
+        if not (0 <= i < len (self)):
+            raise IndexError (f"Design {i} out of range")
+        return self._get (i)
+
+    def __iter__ (self):
+        for i in range (len (self)):
+            yield self._get (i)
+
+    def __contains__ (self, airfoil) -> bool:
+        return isinstance (airfoil, Airfoil) and airfoil.fileName in self._index
+
+
+    @property
+    def fileNames (self) -> list [str]:
+        """ fileNames of all design airfoils - without building them"""
+        return list (self._fileNames)
+
+    @property
+    def max_cached (self) -> int:
+        """ max number of Airfoil objects kept in LRU cache"""
+        return self._max_cached
+
+    def set_max_cached (self, n : int):
+        self._max_cached = max (1, int(n))
+        self._evict ()
+
+    @property
+    def n_cached (self) -> int:
+        """ number of Airfoil objects currently built"""
+        return len (self._cache)
+
+
+    def index (self, airfoil : Airfoil) -> int:
+        """ index of design airfoil - compared by fileName as airfoils may be re-created"""
+
+        i = self._index.get (airfoil.fileName) if isinstance (airfoil, Airfoil) else None
+        if i is None:
+            raise ValueError (f"{airfoil} is not a design")
+        return i
+
+    def index_of_fileName (self, fileName : str) -> int | None:
+        """ index of design with fileName - None if not found"""
+        return self._index.get (fileName)
+
+    def raw (self, i : int):
+        """ raw design data of design i"""
+        return self._raw [i]
+
+    def append_raw (self, fileName : str, raw):
+        """ append raw data of a new design"""
+
+        self._index [fileName] = len (self._raw)
+        self._fileNames.append (fileName)
+        self._raw.append (raw)
+
+    def clear_cache (self):
+        """ release all Airfoil objects"""
+        self._cache.clear()
+
+
+    def _get (self, i : int) -> Airfoil:
+        """ Airfoil of design i - from LRU cache or newly created """
+
+        airfoil = self._cache.get (i)
+        if airfoil is None:
+            airfoil = self._create_airfoil (i, self._raw [i])
+            self._cache [i] = airfoil
+            self._evict ()
+            instrument.count ("xo2.design_airfoil.create")
+        else:
+            self._cache.move_to_end (i)
+        return airfoil
+
+    def _evict (self):
+        while len (self._cache) > self._max_cached:
+            self._cache.popitem (last=False)
+
+
+
+class Reader_Airfoils_Abstract (Reader_Abstract):
+    """
+    Abstract superclass of airfoil design readers - designs are held as Airfoil_Designs
+    """
+
+    @override
+    def _new_results (self) -> Airfoil_Designs:
+        return Airfoil_Designs (self._create_airfoil)
+
+    @property
+    def designs (self) -> Airfoil_Designs: 
+        """ Airfoil_Designs - airfoils are created on demand """
+        return self.results
+
+    def _create_airfoil (self, idesign : int, raw) -> Airfoil:
+        """ create Airfoil of design idesign out of raw design data - to be overridden """
+        raise NotImplementedError
+
+    def _set_design_state (self, airfoil : Airfoil):
+        """ common state of a new design airfoil"""
+
+        airfoil.set_usedAs (usedAs.DESIGN)
+
+        # if airfoil file not was already created before, set modify for lazy write 
+        if os.path.isfile (airfoil.pathFileName_abs):
+            airfoil.set_isModified (False)
+        else: 
+            airfoil.set_isModified (True)                   # up to now airfoil file doesn't exist  
+
+
+
+class Reader_Airfoils (Reader_Airfoils_Abstract):
     """
     The airfoils generated during an optimization 
     """
@@ -904,24 +1113,8 @@ class Reader_Airfoils (Reader_Abstract):
         n_new = 0 
         if idesign == len (self._results):          # new, next design in list 
 
-            # create airfoil - set its file path to resultDir for lazy save to generate polar
-            #                  use basic Geometry (not splined) for faster evaluation
             fileName = self.design_fileName (idesign, Airfoil.Extension )
-
-            airfoil = Airfoil (name=name, workingDir=self._resultDir, geometry=GEO_BASIC)
-
-            airfoil.set_xy (x,y)
-            airfoil.set_pathFileName (fileName, noCheck=True)               # no check - it doesn't exist
-            airfoil.set_usedAs (usedAs.DESIGN)
-
-            # if airfoil file not was already created before, set modify for lazy write 
-            if os.path.isfile (airfoil.pathFileName_abs):
-                airfoil.set_isModified (False)
-            else: 
-                airfoil.set_isModified (True)             # up to now airfoil file doesn't exist  
-
-            self._results.append(airfoil)
-
+            self._results.append_raw (fileName, (name, np.asarray (x, dtype=float), np.asarray (y, dtype=float)))
             n_new = 1           
 
         elif idesign < len (self._results):         # we have it already 
@@ -932,11 +1125,25 @@ class Reader_Airfoils (Reader_Abstract):
         return n_new
 
 
+    @override
+    def _create_airfoil (self, idesign : int, raw) -> Airfoil:
+        """ create airfoil - set its file path to resultDir for lazy save to generate polar
+                             use basic Geometry (not splined) for faster evaluation """
+
+        name, x, y = raw
+
+        airfoil = Airfoil (name=name, workingDir=self._resultDir, geometry=GEO_BASIC)
+        airfoil.set_xy (x, y)
+        airfoil.set_pathFileName (self.design_fileName (idesign, Airfoil.Extension), noCheck=True)
+        self._set_design_state (airfoil)
+        return airfoil
+
+
 
 # -----------------------------------------
 
 
-class Reader_Airfoils_Bezier (Reader_Abstract):
+class Reader_Airfoils_Bezier (Reader_Airfoils_Abstract):
     """
     The airfoils as bezier definitions generated durng an optimization 
     """
@@ -988,31 +1195,12 @@ class Reader_Airfoils_Bezier (Reader_Abstract):
         n_new = 0 
         if idesign == len (self._results):          # new, next design in list 
 
-            # create bezier airfoil out of bezier upper and lower 
-            #  - set its file path to resultDir for lazy save to generate polar
-            airfoil = Airfoil_Bezier (name=name, workingDir=self._resultDir, )
+            # control points as (n,2) arrays of top and bot 
+            pxy_top = np.asarray (pxy_top, dtype=float).reshape (-1, 2)
+            pxy_bot = np.asarray (pxy_bot, dtype=float).reshape (-1, 2)
 
             fileName = self.design_fileName (idesign, Airfoil_Bezier.Extension )
-
-            airfoil.set_pathFileName (fileName, noCheck=True)
-
-            px, py = [], []
-            for i, x_or_y in enumerate(pxy_top):
-                if i % 2 == 0: px.append(x_or_y)
-                else:          py.append(x_or_y)
-            airfoil.set_newSide_for (Line.Type.UPPER, px, py)
-
-            px, py = [], []
-            for i, x_or_y in enumerate(pxy_bot):
-                if i % 2 == 0: px.append(x_or_y)
-                else:          py.append(x_or_y)
-            airfoil.set_newSide_for (Line.Type.LOWER, px, py)
-
-            airfoil.set_usedAs (usedAs.DESIGN)
-            airfoil.set_isModified (True)             # up to now airfoil file doesn't exist  
-
-            self._results.append(airfoil)
-
+            self._results.append_raw (fileName, (name, pxy_top, pxy_bot))
             n_new = 1           
 
         elif idesign < len (self._results):         # we have it already 
@@ -1023,9 +1211,24 @@ class Reader_Airfoils_Bezier (Reader_Abstract):
         return n_new
 
 
+    @override
+    def _create_airfoil (self, idesign : int, raw) -> Airfoil:
+        """ create bezier airfoil out of bezier upper and lower 
+              - set its file path to resultDir for lazy save to generate polar """
+
+        name, pxy_top, pxy_bot = raw
 
+        airfoil = Airfoil_Bezier (name=name, workingDir=self._resultDir)
+        airfoil.set_pathFileName (self.design_fileName (idesign, Airfoil_Bezier.Extension), noCheck=True)
+        airfoil.set_newSide_for (Line.Type.UPPER, pxy_top[:,0].tolist(), pxy_top[:,1].tolist())
+        airfoil.set_newSide_for (Line.Type.LOWER, pxy_bot[:,0].tolist(), pxy_bot[:,1].tolist())
+        self._set_design_state (airfoil)
+        return airfoil
 
-class Reader_Airfoils_HH (Reader_Abstract):
+
+
+
+class Reader_Airfoils_HH (Reader_Airfoils_Abstract):
     """
     The airfoils as Hicks Henne definitions generated during an optimization 
     """
@@ -1039,6 +1242,9 @@ class Reader_Airfoils_HH (Reader_Abstract):
         self._seed_y = None 
         self._seed_name = None
 
+        self._designs_y       = None                    # batch evaluated y of all designs 
+        self._designs_y_of    = None                    # ... for this Airfoil_Designs 
+
         super().__init__(*args,  **kwargs)
 
 
@@ -1083,8 +1289,9 @@ class Reader_Airfoils_HH (Reader_Abstract):
                 else: 
                     hhs_bot = [float(i) for i in vals[3:]] 
 
-                n_new += self.add_airfoil_design (idesign, name, hhs_top, hhs_bot)  # hh can be []
-                hhs_top, hhs_bot = [], []
+                    # design is complete with its bot line (hh can be []) 
+                    n_new += self.add_airfoil_design (idesign, name, hhs_top, hhs_bot)  
+                    hhs_top, hhs_bot = [], []
 
             else:
                 logger.error ("Invalid Hicks Henne file format for designs - skipped.")
@@ -1101,30 +1308,16 @@ class Reader_Airfoils_HH (Reader_Abstract):
 
         if idesign == 0  and len (self._results) == 0: 
 
-            airfoil = Airfoil (name=self._seed_name, geometry=GEO_BASIC)
-            airfoil.set_xy (self._seed_x,self._seed_y)
-            airfoil.set_pathFileName (os.path.join(self._resultDir, self._seed_name + '.dat'), noCheck=True)
-            airfoil.set_isModified (True)             # up to now airfoil file doesn't exist  
-            airfoil.set_usedAs (usedAs.DESIGN)
-            self._results.append(airfoil)
-
-        # create hicks henne airfoil out of upper and lower hh functions 
-        #  - set its file path to resultDir for lazy save to generate polar
+            self._results.append_raw (self._seed_name + '.dat', (self._seed_name, None, None))
 
         elif idesign == len (self._results):          # new, next design in list 
 
-            top_hhs = self._get_hhs (top_hh_vals)
-            bot_hhs = self._get_hhs (bot_hh_vals)
-
-            airfoil = Airfoil_Hicks_Henne (name=name, workingDir=self._resultDir)
+            # hh functions as (n,3) arrays of strength, location, width 
+            top_hh_vals = self._hh_array (top_hh_vals)
+            bot_hh_vals = self._hh_array (bot_hh_vals)
 
             fileName = self.design_fileName (idesign, Airfoil_Hicks_Henne.Extension )
-            airfoil.set_pathFileName (fileName, noCheck=True)
-            airfoil.set_hh_data (name, self._seed_name, self._seed_x, self._seed_y, top_hhs, bot_hhs)
-            airfoil.set_usedAs (usedAs.DESIGN)
-            airfoil.set_isLoaded (True)
-            airfoil.set_isModified (True)             # up to now airfoil file doesn't exist  
-            self._results.append(airfoil)
+            self._results.append_raw (fileName, (name, top_hh_vals, bot_hh_vals))
             n_new += 1           
 
         elif idesign < len (self._results):         # we have it already 
@@ -1135,17 +1328,89 @@ class Reader_Airfoils_HH (Reader_Abstract):
         return n_new
 
 
-    def _get_hhs (self, hh_vals): 
-        """ extract hh function out of array of hh values """
+    @override
+    def _create_airfoil (self, idesign : int, raw) -> Airfoil:
+        """ create seed or hicks henne airfoil out of upper and lower hh functions 
+              - set its file path to resultDir for lazy save to generate polar"""
+
+        name, top_hh_vals, bot_hh_vals = raw
+
+        if top_hh_vals is None:                                     # design 0 - seed 
+
+            airfoil = Airfoil (name=name, geometry=GEO_BASIC)
+            airfoil.set_xy (self._seed_x,self._seed_y)
+            airfoil.set_pathFileName (os.path.join(self._resultDir, name + '.dat'), noCheck=True)
+
+        else: 
+
+            airfoil = Airfoil_Hicks_Henne (name=name, workingDir=self._resultDir)
+            airfoil.set_pathFileName (self.design_fileName (idesign, Airfoil_Hicks_Henne.Extension), noCheck=True)
+            airfoil.set_hh_data (name, self._seed_name, self._seed_x, self._seed_y, 
+                                 self._get_hhs (top_hh_vals), self._get_hhs (bot_hh_vals),
+                                 y=self._design_y (idesign))
+            airfoil.set_isLoaded (True)
+
+        self._set_design_state (airfoil)
+        return airfoil
+
+
+    @property
+    def seed_x (self) -> np.ndarray | None:
+        """ x coordinates of seed - x of all designs"""
+        return np.asarray (self._seed_x) if self._seed_x else None
 
+
+    def designs_y (self) -> np.ndarray:
+        """ 
+        y coordinates of all designs as array (ndesigns, npoints) at seed_x 
+            - hh functions of all designs are evaluated in one broadcast per side 
+            - no Airfoil objects are created 
+        """
+
+        designs : Airfoil_Designs = self.designs
+        if not designs: 
+            return np.zeros ((0, 0))
+
+        seed_x = self.seed_x
+        seed_y = np.asarray (self._seed_y)
+        iLe    = int(np.argmin (seed_x))
+
+        upper_x = np.flip (seed_x [0: iLe + 1])
+        lower_x = seed_x [iLe:]
+
+        empty = np.zeros ((0,3))
+        top_arrays, bot_arrays = [], []
+        for i in range (len (designs)):
+            _, top, bot = designs.raw (i)
+            top_arrays.append (top if top is not None else empty)         # seed has no hh 
+            bot_arrays.append (bot if bot is not None else empty)
+
+        dy_upper = HicksHenne.eval_sum_designs (upper_x, top_arrays)
+        dy_lower = HicksHenne.eval_sum_designs (lower_x, bot_arrays)
+
+        return seed_y + np.concatenate ((np.flip (dy_upper, axis=1), dy_lower[:,1:]), axis=1)
+
+
+    def _design_y (self, idesign : int) -> np.ndarray:
+        """ y of design idesign out of designs_y - re-evaluated only when new designs were read"""
+
+        designs = self.designs
+        if self._designs_y_of is not designs or len (self._designs_y) <= idesign: 
+            self._designs_y    = self.designs_y ()
+            self._designs_y_of = designs
+        return self._designs_y [idesign]
+
+
+    def _hh_array (self, hh_vals) -> np.ndarray: 
+        """ array (n,3) of hh function strength, location, width out of hh values """
+
+        hh_vals = hh_vals if hh_vals else []
         if len(hh_vals)%3 != 0: 
             raise ValueError ("no valid Hicks Henne data array")
+        return np.asarray (hh_vals, dtype=float).reshape (-1, 3)
+
+
+    def _get_hhs (self, hh_array : np.ndarray) -> list [HicksHenne]: 
+        """ hh functions out of array (n,3) of hh values """
 
-        hhs = []
-        nhh = int(len(hh_vals) / 3)
-        for ihh in range(nhh):
-                strength = hh_vals[ihh*3] 
-                location = hh_vals[ihh*3 + 1] 
-                width    = hh_vals[ihh*3 + 2] 
-                hhs.append (HicksHenne (strength, location, width ))
-        return hhs
+        return [HicksHenne (float(strength), float(location), float(width)) for strength, location, width in hh_array]
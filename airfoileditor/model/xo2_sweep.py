@@ -0,0 +1,317 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+
+Parameter sweep over an Xoptfoil2 input file
+
+    |-- Xo2_Sweep                   - variants of a base input file
+        |-- Sweep_Variant           - a written variant input file with its parameter values
+        |-- Xo2_Job_Queue           - runs the variants concurrently
+        |-- Sweep_Result            - row of the comparison table from Xo2_Results
+
+    sweep = Xo2_Sweep (base_pathFileName)
+    sweep.add_parameter ('re_default', [300000, 400000])
+    sweep.add_parameter ('weighting_2', [1.0, 2.0])
+    sweep.write_variants ()                                 # SD7003_v1.xo2 ... SD7003_v4.xo2
+    queue = sweep.run ()                                    # poll queue.update() until done
+    print (sweep.table_text ())
+
+"""
+
+import os
+import re
+import csv
+import itertools
+from shutil                 import copyfile
+from dataclasses            import dataclass, field
+
+from .xo2_input             import Input_File
+from .xo2_results           import Xo2_Results
+from .xo2_queue             import Xo2_Job_Queue, Xo2_Job
+
+import logging
+logger = logging.getLogger(__name__)
+# logger.setLevel(logging.DEBUG)
+
+
+#-------------------------------------------------------------------------------
+# Sweep parameters
+#-------------------------------------------------------------------------------
+
+
+def _set_ncp (input_file : Input_File, val):
+    input_file.nml_bezier_options.set_ncp_top (val)
+    input_file.nml_bezier_options.set_ncp_bot (val)
+
+def _set_nfunctions (input_file : Input_File, val):
+    input_file.nml_hicks_henne_options.set_nfunctions_top (val)
+    input_file.nml_hicks_henne_options.set_nfunctions_bot (val)
+
+
+# name of sweep parameter and function to set the value in an input file
+
+SWEEP_PARAMETERS = {
+    're_default'        : lambda f, v: f.nml_operating_conditions.set_re_default (v),
+    'mach_default'      : lambda f, v: f.nml_operating_conditions.set_mach_default (v),
+    'ncrit'             : lambda f, v: f.nml_xfoil_run_options.set_ncrit (v),
+    'pop'               : lambda f, v: f.nml_particle_swarm_options.set_pop (v),
+    'max_iterations'    : lambda f, v: f.nml_particle_swarm_options.set_max_iterations (v),
+    'ncp'               : _set_ncp,
+    'ncp_top'           : lambda f, v: f.nml_bezier_options.set_ncp_top (v),
+    'ncp_bot'           : lambda f, v: f.nml_bezier_options.set_ncp_bot (v),
+    'nfunctions'        : _set_nfunctions,
+    'initial_perturb'   : lambda f, v: f.nml_optimization_options.shape_functions_nml.set_initial_perturb (v),
+}
+
+WEIGHTING_PARAMETER = re.compile (r"weighting_(\d+)$")      # 'weighting_2' - weighting of op point 2
+
+
+def _set_weighting (input_file : Input_File, iop : int, val):
+
+    opPoint_defs = input_file.opPoint_defs
+    if not (1 <= iop <= len(opPoint_defs)):
+        raise ValueError (f"Op point {iop} doesn't exist in '{input_file.fileName}'")
+    opPoint_defs[iop-1].set_weighting (val)
+
+
+def sweep_parameter_setter (name : str):
+    """ returns the function (input_file, value) to set sweep parameter 'name' - ValueError if unknown"""
+
+    if name in SWEEP_PARAMETERS:
+        return SWEEP_PARAMETERS [name]
+
+    match = WEIGHTING_PARAMETER.match (name)
+    if match:
+        iop = int (match.group(1))
+        return lambda f, v: _set_weighting (f, iop, v)
+
+    raise ValueError (f"Unknown sweep parameter '{name}'")
+
+
+#-------------------------------------------------------------------------------
+# Variant and Result
+#-------------------------------------------------------------------------------
+
+
+@dataclass
+class Sweep_Variant:
+    """ a variant input file of a sweep"""
+
+    pathFileName : str                                      # variant input file
+    params       : dict                                     # parameter name: value
+
+    @property
+    def fileName (self) -> str:
+        return os.path.basename (self.pathFileName)
+
+    @property
+    def outName (self) -> str:
+        return os.path.splitext (self.fileName)[0]
+
+    @property
+    def workingDir (self) -> str:
+        """ directory in which Xoptfoil2 runs this variant"""
+        return Xo2_Job.default_jobDir (self.pathFileName)
+
+
+@dataclass
+class Sweep_Result:
+    """ row of the comparison table - final results of a variant"""
+
+    name         : str
+    params       : dict
+    isFinished   : bool  = False
+    nSteps       : int   = 0
+    nDesigns     : int   = 0
+    objective    : float = None                             # objective function of last step
+    improvement  : float = None                             # in fraction of 1.0
+    geo_targets  : dict  = field (default_factory=dict)     # optVar: value of final design
+
+
+
+#-------------------------------------------------------------------------------
+# Sweep
+#-------------------------------------------------------------------------------
+
+
+class Xo2_Sweep:
+    """
+    Parameter sweep over a base Xoptfoil2 input file
+
+        The full grid of all parameter values is written as new versions
+        of the base input file, run concurrently in a Xo2_Job_Queue
+        and compared in a table of their Xo2_Results
+    """
+
+    def __init__(self, base_pathFileName : str):
+
+        if not os.path.isfile (base_pathFileName):
+            raise ValueError (f"Input file '{base_pathFileName}' doesn't exist")
+
+        self._workingDir, self._base_fileName = os.path.split (os.path.abspath (base_pathFileName))
+
+        self._parameters : dict [str, list] = {}            # name: values
+        self._variants   : list [Sweep_Variant] = []
+
+
+    def __repr__(self) -> str:
+        """ nice representation of self """
+        return f"<{type(self).__name__} {self._base_fileName} {self.n_variants} variants>"
+
+
+    # ---- Properties -------------------------------------------
+
+    @property
+    def workingDir (self) -> str:
+        """ directory of base input file and variants"""
+        return self._workingDir
+
+    @property
+    def base_fileName (self) -> str:
+        return self._base_fileName
+
+    @property
+    def parameters (self) -> dict [str, list]:
+        """ sweep parameters name: values"""
+        return dict (self._parameters)
+
+    @property
+    def n_variants (self) -> int:
+        """ number of variants of the parameter grid"""
+        n = 1
+        for values in self._parameters.values():
+            n *= len (values)
+        return n if self._parameters else 0
+
+    @property
+    def variants (self) -> list [Sweep_Variant]:
+        """ variants written up to now"""
+        return self._variants
+
+
+    # ---- Methods -------------------------------------------
+
+    def add_parameter (self, name : str, values : list):
+        """ add parameter 'name' with its values to the sweep"""
+
+        sweep_parameter_setter (name)                       # check name
+        if not values:
+            raise ValueError (f"No values for sweep parameter '{name}'")
+        self._parameters [name] = list (values)
+
+
+    def param_grid (self) -> list [dict]:
+        """ all combinations of parameter values as list of dict"""
+
+        names = list (self._parameters.keys())
+        return [dict (zip (names, values)) for values in itertools.product (*self._parameters.values())]
+
+
+    def write_variants (self) -> list [Sweep_Variant]:
+        """ write a new version of the base input file for each parameter combination"""
+
+        self._variants = []
+        fileName = self.base_fileName
+
+        for params in self.param_grid ():
+
+            fileName = self._next_fileName (fileName)
+            pathFileName = os.path.join (self.workingDir, fileName)
+            copyfile (os.path.join (self.workingDir, self.base_fileName), pathFileName)
+
+            input_file = Input_File (fileName, workingDir=self.workingDir)
+            for name, val in params.items():
+                sweep_parameter_setter (name) (input_file, val)
+
+            descriptions = input_file.nml_info.descriptions[:1]
+            input_file.nml_info.set_descriptions (descriptions + [f"Sweep {self._params_text (params)}"])
+            input_file.save_nml ()
+
+            self._variants.append (Sweep_Variant (pathFileName, params))
+            logger.debug (f"{self} written {fileName} {params}")
+
+        logger.info (f"{self} written {len(self._variants)} variants of {self.base_fileName}")
+        return self._variants
+
+
+    def run (self, queue : Xo2_Job_Queue = None) -> Xo2_Job_Queue:
+        """ add variants to a (new) job queue - poll queue.update() to run them"""
+
+        if queue is None:
+            queue = Xo2_Job_Queue ()
+
+        for variant in self._variants:
+            queue.add (variant.pathFileName, jobDir=variant.workingDir)
+        return queue
+
+
+    def comparison_table (self) -> list [Sweep_Result]:
+        """ final results of the variants - sorted by objective, variants without results last"""
+
+        rows = []
+        for variant in self._variants:
+
+            row = Sweep_Result (variant.fileName, variant.params)
+            results = Xo2_Results (variant.workingDir, variant.outName)
+
+            if results.steps:
+                row.isFinished  = results.isFinished
+                row.nSteps      = results.nSteps
+                row.nDesigns    = results.nDesigns
+                row.objective   = results.steps[-1].objective
+                row.improvement = results.improvement
+            if results.designs_geoTargets:
+                row.geo_targets = {geo.optVar : geo.value for geo in results.designs_geoTargets[-1]}
+            rows.append (row)
+
+        return sorted (rows, key=lambda row: (row.objective is None, row.objective or 0.0))
+
+
+    def table_text (self) -> str:
+        """ comparison table as plain text"""
+
+        rows  = self.comparison_table ()
+        names = list (self._parameters.keys())
+        geos  = list (dict.fromkeys (optVar for row in rows for optVar in row.geo_targets))
+
+        lines = [f"{'Variant':24s}" + "".join (f"{name:>14s}" for name in names) +
+                 f"{'Objective':>11s}{'Improve %':>10s}" + "".join (f"{geo:>11s}" for geo in geos)]
+
+        for row in rows:
+            line  = f"{row.name:24s}" + "".join (f"{row.params[name]:>14}" for name in names)
+            line += f"{row.objective:11.5f}{row.improvement * 100:10.2f}" if row.objective is not None else f"{'-':>11s}{'-':>10s}"
+            line += "".join (f"{row.geo_targets[geo]:11.5f}" if geo in row.geo_targets else f"{'-':>11s}" for geo in geos)
+            lines.append (line)
+
+        return "\n".join (lines)
+
+
+    def save_csv (self, pathFileName : str):
+        """ write comparison table as csv file with ';' delimiter like Xoptfoil2"""
+
+        rows  = self.comparison_table ()
+        names = list (self._parameters.keys())
+        geos  = list (dict.fromkeys (optVar for row in rows for optVar in row.geo_targets))
+
+        with open (pathFileName, 'w', newline='') as f:
+            writer = csv.writer (f, delimiter=';')
+            writer.writerow (['Variant'] + names + ['Objective', 'Improvement', 'Steps', 'Designs'] + geos)
+            for row in rows:
+                writer.writerow ([row.name] + [row.params[name] for name in names] +
+                                 [row.objective, row.improvement, row.nSteps, row.nDesigns] +
+                                 [row.geo_targets.get (geo) for geo in geos])
+
+
+    def _next_fileName (self, fileName : str) -> str:
+        """ next unused version of fileName"""
+
+        new_fileName = Input_File.new_fileName_version (fileName, self.workingDir)
+        if os.path.isfile (os.path.join (self.workingDir, new_fileName)):
+            new_fileName = Input_File.new_fileName_version (new_fileName, self.workingDir)   # will loop to unused
+        return new_fileName
+
+
+    @staticmethod
+    def _params_text (params : dict) -> str:
+        return ", ".join (f"{name}={val}" for name, val in params.items())
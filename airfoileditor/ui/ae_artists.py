@@ -378,24 +378,26 @@ class Movable_Side_Bezier (Movable_Curve):
         self._airfoil.geo.set_cPoints_from_jpoints_for(self._side.type, self.jpoints, moving=True)
 
 
-    def refresh (self):
-        """ refresh control points from side control points """
+    def refresh (self, curve = None):
+        """ refresh control points from side control points - or from a snapshot curve while matching"""
+
+        cpoints = self._side.cPoints if curve is None else curve.cpoints
 
         # when matching, thread could have changed ncp - race condition ...
-        if len (self._movable_points) != len(self._side.cPoints):
+        if len (self._movable_points) != len(cpoints):
             return
 
         # update all my movable points at once 
         movable_point : Movable_Curve_Point
-        for i, point_xy in enumerate(self._side.cPoints):
+        for i, point_xy in enumerate(cpoints):
             movable_point = self._movable_points[i]
-            movable_point.setPos_silent (point_xy)              # silent - no change signal 
+            movable_point.setPos_silent (tuple (point_xy))      # silent - no change signal 
 
         # update polyline         
         self.setData(*self.points_xy())                         
 
-        # update curve item 
-        self._update_curve_item()
+        # update curve item - a snapshot is evaluated on its own curve 
+        self._update_curve_item(curve=curve)
 
 
     def _add_point (self, pos_x, pos_y):
@@ -487,24 +489,26 @@ class Movable_Side_BSpline (Movable_Curve):
         self._airfoil.geo.set_cPoints_from_jpoints_for(self._side.type, self.jpoints, moving=True)
 
 
-    def refresh (self):
-        """ refresh control points from side control points """
+    def refresh (self, curve = None):
+        """ refresh control points from side control points - or from a snapshot curve while matching"""
+
+        cpoints = self._side.cPoints if curve is None else curve.cpoints
 
         # when matching, thread could have changed ncp - race condition ...
-        if len (self._movable_points) != len(self._side.cPoints):
+        if len (self._movable_points) != len(cpoints):
             return
 
         # update all my movable points at once 
         movable_point : Movable_Curve_Point
-        for i, point_xy in enumerate(self._side.cPoints):
+        for i, point_xy in enumerate(cpoints):
             movable_point = self._movable_points[i]
-            movable_point.setPos_silent (point_xy)              # silent - no change signal 
+            movable_point.setPos_silent (tuple (point_xy))      # silent - no change signal 
 
         # update polyline         
         self.setData(*self.points_xy())                         
 
-        # update curve item 
-        self._update_curve_item()
+        # update curve item - a snapshot is evaluated on its own curve 
+        self._update_curve_item(curve=curve)
 
 
     @override
@@ -1349,19 +1353,20 @@ class Bezier_Artist (Artist):
     @property
     def airfoils (self) -> list [Airfoil]: return self.data_list
 
-    def refresh_from_side (self, aLinetype : Line.Type):
-        """ fast refresh of bezier control points for one line type"""
+    def refresh_from_side (self, aLinetype : Line.Type, curve = None):
+        """ fast refresh of bezier control points for one line type - optional snapshot curve"""
 
         p : Movable_Side_Bezier
         for p in self._plots: 
             if isinstance (p, Movable_Side_Bezier) and p._side.type == aLinetype:
-                if len (p._movable_points) != len(p._side.cPoints):
+                ncp = len(p._side.cPoints) if curve is None else curve.ncp
+                if len (p._movable_points) != ncp:
                     # when matching, thread could have changed ncp - complete refresh
                     self.refresh()     
                     return
                 else:
                     # just update control point items
-                    p.refresh()
+                    p.refresh(curve)
 
     def _plot (self): 
     
@@ -1403,19 +1408,20 @@ class BSpline_Artist (Artist):
     def airfoils (self) -> list [Airfoil]: return self.data_list
 
 
-    def refresh_from_side (self, aLinetype : Line.Type):
-        """ fast refesh of bspline control points for one line type"""
+    def refresh_from_side (self, aLinetype : Line.Type, curve = None):
+        """ fast refesh of bspline control points for one line type - optional snapshot curve"""
 
         p : Movable_Side_BSpline
         for p in self._plots: 
             if isinstance (p, Movable_Side_BSpline) and p._side.type == aLinetype:
-                if len (p._movable_points) != len(p._side.cPoints):
+                ncp = len(p._side.cPoints) if curve is None else curve.ncp
+                if len (p._movable_points) != ncp:
                     # when matching, thread could have changed ncp - complete refresh
                     self.refresh()     
                     return
                 else:
                     # just update control point items
-                    p.refresh()
+                    p.refresh(curve)
 
 
     def _plot (self): 
@@ -2117,9 +2123,11 @@ class Polar_Artist (Artist):
                     if polar.error_occurred:
                         # in error_msg could be e.g. '<' 
                         error_msg.append (f"'{airfoil.name_to_show} - {polar.name}': {html.escape(polar.error_reason)}")
-                    elif not polar.isLoaded: 
+                    elif not polar.isLoaded and not polar.is_preview: 
                         nPolar_generating += 1
                     else: 
+                        if polar.is_preview:                    # interpolated until generated
+                            nPolar_generating += 1
                         nPolar_plotted    += 1
                         # generate increasing color hue value for the polars of an airfoil 
                         color = color_in_series (color_airfoil, iPolar, len(polars), delta_hue=0.1)
@@ -2181,7 +2189,9 @@ class Polar_Artist (Artist):
 
         label = f"{_label_airfoil (airfoils, airfoil)} - {polar.name}" 
 
-        if not polar.isLoaded:
+        if polar.is_preview:
+            label = label + ' preview'                          # interpolated during async generation
+        elif not polar.isLoaded:
             label = label + ' generating'                       # async polar generation  
 
         # set linewidth 
@@ -2200,6 +2210,9 @@ class Polar_Artist (Artist):
         else:
             linewidth=1.0
 
+        if polar.is_preview:
+            style = Qt.PenStyle.DotLine
+
         # NORMAl and DESIGN polar above other polars 
 
         if airfoil.usedAs == usedAs.FINAL:
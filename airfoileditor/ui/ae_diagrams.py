@@ -191,7 +191,7 @@ class Panel_Airfoils (Edit_Panel):
                 if self.airfoil_designs:
                     ComboBox    (l,r,c+1, colSpan=2, width=155, get=lambda: self.airfoil_design.fileName if self.airfoil_design else None,
                                  set=self._on_airfoil_design_selected,
-                                 options= lambda: [airfoil.fileName for airfoil in self.airfoil_designs],  
+                                 options= lambda: self.app_model.case.airfoil_designs_fileNames(),  
                                  toolTip=f"Select a Design out of list of airfoil designs")
                 else: 
                     Field       (l,r,c+1, colSpan=2, width=155, get=lambda i=iair:self.airfoil(i).fileName, 
@@ -328,10 +328,9 @@ class Panel_Airfoils (Edit_Panel):
     def _on_airfoil_design_selected (self, fileName):
         """ callback of combobox when an airfoil design was selected"""
 
-        for airfoil in self.airfoil_designs:
-            if airfoil.fileName == fileName:
-                self.app_model.set_airfoil (airfoil)
-                break
+        fileNames = self.app_model.case.airfoil_designs_fileNames()
+        if fileName in fileNames:
+            self.app_model.set_airfoil (self.airfoil_designs [fileNames.index (fileName)])
 
 
     @override
@@ -723,11 +722,11 @@ class Item_Airfoil (Diagram_Item):
         self.refresh()
 
 
-    def _on_curve_changed (self, side_type : Line.Type):
-        """ slot to handle curve of airfoil changed signal """
+    def _on_curve_changed (self, side_type : Line.Type, curve):
+        """ slot to handle curve of airfoil changed signal - curve is a snapshot of the matched curve"""
 
-        self._bezier_artist.refresh_from_side (side_type)
-        self._bspline_artist.refresh_from_side (side_type)
+        self._bezier_artist.refresh_from_side (side_type, curve)
+        self._bspline_artist.refresh_from_side (side_type, curve)
         self._cst_artist.refresh_from_side (side_type)
 
         
@@ -7,24 +7,25 @@ Extra functions (dialogs) to modify airfoil
 
 """
 
+import copy
 import numpy as np
 
 from PyQt6.QtCore               import Qt, QCoreApplication
 from PyQt6.QtGui                import QCursor
-from PyQt6.QtWidgets            import QWidget, QLayout, QDialogButtonBox, QPushButton, QDialogButtonBox, QFileDialog
+from PyQt6.QtWidgets            import QWidget, QLayout, QDialogButtonBox, QPushButton, QDialogButtonBox, QFileDialog, QScrollArea
 
 from ..base.widgets             import * 
-from ..base.panels              import Dialog_Modal, Dialog_Modeless, MessageBox
+from ..base.panels              import Dialog_Modal, Dialog_Modeless, MessageBox, Panel_Abstract
 
 from ..model.airfoil            import Airfoil
-from ..model.airfoil_exports    import Export_Airfoil_Dxf
+from ..model.airfoil_exports    import Export_Airfoil_Dxf, Export_Airfoils_Dxf, Dxf_Batch_Item
 from ..model.geometry           import Geometry, Flap_Setter
 from ..model.geometry_curve     import LE_Mode
 from ..model.geometry_spline    import Geometry_Splined, Paneling_Spline
 from ..model.geometry_cst       import Geometry_CST, Side_Airfoil_CST
 from ..model.case               import Match_Targets, Case_Match_Target
 from ..base.pso                 import Pso_Options
-from ..match_runner             import Match_Result, Matcher
+from ..match_runner             import Match_Result, Match_Progress, Matcher
 
 from .ae_widgets                import Airfoil_Select_Open_Widget
 
@@ -210,6 +211,320 @@ class Airfoil_Export_DXF_Dialog (Dialog_Modal):
         return buttonBox
 
 
+class Airfoils_Export_DXF_Dialog (Dialog_Modal):
+    """Dialog to export a batch of airfoils to DXF files in background - each with its own chord and TE gap."""
+
+    _width = 520
+
+    name = "Export Airfoils as DXF"
+
+    SOURCE_CURRENT  = "Current and References"
+    SOURCE_DESIGNS  = "Designs of Case"
+    SOURCE_BLEND    = "Blend Series"
+
+    TABLE_HEIGHT    = 200
+
+    def __init__(self, parent: QWidget, app_model: App_Model, **kwargs):
+
+        self._app_model = app_model
+        self._export_btn: QPushButton = None
+        self._cancel_btn: QPushButton = None
+
+        # chord and TE gap are initially taken from the settings of the single airfoil export
+        settings = app_model.exporter_airfoil
+        self._chord_mm  = settings.chord_mm
+        self._te_gap_mm = settings.te_gap_mm if settings.adapt_te_gap else None
+
+        self._source       = self.SOURCE_CURRENT
+        self._blend_with   = self.airfoils_blend_with[0] if self.airfoils_blend_with else None
+        self._blend_steps  = 5
+
+        self._exporter = Export_Airfoils_Dxf ([app_model.airfoil])
+        self._exporter.set_always_as_cubic_fit (settings.always_as_cubic_fit)
+        self._runner  = None 
+        self._progress_text = ""
+
+        self._table : QWidget = None 
+        self._scroll : QScrollArea = None
+        self._set_items ()
+
+        super().__init__(parent=parent, **kwargs)
+
+        self._cancel_btn.clicked.connect(self.close)
+        self._export_btn.clicked.connect(self._export_dxf)
+
+
+    @property
+    def app_model(self) -> App_Model:
+        return self._app_model
+
+    @property
+    def exporter(self) -> Export_Airfoils_Dxf:
+        return self._exporter
+
+    @property
+    def items (self) -> list[Dxf_Batch_Item]:
+        return self.exporter.items
+
+
+    @property
+    def airfoil_designs (self) -> list[Airfoil]:
+        """ designs of the current case"""
+        return self.app_model.case.airfoil_designs if self.app_model.case else []
+
+    @property
+    def airfoils_blend_with (self) -> list[Airfoil]:
+        """ airfoils the current airfoil can be blended with"""
+        airfoils = list (self.app_model.airfoils_ref)
+        if self.app_model.airfoil_2 and self.app_model.airfoil_2 not in airfoils:
+            airfoils.append (self.app_model.airfoil_2)
+        return airfoils
+
+    @property
+    def sources (self) -> list[str]:
+        """ available sources of airfoils"""
+        sources = [self.SOURCE_CURRENT]
+        if self.airfoil_designs:
+            sources.append (self.SOURCE_DESIGNS)
+        if self.airfoils_blend_with:
+            sources.append (self.SOURCE_BLEND)
+        return sources
+
+
+    @property
+    def source (self) -> str:
+        return self._source
+
+    def set_source (self, source : str):
+        self._source = source
+        self._set_items ()
+
+
+    @property
+    def blend_with (self) -> str | None:
+        """ fileName of the airfoil to blend with"""
+        return self._blend_with.fileName if self._blend_with else None
+
+    def set_blend_with (self, fileName : str):
+        self._blend_with = next ((a for a in self.airfoils_blend_with if a.fileName == fileName), None)
+        self._set_items ()
+
+    @property
+    def blend_steps (self) -> int:
+        return self._blend_steps
+
+    def set_blend_steps (self, n : int):
+        self._blend_steps = n
+        self._set_items ()
+
+
+    @property
+    def chord_mm (self) -> float:
+        """ chord of all airfoils"""
+        return self._chord_mm
+
+    def set_chord_mm (self, chord_mm : float):
+        self._chord_mm = chord_mm
+        for item in self.items:
+            item.set_chord_mm (chord_mm)
+
+    @property
+    def adapt_te_gap (self) -> bool:
+        return self._te_gap_mm is not None
+
+    def set_adapt_te_gap (self, aBool : bool):
+        self.set_te_gap_mm (self.app_model.exporter_airfoil.te_gap_mm if aBool else None)
+
+    @property
+    def te_gap_mm (self) -> float | None:
+        """ TE gap of all airfoils - None: keep TE gap of airfoil"""
+        return self._te_gap_mm
+
+    def set_te_gap_mm (self, te_gap_mm : float | None):
+        self._te_gap_mm = te_gap_mm
+        for item in self.items:
+            item.set_te_gap_mm (te_gap_mm)
+
+
+    def _source_airfoils (self) -> list[Airfoil]:
+        """ airfoils of the current source"""
+
+        if self.source == self.SOURCE_DESIGNS:
+            return list (self.airfoil_designs)
+        elif self.source == self.SOURCE_BLEND and self._blend_with:
+            blendBys = np.linspace (0.0, 1.0, self.blend_steps)
+            return Airfoil.blend_series (self.app_model.airfoil, self._blend_with, blendBys)
+        else:
+            return [self.app_model.airfoil] + self.app_model.airfoils_ref
+
+
+    def _set_items (self):
+        """ (re)build the items of the exporter from the current source"""
+
+        self.exporter.set_items ([Dxf_Batch_Item (airfoil, chord_mm=self.chord_mm, te_gap_mm=self.te_gap_mm) 
+                                  for airfoil in self._source_airfoils()])
+        if self._scroll is not None:
+            self._scroll.setWidget (self._table_widget())
+
+
+    def _init_layout(self) -> QLayout:
+
+        l = QGridLayout()
+        r = 0
+        ComboBox (l, r, 0, lab="Airfoils", width=160,
+                  get=lambda: self.source, set=self.set_source, options=lambda: self.sources)
+        Label    (l, r, 2, colSpan=3, style=style.COMMENT, get=lambda: f"{len(self.items)} airfoils")
+        r += 1
+        ComboBox (l, r, 0, lab="Blend with", width=160,
+                  get=lambda: self.blend_with, set=self.set_blend_with,
+                  options=lambda: [a.fileName for a in self.airfoils_blend_with],
+                  hide=lambda: self.source != self.SOURCE_BLEND)
+        FieldI   (l, r, 2, lab="Steps", width=50, lim=(2, 51), step=1,
+                  get=lambda: self.blend_steps, set=self.set_blend_steps,
+                  hide=lambda: self.source != self.SOURCE_BLEND)
+        r += 1
+        Field    (l, r, 0, width=250, colSpan=3, lab="To Directory", get=lambda: self.exporter.export_dir)
+        ToolButton(l, r,4, icon=Icon.OPEN, set=self._select_directory)
+        r += 1
+        SpaceR   (l, r, stretch=0, height=10)
+        r += 1
+        FieldF   (l, r, 0, width=90, lab="Chord all", unit="mm", dec=1, lim=(0.1, 10000), step=1.0,
+                  get=lambda: self.chord_mm, set=self.set_chord_mm)
+        CheckBox (l, r, 2, text="TE gap all", get=lambda: self.adapt_te_gap, set=self.set_adapt_te_gap)
+        FieldF   (l, r, 3, width=80, unit="mm", dec=1, lim=(0.0, 10), step=0.1,
+                  get=lambda: self.te_gap_mm, set=self.set_te_gap_mm, 
+                  disable=lambda: not self.adapt_te_gap)
+        r += 1
+        SpaceR   (l, r, stretch=0, height=5)
+        r += 1
+        self._scroll = QScrollArea ()
+        self._scroll.setWidgetResizable (True)
+        self._scroll.setFixedHeight (self.TABLE_HEIGHT)
+        self._scroll.setWidget (self._table_widget())
+        l.addWidget (self._scroll, r, 0, 1, 6)
+        r += 1
+        SpaceR   (l, r, stretch=1, height=10)
+        r += 1
+        CheckBox (l, r, 0, colSpan=5, text="Export Bezier and B-Spline based airfoils as cubic spline fit",
+                  obj=self.exporter, prop=Export_Airfoils_Dxf.always_as_cubic_fit)
+        r += 1
+        Label    (l, r, 0, colSpan=5, get=lambda: self._progress_text, style=style.COMMENT)
+
+        l.setColumnMinimumWidth(0, 95)
+        l.setColumnMinimumWidth(2, 90)
+        l.setColumnStretch(5, 5)
+        return l
+
+
+    def _table_widget (self) -> QWidget:
+        """ table of the items with individual chord and TE gap"""
+
+        self._table = QWidget()
+        l = QGridLayout()
+        l.setContentsMargins (5, 5, 5, 5)
+        l.setVerticalSpacing (2)
+
+        r = 0
+        Label (l, r, 0, get="Airfoil", style=style.COMMENT)
+        Label (l, r, 1, get="Chord",   style=style.COMMENT)
+        Label (l, r, 2, colSpan=2, get="TE gap", style=style.COMMENT)
+        for item in self.items:
+            r += 1
+            Label    (l, r, 0, get=item.airfoil.fileName_stem, width=(120, None))
+            FieldF   (l, r, 1, width=90, unit="mm", dec=1, lim=(0.1, 10000), step=1.0,
+                      get=lambda item=item: item.chord_mm, set=item.set_chord_mm)
+            CheckBox (l, r, 2, get=lambda item=item: item.te_gap_mm is not None,
+                      set=lambda b, item=item: item.set_te_gap_mm (self.app_model.exporter_airfoil.te_gap_mm if b else None))
+            FieldF   (l, r, 3, width=80, unit="mm", dec=1, lim=(0.0, 10), step=0.1,
+                      get=lambda item=item: item.te_gap_mm, set=item.set_te_gap_mm,
+                      disable=lambda item=item: item.te_gap_mm is None)
+        r += 1
+        l.setRowStretch (r, 1)
+        l.setColumnStretch (4, 1)
+        self._table.setLayout (l)
+
+        for w in Panel_Abstract.widgets_of_layout (l):
+            w.sig_changed.connect (self._on_widget_changed)
+
+        return self._table
+
+
+    @override
+    @property
+    def widgets (self) -> list[Widget]:
+        """ widgets of dialog including the item table"""
+        widgets = super().widgets
+        if self._table is not None:
+            widgets += Panel_Abstract.widgets_of_layout (self._table.layout())
+        return widgets
+
+
+    def _select_directory(self):
+        directory = QFileDialog.getExistingDirectory(self, caption="Select Export Directory",
+                                                     directory=self.exporter.export_dir_abs)
+        if directory:
+            self.exporter.set_export_dir(directory)
+            self.refresh()
+
+
+    def _export_dxf(self, *_):
+        """ start export in background - progress is shown until finished"""
+
+        self._export_btn.setDisabled (True)
+
+        self._runner = self.app_model.run_export_dxf_batch (self.exporter)
+        self._runner.sig_progress.connect (self._on_progress)
+        self._runner.sig_finished.connect (self._on_finished)
+
+
+    def _on_progress (self, n_done : int, n_total : int, result):
+        """ slot - one airfoil exported"""
+
+        self._progress_text = f"{n_done} of {n_total} exported - {result.name}"
+        self.refresh()
+
+
+    def _on_finished (self, results : list):
+        """ slot - export finished"""
+
+        self._runner = None
+        failed = [f"{r.name}: {r.error}" for r in results if not r.ok]
+
+        if failed:
+            MessageBox.error(self, "Export Airfoils as DXF", "DXF export failed.\n\n" + "\n".join (failed), min_height=80)
+            self._export_btn.setDisabled (False)
+            return
+
+        self.close()
+        self._toast_message(f"{len(results)} airfoils exported to {self.exporter.export_dir}")
+
+
+    @override
+    def reject (self):
+        """ stop a running export when closed"""
+        if self._runner: 
+            self._runner.requestInterruption()
+        super().reject()
+
+
+    @override
+    def _on_widget_changed(self):
+        self.refresh()
+
+
+    @override
+    def _button_box(self):
+        buttonBox = QDialogButtonBox(QDialogButtonBox.StandardButton.Cancel)
+
+        self._cancel_btn = buttonBox.button(QDialogButtonBox.StandardButton.Cancel)
+        self._export_btn = QPushButton("&Export", parent=self)
+        self._export_btn.setFixedWidth(80)
+        buttonBox.addButton(self._export_btn, QDialogButtonBox.ButtonRole.ActionRole)
+
+        return buttonBox
+
+
+
 class Blend_Airfoil_Dialog (Dialog_Modeless):
     """ Dialog to blend two airfoils into a new one"""
 
@@ -748,6 +1063,26 @@ class Match_Pso_Options_Dialog (Dialog_Modal):
             set=lambda v: self.pso_options.set_min_radius_best_ui(float(v)),
                 toolTip="Stop threshold for swarm radius around best. 0 disables this criterion.")
 
+        r += 1
+        SpaceR (l, r, height=10)
+
+        r += 1
+        ComboBox (l,r,c, lab="Surrogate", width=70,
+            get=lambda: self.pso_options.surrogate_ui,
+            set=lambda v: self.pso_options.set_surrogate_ui(v),
+                options=["off", "rbf", "quadratic"],
+                toolTip="Pre-screen particles with a surrogate model fitted on the evaluation history.")
+        FieldF (l,r,c+3, lab="True share", width=70, dec=2, lim=(0.05, 1.0), step=0.05,
+            get=lambda: self.pso_options.surrogate_share,
+            set=lambda v: self.pso_options.set_surrogate_share(float(v)),
+            disable=lambda: self.pso_options.surrogate is None,
+                toolTip="Max. share of particles evaluated with the true objective per iteration.")
+        FieldI (l,r,c+6, lab="Warmup", width=70, lim=(1, 100),
+            get=lambda: self.pso_options.surrogate_warmup,
+            set=lambda v: self.pso_options.set_surrogate_warmup(int(v)),
+            disable=lambda: self.pso_options.surrogate is None,
+                toolTip="Iterations with full evaluation before the surrogate is used.")
+
         l.setColumnMinimumWidth (0, 80)
         l.setColumnMinimumWidth (2, 20)
         l.setColumnMinimumWidth (3, 70)
@@ -759,6 +1094,58 @@ class Match_Pso_Options_Dialog (Dialog_Modal):
 
 
 
+class Match_Simplex_Options_Dialog (Dialog_Modal):
+    """Modal dialog to set the multi-start options of Simplex (Nelder-Mead) used by Match mode."""
+
+    name = "Simplex Options"
+
+    @property
+    def targets_list (self) -> list [Match_Targets]:
+        """ targets of upper and lower side - first one is shown"""
+        return self.dataObject
+
+
+    def _set_nm_starts (self, n : int):
+        for targets in self.targets_list:
+            targets.set_nm_starts (n)
+
+    def _set_nm_seed (self, seed : int):
+        for targets in self.targets_list:
+            targets.set_nm_seed (None if seed < 0 else seed)
+
+
+    def _init_layout(self) -> QLayout:
+
+        l = QGridLayout()
+        r, c = 0, 0
+
+        Label  (l,r,c, colSpan=5, style=style.COMMENT,
+                get="Multiple starts run in parallel processes\n" + \
+                    "and the best ones continue (successive halving)")
+
+        r += 1
+        SpaceR (l, r, height=5)
+
+        r += 1
+        FieldI (l,r,c,   lab="Starts", width=70, lim=(1, 32), step=1,
+            get=lambda: self.targets_list[0].nm_starts,
+            set=lambda v: self._set_nm_starts(int(v)),
+            toolTip="Number of starts of Nelder-Mead. 1 is a single run from the start position.")
+        FieldI (l,r,c+3, lab="Seed", width=70, lim=(-1, 999999),
+            get=lambda: self.targets_list[0].nm_seed if self.targets_list[0].nm_seed is not None else -1,
+            set=lambda v: self._set_nm_seed(int(v)),
+            disable=lambda: self.targets_list[0].nm_starts < 2,
+            toolTip="Random seed of the start positions for deterministic runs. -1 means random seed.")
+
+        l.setColumnMinimumWidth (0, 80)
+        l.setColumnMinimumWidth (2, 20)
+        l.setColumnMinimumWidth (3, 70)
+        SpaceC (l, 5, width=10)
+
+        return l
+
+
+
 class Matcher_Run_Info (Dialog_Modal):
     """ Little Info dialog (with stop button) show information during match run"""
 
@@ -781,9 +1168,10 @@ class Matcher_Run_Info (Dialog_Modal):
 
         matcher.finished.connect (self._on_finished)
         matcher.sig_pass_start.connect (self._on_pass_start)
-        matcher.sig_new_results.connect (self._on_results)
+        matcher.sig_progress.connect (self._on_progress)
 
         self._matcher = matcher
+        self._side_view = copy.deepcopy (matcher._side)        # private side to derive metrics of progress 
 
         # init layout etc 
 
@@ -859,15 +1247,14 @@ class Matcher_Run_Info (Dialog_Modal):
 
     # --------------------
 
-    def _on_results (self, ipass, nevals, result : Match_Result):
-        """ slot to receive new results from running thread"""
+    def _on_progress (self, progress : Match_Progress):
+        """ slot to receive new progress from running thread - derive metrics for display"""
 
-        self._ipass   = ipass
-        self._nevals  = nevals
-        self._result  = result  # Store the entire result object
+        self._ipass   = progress.ipass
+        self._nevals  = progress.nevals
+        self._result  = progress.result (self._side_view, self.targets)
 
         self.refresh ()
-        QCoreApplication.processEvents()
 
 
     def _on_pass_start (self, ipass : int, ncp: int, global_search: bool):
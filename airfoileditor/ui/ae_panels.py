@@ -29,7 +29,7 @@ from ..model.xo2_driver         import Xoptfoil2
 from .ae_widgets                import * 
 from .ae_dialogs                import (LE_Radius_Dialog, TE_Gap_Dialog, Matcher_Run_Info,
                                         Blend_Airfoil_Dialog, Flap_Airfoil_Dialog, Repanel_Airfoil_Dialog,
-                                        Match_Pso_Options_Dialog, CST_Fit_Dialog)
+                                        Match_Pso_Options_Dialog, Match_Simplex_Options_Dialog, CST_Fit_Dialog)
 from ..app_model                import App_Model
 from ..match_runner             import Match_Result
 
@@ -126,6 +126,7 @@ class Panel_File_View (Panel_Airfoil_Abstract):
     sig_new_as_cst = pyqtSignal()                       # wants to create new CST based airfoil
     sig_save_as = pyqtSignal()                          # wants to save current airfoil as new file
     sig_export_dxf = pyqtSignal()                       # wants to export current airfoil as dxf
+    sig_export_dxf_batch = pyqtSignal()                 # wants to export current and reference airfoils as dxf
     sig_rename = pyqtSignal()                           # wants to rename current airfoil
     sig_delete = pyqtSignal()                           # wants to delete current airfoil
     sig_delete_temp_files = pyqtSignal()                # wants to delete all temp files
@@ -204,6 +205,8 @@ class Panel_File_View (Panel_Airfoil_Abstract):
                                      toolTip="Create a copy of the current airfoil with new name and filename"))
         menu.addAction (MenuAction ("Export DXF...", self, set=self.sig_export_dxf.emit,
                          toolTip="Export the current airfoil to a DXF file"))
+        menu.addAction (MenuAction ("Export DXF of all...", self, set=self.sig_export_dxf_batch.emit,
+                         toolTip="Export the current and the reference airfoils to DXF files"))
         menu.addAction (MenuAction ("Rename...", self, set=self.sig_rename.emit,
                                      toolTip="Rename name and/or filename of current airfoil"))
         menu.addAction (MenuAction ("Delete", self, set=self.sig_delete.emit,
@@ -1375,16 +1378,21 @@ class Panel_Match_Curve (Panel_Airfoil_Abstract):
 
         l_head.addStretch(1)
 
-        _tip = "Select optimizer used for matching on both upper and lower sides."
+        _tip = "Select optimizer used for matching on both upper and lower sides.\n" + \
+               "Gradient: fast least squares fit (Levenberg-Marquardt)"
         # Label  (l_head, get="Optimizer", hide=self._small)
         ComboBox (l_head, colSpan=3, width=70,
                 get=lambda: self.optimizer, set=self.set_optimizer,
-                options=["Simplex", "PSO"],
+                options=["Simplex", "PSO", "Gradient"],
                 hide=lambda: self._small,  toolTip=_tip)
         ToolButton (l_head, icon=Icon.SETTINGS,
                 set=self._edit_pso_options,
                 hide=lambda: self._small or self.optimizer != "PSO",
                 toolTip="Edit PSO options for development tuning")
+        ToolButton (l_head, icon=Icon.SETTINGS,
+                set=self._edit_simplex_options,
+                hide=lambda: self._small or self.optimizer != "Simplex",
+                toolTip="Edit Simplex options like multiple starts")
 
 
     def _init_layout (self):
@@ -1473,6 +1481,18 @@ class Panel_Match_Curve (Panel_Airfoil_Abstract):
                   style=style.HINT,
                   toolTip=_tip, hide=lambda: self._small or self.target_airfoil.geo.curvature.max_is_at_le)
         r += 1
+        _tip = "Budget of the search for the best number of control points (Auto).\n" + \
+               "Each number gets a short probe, the best ones continue with the rest of the budget."
+        Label  (l,r,c, get="Budget", hide=self._small, toolTip=_tip)
+        FieldI (l,r,c+1, colSpan=3, width=85, step=500, lim=(0, 100000), specialText="no limit",
+                get=lambda: self.max_evals, set=self.set_max_evals,
+                hide=self._small, disable=lambda: not self.ncp_auto,
+                toolTip="Maximum number of objective evaluations of all passes")
+        FieldF (l,r,c+5, colSpan=3, width=70, dec=0, step=10, lim=(0, 3600), unit="s", specialText="no limit",
+                get=lambda: self.max_time, set=self.set_max_time,
+                hide=self._small, disable=lambda: not self.ncp_auto,
+                toolTip="Maximum time of all passes in seconds")
+        r += 1
         l.setRowStretch (r,2)
         r += 1
         c = 0
@@ -1535,16 +1555,45 @@ class Panel_Match_Curve (Panel_Airfoil_Abstract):
         self.targets_lower.set_le_monoton(not monoton)
 
 
+    @property
+    def ncp_auto (self) -> bool:
+        """ True if one of the sides searches the number of control points"""
+        return self.targets_upper.ncp_auto or self.targets_lower.ncp_auto
+
+
+    @property
+    def max_evals (self) -> int:
+        """ evaluation budget - 0 is no limit"""
+        return self.targets_upper.max_evals or 0
+
+    def set_max_evals (self, max_evals : int):
+        for targets in (self.targets_upper, self.targets_lower):
+            targets.set_budget (max_evals=max_evals, max_time=targets.max_time)
+
+
+    @property
+    def max_time (self) -> float:
+        """ time budget in seconds - 0 is no limit"""
+        return self.targets_upper.max_time or 0.0
+
+    def set_max_time (self, max_time : float):
+        for targets in (self.targets_upper, self.targets_lower):
+            targets.set_budget (max_evals=targets.max_evals, max_time=max_time)
+
+
     @property
     def optimizer (self) -> str:
         """ shared optimizer shown in UI; uses upper-side value as source """
+        if self.targets_upper.use_lsq:
+            return "Gradient"
         return "PSO" if self.targets_upper.use_pso else "Simplex"
 
 
     def set_optimizer (self, optimizer: str):
         """ set optimizer for both sides """
-        self.targets_upper.set_use_pso(optimizer == "PSO")
-        self.targets_lower.set_use_pso(optimizer == "PSO")
+        for targets in (self.targets_upper, self.targets_lower):
+            targets.set_use_pso(optimizer == "PSO")
+            targets.set_use_lsq(optimizer == "Gradient")
 
 
     def _edit_pso_options (self):
@@ -1562,6 +1611,20 @@ class Panel_Match_Curve (Panel_Airfoil_Abstract):
         self.app_model.notify_match_target_changed()
 
 
+    def _edit_simplex_options (self):
+        """Open modal dialog for Simplex multi-start options of both sides."""
+
+        diag = Match_Simplex_Options_Dialog(
+            self,
+            getter=lambda: [self.targets_upper, self.targets_lower],
+            parentPos=(0.5, 0.2),
+            dialogPos=(0.5, 1.1),
+        )
+        diag.exec()
+
+        self.app_model.notify_match_target_changed()
+
+
     def _message_text (self):
         """ user info"""
 
@@ -24,7 +24,8 @@ from ..model.xo2_input          import (
     OPT_MAX,
     OPT_MIN,
 )
-from ..model.xo2_results        import OpPoint_Result, Optimization_History_Entry
+from ..base.time_series         import Time_Series
+from ..model.xo2_results        import OpPoint_Result, Optimization_History
 
 from .ae_artists                import _color_airfoil
 
@@ -1022,58 +1023,82 @@ class Xo2_OpPoint_Artist (Artist):
 
 
 
-class Xo2_Design_Radius_Artist (Artist):
-    """ Plot Xoptfoil2 design radius during optimization """
+class Xo2_History_Artist (Artist):
+    """ 
+    Abstract: Plot a time series of the Xoptfoil2 optimization history 
+
+    The series is decimated to about the pixel width of the view - after a 
+    manual zoom the visible range is decimated out of the full resolution data 
+    """
+
+    N_OUT_MIN = 100                                         # min points to plot
+
+    def __init__ (self, *args, **kwargs):
+        super().__init__ (*args, **kwargs)
+
+        self._pi.getViewBox().sigRangeChangedManually.connect (lambda *_: self.refresh())
 
-    
     @property
-    def steps (self) -> list[Optimization_History_Entry]: 
+    def steps (self) -> Optimization_History: 
         """ optimization step entries up to now """
         return self.data_object
 
-    def _plot (self): 
+    @property
+    def series (self) -> Time_Series | None:
+        """ time series to plot - to be overridden"""
+        return None
 
-        radius_list = [entry.design_radius for entry in self.steps]
+    def _decimated (self, series : Time_Series) -> tuple [np.ndarray, np.ndarray]:
+        """ x,y of series decimated to the pixel width of view box """
 
-        if radius_list:
-            p = pg.PlotDataItem  (radius_list)
-            self._add (p)
+        vb : pg.ViewBox = self._pi.getViewBox()
+        n_out   = max (int (vb.width()), self.N_OUT_MIN)
+        x_range = None if vb.autoRangeEnabled()[0] else tuple (vb.viewRange()[0])
+        return series.decimated (n_out, x_range=x_range)
 
-            # plot last as point 
-            x = len(radius_list) - 1
-            y = radius_list[-1]
-            back_color = QColor ("black")
-            back_color.setAlphaF (0.5)
+    def _plot_series (self, color, text_fn : Callable, **kwargs):
+        """ plot decimated series and its last value as point """
 
-            self._plot_point (x,y, size=5, color=COLOR_OK, text = f"{y:.3f}", textFill=back_color, anchor= (1.1, 0.9))
+        series = self.series
+        if not series: return
 
+        x, y = self._decimated (series)
+        self._plot_dataItem (x, y)
 
+        # plot last as point 
+        x, y = series.last
+        back_color = QColor ("black")
+        back_color.setAlphaF (0.5)
+
+        self._plot_point (x,y, size=5, color=color, text=text_fn (y), textFill=back_color, **kwargs)
+
+
+
+class Xo2_Design_Radius_Artist (Xo2_History_Artist):
+    """ Plot Xoptfoil2 design radius during optimization """
 
-class Xo2_Improvement_Artist (Artist):
-    """ Plot Xoptfoil2 improvement during optimization """
-    
     @property
-    def steps (self) -> list[Optimization_History_Entry]: 
-        """ optimization step entries up to now """
-        return self.data_object  
+    def series (self) -> Time_Series | None:
+        steps = self.steps
+        return steps.design_radius_series if isinstance (steps, Optimization_History) else None
 
     def _plot (self): 
 
-        improvement_list = [entry.improvement for entry in self.steps]
+        self._plot_series (COLOR_OK, lambda y: f"{y:.3f}", anchor= (1.1, 0.9))
 
-        if improvement_list:
 
-            p = pg.PlotDataItem  (improvement_list)
-            self._add (p)
 
-            # plot last as point 
-            x = len(improvement_list) - 1
-            y = improvement_list[-1]
-            back_color = QColor ("black")
-            back_color.setAlphaF (0.5)
-            
-            self._plot_point (x,y, size=5, color=COLOR_GOOD, text = f"{y:.2f}%", textFill=back_color, 
-                              textOffset=(-5,0), anchor= (0.8, -0.1))
+class Xo2_Improvement_Artist (Xo2_History_Artist):
+    """ Plot Xoptfoil2 improvement during optimization """
+
+    @property
+    def series (self) -> Time_Series | None:
+        steps = self.steps
+        return steps.improvement_series if isinstance (steps, Optimization_History) else None
+
+    def _plot (self): 
+
+        self._plot_series (COLOR_GOOD, lambda y: f"{y:.2f}%", textOffset=(-5,0), anchor= (0.8, -0.1))
 
 
 
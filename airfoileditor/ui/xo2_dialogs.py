@@ -23,6 +23,7 @@ from ..model.case           import Case_Optimize
 from ..model.xo2_controller import xo2_state, Xo2_Controller
 from ..model.xo2_results    import Xo2_Results, Optimization_History_Entry
 from ..model.xo2_input      import *
+from ..model.xo2_queue      import Xo2_Job_Queue, xo2_job_state
 
 from .util_dialogs          import Polar_Definition_Dialog
 from .ae_widgets            import Airfoil_Select_Open_Widget, mode_color
@@ -1062,6 +1063,107 @@ class Xo2_Run_Dialog (Dialog_Modal):
 
 
 
+class Xo2_Queue_Dialog (Dialog_Modal):
+    """ Dialog to watch the queue of concurrent optimization jobs - add the current case as job"""
+
+    _width  = (400, None)
+
+    name = "Optimization Queue"
+
+    def __init__ (self, parent : QWidget, 
+                  app_model : App_Model,
+                  **kwargs): 
+
+        self._app_model = app_model
+
+        super().__init__ (parent, **kwargs)  
+
+        self.setAttribute (Qt.WidgetAttribute.WA_DeleteOnClose, True)
+
+        self.app_model.sig_xo2_queue_changed.connect (self.refresh)           # job state or progress (Watchdog)
+
+
+    @property
+    def app_model (self) -> App_Model:
+        return self._app_model
+
+    @property
+    def case (self) -> Case_Optimize:
+        return self.app_model.case
+
+    @property
+    def queue (self) -> Xo2_Job_Queue:
+        return self.app_model.xo2_queue
+
+
+    def _init_layout(self) -> QLayout:
+
+        l = QGridLayout()
+        r,c = 0, 0 
+        Label  (l,r,c, colSpan=5, get=lambda: f"{len(self.queue.jobs)} jobs on {self.queue.n_cores} cores", 
+                style=style.COMMENT)
+        r += 1
+        Label  (l,r,c, colSpan=5, height=(80, None), get=self._jobs_text, wordWrap=True)
+        r += 1
+        SpaceR (l,r, height=10, stretch=1)
+        r += 1
+        Button (l,r,c,   text="Add Current", width=90, set=self._add_case,
+                toolTip=lambda: f"Add {self.case.input_file.fileName} as a new job to the queue")
+        Button (l,r,c+1, text="Pause All", width=80, set=self._pause_all,
+                disable=lambda: not self.queue.isActive)
+        Button (l,r,c+2, text="Resume All", width=80, set=self._resume_all,
+                disable=lambda: not self.queue.jobs_in_state (xo2_job_state.PAUSED))
+        Button (l,r,c+3, text="Clear Done", width=80, set=self._clear_done,
+                disable=lambda: not self.queue.jobs_in_state (xo2_job_state.FINISHED, xo2_job_state.FAILED))
+        l.setColumnStretch (4,2)
+        return l
+
+
+    def _jobs_text (self) -> str:
+        """ one line per job with its state and progress"""
+
+        lines = []
+        for job in self.queue.jobs:
+            line = f"{job.name}:  {job.state}"
+            if job.nSteps:
+                line += f"  -  step {job.nSteps}, improvement {job.improvement:.2%}"
+            if job.isActive:
+                line += f"  -  {job.time_running()}"
+            if job.errortext:
+                line += f"  -  {job.errortext}"
+            lines.append (line)
+        return "\n".join (lines) if lines else "No jobs"
+
+
+    def _add_case (self):
+        try:
+            self.queue.add_case (self.case)
+        except ValueError as e:
+            MessageBox.error (self, self.name, str(e), min_height=60)
+        self.refresh()
+
+    def _pause_all (self):
+        self.queue.pause_all ()
+        self.refresh()
+
+    def _resume_all (self):
+        self.queue.resume_all ()
+        self.refresh()
+
+    def _clear_done (self):
+        self.queue.clear_done ()
+        self.refresh()
+
+
+    @override
+    def _button_box (self):
+        """ only close button"""
+        buttonBox = QDialogButtonBox (QDialogButtonBox.StandardButton.Close)
+        buttonBox.rejected.connect (self.close)
+        return buttonBox
+
+
+
 class Xo2_Input_File_Dialog (Dialog_Modal):
 
     """ Text edit of Xoptfoil2 input file  """
@@ -180,6 +180,24 @@ class Panel_Xo2_File (Panel_Xo2_Abstract):
         r += 1
         Button      (l,r,c, width=100, text="&Run Xoptfoil2", button_style = button_style.PRIMARY,
                         set=self._open_run_dialog, toolTip="Run Optimizer Xoptfoil2")        
+        Button      (l,r,c+2, width=80, text="Queue ...", set=self._open_queue_dialog,
+                        toolTip="Run optimizations concurrently in a queue of jobs")
+        r += 1
+        SpaceR      (l,r, height=1)
+        r += 1
+        row_widget = QWidget()
+        row_l = QHBoxLayout()
+        row_l.setContentsMargins(0, 0, 0, 0)
+        row_l.setSpacing(4)
+
+        Label       (row_l, icon=lambda: Icon.ERROR if self._issues["errors"] else Icon.WARNING, width=20,
+                        hide=lambda: not self._issue_texts)
+        Label       (row_l, get=self._issues_text, style=style.COMMENT,
+                        hide=lambda: not self._issue_texts,
+                        toolTip=lambda: '\n'.join(self._issue_texts))
+        row_l.addStretch(1)
+        row_widget.setLayout(row_l)
+        l.addWidget (row_widget, r, c, 1, 4)
         r += 1
         l.setRowStretch (r,2)
         r += 1
@@ -191,6 +209,23 @@ class Panel_Xo2_File (Panel_Xo2_Abstract):
         return l
 
 
+    @property
+    def _issues (self) -> dict [str, list[str]]:
+        """ errors and warnings of the input file"""
+        return self.input_file.get_issue_messages ()
+
+    @property
+    def _issue_texts (self) -> list[str]:
+        """ all issue texts - errors first"""
+        issues = self._issues
+        return issues["errors"] + issues["warnings"]
+
+    def _issues_text (self) -> str:
+        """ short text about the issues of the input file - details in tooltip"""
+        n = len (self._issue_texts)
+        return f"{n} input file issue{'s' if n > 1 else ''}" 
+
+
     @property
     def _input_fileName (self) -> str:
         return self.input_file.fileName
@@ -219,6 +254,13 @@ class Panel_Xo2_File (Panel_Xo2_Abstract):
             self.sig_open_next.emit (newPathFileName)
 
 
+    def _open_queue_dialog (self):
+        """ open dialog of optimization queue - modeless"""
+
+        diag = Xo2_Queue_Dialog (self, self.app_model, parentPos=(0.02,0.8), dialogPos=(0,1))
+        diag.show()
+
+
     def _open_run_dialog (self):
         """ open optimize run dialog"""
 
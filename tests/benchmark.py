@@ -0,0 +1,474 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+    Benchmark suite for the numerical hot paths of the AirfoilEditor.
+
+    Measures curve evaluation (Bezier, BSpline, CST, Hicks-Henne designs), Spline2D build,
+    Geometry_Splined normalize and repanel, single Matcher passes
+    (Nelder-Mead and PSO), Xfoil_Polar_Parser and NeuralFoil inference.
+    All random input is created with fixed seeds so runs are comparable.
+
+    Run from the project root:
+
+        python -m tests.benchmark                                   # print timings
+        python -m tests.benchmark --save bench.json                 # save results e.g. as baseline
+        python -m tests.benchmark --baseline bench.json             # regression gate (exit code 1)
+        python -m tests.benchmark --baseline bench.json --threshold 0.3 --only bezier_eval
+
+    Timings are machine dependent - a baseline should be created on the
+    machine which runs the gate.
+"""
+
+import os
+import sys
+import json
+import argparse
+import platform
+import tempfile
+import statistics
+from contextlib             import AbstractContextManager, ExitStack, contextmanager
+from time                   import perf_counter
+from dataclasses            import dataclass, asdict
+from typing                 import Callable
+
+import numpy as np
+
+# allow 'python tests/benchmark.py' besides 'python -m tests.benchmark'
+if __package__ in (None, ''):
+    sys.path.insert (0, os.path.dirname (os.path.dirname (os.path.abspath (__file__))))
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+SEED              = 42                              # fixed seed for all random input
+THRESHOLD_DEFAULT = 0.25                            # allowed slowdown against baseline (25%)
+REPEAT_DEFAULT    = 5
+
+
+# ------------------------------------------------------------------------------
+# Results
+# ------------------------------------------------------------------------------
+
+
+@dataclass
+class Bench_Result:
+    """Timing result of a single benchmark - times are seconds per call"""
+
+    name     : str
+    number   : int                                  # calls per repeat
+    repeat   : int                                  # number of repeats
+    best     : float                                # fastest repeat
+    median   : float                                # median of repeats
+    skipped  : str | None = None                    # reason why benchmark was skipped
+
+    @property
+    def ok (self) -> bool:
+        return self.skipped is None
+
+    def toDict (self) -> dict:
+        return asdict (self)
+
+    @classmethod
+    def fromDict (cls, aDict : dict) -> 'Bench_Result':
+        return cls (**aDict)
+
+
+@dataclass
+class Bench_Regression:
+    """A benchmark which is slower than its baseline beyond threshold"""
+
+    name     : str
+    baseline : float
+    current  : float
+
+    @property
+    def ratio (self) -> float:
+        return self.current / self.baseline if self.baseline > 0.0 else float('inf')
+
+
+class Benchmark_Skipped (Exception):
+    """Raised by a benchmark setup if it can't run in the current environment"""
+    pass
+
+
+# ------------------------------------------------------------------------------
+# Registry
+# ------------------------------------------------------------------------------
+
+
+BENCHMARKS : dict [str, tuple [Callable, int]] = {}
+
+
+def benchmark (name : str, number : int = 1):
+    """
+    Decorator to register a benchmark.
+        The decorated function is the setup - it returns the callable to be timed
+        or a context manager providing it, which holds resources during timing.
+        'number' is the count of calls per repeat (use >1 for fast functions)
+    """
+
+    def register (setup_fn : Callable) -> Callable:
+        BENCHMARKS [name] = (setup_fn, number)
+        return setup_fn
+
+    return register
+
+
+def _rng () -> np.random.Generator:
+    return np.random.default_rng (SEED)
+
+
+def _example_airfoil (geometry=None):
+    """a fresh copy of the root example airfoil"""
+
+    from airfoileditor.model.airfoil_examples import Root_Example
+    from airfoileditor.model.airfoil          import GEO_SPLINE
+
+    return Root_Example (geometry=geometry if geometry is not None else GEO_SPLINE)
+
+
+def _ensure_qt_app ():
+    """Matcher is a QThread - a QCoreApplication is needed for signals"""
+
+    from PyQt6.QtCore import QCoreApplication
+
+    return QCoreApplication.instance() or QCoreApplication (sys.argv[:1])
+
+
+# ------------------------------------------------------------------------------
+# Benchmarks
+# ------------------------------------------------------------------------------
+
+
+@benchmark ("bezier_eval", number=200)
+def _bench_bezier_eval ():
+
+    from airfoileditor.base.spline import Bezier
+
+    cpx = [0.0, 0.0, 0.3, 0.7, 1.0]
+    cpy = [0.0, 0.04, 0.09, 0.05, 0.0]
+    bezier = Bezier (cpx, cpy)
+    u = np.sort (_rng().random (200))
+
+    return lambda: bezier.eval (u, update_cache=False)
+
+
+@benchmark ("bspline_eval", number=200)
+def _bench_bspline_eval ():
+
+    from airfoileditor.base.spline import BSpline
+
+    cpx = [0.0, 0.0, 0.1, 0.3, 0.6, 0.85, 1.0]
+    cpy = [0.0, 0.03, 0.07, 0.08, 0.05, 0.02, 0.0]
+    bspline = BSpline (cpx, cpy, degree=3)
+    u = np.sort (_rng().random (200))
+
+    return lambda: bspline.eval (u, update_cache=False)
+
+
+@benchmark ("cst_eval", number=200)
+def _bench_cst_eval ():
+
+    from airfoileditor.base.cst import CST
+
+    cst = CST ([0.17, 0.16, 0.18, 0.15, 0.17, 0.14, 0.15, 0.13], le_weight=0.1, te_gap=0.001)
+    x = np.sort (_rng().random (200))
+
+    return lambda: cst.eval_y_on_x (x)
+
+
+@benchmark ("hicks_henne_designs", number=5)
+def _bench_hicks_henne_designs ():
+
+    from airfoileditor.base.spline import HicksHenne
+
+    rng = _rng()
+    x = np.linspace (0.0, 1.0, 160)
+    hh_arrays = [np.column_stack ((rng.uniform (-0.005, 0.005, 4),
+                                   rng.uniform (0.05, 0.95, 4),
+                                   rng.uniform (0.5, 3.0, 4))) for _ in range (500)]
+
+    return lambda: HicksHenne.eval_sum_designs (x, hh_arrays)
+
+
+@benchmark ("spline2d_build", number=20)
+def _bench_spline2d_build ():
+
+    from airfoileditor.base.spline import Spline2D
+
+    airfoil = _example_airfoil ()
+    x, y = airfoil.x, airfoil.y
+
+    return lambda: Spline2D (x, y)
+
+
+@benchmark ("geometry_normalize", number=5)
+def _bench_geometry_normalize ():
+
+    from airfoileditor.model.geometry_spline import Geometry_Splined
+
+    airfoil = _example_airfoil ()
+
+    # rotate, scale and shift the airfoil so normalize has some work to do
+    angle = np.radians (3.0)
+    x = (airfoil.x * np.cos(angle) - airfoil.y * np.sin(angle)) * 1.1 + 0.05
+    y = (airfoil.x * np.sin(angle) + airfoil.y * np.cos(angle)) * 1.1 - 0.02
+
+    def run ():
+        geo = Geometry_Splined (x.copy(), y.copy())
+        geo.normalize ()
+
+    return run
+
+
+@benchmark ("geometry_repanel", number=5)
+def _bench_geometry_repanel ():
+
+    from airfoileditor.model.geometry_spline import Geometry_Splined
+
+    airfoil = _example_airfoil ()
+    x, y = airfoil.x, airfoil.y
+
+    def run ():
+        geo = Geometry_Splined (x.copy(), y.copy())
+        geo.repanel (nPanels=200)
+
+    return run
+
+
+def _matcher_single_pass (use_pso : bool) -> Callable:
+    """setup of a single Matcher pass on the upper side of the example airfoil"""
+
+    from airfoileditor.match_runner     import Match_Airfoil
+    from airfoileditor.model.airfoil    import Airfoil_Bezier
+
+    _ensure_qt_app ()
+
+    match_airfoil = Match_Airfoil (_example_airfoil (), Airfoil_Bezier)
+    match_airfoil.set_use_pso (use_pso, seed=SEED)
+    matcher = match_airfoil._matcher_upper
+
+    def run ():
+        matcher._ipass = 1
+        matcher._side.target_deviation.set_fast (True)
+        matcher._run_single_pass (ncp=matcher._ncp)
+        matcher._side.target_deviation.set_fast (False)
+
+    return run
+
+
+@benchmark ("match_nelder_mead", number=1)
+def _bench_match_nelder_mead ():
+    return _matcher_single_pass (use_pso=False)
+
+
+@benchmark ("match_pso", number=1)
+def _bench_match_pso ():
+    return _matcher_single_pass (use_pso=True)
+
+
+def _xfoil_polar_text (npoints : int = 150) -> str:
+    """a synthetic xfoil polar file with npoints operating points"""
+
+    lines = [ "",
+        "       XFOIL         Version 6.99",
+        "",
+        " Calculated polar for: Benchmark Airfoil",
+        "",
+        " 1 1 Reynolds number fixed          Mach number fixed",
+        "",
+        " xtrf =   1.000 (top)        1.000 (bottom)",
+        " Mach =   0.000     Re =     0.400 e 6     Ncrit =   9.000",
+        "",
+        "  alpha    CL        CD       CDp       CM     Top_Xtr  Bot_Xtr",
+        " ------ -------- --------- --------- -------- -------- --------"]
+
+    rng = _rng()
+    for alpha in np.linspace (-6.0, 14.0, npoints):
+        cl  = 0.1 * alpha + 0.3
+        cd  = 0.006 + 0.0001 * alpha**2 + rng.random() * 1e-4
+        lines.append (f"{alpha:8.3f} {cl:8.4f} {cd:9.5f} {cd*0.4:9.5f} {-0.05:8.4f} {0.6:8.4f} {0.9:8.4f}")
+
+    return "\n".join (lines) + "\n"
+
+
+@benchmark ("xfoil_polar_parse", number=20)
+@contextmanager
+def _bench_xfoil_polar_parse ():
+
+    from airfoileditor.model.xo2_driver import Xfoil_Polar_Parser
+
+    with tempfile.TemporaryDirectory (prefix="ae_bench_") as tmp_dir:
+        pathFileName = os.path.join (tmp_dir, "benchmark_polar.txt")
+        with open (pathFileName, "w") as file:
+            file.write (_xfoil_polar_text ())
+
+        yield lambda: Xfoil_Polar_Parser.parse_file (pathFileName)
+
+
+@benchmark ("neuralfoil_inference", number=3)
+def _bench_neuralfoil_inference ():
+
+    from airfoileditor.model.nf_driver  import Neuralfoil_Evaluator
+    from airfoileditor.model.polar_dto  import Polar_File_Meta
+    from airfoileditor.model.polar_set  import Polar
+
+    if not Neuralfoil_Evaluator.is_available():
+        raise Benchmark_Skipped ("NeuralFoil not available")
+
+    airfoil_as_cst = Polar._geo_as_CST (_example_airfoil().geo)
+    meta = Polar_File_Meta (polar_type="T1", re=400000, ma=0.0, ncrit=9.0, val_range=(-4.0, 12.0, 0.5))
+
+    return lambda: Neuralfoil_Evaluator.get_polar_data_set (airfoil_as_cst, meta)
+
+
+# ------------------------------------------------------------------------------
+# Runner
+# ------------------------------------------------------------------------------
+
+
+def run_benchmark (name : str, repeat : int = REPEAT_DEFAULT) -> Bench_Result:
+    """run a single registered benchmark - setup is not timed"""
+
+    setup_fn, number = BENCHMARKS [name]
+
+    np.random.seed (SEED)                           # for code using the legacy global generator
+
+    with ExitStack () as resources:                 # e.g. temp dir of setup - released after timing
+        try:
+            fn = setup_fn ()
+            if isinstance (fn, AbstractContextManager):
+                fn = resources.enter_context (fn)
+        except Benchmark_Skipped as e:
+            return Bench_Result (name, number, 0, 0.0, 0.0, skipped=str(e))
+
+        fn ()                                       # warm up caches, lazy imports etc.
+
+        times = []
+        for _ in range (max (1, repeat)):
+            t0 = perf_counter ()
+            for _ in range (number):
+                fn ()
+            times.append ((perf_counter () - t0) / number)
+
+    return Bench_Result (name, number, len(times), min(times), statistics.median (times))
+
+
+def run_benchmarks (names : list [str] | None = None,
+                    repeat : int = REPEAT_DEFAULT,
+                    progress_callback : Callable | None = None) -> dict [str, Bench_Result]:
+    """run all (or the named) benchmarks and return results by name"""
+
+    names = list (BENCHMARKS.keys()) if names is None else names
+
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError (f"unknown benchmark(s): {', '.join (unknown)}")
+
+    results = {}
+    for name in names:
+        results [name] = run_benchmark (name, repeat=repeat)
+        if callable (progress_callback):
+            progress_callback (results [name])
+    return results
+
+
+def compare (results : dict [str, Bench_Result],
+             baseline : dict [str, Bench_Result],
+             threshold : float = THRESHOLD_DEFAULT) -> list [Bench_Regression]:
+    """
+    Compare results against baseline - returns regressions which are slower
+    than baseline by more than threshold (0.25 = 25%).
+        The 'best' time is compared as it is the least noisy measure.
+        Benchmarks missing in baseline or skipped are ignored.
+    """
+
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get (name)
+        if base is None or not result.ok or not base.ok:
+            continue
+        if result.best > base.best * (1.0 + threshold):
+            regressions.append (Bench_Regression (name, base.best, result.best))
+    return regressions
+
+
+def save_results (results : dict [str, Bench_Result], pathFileName : str):
+    """save results as json together with some info about the machine"""
+
+    data = {
+        "info"    : {"python"   : platform.python_version(),
+                     "numpy"    : np.__version__,
+                     "machine"  : platform.machine(),
+                     "platform" : platform.platform()},
+        "results" : {name : result.toDict() for name, result in results.items()}
+    }
+
+    with open (pathFileName, "w") as file:
+        json.dump (data, file, indent=2)
+
+
+def load_results (pathFileName : str) -> dict [str, Bench_Result]:
+    """load results saved with save_results"""
+
+    with open (pathFileName, "r") as file:
+        data = json.load (file)
+
+    return {name : Bench_Result.fromDict (aDict) for name, aDict in data.get ("results", {}).items()}
+
+
+def _print_result (result : Bench_Result, base : Bench_Result | None = None):
+
+    if not result.ok:
+        print (f"  {result.name:24s} skipped: {result.skipped}")
+        return
+
+    line = f"  {result.name:24s} {result.best*1000:10.3f} ms   (median {result.median*1000:10.3f} ms)"
+    if base is not None and base.ok and base.best > 0.0:
+        line += f"   {result.best / base.best:6.2f}x baseline"
+    print (line)
+
+
+def main (argv : list [str] | None = None) -> int:
+    """command line entry - returns exit code 1 if a regression was found"""
+
+    parser = argparse.ArgumentParser (description="AirfoilEditor benchmark suite")
+    parser.add_argument ("--only",      nargs="+", metavar="NAME", help="run only these benchmarks")
+    parser.add_argument ("--list",      action="store_true", help="list available benchmarks")
+    parser.add_argument ("--repeat",    type=int, default=REPEAT_DEFAULT, help="repeats per benchmark")
+    parser.add_argument ("--save",      metavar="JSON", help="save results to json file")
+    parser.add_argument ("--baseline",  metavar="JSON", help="compare against baseline json file")
+    parser.add_argument ("--threshold", type=float, default=THRESHOLD_DEFAULT,
+                         help=f"allowed slowdown against baseline (default {THRESHOLD_DEFAULT})")
+    args = parser.parse_args (argv)
+
+    if args.list:
+        for name in BENCHMARKS:
+            print (name)
+        return 0
+
+    baseline = load_results (args.baseline) if args.baseline else {}
+
+    print (f"Running benchmarks (repeat={args.repeat}, seed={SEED})")
+    results = run_benchmarks (args.only, repeat=args.repeat,
+                              progress_callback=lambda r: _print_result (r, baseline.get (r.name)))
+
+    if args.save:
+        save_results (results, args.save)
+        print (f"Results saved to {args.save}")
+
+    if args.baseline:
+        regressions = compare (results, baseline, threshold=args.threshold)
+        if regressions:
+            print (f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+            for reg in regressions:
+                print (f"  {reg.name:24s} {reg.baseline*1000:10.3f} ms -> {reg.current*1000:10.3f} ms  ({reg.ratio:.2f}x)")
+            return 1
+        print (f"\nNo regressions beyond {args.threshold:.0%}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit (main ())
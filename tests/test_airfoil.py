@@ -241,6 +241,53 @@ class Test_Airfoil:
         assert np.all(np.diff(x_new) >= -1e-12)
         assert not np.any(np.isclose(x_new[:-1], x_new[1:]))
 
+    def test_blend_series_equals_single_blends(self):
+
+        airfoil1 = Root_Example(geometry = GEO_SPLINE)
+        airfoil2 = Tip_Example (geometry = GEO_SPLINE)
+        airfoil1.normalize()
+        airfoil2.normalize()
+
+        blendBys = [0.0, 0.25, 0.5, 0.75]
+        airfoils = Airfoil.blend_series (airfoil1, airfoil2, blendBys)
+
+        assert len(airfoils) == len(blendBys)
+        assert all (airfoil.isBlendAirfoil for airfoil in airfoils)
+        assert len({airfoil.fileName for airfoil in airfoils}) == len(blendBys)
+
+        for blendBy, airfoil_series in zip (blendBys, airfoils):
+            airfoil = Airfoil (name="<blend>", geometry = GEO_SPLINE)
+            airfoil.do_blend (airfoil1, airfoil2, blendBy)
+
+            assert np.allclose (airfoil.geo.x, airfoil_series.x)
+            assert np.allclose (airfoil.geo.y, airfoil_series.y)
+
+        assert airfoils[2].geo.max_thick == 7.3015 / 100
+
+        # close and identical blend factors get unique file names
+        blendBys = [0.5, 0.5001, 0.5002, 0.5002]
+        airfoils = Airfoil.blend_series (airfoil1, airfoil2, blendBys)
+        assert len({airfoil.fileName for airfoil in airfoils}) == len(blendBys)
+        assert airfoils[1].fileName_stem.endswith ("50.01")
+        assert airfoils[3].fileName_stem.endswith ("50.02_2")
+
+    def test_flap_sweep_equals_single_flaps(self):
+
+        airfoil = Root_Example(geometry = GEO_BASIC)
+        geo = airfoil.geo
+        flap_angles = [-5.0, -1.0, 0.0, 2.0, 10.0]
+
+        geos_sweep = Geometry (geo.x.copy(), geo.y.copy()).flapped_sweep (flap_angles)
+        assert len(geos_sweep) == len(flap_angles)
+
+        for flap_angle, geo_sweep in zip (flap_angles, geos_sweep):
+            geo_single = Geometry (geo.x.copy(), geo.y.copy())
+            geo_single.set_flap (flap_angle=flap_angle, moving=True)
+
+            assert len(geo_sweep.x) == len(geo_single.x)
+            assert np.allclose (geo_sweep.x, geo_single.x, atol=1e-9)
+            assert np.allclose (geo_sweep.y, geo_single.y, atol=1e-9)
+
     def test_airfoil_file_functions (self, temp_dir):
 
         from pathlib import Path
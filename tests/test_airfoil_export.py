@@ -3,9 +3,10 @@
 
 import ezdxf
 
-from airfoileditor.model.airfoil import Airfoil_BSpline, Airfoil_Bezier, GEO_BASIC
-from airfoileditor.model.airfoil_examples import Root_Example
-from airfoileditor.model.airfoil_exports import Export_Airfoil_Dxf
+from airfoileditor.model.airfoil import Airfoil, Airfoil_BSpline, Airfoil_Bezier, GEO_BASIC
+from airfoileditor.model.airfoil_examples import Root_Example, Tip_Example
+from airfoileditor.model.airfoil_exports import (Export_Airfoil_Dxf, Export_Airfoil_Set, 
+                                                 Export_Airfoils_Dxf, Dxf_Batch_Item)
 
 
 def _export_entity_types(airfoil, tmp_path, export_name: str) -> list[str]:
@@ -32,4 +33,51 @@ def test_export_bspline_airfoil_as_splines(tmp_path):
 
     entity_types = _export_entity_types(airfoil, tmp_path, "bspline_export")
 
-    assert entity_types == ["SPLINE", "SPLINE", "TEXT", "TEXT"]
\ No newline at end of file
+    assert entity_types == ["SPLINE", "SPLINE", "TEXT", "TEXT"]
+
+
+def test_export_blend_series_as_set(tmp_path):
+    airfoils = Airfoil.blend_series(Root_Example(), Tip_Example(), [0.2, 0.4, 0.6])
+
+    exporter = Export_Airfoil_Set(airfoils)
+    exporter.set_export_dir(str(tmp_path / "blend_export"))
+    paths = exporter.do_it()
+
+    assert len(paths) == 3
+    for airfoil, path in zip(airfoils, paths):
+        loaded = Airfoil(pathFileName=path)
+        loaded.load()
+        assert loaded.nPoints == airfoil.nPoints
+
+
+def test_export_batch_dxf_in_process_pool(tmp_path):
+    airfoils = Airfoil.blend_series(Root_Example(), Tip_Example(), [0.0, 0.5, 1.0])
+    airfoils.append(Airfoil_Bezier.on_airfoil(Root_Example(geometry=GEO_BASIC)))
+    items = [Dxf_Batch_Item(airfoil, chord_mm=200.0 - 20.0 * i, te_gap_mm=0.5) for i, airfoil in enumerate(airfoils)]
+
+    progress = []
+    exporter = Export_Airfoils_Dxf(items)
+    exporter.set_export_dir(str(tmp_path / "batch_export"))
+    results = exporter.do_it(max_workers=2, progress_callback=lambda n, n_total, result: progress.append(n))
+
+    assert progress == [1, 2, 3, 4]
+    assert [result.name for result in results] == [airfoil.name for airfoil in airfoils]
+    assert all(result.ok for result in results)
+
+    entity_types = [entity.dxftype() for entity in ezdxf.readfile(results[-1].pathFileName).modelspace()]
+    assert entity_types == ["SPLINE", "SPLINE", "TEXT", "TEXT"]
+
+
+def test_export_batch_dxf_unique_file_names(tmp_path):
+    airfoil = Root_Example()
+    items = [Dxf_Batch_Item(airfoil, chord_mm=100.0), Dxf_Batch_Item(airfoil, chord_mm=200.0)]
+
+    exporter = Export_Airfoils_Dxf(items)
+    exporter.set_export_dir(str(tmp_path / "batch_export"))
+    results = exporter.do_it(max_workers=1)
+
+    paths = [result.pathFileName for result in results]
+    assert all(result.ok for result in results)
+    assert len(set(paths)) == 2
+    assert paths == [exporter.export_pathFileName_abs(item) for item in items]
+    assert paths[1].endswith(f"{airfoil.fileName_stem}_2.dxf")
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+    pytest for the benchmark suite - runner, json persistence and regression gate.
+"""
+
+import pytest
+
+from tests.benchmark import (BENCHMARKS, Bench_Result, run_benchmarks, compare,
+                             save_results, load_results, main)
+
+
+def _result (name, best, skipped=None) -> Bench_Result:
+    return Bench_Result (name, number=1, repeat=1, best=best, median=best, skipped=skipped)
+
+
+def test_all_hot_paths_registered():
+
+    for name in ["bezier_eval", "bspline_eval", "cst_eval", "spline2d_build",
+                 "geometry_normalize", "geometry_repanel", "match_nelder_mead", "match_pso",
+                 "xfoil_polar_parse", "neuralfoil_inference"]:
+        assert name in BENCHMARKS
+
+
+def test_run_fast_benchmarks():
+
+    results = run_benchmarks (["bezier_eval", "cst_eval", "xfoil_polar_parse"], repeat=1)
+
+    assert list (results.keys()) == ["bezier_eval", "cst_eval", "xfoil_polar_parse"]
+    for result in results.values():
+        assert result.ok
+        assert 0.0 < result.best <= result.median
+
+    with pytest.raises (ValueError):
+        run_benchmarks (["not_a_benchmark"])
+
+
+def test_compare_against_baseline():
+
+    baseline = {"a": _result ("a", 1.0), "b": _result ("b", 1.0), "c": _result ("c", 1.0)}
+    results  = {"a": _result ("a", 1.1), "b": _result ("b", 1.5),
+                "c": _result ("c", 0.0, skipped="n/a"), "d": _result ("d", 9.9)}
+
+    regressions = compare (results, baseline, threshold=0.25)
+    assert [reg.name for reg in regressions] == ["b"]
+    assert regressions[0].ratio == pytest.approx (1.5)
+
+    assert compare (results, baseline, threshold=0.6) == []
+    assert [reg.name for reg in compare (results, baseline, threshold=0.05)] == ["a", "b"]
+
+
+def test_save_load_and_gate(tmp_path):
+
+    pathFileName = str (tmp_path / "baseline.json")
+
+    # a baseline which is way too fast will fail the gate
+    save_results ({"bezier_eval": _result ("bezier_eval", 1e-12)}, pathFileName)
+    loaded = load_results (pathFileName)
+    assert loaded["bezier_eval"].best == 1e-12
+
+    assert main (["--only", "bezier_eval", "--repeat", "1", "--baseline", pathFileName]) == 1
+
+    # ... a very slow baseline will pass
+    save_results ({"bezier_eval": _result ("bezier_eval", 10.0)}, pathFileName)
+    assert main (["--only", "bezier_eval", "--repeat", "1", "--baseline", pathFileName]) == 0
@@ -120,6 +120,16 @@ class Test_Bezier:
         np.testing.assert_allclose(y2, n * (n - 1) * bernstein_eval(np.diff(wy, n=2), u), atol=1e-12)
 
 
+    def test_basis_matrix_reproduces_eval(self):
+        """basis_matrix(u) @ control points equals eval(u)."""
+        u = np.linspace(0.0, 1.0, 31)
+        B = self.bez.basis_matrix(u)
+
+        x, y = self.bez.eval(u, update_cache=False)
+        np.testing.assert_allclose(B @ np.asarray(self.bez.cpoints_x), x, atol=1e-12)
+        np.testing.assert_allclose(B @ np.asarray(self.bez.cpoints_y), y, atol=1e-12)
+
+
     def test_basis_function_scalar_matches_array(self):
         """Bezier._basisFunction returns consistent values for scalar and array u."""
         n = self.bez.degree
@@ -128,6 +128,16 @@ class Test_BSpline_Degree4:
         np.testing.assert_allclose(ddx, ddx_fd, rtol=5e-4, atol=1e-12)
         np.testing.assert_allclose(ddy, ddy_fd, rtol=5e-4, atol=1e-12)
 
+    def test_basis_matrix_reproduces_eval(self):
+        """Degree-4: basis_matrix(u) @ control points equals eval(u) and is a partition of unity."""
+        u = np.linspace(0.0, 1.0, 41)
+        B = self.spl.basis_matrix(u)
+
+        x, y = self.spl.eval(u, update_cache=False)
+        np.testing.assert_allclose(B @ np.asarray(self.spl.cpoints_x), x, atol=1e-10)
+        np.testing.assert_allclose(B @ np.asarray(self.spl.cpoints_y), y, atol=1e-10)
+        np.testing.assert_allclose(B.sum(axis=1), 1.0, atol=1e-12)
+
     def test_curvature_consistent_with_derivatives(self):
         """Degree-4: curvature() matches the standard formula applied to eval() derivatives."""
         u = np.linspace(0.1, 0.9, 9)
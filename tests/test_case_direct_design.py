@@ -12,7 +12,7 @@ import shutil
 # pythonpath = ["airfoileditor"]          # add project root to sys.path to find airfoileditor moduls
 
 from airfoileditor.model.case import Case_Direct_Design, Case_Abstract
-from airfoileditor.model.airfoil import Airfoil, GEO_SPLINE
+from airfoileditor.model.airfoil import Airfoil, Airfoil_Writer, GEO_SPLINE
 from airfoileditor.model.airfoil_examples import Root_Example
 
 # temp_dir will be injected by pytest in the arguments of test functions
@@ -233,4 +233,59 @@ class Test_Case_Direct_Design:
         assert len(case2.airfoil_designs) == design_count
         
         # Cleanup
-        shutil.rmtree(case2.design_dir_abs, ignore_errors=True)
\ No newline at end of file
+        shutil.rmtree(case2.design_dir_abs, ignore_errors=True)
+
+class Test_Design_Writer:
+    """Background writing of design files"""
+
+    @pytest.fixture
+    def seed_airfoil(self, temp_dir) -> Airfoil:
+        airfoil = Root_Example(geometry=GEO_SPLINE)
+        airfoil_path = airfoil.saveAs(dir=str(temp_dir), destName="test_seed")
+        airfoil_copied = Airfoil(pathFileName=airfoil_path, workingDir=str(temp_dir))
+        airfoil_copied.load()
+        return airfoil_copied
+
+    def test_add_design_written_in_background(self, seed_airfoil):
+        case = Case_Direct_Design(seed_airfoil)
+        design = case.initial_airfoil_design()
+        for _ in range(5):
+            case.add_design(design)
+
+        assert len(case.airfoil_designs) == 6                  # list is updated immediately
+        case.flush()
+
+        files = sorted(os.listdir(case.design_dir_abs))
+        assert files == sorted(a.fileName for a in case.airfoil_designs)   # no temporary files left
+        loaded = Airfoil(pathFileName=case.airfoil_designs[3].pathFileName_abs)
+        loaded.load()
+        assert loaded.x == pytest.approx(case.airfoil_designs[3].x, abs=1e-7)
+        assert not case.airfoil_designs[3].isModified
+
+    def test_coalesce_and_discard(self, temp_dir):
+        writer = Airfoil_Writer()
+        airfoil = Root_Example()
+        airfoil.set_pathFileName(str(temp_dir / "a.dat"), noCheck=True)
+        other = airfoil.asCopy(pathFileName=str(temp_dir / "b.dat"))
+
+        with writer._cond:                                      # hold the worker back
+            writer.write(airfoil)
+            writer.write(airfoil)                               # same file is written once
+            writer.write(other)
+            assert writer.n_pending == 2
+        assert writer.discard(str(temp_dir / "b.dat")) or os.path.isfile(temp_dir / "b.dat")
+
+        assert writer.flush(timeout=10)
+        assert os.path.isfile(temp_dir / "a.dat")
+        assert not os.path.isfile(temp_dir / (Airfoil_Writer.TMP_PREFIX + "a.dat"))
+        writer.close()
+        assert writer not in Airfoil_Writer.instances
+
+    def test_remove_pending_design(self, seed_airfoil):
+        case = Case_Direct_Design(seed_airfoil)
+        design = case.initial_airfoil_design()
+        case.add_design(design)
+        case.remove_design(case.airfoil_designs[-1])           # file may be pending or written
+        case.flush()
+
+        assert sorted(os.listdir(case.design_dir_abs)) == [case.airfoil_designs[0].fileName]
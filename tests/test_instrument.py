@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+    pytest for the central instrumentation registry.
+"""
+
+import json
+
+import pytest
+
+from airfoileditor.base                 import instrument
+from airfoileditor.base.spline          import Bezier
+from airfoileditor.model.airfoil        import GEO_SPLINE
+from airfoileditor.model.airfoil_examples import Root_Example
+
+
+@pytest.fixture
+def instrumented():
+    """enable instrumentation for a test - restore previous state afterwards"""
+    was_enabled = instrument.enabled()
+    instrument.reset()
+    instrument.enable (True)
+    yield
+    instrument.enable (was_enabled)
+    instrument.reset()
+
+
+def test_disabled_collects_nothing():
+
+    was_enabled = instrument.enabled()
+    instrument.enable (False)
+    instrument.reset()
+
+    instrument.count ("test.counter")
+    with instrument.timer ("test.timer"):
+        pass
+    Bezier ([0.0, 0.3, 1.0], [0.0, 0.1, 0.0]).eval ([0.1, 0.5])
+
+    assert instrument.stats() == []
+    instrument.enable (was_enabled)
+
+
+def test_counters_and_timers(instrumented):
+
+    instrument.count ("test.counter")
+    instrument.count ("test.counter", 2)
+
+    @instrument.timed ("test.timed")
+    def work (n):
+        return sum (range (n))
+
+    assert work (1000) == sum (range (1000))
+    work (10)
+    with instrument.timer ("test.block"):
+        work (10)
+
+    stats = {s.name: s for s in instrument.stats()}
+    assert stats["test.counter"].count == 3
+    assert not stats["test.counter"].isTimer
+    assert stats["test.timed"].count == 3
+    assert stats["test.timed"].total > 0.0
+    assert stats["test.timed"].min <= stats["test.timed"].mean <= stats["test.timed"].max
+    assert stats["test.block"].count == 1
+
+    assert "test.timed" in instrument.summary_text()
+
+
+def test_hot_paths_report(instrumented, tmp_path):
+
+    airfoil = Root_Example (geometry=GEO_SPLINE)
+    airfoil.normalize ()
+    airfoil.geo.repanel (nPanels=160)
+
+    names = {s.name for s in instrument.stats()}
+    assert "geometry.repanel" in names
+    assert "spline.spline2d.build" in names
+
+    pathFileName = str (tmp_path / "instrumentation.json")
+    instrument.save_json (pathFileName)
+    with open (pathFileName) as f:
+        data = json.load (f)
+
+    assert data["enabled"] is True
+    assert data["stats"]["geometry.repanel"]["count"] >= 1
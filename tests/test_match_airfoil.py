@@ -4,9 +4,10 @@
     pytest classes for Match_Airfoil, Match_Result and the Matcher workers.
 """
 
+import numpy as np
 import pytest
 
-from airfoileditor.match_runner         import Match_Airfoil, Match_Result, Matcher
+from airfoileditor.match_runner         import Match_Airfoil, Match_Result, Matcher, Match_Cache
 from airfoileditor.model.airfoil        import Airfoil, Airfoil_Bezier, Airfoil_BSpline
 from airfoileditor.model.airfoil_examples import Root_Example, Tip_Example
 from airfoileditor.model.geometry_spline import Geometry_Splined
@@ -199,3 +200,315 @@ class Test_Match_Airfoil_Sequential:
 
         assert success is True
         assert rms_after < rms_before
+
+
+class Test_Matcher_Least_Squares:
+    """Gradient based least squares pass (Levenberg-Marquardt)"""
+
+    @pytest.mark.parametrize("airfoil_class", [Airfoil_Bezier, Airfoil_BSpline])
+    def test_jacobian_matches_finite_differences(self, qapp, seed_airfoil, airfoil_class):
+        """Analytic deviation Jacobian agrees with finite differences of the residuals."""
+        ma = Match_Airfoil(seed_airfoil, airfoil_class)
+        matcher = ma._matcher_upper
+        matcher._ipass = 1
+        matcher._side.target_deviation.set_fast(True)
+
+        dv = np.array(matcher._map_curve_to_dv())
+        J  = matcher._lsq_jacobian(dv)
+        r0 = matcher._lsq_residuals(dv)
+
+        J_fd = np.empty_like(J)
+        h = 1e-7
+        for j in range(len(dv)):
+            dv_j = dv.copy()
+            dv_j[j] += h
+            J_fd[:, j] = (matcher._lsq_residuals(dv_j) - r0) / h
+
+        assert np.abs(J - J_fd).max() < 0.05 * np.abs(J_fd).max()
+
+    @pytest.mark.parametrize("airfoil_class", [Airfoil_Bezier, Airfoil_BSpline])
+    def test_single_pass_converges_with_few_evaluations(self, qapp, seed_airfoil, airfoil_class):
+        """Least squares pass reaches a good rms within a small number of evaluations."""
+        ma = Match_Airfoil(seed_airfoil, airfoil_class)
+        ma.set_use_lsq(True)
+
+        for matcher in (ma._matcher_upper, ma._matcher_lower):
+            matcher._ipass = 1
+            matcher._side.target_deviation.set_fast(True)
+            rms_before = matcher._side.target_deviation.rms()
+
+            matcher._run_single_pass(ncp=matcher._ncp)
+
+            assert matcher._nevals < 150
+            assert matcher._side.target_deviation.rms() < min(rms_before, 0.0002)
+
+
+class Test_Matcher_Warm_Start:
+    """ncp_auto passes seeded from the result of the previous pass"""
+
+    def test_bezier_warm_start_keeps_shape(self, qapp, seed_airfoil):
+        """Degree elevation seeds the next pass with the previous result."""
+        ma = Match_Airfoil(seed_airfoil, Airfoil_Bezier)
+        matcher = ma._matcher_upper
+        matcher._ipass = 1
+        matcher._side.target_deviation.set_fast(True)
+
+        ncp = matcher._side.NCP_AUTO_RANGE[0]
+        obj_prev = matcher._run_single_pass(ncp=ncp)
+
+        matcher._ipass = 2
+        obj_next = matcher._run_single_pass(ncp=ncp + 1, warm_start=True)
+
+        assert matcher._curve.ncp == ncp + 1
+        assert obj_next <= obj_prev * 1.01
+
+    def test_no_warm_start_on_ncp_jump(self, qapp, seed_airfoil):
+        """Warm start needs a previous result with exactly one control point less."""
+        ma = Match_Airfoil(seed_airfoil, Airfoil_Bezier)
+        matcher = ma._matcher_upper
+        matcher._ipass = 1
+
+        assert not matcher._warm_start_curve(matcher._curve.ncp + 2, bounds=[])
+
+
+class Test_Matcher_Budget:
+    """ncp_auto search bounded by an evaluation or time budget"""
+
+    def _run_counting(self, matcher: Matcher) -> tuple[int, list]:
+        """run matcher synchronously - return total evaluations and passes (ncp)"""
+        passes = []
+        run_pass = matcher._run_single_pass
+
+        def counting_pass(*args, **kwargs):
+            objective = run_pass(*args, **kwargs)
+            passes.append((matcher._curve.ncp, matcher._nevals))
+            return objective
+
+        matcher._run_single_pass = counting_pass
+        matcher.run()
+        return sum(nevals for _, nevals in passes), passes
+
+    def test_eval_budget(self, qapp, seed_airfoil):
+        """Total evaluations stay within the budget; each ncp is probed, the best refined."""
+        ma = Match_Airfoil(seed_airfoil, Airfoil_Bezier)
+        ma.set_budget(max_evals=600)
+        matcher = ma._matcher_upper
+        rms_before = matcher._side.target_deviation.rms()
+
+        nevals, passes = self._run_counting(matcher)
+
+        lo, hi = matcher._side.NCP_AUTO_RANGE
+        assert nevals <= 600 * 1.05
+        assert [ncp for ncp, _ in passes[:hi - lo + 1]] == list(range(lo, hi + 1))
+        assert matcher._side.target_deviation.rms() < rms_before
+
+    def test_time_budget(self, qapp, seed_airfoil):
+        """A time budget bounds the duration of the search."""
+        from timeit import default_timer as timer
+
+        ma = Match_Airfoil(seed_airfoil, Airfoil_BSpline)
+        ma.set_budget(max_time=1.0)
+
+        start = timer()
+        self._run_counting(ma._matcher_lower)
+        assert timer() - start < 2.0
+
+    def test_set_budget(self, qapp, seed_airfoil):
+        targets = Match_Targets.from_airfoil(seed_airfoil, Line.Type.UPPER, ncp=6)
+        assert not targets.has_budget
+
+        targets.set_budget(max_evals=1000)
+        assert targets.has_budget and targets.max_evals == 1000 and targets.max_time is None
+
+        targets.set_budget()
+        assert not targets.has_budget
+
+
+class Test_Match_Cache:
+    """Persistent cache of match results"""
+
+    @pytest.fixture
+    def cache_dir(self, tmp_path):
+        Match_Cache.set_dir(str(tmp_path / "match_cache"))
+        yield tmp_path / "match_cache"
+        Match_Cache.set_dir(None)
+
+    def test_key_depends_on_targets(self, qapp, seed_airfoil):
+        ma = Match_Airfoil(seed_airfoil, Airfoil_Bezier)
+        side    = ma._matcher_upper._side
+        targets = ma.targets_upper
+
+        key = Match_Cache.key(side, targets)
+        assert key == Match_Cache.key(side, targets)
+        assert key != Match_Cache.key(ma._matcher_lower._side, ma.targets_lower)
+
+        targets.set_ncp(targets.ncp + 1)
+        assert key != Match_Cache.key(side, targets)
+
+    def test_second_match_is_cache_hit(self, qapp, seed_airfoil, cache_dir):
+        ma = Match_Airfoil(seed_airfoil, Airfoil_Bezier)
+        ma.set_budget(max_evals=300)
+        assert ma.do_match()
+        assert len(list(cache_dir.glob("*.json"))) == 2
+
+        result = ma.get_result_upper()
+
+        ma2 = Match_Airfoil(seed_airfoil, Airfoil_Bezier)
+        ma2.set_budget(max_evals=300)
+
+        assert ma2.do_match()
+        assert not ma2._matcher_upper.isFinished()      # thread was never started
+        assert not ma2._matcher_lower.isFinished()
+        assert ma2.get_result_upper().ncp == result.ncp
+        assert ma2.get_result_upper().rms == pytest.approx(result.rms)
+
+    def test_disabled(self, qapp, seed_airfoil):
+        ma = Match_Airfoil(seed_airfoil, Airfoil_Bezier)
+        assert not Match_Cache.enabled()
+        assert not ma._matcher_upper.apply_cached()
+
+
+class Test_Matcher_Memo:
+    """Objective memo cache keyed by the quantized design vector"""
+
+    def test_repeated_design_is_hit(self, qapp, seed_airfoil):
+        ma = Match_Airfoil(seed_airfoil, Airfoil_Bezier)
+        matcher = ma._matcher_upper
+        matcher._ipass = 1
+        matcher._reset_memo()
+
+        dv  = np.array(matcher._map_curve_to_dv())
+        obj = matcher._objectiveFn_memo(dv)
+        nevals = matcher._nevals
+
+        assert matcher._objectiveFn_memo(list(dv)) == obj
+        assert matcher._nevals == nevals
+        assert (matcher._memo_hits, matcher._memo_misses) == (1, 1)
+        assert "memo hits: 1/2" in matcher._memo_info()
+
+        assert matcher._objectiveFn_memo(dv + 0.01) != obj
+        assert matcher._memo_misses == 2
+
+    def test_memo_is_bounded(self, qapp, seed_airfoil, monkeypatch):
+        ma = Match_Airfoil(seed_airfoil, Airfoil_Bezier)
+        matcher = ma._matcher_upper
+        matcher._ipass = 1
+        matcher._reset_memo()
+        monkeypatch.setattr(matcher, "MEMO_SIZE", 5)
+
+        dv = np.array(matcher._map_curve_to_dv())
+        for i in range(10):
+            matcher._objectiveFn_memo(dv + i * 0.001)
+
+        assert len(matcher._memo) == 5
+
+
+class Test_Matcher_Multistart:
+    """Multi-start Nelder-Mead pass"""
+
+    def test_multistart_escapes_local_minimum(self, qapp):
+        """Tip example lower side: single start stalls in a local minimum."""
+        objectives = []
+        for n_starts in (1, 4):
+            ma = Match_Airfoil(Tip_Example(geometry=Geometry_Splined), Airfoil_Bezier)
+            ma.set_nm_starts(n_starts)
+            matcher = ma._matcher_lower
+            matcher._ipass = 1
+            matcher._side.target_deviation.set_fast(True)
+            objectives.append(matcher._run_single_pass(ncp=matcher._ncp))
+
+        assert objectives[1] < 0.5 * objectives[0]
+
+    def test_multistart_in_process_pool(self, qapp, monkeypatch):
+        """Starts run in a spawn process pool when there are cpus"""
+        import airfoileditor.base.math_util as math_util
+
+        monkeypatch.setattr("os.cpu_count", lambda: 4)
+        pools = []
+        executor_class = math_util.ProcessPoolExecutor
+        monkeypatch.setattr(math_util, "ProcessPoolExecutor", 
+                            lambda **kwargs: pools.append(kwargs) or executor_class(**kwargs))
+
+        ma = Match_Airfoil(Tip_Example(geometry=Geometry_Splined), Airfoil_Bezier)
+        ma.set_nm_starts(4)
+        matcher = ma._matcher_lower
+        matcher._ipass = 1
+        matcher._side.target_deviation.set_fast(True)
+        objective = matcher._run_single_pass(ncp=matcher._ncp)
+
+        assert pools and pools[0]["max_workers"] == 4
+        assert objective < 0.0001
+
+    @pytest.mark.parametrize("airfoil_class", [Airfoil_Bezier, Airfoil_BSpline])
+    def test_pool_objective_equals_matcher(self, qapp, seed_airfoil, airfoil_class):
+        """Picklable objective of the process pool evaluates like the matcher"""
+        import pickle
+        from airfoileditor.match_runner import match_objective
+
+        ma = Match_Airfoil(seed_airfoil, airfoil_class)
+        matcher = ma._matcher_lower
+        matcher._ipass = 1
+        matcher._side.target_deviation.set_fast(True)
+
+        spec = pickle.loads(pickle.dumps(matcher._match_spec()))
+        dv = np.array(matcher._map_curve_to_dv()) + 0.002
+
+        assert match_objective(dv, spec) == pytest.approx(matcher._objectiveFn(dv), rel=1e-5)
+
+
+class Test_Matcher_Progress:
+    """Time throttled progress snapshots of a running Matcher"""
+
+    def test_progress_is_throttled_snapshot(self, qapp, seed_airfoil):
+        import copy
+        from timeit import default_timer as timer
+        from airfoileditor.match_runner import Match_Progress
+
+        ma = Match_Airfoil(seed_airfoil, Airfoil_Bezier)
+        matcher = ma._matcher_upper
+        matcher._ipass = 1
+        matcher._side.target_deviation.set_fast(True)
+        side_view = copy.deepcopy(matcher._side)
+
+        progress = []
+        matcher.sig_progress.connect(progress.append)
+
+        start = timer()
+        matcher._run_single_pass(ncp=matcher._ncp)
+        duration = timer() - start
+
+        assert progress and all(isinstance(p, Match_Progress) for p in progress)
+        assert len(progress) <= duration * Matcher.PROGRESS_RATE + 2           # + forced final info
+        assert progress[-1].nevals == matcher._nevals
+        assert progress[-1].ncp == matcher._ncp
+
+        # snapshot is decoupled from the running side 
+        last = progress[-1]
+        last.cpoints[1, 1] += 0.01
+        assert matcher._curve.cpoints[1][1] != last.cpoints[1, 1]
+        last.cpoints[1, 1] -= 0.01
+
+        result = last.result(side_view, matcher._targets)
+        assert result.rms == pytest.approx(last.rms, abs=1e-6)
+        assert result.ncp == matcher._ncp
+
+    def test_bspline_snapshot_curve_keeps_own_knots(self, qapp, seed_airfoil):
+        from airfoileditor.model.geometry_curve import BSpline
+
+        ma = Match_Airfoil(seed_airfoil, Airfoil_BSpline)
+        matcher = ma._matcher_upper
+        matcher._ipass = 1
+        matcher._side.target_deviation.set_fast(True)
+
+        progress = []
+        matcher.sig_progress.connect(progress.append)
+        matcher._run_single_pass(ncp=matcher._ncp)
+
+        last = progress[-1]
+        curve = last.curve()
+        assert isinstance(curve, BSpline)
+        assert curve.ncp == last.ncp
+
+        # running curve may change ncp - snapshot curve stays valid 
+        matcher._curve.set_cpoints(np.vstack([matcher._curve.cpoints[:-1], [[0.8, 0.01]], matcher._curve.cpoints[-1:]]))
+        assert last.curve().ncp == last.ncp
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+    pytest for optimizers in math_util.
+"""
+
+import numpy as np
+import pytest
+
+from concurrent.futures import ThreadPoolExecutor
+
+from airfoileditor.base.math_util import (differential_evolution, enforce_bounds, nelder_mead,
+                                          nelder_mead_multistart)
+
+
+def rosenbrock(x: np.ndarray) -> float:
+    return float(np.sum(100.0 * (x[1:] - x[:-1]**2)**2 + (1.0 - x[:-1])**2))
+
+
+def rosenbrock_batch(X: np.ndarray) -> np.ndarray:
+    return np.sum(100.0 * (X[:, 1:] - X[:, :-1]**2)**2 + (1.0 - X[:, :-1])**2, axis=1)
+
+
+def rastrigin(x: np.ndarray) -> float:
+    return float(10.0 * len(x) + np.sum(x * x - 10.0 * np.cos(2.0 * np.pi * x)))
+
+
+BOUNDS = [(-2.0, 2.0)] * 3
+
+
+class Test_Differential_Evolution:
+
+    def test_finds_minimum(self):
+        best, score, ngen = differential_evolution(rosenbrock, BOUNDS, pop_size=30, generations=400, seed=42)
+
+        assert ngen == 400
+        assert score < 1e-3
+        assert np.allclose(best, 1.0, atol=0.05)
+
+    def test_deterministic_and_local_rng(self):
+        np.random.seed(1)
+        state = np.random.get_state()[1].copy()
+
+        run1 = differential_evolution(rosenbrock, BOUNDS, generations=30, seed=7)
+        run2 = differential_evolution(rosenbrock, BOUNDS, generations=30, seed=7)
+
+        assert np.array_equal(run1[0], run2[0]) and run1[1] == run2[1]
+        assert np.array_equal(np.random.get_state()[1], state)           # global state untouched
+
+    def test_batch_and_map_give_same_result(self):
+        single = differential_evolution(rosenbrock, BOUNDS, generations=30, seed=3)
+        batch  = differential_evolution(None, BOUNDS, generations=30, seed=3, batch_objective=rosenbrock_batch)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            mapped = differential_evolution(rosenbrock, BOUNDS, generations=30, seed=3, map_fn=executor.map)
+
+        assert np.allclose(single[0], batch[0]) and single[1] == pytest.approx(batch[1])
+        assert np.array_equal(single[0], mapped[0]) and single[1] == mapped[1]
+
+    def test_bounds_and_stop(self):
+        calls = {"n": 0}
+
+        def stop() -> bool:
+            calls["n"] += 1
+            return calls["n"] >= 5
+
+        best, _, ngen = differential_evolution(rosenbrock, [(0.0, 0.5)] * 3, bound_mode='reflect',
+                                               seed=1, stop_callback=stop)
+        assert ngen == 5
+        assert np.all((best >= 0.0) & (best <= 0.5))
+
+        with pytest.raises(ValueError):
+            differential_evolution(None, BOUNDS)
+
+
+class Test_Nelder_Mead_Multistart:
+
+    def test_escapes_local_minimum(self):
+        x_start = np.array([1.9, -1.1])
+        bounds  = [(-2.5, 2.5)] * 2
+
+        (_, single), _ = nelder_mead(rastrigin, x_start, step=0.1, bounds=bounds, max_iter=500)
+        (best, score), stats = nelder_mead_multistart(rastrigin, x_start, n_starts=8, perturb=0.5,
+                                                      step=0.1, bounds=bounds, seed=42, max_iter=500)
+        assert score < single
+        assert score == min(st.score for st in stats)
+
+        assert len(stats) == 8
+        assert [st.start for st in stats] == list(range(8))
+        assert np.array_equal(stats[0].x_start, x_start)
+        assert sum(not st.dropped for st in stats) == 1                # successive halving 8 - 4 - 2 - 1
+        assert max(st.rounds for st in stats) == 4
+
+    def test_process_pool(self):
+        x_start = np.array([1.9, -1.1])
+
+        seq = nelder_mead_multistart(rastrigin, x_start, n_starts=4, perturb=0.5, seed=1, max_iter=300)
+        par = nelder_mead_multistart(rastrigin, x_start, n_starts=4, perturb=0.5, seed=1, max_iter=300,
+                                     n_workers=2)
+        assert np.allclose(seq[0][0], par[0][0])
+        assert seq[0][1] == pytest.approx(par[0][1])
+
+    def test_single_start_is_nelder_mead(self):
+        x_start = np.array([0.5, 0.5, 0.5])
+
+        (x1, s1), _ = nelder_mead(rosenbrock, x_start, step=0.1, max_iter=400)
+        (x2, s2), stats = nelder_mead_multistart(rosenbrock, x_start, n_starts=1, step=0.1, max_iter=400)
+
+        assert np.allclose(x1, x2) and s1 == s2
+        assert stats[0].rounds == 1 and not stats[0].dropped
+
+
+def test_enforce_bounds_population():
+
+    bounds = [(0.0, 1.0), (0.0, 10.0)]
+    pop = np.array([[1.5, -2.0], [0.5, 11.0]])
+
+    assert np.allclose(enforce_bounds(pop, bounds, mode='reflect'), [[0.5, 2.0], [0.5, 9.0]])
+    assert np.allclose(enforce_bounds(pop, bounds, mode='clip'),    [[1.0, 0.0], [0.5, 10.0]])
+    assert np.allclose(enforce_bounds(pop[0], bounds, mode='reflect'), [0.5, 2.0])
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+    pytest for the polar directory cache keyed by the hash of airfoil coordinates
+"""
+
+import os
+import shutil
+import time
+
+import pytest
+
+from airfoileditor.model.airfoil_examples import Root_Example
+from airfoileditor.model.xo2_driver       import Worker
+
+
+POLAR_FILE = "T1_Re0.400_M0.00_N7.0.txt"
+
+
+def _get_polarFile (pathFileName : str) -> str:
+    return Worker.get_existingPolarFile (pathFileName, 'T1', 400000, 0.0, 7.0, flap_angle=None)
+
+
+@pytest.fixture
+def airfoil_pathFileName (tmp_path) -> str:
+    """ saved airfoil with a generated polar in its polar dir"""
+
+    airfoil = Root_Example (workingDir=str (tmp_path))
+    airfoil.save ()
+
+    Worker.write_polar_manifest (airfoil.pathFileName_abs)              # like generate_polar does
+    polarDir = Worker.polarDir (airfoil.pathFileName_abs)
+    with open (os.path.join (polarDir, POLAR_FILE), 'w') as f:
+        f.write ("polar")
+    return airfoil.pathFileName_abs
+
+
+class Test_Polar_Cache:
+
+    def test_coordinates_hash (self, airfoil_pathFileName, tmp_path):
+
+        coordinates_hash = Worker.coordinates_hash (airfoil_pathFileName)
+        assert coordinates_hash
+
+        # other name and number format - same coordinates
+        with open (airfoil_pathFileName) as f:
+            lines = f.readlines()
+        other = str (tmp_path / "other.dat")
+        with open (other, 'w') as f:
+            f.write ("Another name\n")
+            for line in lines[1:]:
+                x, y = line.split()
+                f.write (f"  {float(x):.9f}   {float(y):.9f}\n")
+        assert Worker.coordinates_hash (other) == coordinates_hash
+
+        with open (other, 'a') as f:
+            f.write ("0.5 0.1\n")
+        assert Worker.coordinates_hash (other) != coordinates_hash
+        assert Worker.coordinates_hash (str (tmp_path / "missing.dat")) is None
+
+
+    def test_touch_keeps_polars (self, airfoil_pathFileName):
+
+        assert _get_polarFile (airfoil_pathFileName).endswith (POLAR_FILE)
+
+        later = time.time () + 10                                       # airfoil file newer than polar dir
+        os.utime (airfoil_pathFileName, (later, later))
+        assert _get_polarFile (airfoil_pathFileName).endswith (POLAR_FILE)
+
+        # changed coordinates - polars are outdated
+        with open (airfoil_pathFileName, 'a') as f:
+            f.write ("0.5 0.1\n")
+        assert _get_polarFile (airfoil_pathFileName) is None
+        assert not os.path.isdir (Worker.polarDir (airfoil_pathFileName))
+
+
+    def test_shared_between_identical_airfoils (self, airfoil_pathFileName, tmp_path):
+
+        copy = str (tmp_path / "copy.dat")
+        shutil.copyfile (airfoil_pathFileName, copy)
+
+        polarFile = _get_polarFile (copy)
+        assert polarFile == os.path.join (Worker.polarDir (copy), POLAR_FILE)
+        assert os.path.isfile (polarFile)
+        assert Worker.polar_manifest (Worker.polarDir (copy))['coordinates_hash'] == Worker.coordinates_hash (copy)
+
+        assert Worker.get_existingPolarFile (copy, 'T1', 500000, 0.0, 7.0, flap_angle=None) is None
+
+
+    def test_legacy_polarDir (self, airfoil_pathFileName):
+
+        polarDir = Worker.polarDir (airfoil_pathFileName)
+        os.remove (os.path.join (polarDir, Worker.POLAR_MANIFEST))
+
+        # polar dir is younger than airfoil - kept and gets a manifest
+        assert _get_polarFile (airfoil_pathFileName).endswith (POLAR_FILE)
+        assert Worker.polar_manifest (polarDir) is not None
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+    pytest for the Re interpolation of loaded polars
+"""
+
+import numpy as np
+import pytest
+
+from airfoileditor.model.airfoil_examples import Root_Example
+from airfoileditor.model.polar_dto        import Polar_Data_Row, Polar_Data_Set
+from airfoileditor.model.polar_set        import Polar_Set, Polar, Polar_Surface, var
+from airfoileditor.model.xo2_driver       import Worker
+
+
+ALPHA = np.arange (-2.0, 10.5, 0.5)
+
+
+def _polar (polar_set : Polar_Set, re : float, ncrit = 7.0, cd = None) -> Polar:
+    """ new polar of polar_set - loaded with synthetic values if cd is given"""
+
+    polar = Polar (polar_set)
+    polar.set_re    (re)
+    polar.set_ncrit (ncrit)
+    polar_set.polars.append (polar)
+
+    if cd is not None:
+        rows = [Polar_Data_Row (alpha=a, cl=0.1 * a + 0.2, cd=cd + 0.0001 * a**2, cdp=cd / 2, cm=-0.05,
+                                xtrt=0.6, xtrb=0.8) for a in ALPHA]
+        polar._import_from_data_set (Polar_Data_Set (meta=polar.as_meta(), rows=rows))
+    return polar
+
+
+@pytest.fixture
+def polar_set (monkeypatch) -> Polar_Set:
+    """ polar set with polars at Re 200k and 800k loaded"""
+
+    monkeypatch.setattr (Worker, "ready", True)             # xfoil polars without Worker binary
+    polar_set = Polar_Set (Root_Example (), polar_def=[])
+    _polar (polar_set, 800000, cd=0.006)
+    _polar (polar_set, 200000, cd=0.010)
+    _polar (polar_set, 400000, ncrit=9.0, cd=0.008)                      # other key
+    return polar_set
+
+
+class Test_Polar_Surface:
+
+    def test_index (self, polar_set):
+
+        surface = polar_set.surface
+        polar_new = _polar (polar_set, 400000)
+
+        assert [p.re for p in surface.polars_of (polar_new)] == [200000, 800000]
+        lower, higher = surface.neighbours (polar_new)
+        assert (lower.re, higher.re) == (200000, 800000)
+        assert surface.neighbours (_polar (polar_set, 900000)) is None    # no extrapolation
+
+        # index follows newly loaded polars
+        _polar (polar_set, 300000, cd=0.009)
+        assert [p.re for p in surface.polars_of (polar_new)] == [200000, 300000, 800000]
+
+
+    def test_values_at (self, polar_set):
+
+        polar_200k = polar_set.polars[1]
+        re, cd = polar_set.surface.values_at (polar_200k, var.ALPHA, [0.0, 2.0, 20.0], var.CD)
+
+        assert list (re) == [200000, 800000]
+        assert cd.shape == (2, 3)
+        assert cd[0,0] == pytest.approx (0.010) and cd[1,1] == pytest.approx (0.0064)
+        assert np.isnan (cd[:,2]).all ()                                  # outside alpha range
+
+        _, glide = polar_set.surface.values_at (Polar_Surface.key_of (polar_200k), var.CL, 0.4, var.GLIDE)
+        assert glide[:,0] == pytest.approx ([0.4 / 0.0104, 0.4 / 0.0064], rel=1e-3)
+
+
+    def test_preview (self, polar_set):
+
+        polar_new = _polar (polar_set, 400000)
+        assert polar_set.surface.preview_polars ([polar_new]) == 1
+
+        assert polar_new.is_preview
+        assert not polar_new.isLoaded                                     # real polar is still to come
+        i = int (np.argmin (np.abs (polar_new.alpha - 0.0)))
+        assert polar_new.cd[i] == pytest.approx (0.008)                   # half way in log(Re)
+        assert polar_new.cl[i] == pytest.approx (0.2)
+
+        # real polar replaces preview
+        rows = [Polar_Data_Row (alpha=a, cl=0.1 * a, cd=0.0079, cdp=0.004, cm=-0.05, xtrt=0.6, xtrb=0.8) for a in ALPHA]
+        polar_new._import_from_data_set (Polar_Data_Set (meta=polar_new.as_meta(), rows=rows))
+        assert polar_new.isLoaded and not polar_new.is_preview
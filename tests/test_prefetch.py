@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+    pytest for the background prefetch of neighbour designs
+"""
+
+import pytest
+
+from airfoileditor.app_model              import Prefetch_Runner
+from airfoileditor.model.airfoil_examples import Root_Example
+from airfoileditor.model.polar_set        import Polar_Set
+
+
+@pytest.fixture
+def designs () -> list:
+    """ some design airfoils """
+    airfoils = []
+    for i in range (6):
+        airfoil = Root_Example ()
+        airfoil.set_name (f"design~{i}")
+        airfoil.useAsDesign ()
+        airfoils.append (airfoil)
+    return airfoils
+
+
+class Test_Prefetch_Runner:
+
+    def test_neighbour_indexes (self):
+
+        assert Prefetch_Runner.neighbour_indexes (3, 10, 2) == [4, 2, 5, 1]
+        assert Prefetch_Runner.neighbour_indexes (0, 10, 2) == [1, 2]
+        assert Prefetch_Runner.neighbour_indexes (9, 10, 1) == [8]
+        assert Prefetch_Runner.neighbour_indexes (0, 1, 2) == []
+
+
+    def test_prefetch (self, qapp, designs):
+
+        runner = Prefetch_Runner ()
+        runner.prefetch (designs, 2, polar_defs=[])
+        assert runner.wait (10000)
+        qapp.processEvents ()                                           # polar sets are handed over in main thread
+
+        assert runner.airfoils == [designs[3], designs[1], designs[4], designs[0]]
+        assert runner.n_done == 4
+        for airfoil in runner.airfoils:
+            assert airfoil.geo._curvature is not None                  # geometry cache is warm
+            assert isinstance (airfoil.polarSet, Polar_Set)
+            assert airfoil.polarSet.airfoil is airfoil                  # prepared on a copy, handed over
+        assert designs[5].polarSet is None                              # not a neighbour
+        assert designs[5].geo._curvature is None
+
+
+    def test_cancel (self, qapp, designs):
+
+        runner = Prefetch_Runner ()
+        runner.prefetch (designs, 0, polar_defs=[], k=5)
+        runner.prefetch (designs, 5, polar_defs=[], k=1)               # selection jumped
+
+        for _ in range (2):                                             # pending prefetch starts when finished
+            assert runner.wait (10000)
+            qapp.processEvents ()
+        assert runner.airfoils == [designs[4]]
+        assert runner.n_done == 1
+        assert designs[4].polarSet is not None
+
+        # cancel doesn't block and drops a pending prefetch 
+        runner.prefetch (designs, 0, polar_defs=[], k=5)
+        runner.prefetch (designs, 5, polar_defs=[], k=1)
+        runner.cancel ()
+        assert runner.wait (10000)
+        qapp.processEvents ()
+        assert not runner.isRunning ()
+        assert runner.airfoils == [designs[1], designs[2], designs[3], designs[4], designs[5]]
@@ -3,8 +3,10 @@
 """Unit tests for PSO core module."""
 
 import numpy as np
+import pytest
 
-from airfoileditor.base.pso import Iteration_Result, Particle, Pso, Swarm, Pso_Options, pso
+from airfoileditor.base.pso import (Design_Score, Iteration_Result, Particle, Pso, Pso_History, Swarm,
+                                    Pso_Options, Surrogate, pso)
 
 
 def sphere(x: np.ndarray) -> float:
@@ -170,3 +172,112 @@ class Test_Pso:
         assert len(runner.history) == runner.iterations
         assert isinstance(runner.history[0], Iteration_Result)
         assert runner.history[0].best.score <= sphere(x0)
+
+
+class Test_Surrogate:
+
+    def test_surrogates_rank_sphere(self):
+        rng = np.random.default_rng(42)
+        X = rng.uniform(-2.0, 2.0, (60, 3))
+        y = np.array([sphere(x) for x in X])
+        X_new = rng.uniform(-2.0, 2.0, (20, 3))
+        y_new = np.array([sphere(x) for x in X_new])
+
+        for kind in ["rbf", "quadratic"]:
+            surrogate = Surrogate.create(kind, span=np.full(3, 4.0))
+            surrogate.fit(X, y)
+            predicted = surrogate.predict(X_new)
+
+            error, rank = Swarm._surrogate_accuracy(predicted, y_new)
+            assert rank > 0.9
+            assert error < 0.2
+
+    def test_surrogate_saves_true_evaluations(self):
+        bounds = [(-4.0, 4.0)] * 4
+        x0 = np.array([3.0, -2.0, 1.0, 2.0])
+
+        def run(surrogate):
+            calls = {"n": 0}
+
+            def objective(x):
+                calls["n"] += 1
+                return sphere(x)
+
+            options = Pso_Options(pop_size=20, max_iter=60, min_iter=60, seed=42, surrogate=surrogate)
+            runner = Pso(objective, x0, bounds, options).run()
+            return runner, calls["n"]
+
+        runner_full, n_full = run(None)
+        runner_surr, n_surr = run("rbf")
+
+        assert n_surr < 0.6 * n_full
+        assert runner_surr.best_score < 1e-3
+        assert sum(result.n_evals for result in runner_surr.history) == n_surr
+
+        screened = [result for result in runner_surr.history if result.surrogate_error is not None]
+        assert screened
+        assert all(result.n_evals <= 6 for result in screened)
+
+    def test_surrogate_options_validation(self):
+        options = Pso_Options()
+        assert options.surrogate is None and options.surrogate_ui == "off"
+
+        options.set_surrogate_ui("quadratic")
+        assert options.surrogate == "quadratic"
+
+        for setter, value in [(options.set_surrogate, "kriging"), (options.set_surrogate_share, 0.0),
+                              (options.set_surrogate_warmup, 0)]:
+            with pytest.raises(ValueError):
+                setter(value)
+
+
+class Test_Checkpoint:
+
+    def test_history_is_array_backed(self):
+        history = Pso_History(dim=2, capacity=2)
+        for i in range(5):                                      # grows beyond capacity
+            best = Design_Score(np.array([i, -i], dtype=float), 10.0 - i, particle_id=0, iteration=i)
+            history.append(Iteration_Result(i, best=best, r_centroid=1.0, r_best=0.5, inertia=0.9))
+
+        assert len(history) == 5
+        assert np.array_equal(history.array("score"), [10.0, 9.0, 8.0, 7.0, 6.0])
+        assert history.array("position").shape == (5, 2)
+        assert history[-1].best.score == 6.0 and history[-1].surrogate_error is None
+        assert [result.iteration for result in history[1:3]] == [1, 2]
+
+    def test_resume_from_checkpoint_file(self, tmp_path):
+        bounds = [(-3.0, 3.0)] * 3
+        x0 = np.array([2.0, -1.0, 1.5])
+        options = Pso_Options(pop_size=12, max_iter=40, min_iter=40, seed=7, surrogate="rbf")
+
+        full = Pso(sphere, x0, bounds, options).run()
+
+        # interrupted run - saved - resumed in a new runner
+        calls = {"n": 0}
+
+        def stop() -> bool:
+            calls["n"] += 1
+            return calls["n"] == 15
+
+        first = Pso(sphere, x0, bounds, options, stop_callback=stop).run()
+        assert first.iterations < 40
+
+        pathFileName = str(tmp_path / "pso.npz")
+        first.save_checkpoint(pathFileName)
+
+        resumed = Pso(sphere, np.zeros(3), bounds, options)
+        resumed.restore(Pso.load_checkpoint(pathFileName))
+        resumed.run()
+
+        assert resumed.iterations == full.iterations
+        assert np.array_equal(resumed.best_position, full.best_position)
+        assert resumed.best_score == full.best_score
+        assert np.array_equal(resumed.history.array("score"), full.history.array("score"))
+
+    def test_restore_checks_shape(self):
+        bounds = [(-3.0, 3.0)] * 2
+        small = Pso(sphere, np.zeros(2), bounds, Pso_Options(pop_size=5, max_iter=3, seed=1)).run()
+        other = Pso(sphere, np.zeros(2), bounds, Pso_Options(pop_size=6, max_iter=3, seed=1))
+
+        with pytest.raises(ValueError):
+            other.restore(small.checkpoint())
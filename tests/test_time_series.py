@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+    pytest for the decimated time series store
+"""
+
+import numpy as np
+import pytest
+
+from airfoileditor.base.time_series import Time_Series, decimate_minmax, decimate_lttb, METHOD_LTTB
+
+
+def _noisy (n : int) -> tuple [np.ndarray, np.ndarray]:
+    rng = np.random.default_rng (42)
+    x = np.arange (n, dtype=float)
+    y = np.exp (-x / n * 5) + rng.normal (0, 0.01, n)
+    y [n // 3] = 5.0                                            # spike
+    return x, y
+
+
+class Test_Time_Series:
+
+    def test_append (self):
+
+        series = Time_Series ('test')
+        for i in range (1000):
+            series.append (i, i * 2.0)
+        series.extend ([1000, 1001], [0.0, 1.0])
+
+        assert len (series) == 1002
+        assert series.y [500] == 1000.0
+        assert series.last == (1001, 1.0)
+        with pytest.raises (ValueError):
+            series.extend ([1, 2], [1])
+
+        series.clear ()
+        assert len (series) == 0 and not series
+
+
+    def test_decimate_minmax (self):
+
+        x, y = _noisy (100000)
+        xd, yd = decimate_minmax (x, y, 800)
+
+        assert len (xd) <= 802
+        assert np.all (np.diff (xd) > 0)                        # x order kept
+        assert yd.max () == 5.0 and yd.min () == y.min ()       # peaks kept
+        assert xd [0] == 0 and xd [-1] == x [-1]
+
+        xs, ys = decimate_minmax (x [:500], y [:500], 800)      # nothing to decimate
+        assert len (xs) == 500
+
+
+    def test_decimate_lttb (self):
+
+        x, y = _noisy (100000)
+        xd, yd = decimate_lttb (x, y, 800)
+
+        assert len (xd) == 800
+        assert np.all (np.diff (xd) > 0)
+        assert 5.0 in yd                                        # spike is the largest triangle
+        assert xd [0] == 0 and xd [-1] == x [-1]
+
+
+    def test_decimated_zoom (self):
+
+        x, y = _noisy (20000)
+        series = Time_Series ()
+        series.extend (x, y)
+
+        xd, yd = series.decimated (400)
+        assert len (xd) <= 402
+        assert series.decimated (400) [0] is xd                 # cached result
+
+        # zoomed view - full resolution of the visible range with one neighbour each side
+        xz, yz = series.decimated (400, x_range=(1000.5, 1100))
+        assert len (xz) == 102
+        assert xz [0] == 1000 and xz [-1] == 1101
+        assert np.array_equal (yz, y [1000:1102])
+
+        xl, _ = series.decimated (400, method=METHOD_LTTB)
+        assert len (xl) == 400
+        with pytest.raises (ValueError):
+            series.decimated (400, method='unknown')
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+    pytest for the in-process check of Xoptfoil2 input files
+"""
+
+import os
+import shutil
+
+import pytest
+
+from airfoileditor.model.xo2_driver import Worker
+from airfoileditor.model.xo2_input  import Input_File, Input_Text
+
+
+EXAMPLE_DIR = os.path.join (os.path.dirname (__file__), '..', 'examples_optimize', 'SD7003_fast')
+
+
+@pytest.fixture
+def input_file (tmp_path, monkeypatch) -> Input_File:
+    """ copy of the SD7003 example input file"""
+
+    monkeypatch.setattr (Worker, "ready", True)             # xfoil polar definitions without Worker binary
+    monkeypatch.setattr (Worker, "_check_results", {})
+    shutil.copytree (EXAMPLE_DIR, tmp_path / "check")
+    return Input_File ("SD7003_fast.xo2", workingDir=str (tmp_path / "check"))
+
+
+def _warnings_of (text : str, workingDir : str = '') -> list [str]:
+    """ warnings of the in-process check of the namelists in text"""
+    return [warning for nml in Input_Text (text, workingDir=workingDir).nmls for warning in nml.check()]
+
+
+class Test_Input_Check:
+
+    def test_input_text (self, input_file):
+
+        text = input_file.as_text ()
+        assert _warnings_of (text, input_file.workingDir) == []
+
+        warnings = _warnings_of (text.replace ("&particle_swarm_options", "&particle_swarm_options\n  pop = 500"),
+                                 input_file.workingDir)
+        assert warnings == ["namelist particle_swarm_options - pop should be between 5 and 100"]
+
+        warnings = _warnings_of (text, workingDir="")                       # seed airfoil not found
+        assert "airfoil_file" in warnings[0]
+
+        text = "&operating_conditions\n noppoint = 2\n op_point(1) = 0.2\n optimization_type(1) = 'min-lift'\n/\n"
+        warnings = _warnings_of (text)
+        assert "namelist operating_conditions - op_point is missing for some of 2 op points" in warnings
+        assert any ("'min-lift'" in warning for warning in warnings)
+
+        assert Input_Text.parse_error_of (text) is None
+        assert Input_Text.parse_error_of ("&operating_conditions\n noppoint = 2 \n").startswith ("Namelist parse error")
+
+
+    def test_check_nml (self, input_file):
+
+        assert input_file.check_nml () == []
+
+        input_file.nml_particle_swarm_options.nml ['max_speed'] = 0.9       # not via setter which would clip
+        assert input_file.check_nml () == ["namelist particle_swarm_options - max_speed should be between 0.01 and 0.7"]
+        assert input_file.get_issue_messages ()["warnings"] == input_file.check_nml ()      # Xoptfoil2 has the final say
+        assert input_file.get_issue_messages ()["errors"] == []
+
+        input_file.nml_particle_swarm_options.set_max_speed (0.5)
+        assert input_file.check_nml () == []
+
+
+    def test_check_content_memoized (self, input_file, monkeypatch):
+
+        n_execute = []
+        def _execute (self, args, **kwargs):
+            n_execute.append (args)
+            return 0
+        monkeypatch.setattr (Worker, "_execute", _execute)
+
+        text = input_file.as_text ()
+        assert input_file.check_content (text) == (0, "")
+        assert input_file.check_content (text) == (0, "")                   # same content - memoized
+        assert len (n_execute) == 1
+        assert not os.path.isfile (os.path.join (input_file.workingDir, "SD7003_fast.xo2.tmp"))
+
+        # out of range is just a warning in-process - Worker decides
+        assert input_file.check_content (text.replace ("&particle_swarm_options", "&particle_swarm_options\n  pop = 1")) == (0, "")
+        assert len (n_execute) == 2
+
+        rc, error_text = input_file.check_content (text + "\n&paneling_options\n npoint = 2 \n")
+        assert rc == 1 and error_text.startswith ("Namelist parse error")
+        assert len (n_execute) == 2                                         # no Worker for parse errors
+
+        assert input_file.check_content (text + "\n") == (0, "")
+        assert len (n_execute) == 3
+
+        # a modified seed airfoil is a new input for the Worker 
+        with open (os.path.join (input_file.workingDir, "SD7003.dat"), 'a') as f:
+            f.write ("\n")
+        assert input_file.check_content (text + "\n") == (0, "")
+        assert len (n_execute) == 4
+        assert input_file.check_content (text + "\n") == (0, "")
+        assert len (n_execute) == 4
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+    pytest for the concurrent Xoptfoil2 job queue
+
+    Xoptfoil2 is replaced by a small script which writes progress to 'run_control'
+    and stops on the 'stop' command like the real program.
+"""
+
+import os
+import sys
+import time
+import shutil
+
+import pytest
+
+from airfoileditor.model.xo2_driver import Xoptfoil2
+from airfoileditor.model.xo2_queue  import Xo2_Job_Queue, xo2_job_state
+
+
+pytestmark = pytest.mark.skipif (os.name == 'nt', reason="fake Xoptfoil2 is a posix script")
+
+EXAMPLE_DIR = os.path.join (os.path.dirname (__file__), '..', 'examples_optimize', 'SD7003_fast')
+
+FAKE_XOPTFOIL2 = """#!{python}
+import os, sys, time, shutil
+args = dict (zip (sys.argv[1::2], sys.argv[2::2]))
+with open ('args.txt', 'w') as f:
+    f.write (f"{{args.get('-a', '')}}\\n{{os.environ.get('OMP_NUM_THREADS', '')}}\\n")
+for step in range (1, {nsteps} + 1):
+    if os.path.isfile ('run_control'):
+        with open ('run_control') as f:
+            if 'stop' in f.read(): break
+    with open ('run_control', 'w') as f:
+        f.write (f"!run-info; step: {{step}}; design: {{step // 2}}; fmin:  {{1.0 - step * 0.01}}\\n")
+    time.sleep (0.05)
+shutil.copy (args['-a'], args['-o'] + '.dat')
+"""
+
+
+@pytest.fixture
+def fake_xoptfoil2 (tmp_path, monkeypatch):
+    """ install fake Xoptfoil2 executable - returns function to set no of steps"""
+
+    exe_dir = tmp_path / "exe"
+    exe_dir.mkdir()
+
+    def install (nsteps : int):
+        exe = exe_dir / Xoptfoil2.NAME_EXE
+        exe.write_text (FAKE_XOPTFOIL2.format (python=sys.executable, nsteps=nsteps))
+        exe.chmod (0o755)
+
+    install (20)
+    monkeypatch.setattr (Xoptfoil2, "exe_dir", str(exe_dir))
+    monkeypatch.setattr (Xoptfoil2, "ready", True)
+    return install
+
+
+@pytest.fixture
+def input_files (tmp_path) -> list [str]:
+    """ three variants of the SD7003 example input file"""
+
+    workDir = tmp_path / "work"
+    shutil.copytree (EXAMPLE_DIR, workDir)
+    paths = []
+    for i in range (3):
+        path = workDir / f"SD7003_var{i}.xo2"
+        shutil.copy (workDir / "SD7003_fast.xo2", path)
+        paths.append (str(path))
+    return paths
+
+
+def _run_until (queue : Xo2_Job_Queue, condition, timeout = 20.0) -> int:
+    """ poll queue until condition - returns max no of active jobs seen """
+
+    max_active = 0
+    end = time.time() + timeout
+    while not condition() and time.time() < end:
+        queue.update ()
+        max_active = max (max_active, len (queue.jobs_in_state (xo2_job_state.RUNNING, xo2_job_state.PAUSING)))
+        time.sleep (0.05)
+    assert condition(), "timeout waiting for queue"
+    return max_active
+
+
+class Test_Xo2_Job_Queue:
+
+    def test_budget (self):
+
+        queue = Xo2_Job_Queue (n_cores=8, threads_per_job=3)
+        assert queue.max_parallel == 2
+        queue.set_threads_per_job (16)
+        assert queue.max_parallel == 1
+        assert not queue.isActive
+
+
+    def test_run_concurrently (self, fake_xoptfoil2, input_files):
+
+        queue = Xo2_Job_Queue (n_cores=4, threads_per_job=2)
+        jobs  = [queue.add (path) for path in input_files]
+
+        with pytest.raises (ValueError):
+            queue.add (input_files[0])                          # same job directory
+
+        progress = []
+        def all_done ():
+            progress.append (jobs[0].nSteps)
+            return all (job.isDone for job in jobs)
+
+        max_active = _run_until (queue, all_done)
+
+        assert max_active == 2                                  # 4 cores / 2 threads
+        assert [job.state for job in jobs] == [xo2_job_state.FINISHED] * 3
+        assert max (progress) > 0                               # progress via run_control
+
+        for job in jobs:
+            # each job in its own directory with own copy of input file and seed as absolute path
+            assert os.path.dirname (job.workingDir) == os.path.dirname (job.input_pathFileName)
+            assert os.path.isfile (os.path.join (job.workingDir, job.name))
+            assert os.path.isfile (job.airfoil_final_pathFileName)
+            with open (os.path.join (job.workingDir, 'args.txt')) as f:
+                seed, n_threads = f.read().split()
+            assert os.path.isabs (seed) and seed.endswith ('SD7003.dat')
+            assert n_threads == '2'
+
+        queue.clear_done ()
+        assert queue.jobs == []
+
+
+    def test_pause_resume (self, fake_xoptfoil2, input_files):
+
+        fake_xoptfoil2 (200)                                    # long running
+
+        queue = Xo2_Job_Queue (n_cores=1)
+        job_1 = queue.add (input_files[0])
+        job_2 = queue.add (input_files[1])
+
+        queue.update ()
+        assert job_1.state == xo2_job_state.RUNNING
+        assert job_2.state == xo2_job_state.QUEUED
+
+        queue.pause (job_2)                                     # queued job is paused directly
+        assert job_2.state == xo2_job_state.PAUSED
+
+        _run_until (queue, lambda: job_1.nSteps > 2)
+        queue.pause (job_1)                                     # running job is stopped via run_control
+        assert job_1.state == xo2_job_state.PAUSING
+
+        _run_until (queue, lambda: job_1.state == xo2_job_state.PAUSED)
+        assert job_1.nSteps < 200
+        assert job_2.state == xo2_job_state.PAUSED              # paused jobs aren't started
+        assert not queue.isActive
+
+        # resume - continues from the airfoil of the paused run
+
+        fake_xoptfoil2 (5)
+        queue.resume_all ()
+        _run_until (queue, lambda: job_1.isDone and job_2.isDone)
+
+        assert job_1.state == xo2_job_state.FINISHED
+        assert job_1.n_runs == 2
+        with open (os.path.join (job_1.workingDir, 'args.txt')) as f:
+            seed = f.read().split()[0]
+        assert seed.endswith ('SD7003_var0_resume.dat')
@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+    pytest for reading Xoptfoil2 design results
+"""
+
+
+import numpy as np
+import pytest
+
+from airfoileditor.model.airfoil          import Airfoil_Hicks_Henne
+from airfoileditor.model.airfoil_examples import Root_Example
+from airfoileditor.model.xo2_results      import (Reader_Airfoils, Reader_Airfoils_Bezier, Reader_Airfoils_HH,
+                                                  Airfoil_Designs, Reader_Optimization_History, Optimization_History)
+
+
+def _line (idesign, name, tag, vals) -> str:
+    return f"{idesign:6d};{name};{tag:>5s};" + ";".join (f"{v:11.7f}" for v in vals) + "\n"
+
+
+@pytest.fixture
+def seed ():
+    airfoil = Root_Example ()
+    airfoil.normalize ()
+    return airfoil
+
+
+class Test_Airfoil_Designs:
+
+    def test_coordinates_lru (self, seed, tmp_path):
+
+        n_designs = 120
+        with open (tmp_path / Reader_Airfoils.filename, 'w') as f:
+            f.write ("    No;           Name; Coord;  1\n")
+            for i in range (n_designs):
+                f.write (_line (i, f"Design~{i}", 'x', seed.x))
+                f.write (_line (i, f"Design~{i}", 'y', seed.y * (1.0 + i * 0.001)))
+
+        reader  = Reader_Airfoils (str(tmp_path))
+        designs = reader.designs
+
+        assert isinstance (designs, Airfoil_Designs)
+        assert len (designs) == n_designs
+        assert designs.n_cached == 0                                # nothing built up to now
+        assert designs.fileNames[3] == reader.design_fileName (3, '.dat')
+
+        designs.set_max_cached (10)
+        for airfoil in designs:                                     # visit all
+            pass
+        assert designs.n_cached == 10
+
+        last = designs[-1]
+        assert last is designs[n_designs-1]                         # cache hit
+        assert np.allclose (last.y, seed.y * (1.0 + (n_designs-1) * 0.001), atol=1e-7)
+        assert last.pathFileName_abs.startswith (str(tmp_path))
+
+        # evicted airfoil is re-created - index is based on fileName
+        first = designs[0]
+        for i in range (1, 20): designs[i]
+        assert designs[0] is not first
+        assert designs.index (first) == 0
+        assert first in designs
+        assert len (designs[5:8]) == 3
+
+        with pytest.raises (IndexError):
+            designs [n_designs]
+
+        # incremental read appends new designs
+        with open (tmp_path / Reader_Airfoils.filename, 'a') as f:
+            f.write (_line (n_designs, "new", 'x', seed.x))
+            f.write (_line (n_designs, "new", 'y', seed.y))
+        reader.set_results_could_be_outdated (True)
+        assert len (reader.designs) == n_designs + 1
+
+
+    def test_bezier (self, tmp_path):
+
+        top = [0.0, 0.0, 0.0, 0.04, 0.3, 0.08, 0.7, 0.03, 1.0, 0.0]
+        bot = [0.0, 0.0, 0.0, -0.03, 0.3, -0.04, 0.7, -0.01, 1.0, 0.0]
+        with open (tmp_path / Reader_Airfoils_Bezier.filename, 'w') as f:
+            f.write ("    No;           Name; Side;  p1x\n")
+            for i in range (3):
+                f.write (_line (i, "bez", 'Top', top))
+                f.write (_line (i, "bez", 'Bot', bot))
+
+        designs = Reader_Airfoils_Bezier (str(tmp_path)).designs
+        assert len (designs) == 3
+        assert len (designs[2].geo.upper.bezier.cpoints) == 5
+
+
+    def test_hicks_henne_both_sides (self, seed, tmp_path):
+
+        with open (tmp_path / Reader_Airfoils_HH.filename, 'w') as f:
+            f.write ("    No;           Name; Coord;  1\n")
+            f.write (_line (0, "seed", 'x', seed.x))
+            f.write (_line (0, "seed", 'y', seed.y))
+            f.write ("    No;           Name; Side;  hh1_str\n")
+            for i in range (1, 4):
+                f.write (_line (i, f"hh~{i}", 'Top', [0.001 * i, 0.3, 1.0]))
+                f.write (_line (i, f"hh~{i}", 'Bot', [-0.002 * i, 0.5, 1.0, 0.001, 0.7, 1.0]))
+
+        designs = Reader_Airfoils_HH (str(tmp_path)).designs
+        assert len (designs) == 4
+        assert not isinstance (designs[0], Airfoil_Hicks_Henne)     # seed
+
+        airfoil = designs[3]
+        assert isinstance (airfoil, Airfoil_Hicks_Henne)
+        assert len (airfoil.geo.upper.hhs) == 1
+        assert len (airfoil.geo.lower.hhs) == 2
+        assert airfoil.geo.lower.hhs[0].strength == pytest.approx (-0.006)
+
+        # all designs at once without creating airfoils
+        reader    = Reader_Airfoils_HH (str(tmp_path))
+        designs_y = reader.designs_y ()
+        assert designs_y.shape == (4, len (seed.x))
+        assert np.allclose (designs_y[0], seed.y, atol=1e-7)
+        assert reader.designs.n_cached == 0                      # no Airfoil objects built
+
+        # design airfoils take their y from the batch evaluation - same as bump by bump 
+        airfoil = reader.designs[3]
+        single  = Airfoil_Hicks_Henne (name="single")
+        single.set_hh_data ("single", "seed", seed.x, seed.y, airfoil.geo.upper.hhs, airfoil.geo.lower.hhs)
+        assert np.allclose (airfoil.y, designs_y[3], atol=1e-12)
+        assert np.allclose (airfoil.y, single.y, atol=1e-12)
+
+
+
+class Test_Optimization_History:
+
+    def test_series (self, tmp_path):
+
+        with open (tmp_path / Reader_Optimization_History.filename, 'w') as f:
+            f.write ("  Iter;Design;  Objective;  % Improve; Design rad\n")
+            f.write ("     0;      ;  1.0000000;  0.0000000;  0.1459420\n")
+            for i in range (1, 3000):
+                f.write (f"{i:6d};      ;  {1-i*1e-5:.7f};  {i*1e-3:.7f};  {0.1/i:.7f}\n")
+
+        reader = Reader_Optimization_History (str(tmp_path))
+        steps  = reader.steps
+
+        assert isinstance (steps, Optimization_History)
+        assert len (steps.improvement_series) == 3000
+        assert steps.improvement_series.last == (2999, pytest.approx (2.999))
+        x, _ = steps.design_radius_series.decimated (500)
+        assert len (x) <= 502
+
+        # incremental read appends to the series
+        with open (tmp_path / Reader_Optimization_History.filename, 'a') as f:
+            f.write ("  3000;     1;  0.9000000;  10.000000;  0.0000100\n")
+        reader.set_results_could_be_outdated (True)
+        assert len (reader.steps.objective_series) == 3001
+        assert reader.steps.objective_series.last == (3000, 0.9)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+    pytest for the Xoptfoil2 parameter sweep
+"""
+
+import os
+import shutil
+
+import pytest
+
+from airfoileditor.model.xo2_driver import Worker, Xoptfoil2
+from airfoileditor.model.xo2_input  import Input_File
+from airfoileditor.model.xo2_sweep  import Xo2_Sweep, sweep_parameter_setter
+
+
+EXAMPLE_DIR = os.path.join (os.path.dirname (__file__), '..', 'examples_optimize', 'SD7003_fast')
+
+
+@pytest.fixture
+def base_file (tmp_path, monkeypatch) -> str:
+    """ copy of the SD7003 example input file"""
+
+    monkeypatch.setattr (Worker, "ready", True)             # xfoil polar definitions without Worker binary
+    shutil.copytree (EXAMPLE_DIR, tmp_path / "sweep")
+    return str (tmp_path / "sweep" / "SD7003_fast.xo2")
+
+
+def _write_fake_results (workingDir : str, outName : str, objective : float, thickness : float):
+    """ write minimal Xoptfoil2 result files of a finished run"""
+
+    resultDir = os.path.join (workingDir, outName + Xoptfoil2.RESULT_DIR_POSTFIX)
+    os.makedirs (resultDir)
+    with open (os.path.join (resultDir, 'Optimization_History.csv'), 'w') as f:
+        f.write ("  Iter;Design;  Objective;  % Improve; Design rad\n")
+        f.write ("     0;      ;  1.0000000;  0.0000000;  0.1459420\n")
+        f.write (f"     1;     1;  {objective:.7f};  {(1-objective)*100:.7f};  0.1433520\n")
+    with open (os.path.join (resultDir, 'Design_GeoTargets.csv'), 'w') as f:
+        f.write ("    No; iGeo;        type;       val;        dev;   weight\n")
+        f.write ("     0;    1;   Thickness;   0.08201; -16.507213;      1.0\n")
+        f.write (f"     1;    1;   Thickness;   {thickness:.5f};  -1.0;      1.0\n")
+
+
+class Test_Xo2_Sweep:
+
+    def test_parameters (self, base_file):
+
+        sweep = Xo2_Sweep (base_file)
+        sweep.add_parameter ('re_default', [300000, 400000])
+        sweep.add_parameter ('weighting_2', [1.0, 2.0, 3.0])
+        assert sweep.n_variants == 6
+        assert sweep.param_grid()[1] == {'re_default': 300000, 'weighting_2': 2.0}
+
+        with pytest.raises (ValueError):
+            sweep.add_parameter ('not_a_parameter', [1])
+        with pytest.raises (ValueError):
+            sweep.add_parameter ('ncrit', [])
+        assert sweep_parameter_setter ('weighting_12')
+
+
+    def test_write_variants (self, base_file):
+
+        sweep = Xo2_Sweep (base_file)
+        sweep.add_parameter ('re_default', [300000, 500000])
+        sweep.add_parameter ('weighting_2', [2.0])
+        sweep.add_parameter ('pop', [20])
+
+        variants = sweep.write_variants ()
+
+        assert [v.fileName for v in variants] == ["SD7003_fast_v1.xo2", "SD7003_fast_v2.xo2"]
+
+        input_file = Input_File (variants[1].pathFileName)
+        assert input_file.nml_operating_conditions.re_default == 500000
+        assert input_file.opPoint_defs[1].weighting == 2.0
+        assert input_file.nml_particle_swarm_options.pop == 20
+        assert "re_default=500000" in input_file.nml_info.descriptions[-1]
+
+        # base file is unchanged - a second sweep continues with the version numbers
+        assert Input_File (base_file).nml_particle_swarm_options.pop != 20
+        assert Xo2_Sweep (base_file)._next_fileName ("SD7003_fast.xo2") == "SD7003_fast_v3.xo2"
+
+
+    def test_run_and_compare (self, base_file, tmp_path):
+
+        sweep = Xo2_Sweep (base_file)
+        sweep.add_parameter ('ncrit', [7.0, 9.0, 11.0])
+        variants = sweep.write_variants ()
+
+        queue = sweep.run ()
+        assert [job.workingDir for job in queue.jobs] == [v.workingDir for v in variants]
+
+        # results of two finished variants - the third one didn't run
+        _write_fake_results (variants[0].workingDir, variants[0].outName, 0.95, 0.0810)
+        _write_fake_results (variants[1].workingDir, variants[1].outName, 0.90, 0.0805)
+
+        table = sweep.comparison_table ()
+
+        assert [row.name for row in table] == ["SD7003_fast_v2.xo2", "SD7003_fast_v1.xo2", "SD7003_fast_v3.xo2"]
+        assert table[0].params == {'ncrit': 9.0}
+        assert table[0].objective == pytest.approx (0.90)
+        assert table[0].improvement == pytest.approx (0.10)
+        assert table[0].geo_targets == {'Thickness': pytest.approx (0.0805)}
+        assert table[2].objective is None
+
+        text = sweep.table_text ()
+        assert "Thickness" in text and "SD7003_fast_v3.xo2" in text
+
+        pathFileName = str (tmp_path / "sweep.csv")
+        sweep.save_csv (pathFileName)
+        with open (pathFileName) as f:
+            lines = f.readlines()
+        assert lines[0].startswith ("Variant;ncrit;Objective")
+        assert len (lines) == 4